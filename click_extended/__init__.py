@@ -1,15 +1,20 @@
 """Initialization file for the 'click_extended' module."""
 
-from click_extended.core.decorators.argument import argument
-from click_extended.core.decorators.command import command
-from click_extended.core.decorators.context import context
-from click_extended.core.decorators.env import env
-from click_extended.core.decorators.group import group
-from click_extended.core.decorators.option import option
-from click_extended.core.decorators.prompt import prompt
-from click_extended.core.decorators.selection import selection
-from click_extended.core.decorators.tag import tag
-from click_extended.core.other.get_context import get_context
+from typing import TYPE_CHECKING
+
+from click_extended.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from click_extended.core.decorators.argument import argument
+    from click_extended.core.decorators.command import command
+    from click_extended.core.decorators.context import context
+    from click_extended.core.decorators.env import env
+    from click_extended.core.decorators.group import group
+    from click_extended.core.decorators.option import option
+    from click_extended.core.decorators.prompt import prompt
+    from click_extended.core.decorators.selection import selection
+    from click_extended.core.decorators.tag import tag
+    from click_extended.core.other.get_context import get_context
 
 __all__ = [
     "argument",
@@ -23,3 +28,19 @@ __all__ = [
     "selection",
     "tag",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "argument": ".core.decorators.argument",
+        "command": ".core.decorators.command",
+        "context": ".core.decorators.context",
+        "env": ".core.decorators.env",
+        "group": ".core.decorators.group",
+        "option": ".core.decorators.option",
+        "prompt": ".core.decorators.prompt",
+        "selection": ".core.decorators.selection",
+        "tag": ".core.decorators.tag",
+        "get_context": ".core.other.get_context",
+    },
+)
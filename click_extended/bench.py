@@ -0,0 +1,400 @@
+"""
+Benchmarks of the startup cost of commands.
+
+The ``startup`` benchmark measures, each in new interpreters:
+
+- The cold import of ``click_extended``, ``click_extended.decorators``,
+  each decorator subpackage and any other given module, parsed from the
+  output of ``python -X importtime``.
+- The time to decorate a number of synthetic commands.
+- The time to run a command that does nothing, both within the process
+  and for the whole process.
+
+The results are written as JSON, and checked against budgets of the
+median milliseconds of each measurement.
+
+Usage::
+
+    python -m click_extended.bench startup [--budgets FILE] [--output FILE]
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import argparse
+import json
+import os
+import pkgutil
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+
+DEFAULT_MODULES = ("click_extended", "click_extended.decorators")
+DEFAULT_COMMANDS = 200
+DEFAULT_REPEAT = 5
+
+
+def parse_importtime(output: str) -> list[tuple[int, str, int]]:
+    """
+    Parse the output of ``python -X importtime``.
+
+    :param output:
+        The standard error of the interpreter.
+
+    :returns:
+        The nesting level, module name and cumulative microseconds of every
+        imported module, in the order they finished importing.
+    :rtype: list[tuple[int, str, int]]
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((level, name.strip(), int(cumulative)))
+    return imports
+
+
+def _importtime(code: str) -> list[tuple[int, str, int]]:
+    """Run code in a new interpreter and parse its import times."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def import_time(module: str, baseline: set[str] | None = None) -> float:
+    """
+    Return the milliseconds a cold import of a module takes.
+
+    This is the cumulative time of the modules imported by the import
+    statement, which excludes those the interpreter imports at startup.
+
+    :param module:
+        The name of the module.
+    :param baseline:
+        The modules the interpreter imports at startup, detected if not
+        given.
+
+    :returns:
+        The milliseconds of the import.
+    :rtype: float
+    """
+    if baseline is None:
+        baseline = {name for _, name, _ in _importtime("pass")}
+    return (
+        sum(
+            cumulative
+            for level, name, cumulative in _importtime(f"import {module}")
+            if level == 0 and name not in baseline
+        )
+        / 1000
+    )
+
+
+def _synthetic_callback(index: int) -> Callable[..., None]:
+    """Create the callback of a synthetic command."""
+
+    def callback(**_: Any) -> None:
+        """A synthetic command."""
+
+    callback.__name__ = f"command_{index}"
+    return callback
+
+
+def decorate_time(commands: int) -> float:
+    """
+    Return the milliseconds decorating synthetic commands takes.
+
+    Every command has an argument, an option with a ``choice()`` child, an
+    integer option and a flag, and is added to a group.
+
+    :param commands:
+        The number of commands.
+
+    :returns:
+        The milliseconds of decorating the commands, excluding imports.
+    :rtype: float
+    """
+    from click_extended import argument, group, option
+    from click_extended.decorators import choice
+
+    start = time.perf_counter()
+
+    @group()
+    def cli() -> None:
+        """A synthetic group."""
+
+    for index in range(commands):
+        func = _synthetic_callback(index)
+        func = option("--verbose", is_flag=True)(func)
+        func = option("--count", type=int, default=1)(func)
+        func = choice("fast", "slow")(func)
+        func = option("--mode", default="fast")(func)
+        func = argument("target")(func)
+        cli.command()(func)
+
+    return (time.perf_counter() - start) * 1000
+
+
+def noop_time() -> float:
+    """
+    Return the milliseconds running a command that does nothing takes.
+
+    :returns:
+        The milliseconds of ``main``, excluding imports and decorating.
+    :rtype: float
+    """
+    from click_extended import command, option
+
+    @command()
+    @option("--name", default="world")
+    def noop(name: str) -> None:
+        """A command that does nothing."""
+
+    start = time.perf_counter()
+    noop.main(["--name", "bench"], standalone_mode=False)
+    return (time.perf_counter() - start) * 1000
+
+
+def _in_new_interpreter(call: str) -> float:
+    """Run a function of this module in a new interpreter."""
+    code = f"from click_extended import bench; print(bench.{call})"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def _process_time(code: str) -> float:
+    """Return the milliseconds a new interpreter running code takes."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], capture_output=True, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def _stats(samples: list[float]) -> dict[str, float]:
+    """Summarize the milliseconds of repeated measurements."""
+    return {
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def decorator_subpackages() -> list[str]:
+    """
+    Return the names of the decorator subpackages.
+
+    :returns:
+        The names, such as ``click_extended.decorators.check``.
+    :rtype: list[str]
+    """
+    import click_extended.decorators
+
+    return sorted(
+        f"click_extended.decorators.{info.name}"
+        for info in pkgutil.iter_modules(click_extended.decorators.__path__)
+        if info.ispkg
+    )
+
+
+def startup(
+    modules: list[str] | None = None,
+    commands: int = DEFAULT_COMMANDS,
+    repeat: int = DEFAULT_REPEAT,
+) -> dict[str, Any]:
+    """
+    Measure the startup cost of commands.
+
+    :param modules:
+        Modules to measure the import of in addition to ``click_extended``,
+        ``click_extended.decorators`` and the decorator subpackages.
+    :param commands:
+        The number of synthetic commands to decorate.
+    :param repeat:
+        How often every measurement is repeated.
+
+    :returns:
+        The environment and the statistics of every measurement, keyed by
+        its name.
+    :rtype: dict[str, Any]
+    """
+    names = [*DEFAULT_MODULES, *decorator_subpackages(), *(modules or [])]
+    baseline = {name for _, name, _ in _importtime("pass")}
+    noop_code = (
+        "from click_extended import command\n"
+        "@command()\ndef noop(): pass\n"
+        "noop.main([], standalone_mode=False)"
+    )
+
+    measurements: dict[str, Callable[[], float]] = {
+        f"import:{name}": partial(import_time, name, baseline) for name in names
+    }
+    measurements["decorate"] = partial(
+        _in_new_interpreter, f"decorate_time({commands})"
+    )
+    measurements["noop:invoke"] = partial(_in_new_interpreter, "noop_time()")
+    measurements["noop:process"] = partial(_process_time, noop_code)
+    measurements["interpreter"] = partial(_process_time, "pass")
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commands": commands,
+        "repeat": repeat,
+        "results": {
+            name: _stats([measure() for _ in range(repeat)])
+            for name, measure in measurements.items()
+        },
+    }
+
+
+def check_budgets(
+    results: dict[str, dict[str, float]], budgets: dict[str, float]
+) -> list[str]:
+    """
+    Check the median of measurements against budgets.
+
+    :param results:
+        The statistics of every measurement, keyed by its name.
+    :param budgets:
+        The maximum median milliseconds, keyed by the name of the
+        measurement, or by the module name for imports.
+
+    :returns:
+        A message for every measurement over its budget, or that is
+        missing.
+    :rtype: list[str]
+    """
+    failures = []
+    for name, budget in budgets.items():
+        key = name if name in results else f"import:{name}"
+        if key not in results:
+            failures.append(f"{name}: no such measurement")
+        elif (median := results[key]["median_ms"]) > budget:
+            failures.append(f"{name}: {median:.1f} ms is over {budget:.1f} ms")
+    return failures
+
+
+def _parse_budget(value: str) -> tuple[str, float]:
+    """Parse a ``NAME=MS`` budget."""
+    name, equals, milliseconds = value.rpartition("=")
+    try:
+        if not equals or not name:
+            raise ValueError
+        return name, float(milliseconds)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(
+            f"invalid budget '{value}', expected NAME=MS"
+        ) from e
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Create the parser of the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m click_extended.bench",
+        description="Benchmark the startup cost of commands.",
+    )
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+    startup_parser = subparsers.add_parser(
+        "startup", help="Measure import, decoration and invocation times."
+    )
+    startup_parser.add_argument(
+        "--module",
+        action="append",
+        default=[],
+        help="Also measure the import of a module. Can be repeated.",
+    )
+    startup_parser.add_argument(
+        "--commands",
+        type=int,
+        default=DEFAULT_COMMANDS,
+        help=f"Synthetic commands to decorate (default: {DEFAULT_COMMANDS}).",
+    )
+    startup_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"Repetitions of every measurement (default: {DEFAULT_REPEAT}).",
+    )
+    startup_parser.add_argument(
+        "--output",
+        type=Path,
+        help="Write the results as JSON to a file instead of stdout.",
+    )
+    startup_parser.add_argument(
+        "--budgets",
+        type=Path,
+        help="A JSON object of the maximum median milliseconds by name.",
+    )
+    startup_parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        type=_parse_budget,
+        metavar="NAME=MS",
+        help="The maximum median milliseconds of a measurement. Can be "
+        "repeated, and overrides --budgets.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run a benchmark from the command line.
+
+    :param argv:
+        The arguments, ``sys.argv[1:]`` if not given.
+
+    :returns:
+        ``1`` if a measurement is over its budget, otherwise ``0``.
+    :rtype: int
+    """
+    args = _parser().parse_args(argv)
+    budgets: dict[str, float] = {}
+    if args.budgets is not None:
+        budgets.update(json.loads(args.budgets.read_text(encoding="utf-8")))
+    budgets.update(args.budget)
+
+    report = startup(args.module, args.commands, args.repeat)
+    report["budgets"] = budgets
+    report["failures"] = check_budgets(report["results"], budgets)
+
+    output = json.dumps(report, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        args.output.write_text(output + os.linesep, encoding="utf-8")
+
+    for name, stats in report["results"].items():
+        print(f"{name:<45} {stats['median_ms']:>10.2f} ms", file=sys.stderr)
+    for failure in report["failures"]:
+        print(f"Over budget: {failure}", file=sys.stderr)
+    return 1 if report["failures"] else 0
+
+
+__all__ = [
+    "check_budgets",
+    "decorate_time",
+    "decorator_subpackages",
+    "import_time",
+    "main",
+    "noop_time",
+    "parse_importtime",
+    "startup",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
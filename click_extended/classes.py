@@ -10,6 +10,7 @@ from click_extended.core.nodes.node import Node
 from click_extended.core.nodes.option_node import OptionNode
 from click_extended.core.nodes.parent_node import ParentNode
 from click_extended.core.nodes.validation_node import ValidationNode
+from click_extended.core.other.settings import Settings
 
 __all__ = [
     "Node",
@@ -20,6 +21,7 @@ __all__ = [
     "OptionNode",
     "Command",
     "Group",
+    "Settings",
     "Tag",
     "ValidationNode",
 ]
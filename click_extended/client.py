@@ -0,0 +1,126 @@
+"""
+Client running commands through a daemon started with ``ClickGroup.serve``.
+
+The client only uses the standard library, so launchers using it start
+quickly. It passes its stdin, stdout and stderr, arguments, environment and
+working directory to the daemon and exits with the exit code of the
+invocation. When no daemon is listening, the command is imported and run in
+the process instead.
+
+Usage::
+
+    python -m click_extended.client SOCKET MODULE:ATTRIBUTE [ARGS]...
+"""
+
+import importlib
+import json
+import os
+import signal
+import socket
+import sys
+from typing import Any, NoReturn
+
+FORWARDED_SIGNALS = tuple(
+    getattr(signal, name)
+    for name in ("SIGINT", "SIGTERM", "SIGHUP")
+    if hasattr(signal, name)
+)
+
+
+def run_local(target: str, argv: list[str], prog_name: str | None = None) -> NoReturn:
+    """
+    Import a command and run it in this process.
+
+    :param target:
+        The command as ``"module:attribute"``.
+    :param argv:
+        The arguments of the command.
+    :param prog_name:
+        The program name used in usage messages.
+    """
+    module_name, _, attribute = target.partition(":")
+    command = getattr(importlib.import_module(module_name), attribute)
+    command.main(argv, prog_name=prog_name)
+    sys.exit(0)
+
+
+def run(
+    path: str,
+    target: str,
+    argv: list[str] | None = None,
+    prog_name: str | None = None,
+) -> NoReturn:
+    """
+    Run a command through the daemon listening on a socket.
+
+    Signals the client receives are forwarded to the invocation.
+
+    :param path:
+        The path of the socket of the daemon.
+    :param target:
+        The command as ``"module:attribute"``, run in this process when no
+        daemon is listening.
+    :param argv:
+        The arguments of the command. Defaults to ``sys.argv[1:]``.
+    :param prog_name:
+        The program name used in usage messages. Defaults to the name of
+        the running script.
+
+    :raises NotImplementedError:
+        If the platform cannot pass file descriptors over Unix domain
+        sockets.
+    """
+    if not hasattr(socket, "AF_UNIX") or not hasattr(socket, "send_fds"):
+        raise NotImplementedError(
+            "The daemon client requires a POSIX platform with Unix domain sockets."
+        )
+
+    argv = sys.argv[1:] if argv is None else argv
+    prog_name = prog_name or os.path.basename(sys.argv[0])
+
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(path)
+    except OSError:
+        conn.close()
+        run_local(target, argv, prog_name)
+
+    with conn:
+        socket.send_fds(conn, [b"\0"], [0, 1, 2])
+        header: dict[str, Any] = {
+            "argv": argv,
+            "env": dict(os.environ),
+            "cwd": os.getcwd(),
+            "prog_name": prog_name,
+        }
+        conn.sendall(json.dumps(header).encode() + b"\n")
+
+        reader = conn.makefile("rb")
+        line = reader.readline()
+        if not line:
+            sys.exit(1)
+        pid = json.loads(line)["pid"]
+
+        previous = {
+            signum: signal.signal(signum, lambda signum, _: os.kill(pid, signum))
+            for signum in FORWARDED_SIGNALS
+        }
+        try:
+            line = reader.readline()
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+        sys.exit(json.loads(line)["exit_code"] if line else 1)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(
+            "Usage: python -m click_extended.client SOCKET MODULE:ATTRIBUTE "
+            "[ARGS]...",
+            file=sys.stderr,
+        )
+        sys.exit(2)
+
+    run(sys.argv[1], sys.argv[2], sys.argv[3:], sys.argv[2].rpartition(":")[2])
@@ -0,0 +1,505 @@
+"""
+Shell completion answered from an index of the commands of a program.
+
+The module only uses the standard library, so a program can answer the
+shell before it imports its commands. Call ``complete()`` at the top of the
+entry point of the program:
+
+Usage::
+
+    from click_extended.completion import complete
+
+    complete()
+
+    from app.cli import cli
+
+    cli()
+
+The index is written by the program the first time the shell asks it for
+completions, and is rebuilt when a source file of the commands changes.
+Until then, and for completions the index can not answer, such as those of
+custom ``shell_complete`` functions, ``complete()`` returns and the program
+answers the shell itself.
+"""
+
+import json
+import os
+import shlex
+import sys
+import zlib
+from pathlib import Path
+from typing import Any
+
+MANIFEST_VERSION = 1
+CACHE_DIR_ENV_VAR = "CLICK_EXTENDED_CACHE_DIR"
+SHELLS = ("bash", "zsh", "fish")
+
+Completion = tuple[str, str, str | None]
+
+
+def default_cache_dir() -> Path:
+    """
+    Return the directory manifests are written to by default.
+
+    :returns:
+        ``$CLICK_EXTENDED_CACHE_DIR``, or ``click-extended`` in
+        ``$XDG_CACHE_HOME`` or ``~/.cache``.
+    :rtype: Path
+    """
+    if directory := os.environ.get(CACHE_DIR_ENV_VAR):
+        return Path(directory)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "click-extended"
+
+
+def file_source(path: str) -> dict[str, Any] | None:
+    """
+    Return the modification time, size and hash of a source file.
+
+    :param path:
+        The path of the file.
+
+    :returns:
+        The source, or ``None`` if the file can not be read.
+    :rtype: dict[str, Any] | None
+    """
+    # pylint: disable=import-outside-toplevel
+    import hashlib
+
+    try:
+        stat = os.stat(path)
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest}
+
+
+def is_fresh(sources: dict[str, dict[str, Any]]) -> bool:
+    """
+    Return whether source files are unchanged.
+
+    Files whose modification time and size are unchanged are not read, and
+    files that were only touched are compared by their hash.
+
+    :param sources:
+        The recorded sources by path, as returned by ``file_source``.
+
+    :returns:
+        ``True`` if every file has the recorded content.
+    :rtype: bool
+    """
+    for path, recorded in sources.items():
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if (stat.st_mtime_ns, stat.st_size) == (
+            recorded["mtime_ns"],
+            recorded["size"],
+        ):
+            continue
+        source = file_source(path)
+        if source is None or source["sha256"] != recorded["sha256"]:
+            return False
+    return True
+
+
+def read_manifest(path: Path) -> dict[str, Any] | None:
+    """
+    Read a manifest if it exists and its sources are unchanged.
+
+    :param path:
+        The path of the manifest.
+
+    :returns:
+        The manifest, or ``None`` if it is missing or stale.
+    :rtype: dict[str, Any] | None
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != MANIFEST_VERSION
+        or not is_fresh(data.get("sources", {}))
+    ):
+        return None
+    return data
+
+
+def program_name() -> str:
+    """
+    Return the name of the program like Click detects it.
+
+    :returns:
+        The file name of the program, or ``python -m module``.
+    :rtype: str
+    """
+    main = sys.modules["__main__"]
+    path = sys.argv[0]
+    package = getattr(main, "__package__", None)
+    if not package:
+        return os.path.basename(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    if name != "__main__":
+        package = f"{package}.{name}"
+    return f"python -m {package.lstrip('.')}"
+
+
+def complete_var_name(prog_name: str) -> str:
+    """
+    Return the environment variable the shell asks a program to complete in.
+
+    :param prog_name:
+        The name of the program.
+
+    :returns:
+        The name of the variable, such as ``_APP_COMPLETE``.
+    :rtype: str
+    """
+    name = prog_name.replace("-", "_").replace(".", "_")
+    return f"_{name}_COMPLETE".upper()
+
+
+def index_path(complete_var: str, cache_dir: str | Path | None = None) -> Path:
+    """
+    Return the path of the completion index of the running program.
+
+    :param complete_var:
+        The environment variable the shell asks the program to complete in.
+    :param cache_dir:
+        The directory of the index, ``default_cache_dir()`` if not given.
+
+    :returns:
+        The path of the index.
+    :rtype: Path
+    """
+    key = f"{complete_var}:{sys.executable}:{os.path.abspath(sys.argv[0])}"
+    digest = f"{zlib.crc32(key.encode()):08x}"
+    directory = Path(cache_dir) if cache_dir else default_cache_dir()
+    return directory / f"completion-{digest}.json"
+
+
+def split_arg_string(string: str) -> list[str]:
+    """
+    Split a command line like a shell, keeping an incomplete last word.
+
+    :param string:
+        The command line.
+
+    :returns:
+        The words of the command line.
+    :rtype: list[str]
+    """
+    lex = shlex.shlex(string, posix=True)
+    lex.whitespace_split = True
+    lex.commenters = ""
+    out: list[str] = []
+    try:
+        out.extend(lex)
+    except ValueError:
+        out.append(lex.token)
+    return out
+
+
+def completion_args(shell: str) -> tuple[list[str], str]:
+    """
+    Return the complete words and the incomplete word the shell passed.
+
+    :param shell:
+        The shell, one of ``SHELLS``.
+
+    :returns:
+        The complete arguments after the program name and the incomplete
+        word.
+    :rtype: tuple[list[str], str]
+    """
+    cwords = split_arg_string(os.environ["COMP_WORDS"])
+    if shell == "fish":
+        incomplete = os.environ["COMP_CWORD"]
+        if incomplete:
+            incomplete = split_arg_string(incomplete)[0]
+        args = cwords[1:]
+        if incomplete and args and args[-1] == incomplete:
+            args.pop()
+        return args, incomplete
+
+    cword = int(os.environ["COMP_CWORD"])
+    args = cwords[1:cword]
+    try:
+        incomplete = cwords[cword]
+    except IndexError:
+        incomplete = ""
+    return args, incomplete
+
+
+def format_completion(shell: str, completion: Completion) -> str:
+    """
+    Format a completion for the completion script of a shell.
+
+    :param shell:
+        The shell, one of ``SHELLS``.
+    :param completion:
+        The type, value and help of the completion.
+
+    :returns:
+        The completion as the script of the shell reads it.
+    :rtype: str
+    """
+    kind, value, help = completion  # pylint: disable=redefined-builtin
+    if shell == "zsh":
+        help = help or "_"
+        value = value.replace(":", r"\:") if help != "_" else value
+        return f"{kind}\n{value}\n{help}"
+    if shell == "fish" and help:
+        help = help.replace("\n", "\\n").replace("\t", " ")
+        return f"{kind},{value}\t{help}"
+    return f"{kind},{value}"
+
+
+def _is_option(arg: str) -> bool:
+    """Return whether an argument looks like the start of an option."""
+    return arg[:1] == "-"
+
+
+def _takes_value(option: dict[str, Any]) -> bool:
+    """Return whether an option takes a value."""
+    return not (option["is_flag"] or option["count"])
+
+
+def _options(command: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the options of a command, including its help option."""
+    options = [p for p in command["params"] if p["param_type"] == "option"]
+    if command.get("help_option"):
+        options.append(command["help_option"])
+    return options
+
+
+def _subcommand(command: dict[str, Any], name: str) -> dict[str, Any] | None:
+    """Return the entry of a subcommand of a group by name or alias."""
+    commands: dict[str, dict[str, Any]] = command["commands"]
+    if name in commands:
+        return commands[name]
+    for sub in commands.values():
+        if name in sub["aliases"]:
+            return sub
+    return None
+
+
+def _capacity(command: dict[str, Any]) -> float:
+    """Return how many values the arguments of a command take."""
+    nargs = [p["nargs"] for p in command["params"] if p["param_type"] == "argument"]
+    return float("inf") if -1 in nargs else sum(nargs)
+
+
+def _walk(
+    command: dict[str, Any], args: list[str]
+) -> tuple[dict[str, Any], set[str], int] | None:
+    """
+    Find the command the arguments end in.
+
+    Returns the command, the names of the options given to it and the
+    number of values given to its arguments, or ``None`` for chained groups.
+    """
+    used: set[str] = set()
+    positional = 0
+    options_done = False
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        index += 1
+        if arg == "--" and not options_done:
+            options_done = True
+        elif not options_done and len(arg) > 1 and _is_option(arg):
+            name, equals, _ = arg.partition("=")
+            for option in _options(command):
+                if name in option["opts"] or name in option["secondary_opts"]:
+                    used.add(option["name"])
+                    if _takes_value(option) and not equals:
+                        index += option["nargs"]
+                    break
+        elif "commands" in command and positional >= _capacity(command):
+            if command["chain"]:
+                return None
+            sub = _subcommand(command, arg)
+            if sub is None:
+                break
+            command = json.loads(sub["index"])
+            used, positional, options_done = set(), 0, False
+        else:
+            positional += 1
+    return command, used, positional
+
+
+def _is_incomplete_option(args: list[str], option: dict[str, Any]) -> bool:
+    """Return whether the arguments end in an option that needs a value."""
+    if not _takes_value(option):
+        return False
+    for index, arg in enumerate(reversed(args)):
+        if index + 1 > option["nargs"]:
+            break
+        if _is_option(arg):
+            return arg in option["opts"]
+    return False
+
+
+def _value_completions(
+    param: dict[str, Any], incomplete: str
+) -> list[Completion] | None:
+    """Return the completions of the value of a parameter."""
+    if param["custom_complete"]:
+        return None
+    param_type = param["type"] or {}
+    kind = param_type.get("kind")
+    if kind == "choice":
+        choices: list[str] = param_type["choices"]
+        if param_type["case_sensitive"]:
+            return [("plain", c, None) for c in choices if c.startswith(incomplete)]
+        lower = incomplete.lower()
+        return [("plain", c, None) for c in choices if c.lower().startswith(lower)]
+    if kind == "path":
+        dir_only = param_type["dir_okay"] and not param_type["file_okay"]
+        return [("dir" if dir_only else "file", incomplete, None)]
+    if kind == "file":
+        return [("file", incomplete, None)]
+    return []
+
+
+def _command_completions(
+    command: dict[str, Any], used: set[str], incomplete: str
+) -> list[Completion]:
+    """Return the completions of subcommand and option names."""
+    found: list[Completion] = []
+    if "commands" in command:
+        aliases = (a for sub in command["commands"].values() for a in sub["aliases"])
+        for name in sorted({*command["commands"], *aliases}):
+            sub = _subcommand(command, name)
+            if name.startswith(incomplete) and sub and not sub["hidden"]:
+                found.append(("plain", name, sub["short_help_str"]))
+
+    if incomplete and not incomplete[0].isalnum():
+        for option in _options(command):
+            if option["hidden"] or (not option["multiple"] and option["name"] in used):
+                continue
+            found.extend(
+                ("plain", name, option["help"])
+                for name in [*option["opts"], *option["secondary_opts"]]
+                if name.startswith(incomplete)
+            )
+    return found
+
+
+def completions(
+    command: dict[str, Any], args: list[str], incomplete: str
+) -> list[Completion] | None:
+    """
+    Return the completions of an incomplete word from a command index.
+
+    :param command:
+        The description of the program's command in the index.
+    :param args:
+        The complete arguments after the program name.
+    :param incomplete:
+        The word being completed, which may be empty.
+
+    :returns:
+        The type, value and help of every completion, or ``None`` if the
+        index can not answer, such as for custom completion functions.
+    :rtype: list[tuple[str, str, str | None]] | None
+    """
+    args = list(args)
+    if incomplete == "=":
+        incomplete = ""
+    elif "=" in incomplete and _is_option(incomplete):
+        name, _, incomplete = incomplete.partition("=")
+        args.append(name)
+
+    walked = _walk(command, args)
+    if walked is None:
+        return None
+    command, used, positional = walked
+
+    if "--" not in args and _is_option(incomplete):
+        return _command_completions(command, used, incomplete)
+
+    for option in _options(command):
+        if _is_incomplete_option(args, option):
+            return _value_completions(option, incomplete)
+
+    for argument in command["params"]:
+        if argument["param_type"] != "argument":
+            continue
+        if argument["nargs"] == -1 or positional < argument["nargs"]:
+            return _value_completions(argument, incomplete)
+        positional -= argument["nargs"]
+
+    return _command_completions(command, used, incomplete)
+
+
+def shell_completions(command: dict[str, Any], shell: str) -> str | None:
+    """
+    Return the completions the shell asked for, formatted for the shell.
+
+    :param command:
+        The description of the program's command in the index.
+    :param shell:
+        The shell, one of ``SHELLS``.
+
+    :returns:
+        The formatted completions, or ``None`` if the index can not answer.
+    :rtype: str | None
+    """
+    args, incomplete = completion_args(shell)
+    found = completions(command, args, incomplete)
+    if found is None:
+        return None
+    return "\n".join(format_completion(shell, c) for c in found)
+
+
+def complete(
+    prog_name: str | None = None,
+    complete_var: str | None = None,
+    cache_dir: str | Path | None = None,
+) -> None:
+    """
+    Answer the shell from the completion index and exit, if it asks.
+
+    Returns without doing anything when the program is not run by the
+    completion script of a shell, when the index is missing or stale, or
+    when the index can not answer.
+
+    :param prog_name:
+        The name of the program, detected like Click does if not given.
+    :param complete_var:
+        The environment variable the shell asks the program to complete
+        in, ``_{PROG_NAME}_COMPLETE`` if not given.
+    :param cache_dir:
+        The directory of the index, when the group passes one to
+        ``use_manifest``.
+    """
+    complete_var = complete_var or complete_var_name(prog_name or program_name())
+    shell, _, action = os.environ.get(complete_var, "").partition("_")
+    if action != "complete" or shell not in SHELLS:
+        return
+
+    data = read_manifest(index_path(complete_var, cache_dir))
+    if data is None:
+        return
+    output = shell_completions(data["command"], shell)
+    if output is None:
+        return
+    sys.stdout.buffer.write(f"{output}\n".encode())
+    sys.stdout.flush()
+    sys.exit(0)
+
+
+__all__ = [
+    "complete",
+    "completions",
+    "default_cache_dir",
+    "index_path",
+    "is_fresh",
+    "read_manifest",
+]
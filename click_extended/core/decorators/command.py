@@ -8,6 +8,7 @@ import click
 
 from click_extended.core.nodes._root_node import RootNode
 from click_extended.core.other._click_command import ClickCommand
+from click_extended.core.other.settings import Settings
 
 
 class Command(RootNode):
@@ -55,6 +56,7 @@ def command(
     *,
     aliases: str | list[str] | None = None,
     help: str | None = None,
+    settings: Settings | None = None,
     **kwargs: Any,
 ) -> Callable[[Callable[..., Any]], ClickCommand]:
     r"""
@@ -67,6 +69,8 @@ def command(
         string or a list of strings.
     :param help: The help message for the command. If not provided,
         uses the first line of the function's docstring.
+    :param settings: The runtime settings of the command, such as
+        ``Settings(strict_types=False)``. Defaults to ``Settings()``.
     :param \*\*kwargs: Additional arguments to pass to ``click.Command``.
 
     :returns: A decorator function that returns a Click command.
@@ -76,6 +80,8 @@ def command(
         kwargs["aliases"] = aliases
     if help is not None:
         kwargs["help"] = help
+    if settings is not None:
+        kwargs["settings"] = settings
 
     def decorator(func: Callable[..., Any]) -> ClickCommand:
         if help is None and func.__doc__:
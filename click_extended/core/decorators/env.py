@@ -4,12 +4,11 @@
 # pylint: disable=too-many-arguments
 # pylint: disable=too-many-positional-arguments
 # pylint: disable=redefined-builtin
+# pylint: disable=import-outside-toplevel
 
 import os
 from typing import Any, Callable, ParamSpec, TypeVar, cast
 
-from dotenv import load_dotenv
-
 from click_extended.core.nodes.parent_node import ParentNode
 from click_extended.core.other.context import Context
 from click_extended.utils.casing import Casing
@@ -23,6 +22,8 @@ T = TypeVar("T")
 class Env(ParentNode):
     """`ParentNode` that loads a value from an environment variable."""
 
+    independent = True
+
     def load(self, context: Context, *args: Any, **kwargs: Any) -> Any:
         r"""
         Load and return the environment variable value.
@@ -45,6 +46,8 @@ class Env(ParentNode):
         """
         global _DOTENV_LOADED
         if not _DOTENV_LOADED:
+            from dotenv import load_dotenv
+
             load_dotenv()
             _DOTENV_LOADED = True
 
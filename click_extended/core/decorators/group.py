@@ -4,6 +4,7 @@
 # pylint: disable=redefined-builtin
 # pylint: disable=too-many-locals
 # pylint: disable=too-many-branches
+# pylint: disable=too-many-arguments
 
 from typing import Any, Callable
 
@@ -11,6 +12,7 @@ import click
 
 from click_extended.core.nodes._root_node import RootNode
 from click_extended.core.other._click_group import ClickGroup
+from click_extended.core.other.settings import Settings
 
 
 class Group(RootNode):
@@ -73,6 +75,7 @@ def group(
     help: str | None = None,
     invoke_on_subcommand: bool = True,
     invoke_without_command: bool | None = None,
+    settings: Settings | None = None,
     **kwargs: Any,
 ) -> Callable[[Callable[..., Any]], ClickGroup]:
     r"""
@@ -94,6 +97,8 @@ def group(
         without a subcommand. Defaults to ``None`` (Click's default behavior
         of requiring a subcommand). When ``True``, the group can be called
         directly without specifying a subcommand.
+    :param settings: The runtime settings of the group, such as
+        ``Settings(strict_types=False)``. Defaults to ``Settings()``.
     :param \*\*kwargs: Additional arguments to pass to ``click.Group``.
 
     :returns: A decorator function that returns a ClickGroup.
@@ -106,6 +111,8 @@ def group(
     kwargs["invoke_on_subcommand"] = invoke_on_subcommand
     if invoke_without_command is not None:
         kwargs["invoke_without_command"] = invoke_without_command
+    if settings is not None:
+        kwargs["settings"] = settings
 
     def decorator(func: Callable[..., Any]) -> ClickGroup:
         if help is None and func.__doc__:
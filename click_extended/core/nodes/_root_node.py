@@ -12,15 +12,17 @@
 # pylint: disable=line-too-long
 
 import asyncio
+import inspect
 import sys
+import threading
 import traceback
+from concurrent.futures import Executor
 from functools import wraps
 from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast, get_type_hints
 
 import click
 from click.utils import echo
 
-from click_extended.core.decorators.env import Env
 from click_extended.core.decorators.tag import Tag
 from click_extended.core.nodes.argument_node import ArgumentNode
 from click_extended.core.nodes.child_validation_node import ChildValidationNode
@@ -28,6 +30,7 @@ from click_extended.core.nodes.node import Node
 from click_extended.core.nodes.option_node import OptionNode
 from click_extended.core.other._tree import Tree
 from click_extended.core.other.context import Context
+from click_extended.core.other.settings import Settings
 from click_extended.errors import (
     ContextAwareError,
     NameExistsError,
@@ -36,11 +39,19 @@ from click_extended.errors import (
     UnhandledTypeError,
 )
 from click_extended.utils.humanize import humanize_type
+from click_extended.utils.offload import (
+    create_executor,
+    run_in_executor,
+)
 from click_extended.utils.process import (
-    check_has_async_handlers,
-    process_children,
-    process_children_async,
+    compile_children,
+    is_offloaded_load,
+    run_chains,
 )
+from click_extended.utils.profile import Profiler, get_profile_setting, measure
+from click_extended.utils.run_state import RunState, get_run_state, use_run_state
+from click_extended.utils.scope import enter_task_scope
+from click_extended.utils.trace import Tracer, get_trace_path, span
 
 if TYPE_CHECKING:
     from click_extended.core.nodes.child_node import ChildNode
@@ -65,14 +76,37 @@ class RootNode(Node):
         :param name: The name of the node.
         :param \*args: Additional positional arguments (stored but not passed to Node).
         :param \*\*kwargs: Additional keyword arguments (stored but not passed to Node).
-            May include 'aliases' for command/group aliases.
+            May include 'aliases' for command/group aliases and 'settings'
+            for the runtime ``Settings``.
         """
         super().__init__(name=name, children={})
         self.aliases = kwargs.pop("aliases", None)
+        self.settings: Settings = kwargs.pop("settings", None) or Settings()
+        self._executor: Executor | None = None
+        self._executor_lock = threading.Lock()
         self.tree = Tree()
         self.extra_args = args
         self.extra_kwargs = kwargs
 
+    def get_executor(self) -> Executor | None:
+        """
+        Get the executor blocking calls of this command run in.
+
+        The executor is created on first use and shared by every invocation
+        of the command.
+
+        :returns: The executor, or ``None`` if no executor is configured.
+        :rtype: Executor | None
+        """
+        kind = self.settings.executor
+        if kind is None:
+            return None
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = create_executor(kind, self.settings.max_workers)
+        return self._executor
+
     def format_name_with_aliases(self) -> str:
         """
         Format the node name with its aliases for display.
@@ -254,8 +288,16 @@ class RootNode(Node):
             @wraps(func)
             def wrapper(*call_args: Any, **call_kwargs: Any) -> Any:
                 """
-                Wrapper that executes the initialization phases
-                and injects values into the function.
+                Wrapper that runs the invocation with its own ``RunState``,
+                so invocations from several threads do not share values.
+                """
+                with use_run_state(RunState()):
+                    return run(*call_args, **call_kwargs)
+
+            def run(*call_args: Any, **call_kwargs: Any) -> Any:
+                """
+                Execute the initialization phases and inject values into
+                the function.
 
                 Phases:
                 1. **Collection**: Already done (decorators applied).
@@ -264,77 +306,80 @@ class RootNode(Node):
                 4. **Runtime**: Process parameters and execute function.
                 """
                 from click_extended.hooks import HookPhase, run_hook_phase
+                from click_extended.hooks.hook_registry import get_registry
 
                 context = click.get_current_context()
                 custom_context: Context | None = None
                 hook_error: BaseException | None = None
+                trace_path = get_trace_path()
+                tracer = Tracer() if trace_path else None
 
                 if not context.meta.get("click_extended_exit_hook_registered"):
 
                     def on_close() -> None:
-                        run_hook_phase(
-                            HookPhase.EXIT,
-                            context,
-                            root,
-                            context=custom_context,
-                            exception=hook_error,
-                        )
+                        exit_meta = context.meta.get("click_extended", {})
+                        exit_tracer = exit_meta.get("tracer")
+                        exit_state = exit_meta.get("run_state") or RunState()
+
+                        with (
+                            use_run_state(exit_state),
+                            span(exit_tracer, "exit", "phase"),
+                        ):
+                            run_hook_phase(
+                                HookPhase.EXIT,
+                                context,
+                                root,
+                                context=custom_context,
+                                exception=hook_error,
+                            )
+
+                        exit_profiler = exit_meta.get("profiler")
+                        exit_path = exit_meta.get("profile_path")
+                        if exit_profiler is not None and exit_path:
+                            exit_profiler.dump(exit_path)
+                        if exit_tracer is not None:
+                            exit_tracer.dump(exit_meta["trace_path"])
 
                     context.call_on_close(on_close)
                     context.meta["click_extended_exit_hook_registered"] = True
 
-                run_hook_phase(HookPhase.BOOT, context, root, context=None)
+                with span(tracer, "boot", "phase"):
+                    run_hook_phase(HookPhase.BOOT, context, root, context=None)
                 try:
                     # Phase 1: Collection
                     # Phase 2: Context
-                    Tree.initialize_context(context, root)
+                    with span(tracer, "initialize_context", "phase"):
+                        Tree.initialize_context(context, root)
+
+                    context.meta["click_extended"]["run_state"] = get_run_state()
+
+                    if tracer is not None:
+                        context.meta["click_extended"]["tracer"] = tracer
+                        context.meta["click_extended"]["trace_path"] = trace_path
+
+                    profiling, profile_path = get_profile_setting()
+                    if root.settings.profile or profiling:
+                        context.meta["click_extended"]["profiler"] = Profiler()
+                        context.meta["click_extended"]["profile_path"] = profile_path
 
                     # Phase 3: Validation
-                    root.tree.validate_and_build(context)
+                    with span(tracer, "validate_and_build", "phase"):
+                        root.tree.validate_and_build(context)
 
                     # Phase 4: Runtime
-                    if root.tree.root is None:
+                    plan = root.tree.get_plan()
+                    if root.tree.root is None or plan is None:
                         raise NoRootError()
 
                     parent_values: dict[str, Any] = {}
 
-                    all_tag_names: set[str] = set()
-                    for parent_node in root.tree.root.children.values():
-                        if isinstance(
-                            parent_node,
-                            (OptionNode, ArgumentNode, type(parent_node)),
-                        ):
-                            tags = parent_node.tags  # type: ignore
-                            all_tag_names.update(tags)  # type: ignore
-
-                    tags_dict: dict[str, "Tag"] = {}
-                    for tag_name, tag in root.tree.tags.items():
-                        tags_dict[tag_name] = tag
-                        tag.parent_nodes = []
-
-                    for tag_name in all_tag_names:
-                        if tag_name not in tags_dict:
-                            auto_tag = Tag(name=tag_name)
-                            tags_dict[tag_name] = auto_tag
-                            auto_tag.parent_nodes = []
-
-                    for parent_node in root.tree.root.children.values():
-                        if isinstance(
-                            parent_node,
-                            (OptionNode, ArgumentNode, type(parent_node)),
-                        ):
-                            parent_node = cast("ParentNode", parent_node)
-                            p_tags = parent_node.tags
-                            for tag_name in p_tags:
-                                if tag_name in tags_dict:
-                                    tags_dict[tag_name].parent_nodes.append(parent_node)
-
                     meta = context.meta.get("click_extended", {})
+                    profiler: Profiler | None = meta.get("profiler")
 
-                    missing_env_vars: list[str] = []
-                    for parent_node in root.tree.root.children.values():
-                        if isinstance(parent_node, Env):
-                            missing_var = parent_node.check_required()
+                    with span(tracer, "env", "phase"):
+                        missing_env_vars: list[str] = []
+                        for env_node in plan.envs:
+                            missing_var = env_node.check_required()
                             if missing_var:
                                 missing_env_vars.append(missing_var)
 
@@ -362,92 +407,73 @@ class RootNode(Node):
 
                         raise ProcessError(error_msg)
 
-                    meta = context.meta.get("click_extended", {})
-
-                    parents: dict[str, "ParentNode"] = {}
-                    for name, node in root.tree.root.children.items():
-                        if isinstance(name, str):
-                            parents[name] = cast("ParentNode", node)
-
                     custom_context = Context(
                         root=root,
                         parent=None,
                         current=root,
                         click_context=context,
-                        nodes={},
-                        parents=parents,
+                        nodes=plan.nodes,
+                        parents=plan.parents,
                         tags=root.tree.tags,
                         children={},
                         data=meta.get("data", {}),
                         debug=meta.get("debug", False),
+                        index=meta.get("parent_index"),
                     )
 
-                    run_hook_phase(
-                        HookPhase.INIT,
-                        context,
-                        root,
-                        context=custom_context,
-                    )
-
-                    for validation_node in root.tree.validations:
-                        validation_node.on_init(
-                            custom_context,
-                            *validation_node.process_args,
-                            **validation_node.process_kwargs,
+                    with span(tracer, "init", "phase"):
+                        run_hook_phase(
+                            HookPhase.INIT,
+                            context,
+                            root,
+                            context=custom_context,
                         )
 
-                    assert root.tree.root is not None
-                    needs_async = False
-                    for parent_node in root.tree.root.children.values():
-                        if isinstance(parent_node, (OptionNode, ArgumentNode, Env)):
-                            if parent_node.children and check_has_async_handlers(
-                                parent_node.children
-                            ):
-                                needs_async = True
-                                break
+                        for validation_node in root.tree.validations:
+                            validation_node.on_init(
+                                custom_context,
+                                *validation_node.process_args,
+                                **validation_node.process_kwargs,
+                            )
 
-                    if not needs_async:
-                        for tag in root.tree.tags.values():
-                            if tag.children and check_has_async_handlers(tag.children):
-                                needs_async = True
-                                break
+                    assert root.tree.root is not None
+                    executor = root.get_executor()
+                    if executor is not None:
+                        meta["executor"] = executor
 
-                    if needs_async:
+                    if plan.is_async:
 
                         async def async_processing() -> dict[str, Any]:
                             """Process all handlers asynchronously."""
                             assert root.tree.root is not None
                             async_parent_values: dict[str, Any] = {}
 
-                            # Phase 1
-                            loaded_async_parents: dict[
-                                str, tuple[Any, "ParentNode"]
-                            ] = {}
-
-                            for (
-                                parent_name,
-                                parent_node,
-                            ) in root.tree.root.children.items():
-                                if isinstance(parent_name, str):
-                                    raw_value = None
-                                    was_provided = False
+                            async def load_parent(
+                                parent_name: str,
+                                parent_node: Any,
+                            ) -> tuple[Any, "ParentNode"]:
+                                """Load the raw value of a single parent."""
+                                raw_value = None
+                                was_provided = False
 
-                                    if isinstance(
-                                        parent_node, (OptionNode, ArgumentNode)
-                                    ):
-                                        raw_value = call_kwargs.get(parent_name)
-                                        was_provided = (
-                                            parent_name in call_kwargs
-                                            and raw_value != parent_node.default
-                                        )
-                                        parent_node.was_provided = was_provided
+                                if isinstance(parent_node, (OptionNode, ArgumentNode)):
+                                    raw_value = call_kwargs.get(parent_name)
+                                    was_provided = (
+                                        parent_name in call_kwargs
+                                        and raw_value != parent_node.default
+                                    )
+                                    parent_node.was_provided = was_provided
 
-                                        Tree.update_scope(
-                                            context,
-                                            "parent",
-                                            parent_node=parent_node,
-                                        )
+                                    Tree.update_scope(
+                                        context,
+                                        "parent",
+                                        parent_node=parent_node,
+                                    )
 
+                                    with (
+                                        measure(profiler, "loads", parent_name),
+                                        span(tracer, parent_name, "parent"),
+                                    ):
                                         if asyncio.iscoroutinefunction(
                                             parent_node.load
                                         ):
@@ -462,127 +488,170 @@ class RootNode(Node):
                                                 custom_context,
                                                 **parent_node.decorator_kwargs,
                                             )
-                                    else:
-                                        parent_node = cast("ParentNode", parent_node)
+                                else:
+                                    parent_node = cast("ParentNode", parent_node)
 
-                                        Tree.update_scope(
-                                            context,
-                                            "parent",
-                                            parent_node=parent_node,
-                                        )
+                                    Tree.update_scope(
+                                        context,
+                                        "parent",
+                                        parent_node=parent_node,
+                                    )
 
-                                        raw_value = (
-                                            await parent_node.load(
+                                    with (
+                                        measure(profiler, "loads", parent_name),
+                                        span(tracer, parent_name, "parent"),
+                                    ):
+                                        if asyncio.iscoroutinefunction(
+                                            parent_node.load
+                                        ):
+                                            raw_value = await parent_node.load(
                                                 custom_context,
                                                 **parent_node.decorator_kwargs,
                                             )
-                                            if asyncio.iscoroutinefunction(
-                                                parent_node.load
+                                        elif is_offloaded_load(
+                                            parent_node, executor is not None
+                                        ):
+                                            raw_value = await run_in_executor(
+                                                parent_node.load,
+                                                (custom_context,),
+                                                parent_node.decorator_kwargs,
+                                                executor,
                                             )
-                                            else parent_node.load(
+                                        else:
+                                            raw_value = parent_node.load(
                                                 custom_context,
                                                 **parent_node.decorator_kwargs,
                                             )
-                                        )
-                                        was_provided = raw_value is not None
-                                        parent_node.was_provided = was_provided
-
-                                    inject_name = parent_node.param
-                                    parent_node.raw_value = raw_value
-                                    parent_node.cached_value = raw_value
-
-                                    loaded_async_parents[parent_name] = (
-                                        raw_value,
-                                        parent_node,
-                                    )
+                                    was_provided = raw_value is not None
+                                    parent_node.was_provided = was_provided
 
-                            # Phase 2
-                            for parent_name, (
-                                raw_value,
-                                parent_node,
-                            ) in loaded_async_parents.items():
-                                inject_name = parent_node.param
+                                parent_node.raw_value = raw_value
+                                parent_node.cached_value = raw_value
+                                return raw_value, parent_node
+
+                            async def load_isolated(
+                                parent_name: str, parent_node: Any
+                            ) -> tuple[bool, Any, dict[str, Any]]:
+                                """Load a parent in its own task scope."""
+                                scope = enter_task_scope()
+                                try:
+                                    loaded = await load_parent(parent_name, parent_node)
+                                except Exception as e:
+                                    return False, e, scope
+                                return True, loaded, scope
+
+                            with span(tracer, "loads", "phase"):
+                                # Phase 1
+                                loaded_async_parents: dict[
+                                    str, tuple[Any, "ParentNode"]
+                                ] = {}
+
+                                for batch in plan.load_batches:
+                                    if len(batch) == 1:
+                                        name, node = batch[0]
+                                        loaded_async_parents[name] = await load_parent(
+                                            name, node
+                                        )
+                                        continue
 
-                                if parent_node.children:
-                                    Tree.update_scope(
-                                        context,
-                                        "parent",
-                                        parent_node=parent_node,
+                                    outcomes = await asyncio.gather(
+                                        *(
+                                            load_isolated(name, node)
+                                            for name, node in batch
+                                        )
                                     )
-
-                                    processed_value = await process_children_async(
-                                        raw_value,
-                                        parent_node.children,
-                                        parent_node,
-                                        tags_dict,
-                                        context,
+                                    for (name, _), (ok, result, scope) in zip(
+                                        batch, outcomes
+                                    ):
+                                        if not ok:
+                                            # Report the error with the scope
+                                            # of the parent that failed.
+                                            meta.update(scope)
+                                            raise result
+                                        loaded_async_parents[name] = result
+
+                                plan.index.reset_provided()
+
+                            with span(tracer, "children", "phase"):
+                                # Phase 2
+                                chains = [
+                                    (parent_node, raw_value)
+                                    for raw_value, parent_node in (
+                                        loaded_async_parents.values()
                                     )
-                                    async_parent_values[inject_name] = processed_value
-                                    parent_node.cached_value = processed_value
-                                else:
-                                    async_parent_values[inject_name] = raw_value
-
-                            for tag in root.tree.tags.values():
-                                if tag.children:
-                                    tag_values_dict = {
-                                        p.name: (p.get_value())  # type: ignore
-                                        for p in tag.parent_nodes
-                                    }
+                                    if parent_node.children
+                                ]
+                                processed_values = await run_chains(
+                                    chains, context, root.settings.chain_concurrency
+                                )
 
-                                    await process_children_async(
-                                        tag_values_dict,
-                                        tag.children,
-                                        tag,
-                                        tags_dict,
-                                        context,
-                                    )
+                                for (
+                                    raw_value,
+                                    parent_node,
+                                ) in loaded_async_parents.values():
+                                    inject_name = parent_node.param
 
-                            for validation_node in root.tree.validations:
-                                if asyncio.iscoroutinefunction(
-                                    validation_node.on_finalize
-                                ):
-                                    await validation_node.on_finalize(
-                                        custom_context,
-                                        *validation_node.process_args,
-                                        **validation_node.process_kwargs,
-                                    )
-                                else:
-                                    validation_node.on_finalize(
-                                        custom_context,
-                                        *validation_node.process_args,
-                                        **validation_node.process_kwargs,
-                                    )
+                                    if parent_node in processed_values:
+                                        processed_value = processed_values[parent_node]
+                                        async_parent_values[inject_name] = (
+                                            processed_value
+                                        )
+                                        parent_node.cached_value = processed_value
+                                    else:
+                                        async_parent_values[inject_name] = raw_value
+
+                            with span(tracer, "tags", "phase"):
+                                for tag in root.tree.tags.values():
+                                    if tag.children:
+                                        tag_values_dict = {
+                                            p.name: (p.get_value())  # type: ignore
+                                            for p in tag.parent_nodes
+                                        }
+
+                                        await compile_children(
+                                            tag.children, tag
+                                        ).run_async(tag_values_dict, context)
+
+                            with span(tracer, "validations", "phase"):
+                                for validation_node in plan.validations:
+                                    with (
+                                        measure(
+                                            profiler,
+                                            "validations",
+                                            validation_node.name,
+                                        ),
+                                        span(
+                                            tracer, validation_node.name, "validation"
+                                        ),
+                                    ):
+                                        finalized = validation_node.on_finalize(
+                                            custom_context,
+                                            *validation_node.process_args,
+                                            **validation_node.process_kwargs,
+                                        )
+                                        if inspect.isawaitable(finalized):
+                                            await finalized
 
                             return async_parent_values
 
-                        try:
-                            parent_values = asyncio.run(async_processing())
-                        except RuntimeError as e:
-                            if "already running" in str(e).lower():
-                                raise ProcessError(
-                                    "Cannot use async handlers in an existing "
-                                    "event loop (e.g., Jupyter notebooks).",
-                                    tip="Use synchronous handlers instead, or "
-                                    "run your CLI outside of async contexts.",
-                                ) from e
-                            raise
+                        parent_values = get_registry().run_coroutine(async_processing())
                     else:
-                        # Phase 1
-                        loaded_parents: dict[str, tuple[Any, "ParentNode"]] = {}
-
-                        for (
-                            parent_name,
-                            parent_node,
-                        ) in root.tree.root.children.items():
-                            if isinstance(parent_name, str):
+                        with span(tracer, "loads", "phase"):
+                            # Phase 1
+                            loaded_parents: dict[str, tuple[Any, "ParentNode"]] = {}
+
+                            for parent_name, parent_node, from_argv in plan.loads:
                                 raw_value = None
                                 was_provided = False
 
-                                if isinstance(parent_node, (OptionNode, ArgumentNode)):
+                                if from_argv:
+                                    argv_node = cast(
+                                        "OptionNode | ArgumentNode", parent_node
+                                    )
                                     raw_value = call_kwargs.get(parent_name)
                                     was_provided = (
                                         parent_name in call_kwargs
-                                        and raw_value != parent_node.default
+                                        and raw_value != argv_node.default
                                     )
                                     parent_node.was_provided = was_provided
 
@@ -592,24 +661,30 @@ class RootNode(Node):
                                         parent_node=parent_node,
                                     )
 
-                                    raw_value = parent_node.load(
-                                        raw_value,
-                                        custom_context,
-                                        **parent_node.decorator_kwargs,
-                                    )
+                                    with (
+                                        measure(profiler, "loads", parent_name),
+                                        span(tracer, parent_name, "parent"),
+                                    ):
+                                        raw_value = argv_node.load(
+                                            raw_value,
+                                            custom_context,
+                                            **parent_node.decorator_kwargs,
+                                        )
                                 else:
-                                    parent_node = cast("ParentNode", parent_node)
-
                                     Tree.update_scope(
                                         context,
                                         "parent",
                                         parent_node=parent_node,
                                     )
 
-                                    raw_value = parent_node.load(
-                                        custom_context,
-                                        **parent_node.decorator_kwargs,
-                                    )
+                                    with (
+                                        measure(profiler, "loads", parent_name),
+                                        span(tracer, parent_name, "parent"),
+                                    ):
+                                        raw_value = parent_node.load(
+                                            custom_context,
+                                            **parent_node.decorator_kwargs,
+                                        )
                                     was_provided = raw_value is not None
                                     parent_node.was_provided = was_provided
 
@@ -622,77 +697,58 @@ class RootNode(Node):
                                     parent_node,
                                 )
 
-                        # Phase 2
-                        for parent_name, (
-                            raw_value,
-                            parent_node,
-                        ) in loaded_parents.items():
-                            inject_name = parent_node.param
-
-                            if parent_node.children:
-                                Tree.update_scope(
-                                    context,
-                                    "parent",
-                                    parent_node=parent_node,
-                                )
+                            plan.index.reset_provided()
 
-                                processed_value = process_children(
-                                    raw_value,
-                                    parent_node.children,
-                                    parent_node,
-                                    tags_dict,
-                                    context,
-                                )
-                                parent_values[inject_name] = processed_value
-                                parent_node.cached_value = processed_value
-                            else:
-                                parent_values[inject_name] = raw_value
-
-                        for tag_name, tag in root.tree.tags.items():
-                            if tag.children:
-                                tag_values_dict = {
-                                    parent_node.name: parent_node.get_value()
-                                    for parent_node in tag.parent_nodes
-                                }
-
-                                process_children(
-                                    tag_values_dict,
-                                    tag.children,
-                                    tag,
-                                    tags_dict,
-                                    context,
-                                )
+                        with span(tracer, "children", "phase"):
+                            # Phase 2
+                            for parent_name, (
+                                raw_value,
+                                parent_node,
+                            ) in loaded_parents.items():
+                                inject_name = parent_node.param
 
-                    catch_nodes = [
-                        v
-                        for v in root.tree.validations
-                        if v.__class__.__name__ == "Catch"
-                    ]
-                    other_nodes = [
-                        v
-                        for v in root.tree.validations
-                        if v.__class__.__name__ != "Catch"
-                    ]
-                    root.tree.validations = catch_nodes + other_nodes
-
-                    for i, validation_node in enumerate(root.tree.validations):
-                        if validation_node.__class__.__name__ == "Catch":
-                            if hasattr(validation_node, "remaining_validations"):
-                                validation_node.remaining_validations = (  # type: ignore
-                                    root.tree.validations[i + 1 :]
-                                )
-                            validation_node.on_finalize(
-                                custom_context,
-                                *validation_node.process_args,
-                                **validation_node.process_kwargs,
-                            )
-                            break
+                                if parent_node.children:
+                                    Tree.update_scope(
+                                        context,
+                                        "parent",
+                                        parent_node=parent_node,
+                                    )
 
-                        validation_node.on_finalize(
-                            custom_context,
-                            *validation_node.process_args,
-                            **validation_node.process_kwargs,
-                        )
+                                    processed_value = compile_children(
+                                        parent_node.children, parent_node
+                                    ).run(raw_value, context)
+                                    parent_values[inject_name] = processed_value
+                                    parent_node.cached_value = processed_value
+                                else:
+                                    parent_values[inject_name] = raw_value
+
+                        with span(tracer, "tags", "phase"):
+                            for tag in root.tree.tags.values():
+                                if tag.children:
+                                    tag_values_dict = {
+                                        parent_node.name: parent_node.get_value()
+                                        for parent_node in tag.parent_nodes
+                                    }
+
+                                    compile_children(tag.children, tag).run(
+                                        tag_values_dict, context
+                                    )
+
+                        with span(tracer, "validations", "phase"):
+                            for validation_node in plan.validations:
+                                with (
+                                    measure(
+                                        profiler, "validations", validation_node.name
+                                    ),
+                                    span(tracer, validation_node.name, "validation"),
+                                ):
+                                    finalized = validation_node.on_finalize(
+                                        custom_context,
+                                        *validation_node.process_args,
+                                        **validation_node.process_kwargs,
+                                    )
+                                    if inspect.isawaitable(finalized):
+                                        get_registry().run_coroutine(finalized)
 
                     merged_kwargs: dict[str, Any] = {
                         **call_kwargs,
@@ -708,7 +764,8 @@ class RootNode(Node):
                     ):
                         return None
 
-                    return func(*call_args, **merged_kwargs)
+                    with span(tracer, "function", "phase"):
+                        return func(*call_args, **merged_kwargs)
                 except ContextAwareError as e:
                     hook_error = e
                     run_hook_phase(
@@ -1028,6 +1085,7 @@ class RootNode(Node):
                 ]
 
         kwargs.pop("invoke_on_subcommand", None)
+        kwargs.pop("settings", None)
 
         click_cls = cls._get_click_cls()
         params = getattr(func, "__click_params__", [])
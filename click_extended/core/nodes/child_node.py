@@ -2,7 +2,7 @@
 
 # pylint: disable=too-many-public-methods
 
-from abc import ABC
+from abc import ABC, ABCMeta
 from datetime import date, datetime, time
 from decimal import Decimal
 from pathlib import Path
@@ -18,7 +18,29 @@ if TYPE_CHECKING:
     from click_extended.types import Decorator
 
 
-class ChildNode(Node, ABC):
+class ChildNodeMeta(ABCMeta):
+    """
+    Metaclass for ``ChildNode`` that tracks changes to handler methods.
+
+    Handler lookups are compiled once per class by the dispatcher, so
+    assigning or deleting a ``handle_*`` attribute on any child class after
+    it has been created bumps ``handler_generation`` to invalidate them.
+    """
+
+    handler_generation: int = 0
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name.startswith("handle_"):
+            ChildNodeMeta.handler_generation += 1
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if name.startswith("handle_"):
+            ChildNodeMeta.handler_generation += 1
+
+
+class ChildNode(Node, ABC, metaclass=ChildNodeMeta):
     """
     Base class for child nodes with type-specific handlers. Child nodes
     process values through handler methods based on value type.
@@ -33,8 +55,21 @@ class ChildNode(Node, ABC):
 
     If a value is passed to the child in which it has not implemented a
     relevant handler, an `UnhandledTypeError` exception is raised.
+
+    Set `max_concurrency` on a subclass to process the values of a container
+    tuple (from `multiple=True` or `nargs>1`) concurrently with async
+    handlers, with at most that many handler calls running at once.
+
+    Set `offload` to `True` on a subclass whose sync handlers block on I/O
+    to run them in a worker thread when the command is processed
+    asynchronously, so the children of other parents keep running in the
+    meantime. With `max_concurrency`, the values of a container tuple are
+    then also processed concurrently.
     """
 
+    max_concurrency: int | None = None
+    offload: bool = False
+
     def __init__(
         self,
         name: str,
@@ -58,6 +93,11 @@ class ChildNode(Node, ABC):
         self.process_args = process_args or ()
         self.process_kwargs = process_kwargs or {}
 
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {self.max_concurrency}."
+            )
+
     def handle_none(self, context: "Context", *args: Any, **kwargs: Any) -> Any:
         r"""
         Handle None values explicitly.
@@ -271,6 +311,39 @@ class ChildNode(Node, ABC):
         """
         raise NotImplementedError
 
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: "Context",
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        r"""
+        Handle all values of a container tuple in a single call.
+
+        Called instead of the element handlers for tuples from options and
+        arguments with ``multiple=True`` or ``nargs>1``. Nested tuples are
+        passed one inner tuple at a time. If element handlers are also
+        implemented, ``handle_batch`` is only called when every value is
+        routed to one of them.
+
+        To report the index of a failing value, raise a ``BatchItemError``
+        with its position in ``values`` and the ``ValueError`` or
+        ``TypeError`` of the value. Other errors are reported for the tuple
+        as a whole.
+
+        Can be implemented as sync or async.
+
+        :param values: The values of the container tuple.
+        :param context: Information about the current context.
+        :param \*args: Additional positional arguments from decorator.
+        :param \*\*kwargs: Additional keyword arguments from decorator.
+
+        :returns: The processed values with the same length as ``values``,
+            or ``None`` to pass through unchanged.
+        """
+        return None
+
     def handle_tag(
         self,
         value: dict[str, Any],
@@ -419,4 +492,4 @@ class ChildNode(Node, ABC):
         return decorator
 
 
-__all__ = ["ChildNode"]
+__all__ = ["ChildNode", "ChildNodeMeta"]
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Any, Callable, ParamSpec, TypeVar, cast
 
 from click_extended.core.nodes.node import Node
 from click_extended.core.other._tree import Tree
+from click_extended.utils.run_state import get_run_state
 
 if TYPE_CHECKING:
     from click_extended.core.nodes._root_node import RootNode
@@ -24,9 +25,15 @@ T = TypeVar("T")
 class ParentNode(Node, ABC):
     """
     Abstract base class for nodes that manage child nodes and inject values.
+
+    Set `independent` to `True` on a subclass whose `load` never reads
+    other nodes through the context, such as with `context.get_parent()`.
+    Its async loads, and its sync loads when they are offloaded, then run
+    concurrently with the loads of other independent parents.
     """
 
     parent: "RootNode"
+    independent: bool = False
 
     def __init__(
         self,
@@ -66,12 +73,80 @@ class ParentNode(Node, ABC):
         else:
             self.tags = list(tags)
 
-        self.was_provided: bool = False
-        self.raw_value: Any = None
-        self.cached_value: Any = None
+        self._was_provided: bool = False
+        self._raw_value: Any = None
+        self._cached_value: Any = None
         self._value_computed: bool = False
         self.decorator_kwargs: dict[str, Any] = {}
 
+    @property
+    def was_provided(self) -> bool:
+        """
+        Whether the value was provided in the running invocation.
+
+        During an invocation, this and ``raw_value`` and ``cached_value``
+        are read from and written to the ``RunState`` of the invocation, so
+        concurrent invocations of a command do not overwrite each other.
+        Outside of an invocation, they are stored on the node.
+
+        :returns: ``True`` if the value was provided, ``False`` otherwise.
+        :rtype: bool
+        """
+        state = get_run_state()
+        if state is None:
+            return self._was_provided
+        return state.provided.get(self, False)
+
+    @was_provided.setter
+    def was_provided(self, value: bool) -> None:
+        state = get_run_state()
+        if state is None:
+            self._was_provided = value
+        else:
+            state.provided[self] = value
+
+    @property
+    def raw_value(self) -> Any:
+        """
+        The value returned by ``load()`` in the running invocation.
+
+        :returns: The loaded value before processing by child nodes.
+        :rtype: Any
+        """
+        state = get_run_state()
+        if state is None:
+            return self._raw_value
+        return state.raw_values.get(self)
+
+    @raw_value.setter
+    def raw_value(self, value: Any) -> None:
+        state = get_run_state()
+        if state is None:
+            self._raw_value = value
+        else:
+            state.raw_values[self] = value
+
+    @property
+    def cached_value(self) -> Any:
+        """
+        The processed value in the running invocation.
+
+        :returns: The value after processing by child nodes.
+        :rtype: Any
+        """
+        state = get_run_state()
+        if state is None:
+            return self._cached_value
+        return state.values.get(self)
+
+    @cached_value.setter
+    def cached_value(self, value: Any) -> None:
+        state = get_run_state()
+        if state is None:
+            self._cached_value = value
+        else:
+            state.values[self] = value
+
     @abstractmethod
     def load(self, context: "Context", *args: Any, **kwargs: Any) -> Any:
         r"""
@@ -3,7 +3,7 @@
 import asyncio
 from abc import ABC
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, ParamSpec, TypeVar
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, ParamSpec, TypeVar
 
 from click_extended.core.nodes.node import Node
 from click_extended.core.other._tree import Tree
@@ -59,17 +59,23 @@ class ValidationNode(Node, ABC):
         :raises Any: exception to abort command execution.
         """
 
-    def on_finalize(self, context: "Context", *args: Any, **kwargs: Any) -> None:
+    def on_finalize(
+        self, context: "Context", *args: Any, **kwargs: Any
+    ) -> Awaitable[None] | None:
         r"""
         Run after all parent nodes are processed.
 
         This hook is called after all parent and tag processing is complete,
-        but before the decorated function is called.
+        but before the decorated function is called. It may be async, and an
+        awaitable it returns is awaited on the event loop of the invocation.
 
         :param context: The current context with access to all processed values.
         :param \*args: Additional positional arguments from decorator.
         :param \*\*kwargs: Additional keyword arguments from decorator.
 
+        :returns: ``None``, or an awaitable to await before continuing.
+        :rtype: Awaitable[None] | None
+
         :raises Any: exception to abort command execution.
         """
 
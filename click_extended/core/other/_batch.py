@@ -0,0 +1,471 @@
+"""Batch mode running a command once for every line of an input."""
+
+# pylint: disable=global-statement
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-locals
+
+import importlib
+import io
+import json
+import os
+import shlex
+import sys
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Any, TextIO
+
+import click
+
+BATCH_FLAG = "--batch"
+BATCH_SETTINGS = ("batch_workers", "batch_chunk_size", "batch_unordered")
+
+_WORKER_COMMAND: click.Command | None = None
+_WORKER_PROG_NAME: str | None = None
+
+
+def parse_line(line: str) -> list[str] | dict[str, Any]:
+    """
+    Parse a line of batch input.
+
+    A line holding a JSON object holds values by parameter name, and a line
+    holding a JSON array holds the arguments of the command. Any other line
+    is split into arguments like a shell would.
+
+    :param line:
+        The line to parse.
+
+    :returns:
+        The arguments, or the values by parameter name.
+    :rtype: list[str] | dict[str, Any]
+
+    :raises click.UsageError:
+        If the line is not a JSON object or an array of strings.
+    """
+    stripped = line.strip()
+    if not stripped.startswith(("{", "[")):
+        return shlex.split(stripped)
+
+    try:
+        item = json.loads(stripped)
+    except json.JSONDecodeError as e:
+        raise click.UsageError(f"Invalid JSON: {e}") from e
+
+    if isinstance(item, dict):
+        return item
+    if isinstance(item, list) and all(isinstance(arg, str) for arg in item):
+        return item
+
+    raise click.UsageError("Expected a JSON object or an array of strings.")
+
+
+def run_item(
+    command: click.Command,
+    line: str,
+    number: int,
+    prog_name: str | None = None,
+) -> dict[str, Any]:
+    """
+    Run a command for a single line of batch input.
+
+    The output of the command is captured, and errors and exits are recorded
+    instead of ending the process.
+
+    :param command:
+        The command to run.
+    :param line:
+        The line of batch input.
+    :param number:
+        The line number of the line, starting at ``1``.
+    :param prog_name:
+        The program name used in usage messages.
+
+    :returns:
+        The record of the run with the line number, exit code, return value,
+        captured output and, if the run failed, the error.
+    :rtype: dict[str, Any]
+    """
+    record: dict[str, Any] = {"line": number, "exit_code": 0, "result": None}
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            item = parse_line(line)
+            if isinstance(item, dict):
+                invoke_fast = getattr(command, "invoke_fast", None)
+                if invoke_fast is None:
+                    raise click.UsageError(
+                        "JSON objects are only supported by commands, "
+                        "pass the arguments instead."
+                    )
+                record["result"] = invoke_fast(**item)
+            else:
+                record["result"] = command.main(
+                    item, prog_name=prog_name, standalone_mode=False
+                )
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            record["exit_code"] = e.code
+        elif e.code is not None:
+            record["exit_code"] = 1
+            record["error"] = str(e.code)
+    except click.ClickException as e:
+        record["exit_code"] = e.exit_code
+        record["error"] = e.format_message()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        record["exit_code"] = 1
+        record["error"] = f"{e.__class__.__name__}: {e}"
+
+    record["stdout"] = stdout.getvalue()
+    record["stderr"] = stderr.getvalue()
+    return record
+
+
+def run_batch(
+    command: click.Command,
+    lines: Iterable[str],
+    out: TextIO,
+    prog_name: str | None = None,
+) -> int:
+    """
+    Run a command once for every line of batch input.
+
+    Empty lines are skipped. A JSON record is written to ``out`` for every
+    other line as soon as it has run, and a failing line does not stop the
+    lines after it. The tree of the command is built by the first line and
+    reused by the others.
+
+    :param command:
+        The command to run.
+    :param lines:
+        The lines of batch input.
+    :param out:
+        The stream the records are written to.
+    :param prog_name:
+        The program name used in usage messages.
+
+    :returns:
+        ``0`` if every line succeeded, ``1`` otherwise.
+    :rtype: int
+    """
+    failed = False
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+
+        record = run_item(command, line, number, prog_name)
+        out.write(json.dumps(record, default=str) + "\n")
+        out.flush()
+        failed = failed or record["exit_code"] != 0
+
+    return 1 if failed else 0
+
+
+def locate_command(command: click.Command) -> tuple[str, str]:
+    """
+    Find the module attribute a command is defined as.
+
+    Worker processes import the command through this reference, since
+    commands can not be sent to other processes.
+
+    :param command:
+        The command to locate.
+
+    :returns:
+        The module name and the attribute name of the command.
+    :rtype: tuple[str, str]
+
+    :raises click.UsageError:
+        If the command is not defined at the top level of a module.
+    """
+    callback = command.callback
+    module_name = getattr(callback, "__module__", None)
+    name = getattr(callback, "__name__", None)
+    module = sys.modules.get(module_name) if module_name is not None else None
+
+    if (
+        module_name is None
+        or name is None
+        or getattr(module, name, None) is not command
+    ):
+        raise click.UsageError(
+            f"'{command.name}' must be defined at the top level of a module "
+            "to run in worker processes."
+        )
+
+    return module_name, name
+
+
+def _init_worker(module_name: str, name: str, prog_name: str | None) -> None:
+    """Import the command once when a worker process starts."""
+    global _WORKER_COMMAND, _WORKER_PROG_NAME
+
+    _WORKER_COMMAND = getattr(importlib.import_module(module_name), name)
+    _WORKER_PROG_NAME = prog_name
+
+
+def _run_chunk(chunk: list[tuple[int, str]]) -> tuple[int, list[dict[str, Any]]]:
+    """Run a chunk of lines in a worker process."""
+    assert _WORKER_COMMAND is not None
+    return os.getpid(), [
+        run_item(_WORKER_COMMAND, line, number, _WORKER_PROG_NAME)
+        for number, line in chunk
+    ]
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[list[tuple[int, str]]]:
+    """Group the non-empty lines and their line numbers into chunks."""
+    chunk: list[tuple[int, str]] = []
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        chunk.append((number, line))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_batch_parallel(
+    command: click.Command,
+    lines: Iterable[str],
+    out: TextIO,
+    prog_name: str | None = None,
+    *,
+    workers: int = 2,
+    chunk_size: int = 16,
+    ordered: bool = True,
+    summary: TextIO | None = None,
+) -> int:
+    """
+    Run a command once for every line of batch input in worker processes.
+
+    Every worker imports the command and builds its tree once, then runs
+    chunks of lines. Records are written to ``out`` in input order, or as
+    soon as their chunk is done when ``ordered`` is ``False``, and carry the
+    process ID of their worker. Only a few chunks per worker are read ahead,
+    so input is streamed. If a worker dies, the lines of its chunk are
+    recorded as failed.
+
+    :param command:
+        The command to run. It must be defined at the top level of a module.
+    :param lines:
+        The lines of batch input.
+    :param out:
+        The stream the records are written to.
+    :param prog_name:
+        The program name used in usage messages.
+    :param workers:
+        The number of worker processes.
+    :param chunk_size:
+        The number of lines sent to a worker at once.
+    :param ordered:
+        Whether records are written in input order.
+    :param summary:
+        The stream a JSON summary of the lines, failures, time and lines per
+        worker is written to at the end, if any.
+
+    :returns:
+        ``0`` if every line succeeded, ``1`` otherwise.
+    :rtype: int
+    """
+    module_name, name = locate_command(command)
+    started = time.perf_counter()
+    per_worker: dict[int, int] = {}
+    total = 0
+    failed = 0
+
+    def emit(future: "Future[tuple[int, list[dict[str, Any]]]]", chunk: Any) -> None:
+        nonlocal total, failed
+        try:
+            pid, records = future.result()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            pid = 0
+            records = [
+                {
+                    "line": number,
+                    "exit_code": 1,
+                    "result": None,
+                    "error": f"{e.__class__.__name__}: {e}",
+                    "stdout": "",
+                    "stderr": "",
+                }
+                for number, _ in chunk
+            ]
+
+        per_worker[pid] = per_worker.get(pid, 0) + len(records)
+        for record in records:
+            record["worker"] = pid
+            total += 1
+            failed += record["exit_code"] != 0
+            out.write(json.dumps(record, default=str) + "\n")
+        out.flush()
+
+    pending: list[tuple[Future[Any], list[tuple[int, str]]]] = []
+
+    def next_done() -> tuple[Future[Any], list[tuple[int, str]]]:
+        if ordered:
+            return pending.pop(0)
+        done, _ = wait([future for future, _ in pending], return_when=FIRST_COMPLETED)
+        index = next(i for i, (future, _) in enumerate(pending) if future in done)
+        return pending.pop(index)
+
+    with ProcessPoolExecutor(
+        workers,
+        initializer=_init_worker,
+        initargs=(module_name, name, prog_name),
+    ) as pool:
+        for chunk in _chunks(lines, chunk_size):
+            pending.append((pool.submit(_run_chunk, chunk), chunk))
+            while len(pending) >= workers * 2:
+                emit(*next_done())
+
+        while pending:
+            emit(*next_done())
+
+    if summary is not None:
+        report = {
+            "lines": total,
+            "failed": failed,
+            "seconds": round(time.perf_counter() - started, 6),
+            "workers": {str(pid): count for pid, count in sorted(per_worker.items())},
+        }
+        summary.write(json.dumps(report) + "\n")
+        summary.flush()
+
+    return 1 if failed else 0
+
+
+class BatchOption(click.Option):
+    """
+    The ``--batch`` option.
+
+    The option is eager, so it runs before the parameters of the command are
+    processed and required parameters do not have to be given. It reads the
+    other batch settings from the parsed options itself, so their position
+    on the command line does not matter.
+    """
+
+    def handle_parse_result(
+        self, ctx: click.Context, opts: Mapping[str, Any], args: list[str]
+    ) -> tuple[Any, list[str]]:
+        """Collect the batch settings before the batch runs."""
+        if self.name in opts and not ctx.resilient_parsing:
+            settings: dict[str, Any] = {}
+            for param in ctx.command.params:
+                if param.name in BATCH_SETTINGS:
+                    value, _ = param.consume_value(ctx, opts)
+                    value = param.process_value(ctx, value)
+                    settings[param.name] = value
+            ctx.meta["click_extended_batch"] = settings
+
+        return super().handle_parse_result(ctx, opts, args)
+
+
+def _batch_callback(ctx: click.Context, _param: click.Parameter, value: Any) -> None:
+    """Run the batch and exit when the batch option is given."""
+    if value is None or ctx.resilient_parsing:
+        return
+
+    settings = ctx.meta.get("click_extended_batch", {})
+    workers = settings.get("batch_workers")
+    if workers is None:
+        sys.exit(run_batch(ctx.command, value, sys.stdout, ctx.info_name))
+
+    sys.exit(
+        run_batch_parallel(
+            ctx.command,
+            value,
+            sys.stdout,
+            ctx.info_name,
+            workers=workers,
+            chunk_size=settings.get("batch_chunk_size") or 16,
+            ordered=not settings.get("batch_unordered", False),
+            summary=sys.stderr,
+        )
+    )
+
+
+def add_batch_option(command: click.Command) -> None:
+    """
+    Add the ``--batch`` option to a command.
+
+    The options setting up worker processes, ``--batch-workers``,
+    ``--batch-chunk-size`` and ``--batch-unordered``, are added along with
+    it, hidden from the help of the command.
+
+    :param command:
+        The command to add the option to.
+
+    :raises ValueError:
+        If a parameter of the command already uses one of the flags or
+        names of the options.
+    """
+    names = {"batch", *BATCH_SETTINGS}
+    flags = {BATCH_FLAG, *(f"--{name.replace('_', '-')}" for name in BATCH_SETTINGS)}
+    for param in command.params:
+        taken = flags.intersection(getattr(param, "opts", ()))
+        if param.name in names or taken:
+            raise ValueError(
+                f"Parameter '{param.name}' of '{command.name}' conflicts with "
+                f"the batch options, so batch mode cannot be enabled."
+            )
+
+    command.params.append(
+        BatchOption(
+            [BATCH_FLAG],
+            type=click.File("r"),
+            metavar="FILE",
+            is_eager=True,
+            expose_value=False,
+            callback=_batch_callback,
+            help="Run once for every line of FILE ('-' for stdin) and "
+            "write the results as JSON lines.",
+        )
+    )
+    command.params.append(
+        click.Option(
+            ["--batch-workers"],
+            type=click.IntRange(min=1),
+            default=None,
+            metavar="N",
+            expose_value=False,
+            hidden=True,
+            help="Run --batch in N worker processes.",
+        )
+    )
+    command.params.append(
+        click.Option(
+            ["--batch-chunk-size"],
+            type=click.IntRange(min=1),
+            default=16,
+            metavar="N",
+            expose_value=False,
+            hidden=True,
+            help="Send N lines to a worker at once.",
+        )
+    )
+    command.params.append(
+        click.Option(
+            ["--batch-unordered"],
+            is_flag=True,
+            expose_value=False,
+            hidden=True,
+            help="Write results of workers as they finish.",
+        )
+    )
+
+
+__all__ = [
+    "BATCH_FLAG",
+    "BatchOption",
+    "add_batch_option",
+    "locate_command",
+    "parse_line",
+    "run_batch",
+    "run_batch_parallel",
+    "run_item",
+]
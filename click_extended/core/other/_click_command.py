@@ -1,15 +1,41 @@
 """Click Command class for integration with RootNode."""
 
+import asyncio
+import os
 import sys
-from collections.abc import Sequence
+from collections.abc import Mapping, MutableMapping, Sequence
 from typing import TYPE_CHECKING, Any
 
 import click
+from click.core import ParameterSource
 
 if TYPE_CHECKING:
     from click_extended.core.nodes._root_node import RootNode
 
 
+def _as_container(param: click.Parameter, value: Any) -> Any:
+    """
+    Convert the value of a parameter to the tuples Click passes.
+
+    :param param:
+        The parameter the value belongs to.
+    :param value:
+        The value, such as a list for ``multiple=True``.
+
+    :returns:
+        A tuple for ``multiple=True`` or ``nargs>1``, of tuples if both are
+        set, otherwise the value unchanged.
+    :rtype: Any
+    """
+    if value is None or isinstance(value, (str, bytes)):
+        return value
+    if param.multiple and param.nargs != 1:
+        return tuple(tuple(item) for item in value)
+    if param.multiple or param.nargs != 1:
+        return tuple(value)
+    return value
+
+
 class ClickCommand(click.Command):
     """
     A Click Command that integrates with the ``RootNode``.
@@ -39,6 +65,10 @@ class ClickCommand(click.Command):
 
         kwargs.pop("aliases", None)
         super().__init__(*args, **kwargs)
+        if root_instance.settings.batch:
+            from click_extended.core.other._batch import add_batch_option
+
+            add_batch_option(self)
 
     def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
         """
@@ -77,3 +107,100 @@ class ClickCommand(click.Command):
         except click.exceptions.ClickException as exc:
             exc.show()
             sys.exit(exc.exit_code)
+
+    def _main_shell_completion(
+        self,
+        ctx_args: MutableMapping[str, Any],
+        prog_name: str,
+        complete_var: str | None = None,
+    ) -> None:
+        """Answer shell completion from the completion index of the command."""
+        from click_extended.completion import complete_var_name
+
+        if os.environ.get(complete_var or complete_var_name(prog_name)):
+            from click_extended.core.other._completion import complete_from_index
+
+            complete_from_index(self, prog_name, complete_var)
+        super()._main_shell_completion(ctx_args, prog_name, complete_var)
+
+    def _bind_values(self, ctx: click.Context, values: Mapping[str, Any]) -> None:
+        """
+        Bind already typed values to the parameters of a context.
+
+        Values are used as given, except that the values of parameters with
+        ``multiple=True`` or ``nargs>1`` are converted to tuples, as Click
+        passes them. Parameters without a value are resolved like Click
+        resolves parameters missing from the command line, from their
+        environment variable or default.
+
+        :param ctx:
+            The context to bind the values to.
+        :param values:
+            The values by parameter name.
+
+        :raises TypeError:
+            If a value does not belong to a parameter of the command.
+        :raises click.MissingParameter:
+            If a required parameter has no value.
+        """
+        names = {param.name for param in self.params if param.expose_value}
+        for name in values:
+            if name not in names:
+                raise TypeError(
+                    f"{self.name}() got an unexpected keyword argument '{name}'"
+                )
+
+        for param in self.params:
+            if param.name is None:
+                continue
+            if param.name in values:
+                ctx.params[param.name] = _as_container(param, values[param.name])
+                ctx.set_parameter_source(param.name, ParameterSource.COMMANDLINE)
+                continue
+
+            value, _ = param.handle_parse_result(ctx, {}, [])
+            if (
+                param.expose_value
+                and not isinstance(value, tuple)
+                and param.value_is_missing(value)
+            ):
+                # Click leaves missing values unset until it parses arguments
+                ctx.params[param.name] = None
+
+    def invoke_fast(self, **values: Any) -> Any:
+        r"""
+        Invoke the command from Python with already typed values.
+
+        The values skip the round trip through command line strings and are
+        passed straight to the parents, children and validations of the
+        command in a minimal Click context. Hooks, errors and exit codes
+        behave as on the command line, so an error raises ``SystemExit``.
+
+        :param \*\*values:
+            The values by parameter name.
+
+        :returns:
+            The return value of the command function.
+        :rtype: Any
+        """
+        assert self.callback is not None
+        with click.Context(self, info_name=self.name) as ctx:
+            self._bind_values(ctx, values)
+            return ctx.invoke(self.callback, **ctx.params)
+
+    async def ainvoke(self, **values: Any) -> Any:
+        r"""
+        Invoke the command like ``invoke_fast`` from async code.
+
+        The invocation runs in a worker thread with its own event loop, so it
+        does not block the loop of the caller and async handlers of the
+        command can run.
+
+        :param \*\*values:
+            The values by parameter name.
+
+        :returns:
+            The return value of the command function.
+        :rtype: Any
+        """
+        return await asyncio.to_thread(self.invoke_fast, **values)
@@ -5,15 +5,20 @@
 
 from __future__ import annotations
 
+import os
 import sys
-from collections.abc import Sequence
+from collections.abc import MutableMapping, Sequence
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 
 import click
 
+from click_extended.core.other._lazy_command import LazyCommand
+
 if TYPE_CHECKING:
     from click_extended.core.nodes._root_node import RootNode
     from click_extended.core.other._click_command import ClickCommand
+    from click_extended.core.other._manifest import Manifest
 
 
 class ClickGroup(click.Group):
@@ -43,9 +48,15 @@ class ClickGroup(click.Group):
 
         self.root = root_instance
         self.aliases = root_instance.aliases
+        self.lazy_commands: dict[str, LazyCommand] = {}
+        self.manifest: Manifest | None = None
 
         kwargs.pop("aliases", None)
         super().__init__(*args, **kwargs)
+        if root_instance.settings.batch:
+            from click_extended.core.other._batch import add_batch_option
+
+            add_batch_option(self)
 
     def format_help(  # type: ignore[override]
         self, ctx: click.Context, formatter: click.HelpFormatter
@@ -87,6 +98,21 @@ class ClickGroup(click.Group):
             exc.show()
             sys.exit(exc.exit_code)
 
+    def _main_shell_completion(
+        self,
+        ctx_args: MutableMapping[str, Any],
+        prog_name: str,
+        complete_var: str | None = None,
+    ) -> None:
+        """Answer shell completion from the completion index of the group."""
+        from click_extended.completion import complete_var_name
+
+        if os.environ.get(complete_var or complete_var_name(prog_name)):
+            from click_extended.core.other._completion import complete_from_index
+
+            complete_from_index(self, prog_name, complete_var)
+        super()._main_shell_completion(ctx_args, prog_name, complete_var)
+
     def add_command(self, cmd: click.Command, name: str | None = None) -> None:
         """
         Add a command to the group, including its aliases.
@@ -116,7 +142,7 @@ class ClickGroup(click.Group):
         :param formatter:
             The formatter to write command information to.
         """
-        commands: dict[str, click.Command] = {}
+        rows: list[tuple[str, str]] = []
         for name, cmd in self.commands.items():
             if name == cmd.name:
                 aliases = getattr(cmd, "aliases", None)
@@ -128,16 +154,216 @@ class ClickGroup(click.Group):
                     if valid_aliases:
                         display_name = f"{name} ({', '.join(valid_aliases)})"
 
-                commands[display_name] = cmd
+                rows.append((display_name, cmd.help or ""))
 
-        rows: list[tuple[str, str]] = [
-            (name, cmd.help or "") for name, cmd in commands.items()
-        ]
+        for name, lazy in self.lazy_commands.items():
+            if name == lazy.name and name not in self.commands:
+                display_name = name
+                if lazy.aliases:
+                    display_name = f"{name} ({', '.join(lazy.aliases)})"
+                rows.append((display_name, self._lazy_help(lazy) or ""))
 
         if rows:
             with formatter.section("Commands"):
                 formatter.write_dl(rows)
 
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """
+        Return a command by name or alias, importing it if it is lazy.
+
+        :param ctx:
+            The Click context.
+        :param cmd_name:
+            The name or alias of the command.
+
+        :returns:
+            The command, or ``None`` if no command has the name.
+        :rtype: click.Command | None
+        """
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is not None or cmd_name not in self.lazy_commands:
+            return cmd
+
+        lazy = self.lazy_commands[cmd_name]
+        if lazy.command is None and self.manifest is not None:
+            info = self.manifest.lookup(lazy.name)
+            if info is not None and lazy.command is None:
+                from click_extended.core.other._manifest import manifest_command
+
+                return manifest_command(info, lazy.load)
+        return lazy.load()
+
+    def _lazy_help(self, lazy: LazyCommand) -> str | None:
+        """Return the help of a lazy command without importing it."""
+        if lazy.help is not None:
+            return lazy.help
+        if lazy.command is not None:
+            return lazy.command.help
+        if self.manifest is not None:
+            info = self.manifest.lookup(lazy.name)
+            if info is not None:
+                help: str | None = info["listed_help"]
+                return help
+        return None
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """
+        Return the names and aliases of all commands, including lazy ones.
+
+        :param ctx:
+            The Click context.
+
+        :returns:
+            The sorted names and aliases.
+        :rtype: list[str]
+        """
+        return sorted({*self.commands, *self.lazy_commands})
+
+    def lazy_command(
+        self,
+        name: str,
+        import_path: str,
+        *,
+        help: str | None = None,
+        aliases: str | list[str] | None = None,
+    ) -> "ClickGroup":
+        """
+        Add a command that is imported when it is first invoked.
+
+        The module of the command is not imported to list the commands of
+        the group, so the help text shown in the list is given here.
+
+        :param name:
+            The name of the command.
+        :param import_path:
+            Where the command is imported from, as ``"module:attribute"``.
+        :param help:
+            The help text shown in the command list of the group.
+        :param aliases:
+            Alternative name(s) for the command. Can be a single
+            string or a list of strings.
+
+        :returns:
+            The instance to allow chaining.
+        :rtype: Self
+
+        Example:
+            ```python
+            @group()
+            def cli():
+                pass
+
+            cli.lazy_command(
+                "deploy", "app.commands.deploy:deploy", help="Deploy the app."
+            ).lazy_command("logs", "app.commands.logs:logs", aliases="l")
+            ```
+        """
+        return self._add_lazy(LazyCommand(name, import_path, help, aliases))
+
+    def lazy_group(
+        self,
+        name: str,
+        import_path: str,
+        *,
+        help: str | None = None,
+        aliases: str | list[str] | None = None,
+    ) -> "ClickGroup":
+        """
+        Add a group that is imported when it is first invoked.
+
+        :param name:
+            The name of the group.
+        :param import_path:
+            Where the group is imported from, as ``"module:attribute"``.
+        :param help:
+            The help text shown in the command list of the group.
+        :param aliases:
+            Alternative name(s) for the group. Can be a single
+            string or a list of strings.
+
+        :returns:
+            The instance to allow chaining.
+        :rtype: Self
+        """
+        return self._add_lazy(
+            LazyCommand(name, import_path, help, aliases, is_group=True)
+        )
+
+    def use_manifest(self, cache_dir: str | Path | None = None) -> "ClickGroup":
+        """
+        Answer help and completion of lazy commands from a manifest.
+
+        The manifest records the commands of the group, with their options,
+        arguments, aliases, help and tags, in a file of the cache directory.
+        Showing the help of a lazy command, or completing its options, then
+        does not import it. The manifest is rebuilt, importing every lazy
+        command, when it is missing or a source file of the commands has
+        changed since it was written.
+
+        :param cache_dir:
+            The directory the manifest is stored in. Defaults to
+            ``$CLICK_EXTENDED_CACHE_DIR``, or ``click-extended`` in
+            ``$XDG_CACHE_HOME`` or ``~/.cache``.
+
+        :returns:
+            The instance to allow chaining.
+        :rtype: Self
+
+        Example:
+            ```python
+            @group()
+            def cli():
+                pass
+
+            cli.lazy_command(
+                "deploy", "app.commands.deploy:deploy"
+            ).use_manifest()
+            ```
+        """
+        from click_extended.core.other._manifest import Manifest
+
+        self.manifest = Manifest(self, cache_dir)
+        return self
+
+    def _add_lazy(self, lazy: LazyCommand) -> "ClickGroup":
+        """Register a lazy command under its name and aliases."""
+        for name in (lazy.name, *lazy.aliases):
+            self.lazy_commands[name] = lazy
+        return self
+
+    def serve(self, path: str) -> None:
+        """
+        Serve invocations of the group over a Unix domain socket.
+
+        Modules stay imported and the trees of the group and its commands
+        are built once. Every invocation runs in a process forked from the
+        daemon, so its state is isolated from other invocations. Use
+        ``click_extended.client.run`` to invoke the group through the
+        daemon.
+
+        :param path:
+            The path of the socket.
+
+        :raises NotImplementedError:
+            If the platform has no ``fork`` or Unix domain sockets.
+
+        Example:
+            ```python
+            # server.py
+            from app import cli
+
+            cli.serve("/tmp/app.sock")
+
+            # app_client.py
+            from click_extended.client import run
+
+            run("/tmp/app.sock", "app:cli")
+            ```
+        """
+        from click_extended.core.other._daemon import serve
+
+        serve(self, path)
+
     def add(self, cmd: click.Command | click.Group) -> "ClickGroup":
         """
         A method to add a command or group and return self for chaining.
@@ -0,0 +1,122 @@
+"""Shell completion of commands and groups from a completion index."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from typing import Any
+
+import click
+
+from click_extended.completion import (
+    SHELLS,
+    complete_var_name,
+    index_path,
+    read_manifest,
+    shell_completions,
+)
+from click_extended.core.other._manifest import build_manifest, write_manifest
+
+_PARAM_KEYS = (
+    "param_type",
+    "name",
+    "opts",
+    "secondary_opts",
+    "nargs",
+    "multiple",
+    "is_flag",
+    "count",
+    "hidden",
+    "help",
+    "custom_complete",
+    "type",
+)
+
+
+def _index_param(param: dict[str, Any]) -> dict[str, Any]:
+    """Return the fields of a parameter completion needs."""
+    return {key: param[key] for key in _PARAM_KEYS}
+
+
+def completion_index(command: dict[str, Any]) -> dict[str, Any]:
+    """
+    Reduce the description of a command to what completion needs.
+
+    The index of a subcommand is stored as a JSON string next to its
+    aliases and help, so reading the index only decodes the subcommands
+    the completed command line goes through.
+
+    :param command:
+        The description of the command, as returned by
+        ``describe_command``.
+
+    :returns:
+        The completion index of the command.
+    :rtype: dict[str, Any]
+    """
+    help_option = command["help_option"]
+    index: dict[str, Any] = {
+        "params": [_index_param(param) for param in command["params"]],
+        "help_option": _index_param(help_option) if help_option else None,
+    }
+    if "commands" in command:
+        index["chain"] = command["chain"]
+        index["commands"] = {
+            name: {
+                "aliases": sub["aliases"],
+                "hidden": sub["hidden"],
+                "short_help_str": sub["short_help_str"],
+                "index": json.dumps(completion_index(sub)),
+            }
+            for name, sub in command["commands"].items()
+        }
+    return index
+
+
+def complete_from_index(
+    command: click.Command, prog_name: str, complete_var: str | None
+) -> None:
+    """
+    Answer the shell from the completion index of a command and exit.
+
+    Completion does not create contexts, so neither hooks, trees nor
+    parent loads run. The index is built from the command, or from the
+    manifest of a group using one, and written for ``complete()`` of
+    ``click_extended.completion`` when it is missing or stale. Returns when
+    the shell does not ask for completions, or the index can not answer
+    and Click has to.
+
+    :param command:
+        The command the program runs.
+    :param prog_name:
+        The name of the program.
+    :param complete_var:
+        The environment variable the shell asks the program to complete
+        in, ``_{PROG_NAME}_COMPLETE`` if ``None``.
+    """
+    complete_var = complete_var or complete_var_name(prog_name)
+    shell, _, action = os.environ.get(complete_var, "").partition("_")
+    if action != "complete" or shell not in SHELLS:
+        return
+
+    manifest = getattr(command, "manifest", None)
+    cache_dir = manifest.cache_dir if manifest is not None else None
+    path = index_path(complete_var, cache_dir)
+    data = read_manifest(path)
+    if data is None:
+        if manifest is not None:
+            data = dict(manifest.get())
+        else:
+            data = build_manifest(command, prog_name)
+        data["command"] = completion_index(data["command"])
+        write_manifest(path, data)
+
+    output = shell_completions(data["command"], shell)
+    if output is None:
+        return
+    click.echo(output.encode())
+    sys.exit(0)
+
+
+__all__ = ["complete_from_index", "completion_index"]
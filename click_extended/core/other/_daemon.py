@@ -0,0 +1,261 @@
+"""Daemon serving invocations of a command over a Unix domain socket."""
+
+# pylint: disable=broad-exception-caught
+# pylint: disable=import-outside-toplevel
+# pylint: disable=protected-access
+# pylint: disable=consider-using-with
+
+import json
+import os
+import select
+import signal
+import socket
+import sys
+import traceback
+from typing import Any, NoReturn
+
+import click
+
+
+def warm(command: click.Command, seen: set[int] | None = None) -> None:
+    """
+    Build and validate the trees of a command and its subcommands.
+
+    Lazy subcommands are imported as well. Errors are ignored here, they are
+    reported when the command is invoked.
+
+    :param command:
+        The command to warm.
+    :param seen:
+        The IDs of the commands that were already warmed.
+    """
+    from click_extended.core.other._tree import Tree
+
+    seen = set() if seen is None else seen
+    if id(command) in seen:
+        return
+    seen.add(id(command))
+
+    ctx = click.Context(command, info_name=command.name)
+    root = getattr(command, "root", None)
+    if root is not None:
+        try:
+            Tree.initialize_context(ctx, root)
+            root.tree.validate_and_build(ctx)
+        except Exception:
+            pass
+
+    if isinstance(command, click.Group):
+        for name in command.list_commands(ctx):
+            try:
+                subcommand = command.get_command(ctx, name)
+            except Exception:
+                continue
+            if subcommand is not None:
+                warm(subcommand, seen)
+
+
+def _reap() -> None:
+    """Collect the exit status of finished invocations."""
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+
+
+def _send(conn: socket.socket, message: dict[str, Any]) -> None:
+    """Send a JSON message to the client."""
+    conn.sendall(json.dumps(message).encode() + b"\n")
+
+
+def _handle(conn: socket.socket, command: click.Command) -> int:
+    """
+    Run a single invocation in a forked process.
+
+    The client sends its stdin, stdout and stderr file descriptors, then a
+    JSON header with the arguments, environment, working directory and
+    program name. The process takes them over, runs the command and sends
+    its process ID first and the exit code last.
+
+    :param conn:
+        The connection to the client.
+    :param command:
+        The command to run.
+
+    :returns:
+        The exit code of the invocation.
+    :rtype: int
+    """
+    _, fds, _, _ = socket.recv_fds(conn, 1, 3)
+    header = json.loads(conn.makefile("rb").readline())
+
+    for target, fd in zip((0, 1, 2), fds):
+        os.dup2(fd, target)
+        os.close(fd)
+
+    encoding = getattr(sys.__stdout__, "encoding", None) or "utf-8"
+    sys.stdin = open(0, "r", encoding=encoding, closefd=False)
+    sys.stdout = open(1, "w", encoding=encoding, closefd=False)
+    sys.stderr = open(2, "w", encoding=encoding, closefd=False)
+
+    os.chdir(header["cwd"])
+    os.environ.clear()
+    os.environ.update(header["env"])
+    prog_name = header.get("prog_name") or command.name
+    sys.argv = [prog_name or "", *header["argv"]]
+
+    _send(conn, {"pid": os.getpid()})
+
+    code = 0
+    try:
+        command.main(header["argv"], prog_name=prog_name)
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            code = e.code
+        elif e.code is not None:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except KeyboardInterrupt:
+        code = 130
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+    return code
+
+
+def _run_child(
+    conn: socket.socket, command: click.Command, *inherited: socket.socket
+) -> NoReturn:
+    """
+    Run an invocation in the forked process and exit with its exit code.
+
+    :param conn:
+        The connection to the client.
+    :param command:
+        The command to run.
+    :param inherited:
+        The sockets of the server, which are closed in the forked process.
+    """
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    for sock in inherited:
+        sock.close()
+
+    code = 1
+    try:
+        code = _handle(conn, command)
+        _send(conn, {"exit_code": code})
+    finally:
+        os._exit(code)
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Remove a socket no server is listening on anymore."""
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)
+    else:
+        raise click.UsageError(f"A daemon is already listening on '{path}'.")
+    finally:
+        probe.close()
+
+
+def _bind_private(server: socket.socket, path: str) -> None:
+    """
+    Bind a socket to a path only its owner can connect to.
+
+    The socket file is created with the restricted permissions rather than
+    changed afterwards, so there is no window in which others can connect.
+    """
+    previous_umask = os.umask(0o177)
+    try:
+        server.bind(path)
+    finally:
+        os.umask(previous_umask)
+
+
+def serve(command: click.Command, path: str) -> None:
+    """
+    Serve invocations of a command over a Unix domain socket.
+
+    Modules stay imported and the trees of the command and its subcommands
+    are built once, before the first connection. Every invocation runs in a
+    process forked from the server, so the values, hooks and module state of
+    an invocation are not visible to the next one. The server runs until it
+    is interrupted or terminated and removes the socket when it stops.
+
+    :param command:
+        The command to serve.
+    :param path:
+        The path of the socket.
+
+    :raises NotImplementedError:
+        If the platform has no ``fork`` or Unix domain sockets.
+    :raises click.UsageError:
+        If another server is already listening on the socket.
+    """
+    if not hasattr(os, "fork") or not hasattr(socket, "AF_UNIX"):
+        raise NotImplementedError(
+            "Daemon mode requires a POSIX platform with fork and Unix domain "
+            "sockets."
+        )
+
+    _remove_stale_socket(path)
+    warm(command)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    wake_read, wake_write = socket.socketpair()
+    wake_write.setblocking(False)
+    stopping = False
+
+    def stop(*_: Any) -> None:
+        # Raising here could be swallowed when the signal arrives while a
+        # finalizer runs, so the loop is woken up through the wakeup socket.
+        nonlocal stopping
+        stopping = True
+
+    previous = signal.signal(signal.SIGTERM, stop)
+    previous_wakeup = signal.set_wakeup_fd(wake_write.fileno())
+    try:
+        _bind_private(server, path)
+        server.listen()
+
+        while not stopping:
+            _reap()
+            readable, _, _ = select.select([server, wake_read], [], [], 1.0)
+            if wake_read in readable:
+                wake_read.recv(4096)
+            if server not in readable or stopping:
+                continue
+
+            conn, _ = server.accept()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+            if pid == 0:
+                _run_child(conn, command, server, wake_read, wake_write)
+            conn.close()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.set_wakeup_fd(previous_wakeup)
+        signal.signal(signal.SIGTERM, previous)
+        server.close()
+        wake_read.close()
+        wake_write.close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+__all__ = ["serve", "warm"]
@@ -0,0 +1,174 @@
+"""Execution plan shared by every invocation of a command."""
+
+# pylint: disable=import-outside-toplevel
+# pylint: disable=too-few-public-methods
+# pylint: disable=too-many-instance-attributes
+
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from click_extended.core.decorators.env import Env
+    from click_extended.core.decorators.tag import Tag
+    from click_extended.core.nodes.child_node import ChildNode
+    from click_extended.core.nodes.parent_node import ParentNode
+    from click_extended.core.nodes.validation_node import ValidationNode
+    from click_extended.core.other._parent_index import ParentIndex
+    from click_extended.core.other._tree import Tree
+
+
+def collect_nodes(
+    tree: "Tree",
+) -> tuple[dict[str, "ParentNode"], dict[str, "ChildNode"]]:
+    """
+    Collect the parents and children of a tree by name.
+
+    :param tree:
+        The tree to collect the nodes of.
+
+    :returns:
+        The parents and the children, including the children of tags,
+        keyed by name.
+    :rtype: tuple[dict[str, ParentNode], dict[str, ChildNode]]
+    """
+    parents: dict[str, "ParentNode"] = {}
+    if tree.root is not None:
+        parents = {
+            name: cast("ParentNode", node)
+            for name, node in tree.root.children.items()
+            if isinstance(name, str)
+        }
+
+    children: dict[str, "ChildNode"] = {}
+    for owner in (*parents.values(), *tree.tags.values()):
+        for child_name, child_node in owner.children.items():
+            if isinstance(child_name, (str, int)):
+                children[child_node.name] = cast("ChildNode", child_node)
+
+    return parents, children
+
+
+class ExecutionPlan:
+    """
+    Everything an invocation needs that only depends on the tree structure.
+
+    The plan is built once the tree has been validated and is shared by every
+    invocation of the command, which then only binds the values parsed from
+    the command line. Its dictionaries are shared as well and must not be
+    modified. Whether a handler is async depends on the handlers of the child
+    classes, so the plan is rebuilt when a handler method changes.
+
+    :Attributes:
+        parents (dict[str, ParentNode]):
+            The parent nodes by name, in tree order.
+        children (dict[str, ChildNode]):
+            The child nodes of parents and tags by name.
+        nodes (dict[str, Any]):
+            The parents, tags, children and root node by name.
+        envs (tuple[Env, ...]):
+            The parents that read an environment variable.
+        loads (tuple[tuple[str, ParentNode, bool], ...]):
+            The name and node of every parent in tree order, and whether its
+            value is parsed from the command line.
+        load_batches (list[list[tuple[str, ParentNode]]]):
+            The parents grouped into batches whose loads can run concurrently.
+        validations (list[ValidationNode]):
+            The validations the runtime calls itself, in order.
+        index (ParentIndex):
+            Lookups over the parent nodes by tag, kind and provided state.
+        is_async (bool):
+            Whether an invocation has to run on the event loop, because a
+            load or handler is async or blocking calls are offloaded.
+        generation (int):
+            The handler generation the plan was built for.
+    """
+
+    __slots__ = (
+        "parents",
+        "children",
+        "nodes",
+        "envs",
+        "loads",
+        "load_batches",
+        "validations",
+        "index",
+        "is_async",
+        "generation",
+    )
+
+    def __init__(
+        self,
+        tree: "Tree",
+        index: "ParentIndex",
+        validations: list["ValidationNode"],
+    ) -> None:
+        """
+        Build the plan of a validated tree.
+
+        :param tree:
+            The tree to build the plan of.
+        :param index:
+            The lookups over the parent nodes of the tree.
+        :param validations:
+            The validations the runtime calls itself, in order.
+        """
+        import asyncio
+
+        from click_extended.core.decorators.env import Env
+        from click_extended.core.nodes.argument_node import ArgumentNode
+        from click_extended.core.nodes.child_node import ChildNodeMeta
+        from click_extended.core.nodes.option_node import OptionNode
+        from click_extended.utils.process import compile_children, plan_loads
+
+        root = tree.root
+        offload = root is not None and root.settings.executor is not None
+        concurrent_loads = root is None or root.settings.concurrent_loads
+
+        self.generation = ChildNodeMeta.handler_generation
+        self.parents, self.children = collect_nodes(tree)
+
+        self.nodes: dict[str, Any] = {**self.parents, **tree.tags, **self.children}
+        if root is not None:
+            self.nodes[root.name] = root
+
+        self.envs: tuple["Env", ...] = tuple(
+            node for node in self.parents.values() if isinstance(node, Env)
+        )
+        self.loads: tuple[tuple[str, "ParentNode", bool], ...] = tuple(
+            (name, node, isinstance(node, (OptionNode, ArgumentNode)))
+            for name, node in self.parents.items()
+        )
+        self.load_batches = plan_loads(self.parents, concurrent_loads, offload)
+        self.validations = validations
+        self.index = index
+
+        owners: tuple["ParentNode | Tag", ...] = (
+            *self.parents.values(),
+            *tree.tags.values(),
+        )
+        self.is_async = (
+            offload
+            or any(
+                asyncio.iscoroutinefunction(getattr(node, "load", None))
+                for node in self.parents.values()
+            )
+            or any(
+                compile_children(owner.children, owner).is_async
+                for owner in owners
+                if owner.children
+            )
+        )
+
+    def is_current(self) -> bool:
+        """
+        Check if the plan still matches the handlers of the child classes.
+
+        :returns:
+            ``True`` if no handler method changed since the plan was built.
+        :rtype: bool
+        """
+        from click_extended.core.nodes.child_node import ChildNodeMeta
+
+        return self.generation == ChildNodeMeta.handler_generation
+
+
+__all__ = ["ExecutionPlan", "collect_nodes"]
@@ -0,0 +1,113 @@
+"""Commands of a group that are imported when they are first used."""
+
+# pylint: disable=redefined-builtin
+# pylint: disable=too-few-public-methods
+# pylint: disable=too-many-arguments
+
+from importlib import import_module
+
+import click
+
+
+class LazyCommand:
+    """
+    The registration of a command imported from an import string.
+
+    :Attributes:
+        name (str):
+            The name the command is registered under.
+        import_path (str):
+            Where the command is imported from, as ``"module:attribute"``.
+        help (str | None):
+            The help text shown in the command list of the group.
+        aliases (list[str]):
+            Alternative names of the command.
+        is_group (bool):
+            Whether the imported object must be a group.
+        command (click.Command | None):
+            The imported command, once loaded.
+    """
+
+    __slots__ = ("name", "import_path", "help", "aliases", "is_group", "command")
+
+    def __init__(
+        self,
+        name: str,
+        import_path: str,
+        help: str | None = None,
+        aliases: str | list[str] | None = None,
+        is_group: bool = False,
+    ) -> None:
+        """
+        Initialize a new ``LazyCommand`` instance.
+
+        :param name:
+            The name the command is registered under.
+        :param import_path:
+            Where the command is imported from, as ``"module:attribute"``.
+        :param help:
+            The help text shown in the command list of the group.
+        :param aliases:
+            Alternative name(s) for the command.
+        :param is_group:
+            Whether the imported object must be a group.
+
+        :raises ValueError:
+            If the import path is not of the form ``"module:attribute"``.
+        """
+        module, _, attribute = import_path.partition(":")
+        if not module or not attribute:
+            raise ValueError(
+                f"Invalid import path '{import_path}' for command '{name}', "
+                "expected 'module:attribute'."
+            )
+
+        self.name = name
+        self.import_path = import_path
+        self.help = help
+        aliases_list = [aliases] if isinstance(aliases, str) else aliases or []
+        self.aliases = [alias for alias in aliases_list if alias]
+        self.is_group = is_group
+        self.command: click.Command | None = None
+
+    def load(self) -> click.Command:
+        """
+        Import the command, or return it if it was already imported.
+
+        :returns:
+            The imported command.
+        :rtype: click.Command
+
+        :raises ImportError:
+            If the module or attribute can not be imported.
+        :raises TypeError:
+            If the imported object is not a command, or not a group when
+            a group is expected.
+        """
+        if self.command is not None:
+            return self.command
+
+        module_name, _, attribute = self.import_path.partition(":")
+        obj = import_module(module_name)
+        for part in attribute.split("."):
+            try:
+                obj = getattr(obj, part)
+            except AttributeError as e:
+                raise ImportError(
+                    f"Module '{module_name}' has no attribute '{attribute}' "
+                    f"for command '{self.name}'."
+                ) from e
+
+        expected = click.Group if self.is_group else click.Command
+        if not isinstance(obj, expected):
+            kind = "group" if self.is_group else "command"
+            raise TypeError(
+                f"'{self.import_path}' must be a {kind}, "
+                f"got '{type(obj).__name__}'."
+            )
+
+        self.command = obj
+        return obj
+
+
+__all__ = ["LazyCommand"]
@@ -0,0 +1,706 @@
+"""On-disk manifest of a group for help and completion without imports."""
+
+# pylint: disable=protected-access
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-ancestors
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
+
+import click
+
+from click_extended.completion import (
+    MANIFEST_VERSION,
+    default_cache_dir,
+    file_source,
+    read_manifest,
+)
+
+_CONTEXT_SETTINGS = (
+    "help_option_names",
+    "max_content_width",
+    "show_default",
+    "ignore_unknown_options",
+    "allow_extra_args",
+    "allow_interspersed_args",
+)
+
+
+def _choice_values(
+    command: click.Command, name: str | None
+) -> tuple[list[str], bool] | None:
+    """
+    Return the values of a ``choice()`` child of a parent, if any, and
+    whether they are matched case-sensitively.
+    """
+    root = getattr(command, "root", None)
+    tree_root = getattr(getattr(root, "tree", None), "root", None)
+    if tree_root is None or name not in tree_root.children:
+        return None
+
+    # pylint: disable=import-outside-toplevel
+    from click_extended.decorators.misc.choice import Choice
+
+    for child in tree_root.children[name].children.values():
+        if isinstance(child, Choice):
+            return (
+                [str(value) for value in child.process_kwargs["values"]],
+                child.process_kwargs.get("case_sensitive", True),
+            )
+    return None
+
+
+def _describe_param(
+    command: click.Command, param: click.Parameter, ctx: click.Context
+) -> dict[str, Any]:
+    """Describe a parameter of a command."""
+    try:
+        help_record = param.get_help_record(ctx)
+    except Exception:  # pylint: disable=broad-exception-caught
+        help_record = None
+
+    info: dict[str, Any] = {
+        "param_type": param.param_type_name,
+        "name": param.name,
+        "opts": list(param.opts),
+        "secondary_opts": list(param.secondary_opts),
+        "nargs": param.nargs,
+        "multiple": param.multiple,
+        "help_record": list(help_record) if help_record else None,
+        "usage_pieces": param.get_usage_pieces(ctx),
+        "is_flag": getattr(param, "is_flag", False),
+        "count": getattr(param, "count", False),
+        "hidden": getattr(param, "hidden", False),
+        "help": getattr(param, "help", None),
+        "custom_complete": getattr(param, "_custom_shell_complete", None) is not None,
+        "type": None,
+    }
+
+    param_type = param.type
+    if isinstance(param_type, click.Choice):
+        info["type"] = {
+            "kind": "choice",
+            "choices": [
+                param_type.normalize_choice(choice, ctx)
+                for choice in param_type.choices
+            ],
+            "case_sensitive": param_type.case_sensitive,
+        }
+    elif (choice := _choice_values(command, param.name)) is not None:
+        values, case_sensitive = choice
+        info["type"] = {
+            "kind": "choice",
+            "choices": values,
+            "case_sensitive": case_sensitive,
+        }
+    elif isinstance(param_type, click.Path):
+        info["type"] = {
+            "kind": "path",
+            "file_okay": param_type.file_okay,
+            "dir_okay": param_type.dir_okay,
+        }
+    elif isinstance(param_type, click.File):
+        info["type"] = {"kind": "file"}
+    elif type(param_type).shell_complete is not click.ParamType.shell_complete:
+        info["custom_complete"] = True
+    return info
+
+
+def _tags(command: click.Command) -> dict[str, list[str]]:
+    """Return the names of the parents of a command by tag."""
+    tree_root = getattr(
+        getattr(getattr(command, "root", None), "tree", None), "root", None
+    )
+    tags: dict[str, list[str]] = {}
+    if tree_root is not None:
+        for name, parent in tree_root.children.items():
+            for tag in getattr(parent, "tags", []):
+                tags.setdefault(tag, []).append(name)
+    return tags
+
+
+def _subcommands(
+    group: click.Group, ctx: click.Context
+) -> list[tuple[str, list[str], str | None, click.Command]]:
+    """Return the name, aliases, listed help and command of subcommands."""
+    commands: list[tuple[str, list[str], str | None, click.Command]] = []
+    lazy_commands = getattr(group, "lazy_commands", None)
+    if lazy_commands is None:
+        for name in group.list_commands(ctx):
+            command = group.get_command(ctx, name)
+            if command is not None:
+                commands.append((name, [], command.help, command))
+        return commands
+
+    for name, command in group.commands.items():
+        if name == command.name:
+            aliases = getattr(command, "aliases", None) or []
+            aliases = [aliases] if isinstance(aliases, str) else aliases
+            commands.append((name, [a for a in aliases if a], command.help, command))
+    for name, lazy in lazy_commands.items():
+        if name == lazy.name and name not in group.commands:
+            command = lazy.load()
+            commands.append((name, lazy.aliases, lazy.help or command.help, command))
+    return commands
+
+
+def describe_command(
+    command: click.Command, name: str, parent: click.Context | None = None
+) -> dict[str, Any]:
+    """
+    Describe a command, and the subcommands of a group, as JSON data.
+
+    Lazy subcommands are imported to describe them.
+
+    :param command:
+        The command to describe.
+    :param name:
+        The name the command is invoked as.
+    :param parent:
+        The context of the parent group, if any.
+
+    :returns:
+        The description of the command.
+    :rtype: dict[str, Any]
+    """
+    ctx = click.Context(command, info_name=name, parent=parent)
+    info: dict[str, Any] = {
+        "name": name,
+        "help": command.help,
+        "short_help": command.short_help,
+        "epilog": command.epilog,
+        "options_metavar": command.options_metavar,
+        "add_help_option": command.add_help_option,
+        "no_args_is_help": command.no_args_is_help,
+        "hidden": command.hidden,
+        "deprecated": command.deprecated,
+        "context_settings": {
+            key: value
+            for key, value in command.context_settings.items()
+            if key in _CONTEXT_SETTINGS
+        },
+        "short_help_str": command.get_short_help_str(),
+        "params": [_describe_param(command, p, ctx) for p in command.params],
+        "help_option": None,
+        "tags": _tags(command),
+    }
+
+    if (help_option := command.get_help_option(ctx)) is not None:
+        info["help_option"] = _describe_param(command, help_option, ctx)
+
+    if isinstance(command, click.Group):
+        info["chain"] = command.chain
+        info["subcommand_metavar"] = command.subcommand_metavar
+        info["invoke_without_command"] = command.invoke_without_command
+        info["commands"] = {}
+        for sub_name, aliases, listed_help, sub in _subcommands(command, ctx):
+            sub_info = describe_command(sub, sub_name, ctx)
+            sub_info["aliases"] = aliases
+            sub_info["listed_help"] = listed_help
+            info["commands"][sub_name] = sub_info
+    return info
+
+
+def _modules(command: click.Command) -> set[str]:
+    """Return the modules commands of a group are defined in."""
+    modules = {getattr(command.callback, "__module__", None) or ""}
+    if isinstance(command, click.Group):
+        ctx = click.Context(command)
+        for _, _, _, sub in _subcommands(command, ctx):
+            modules |= _modules(sub)
+    for lazy in getattr(command, "lazy_commands", {}).values():
+        modules.add(lazy.import_path.partition(":")[0])
+    return modules
+
+
+def collect_sources(command: click.Command) -> dict[str, dict[str, Any]]:
+    """
+    Return the source files a command and its subcommands are defined by.
+
+    These are the loaded modules of the top-level packages the commands
+    are defined in.
+
+    :param command:
+        The command to collect the sources of.
+
+    :returns:
+        The modification time, size and hash of each file, by path.
+    :rtype: dict[str, dict[str, Any]]
+    """
+    packages = {module.partition(".")[0] for module in _modules(command) if module}
+    sources: dict[str, dict[str, Any]] = {}
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and name.partition(".")[0] in packages:
+            if (source := file_source(path)) is not None:
+                sources[path] = source
+    return sources
+
+
+def build_manifest(command: click.Command, name: str) -> dict[str, Any]:
+    """
+    Describe a command and record the source files it is defined by.
+
+    :param command:
+        The command to describe.
+    :param name:
+        The name the command is invoked as.
+
+    :returns:
+        The manifest.
+    :rtype: dict[str, Any]
+    """
+    return {
+        "version": MANIFEST_VERSION,
+        "sources": collect_sources(command),
+        "command": describe_command(command, name),
+    }
+
+
+def write_manifest(path: Path, data: dict[str, Any]) -> None:
+    """
+    Write a manifest atomically.
+
+    Failing to write the manifest is not an error, it is then built again
+    the next time it is needed.
+
+    :param path:
+        The path of the manifest.
+    :param data:
+        The manifest.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
+class Manifest:
+    """
+    The manifest of a group, stored in a cache directory.
+
+    :Attributes:
+        group (click.Group):
+            The group the manifest describes.
+        cache_dir (Path):
+            The directory the manifest is stored in.
+    """
+
+    def __init__(self, group: click.Group, cache_dir: str | Path | None = None):
+        """
+        Initialize a new ``Manifest`` instance.
+
+        :param group:
+            The group the manifest describes.
+        :param cache_dir:
+            The directory the manifest is stored in, ``default_cache_dir()``
+            if not given.
+        """
+        self.group = group
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self._data: dict[str, Any] | None = None
+
+    @property
+    def path(self) -> Path:
+        """The path of the manifest file."""
+        module = getattr(self.group.callback, "__module__", None)
+        key = f"{module}:{self.group.name}:{sys.executable}"
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return self.cache_dir / f"{self.group.name or 'cli'}-{digest}.json"
+
+    def load(self) -> dict[str, Any] | None:
+        """
+        Read the manifest if it exists and its sources are unchanged.
+
+        :returns:
+            The manifest, or ``None`` if it is missing or stale.
+        :rtype: dict[str, Any] | None
+        """
+        return read_manifest(self.path)
+
+    def build(self) -> dict[str, Any]:
+        """
+        Describe the group, importing lazy commands, and write the manifest.
+
+        :returns:
+            The manifest.
+        :rtype: dict[str, Any]
+        """
+        data = build_manifest(self.group, self.group.name or "cli")
+        write_manifest(self.path, data)
+        return data
+
+    def get(self) -> dict[str, Any]:
+        """
+        Return the manifest, rebuilding it if it is missing or stale.
+
+        :returns:
+            The manifest.
+        :rtype: dict[str, Any]
+        """
+        if self._data is None:
+            self._data = self.load() or self.build()
+        return self._data
+
+    def lookup(self, name: str) -> dict[str, Any] | None:
+        """
+        Return the description of a subcommand of the group.
+
+        :param name:
+            The name of the subcommand.
+
+        :returns:
+            The description, or ``None`` if the manifest has no such command.
+        :rtype: dict[str, Any] | None
+        """
+        commands: dict[str, Any] = self.get()["command"].get("commands", {})
+        return commands.get(name)
+
+
+def _make_type(info: dict[str, Any] | None) -> click.ParamType[Any]:
+    """Create the type of a stand-in parameter."""
+    if info is None:
+        return click.STRING
+    if info["kind"] == "choice":
+        return click.Choice(info["choices"], case_sensitive=info["case_sensitive"])
+    if info["kind"] == "path":
+        return click.Path(file_okay=info["file_okay"], dir_okay=info["dir_okay"])
+    return click.File()
+
+
+class _ManifestParam:
+    """Parameter answering help from its description."""
+
+    info: dict[str, Any]
+
+    def get_help_record(self, ctx: click.Context) -> tuple[str, str] | None:
+        """Return the recorded help row."""
+        record = self.info["help_record"]
+        return (record[0], record[1]) if record else None
+
+    def get_usage_pieces(self, ctx: click.Context) -> list[str]:
+        """Return the recorded usage pieces."""
+        return list(self.info["usage_pieces"])
+
+
+class ManifestOption(_ManifestParam, click.Option):
+    """An option created from its description in a manifest."""
+
+    def __init__(self, info: dict[str, Any]) -> None:
+        """
+        Initialize a new ``ManifestOption`` instance.
+
+        :param info:
+            The description of the option.
+        """
+        self.info = info
+        opts: list[str] = info["opts"]
+        secondary: list[str] = info["secondary_opts"]
+        decls = [info["name"]] if info["name"] else []
+        decls += [
+            f"{opt}/{secondary[i]}" if i < len(secondary) else opt
+            for i, opt in enumerate(opts)
+        ]
+        decls += [f"{opts[0]}/{second}" for second in secondary[len(opts) :]]
+        kwargs: dict[str, Any] = {"hidden": info["hidden"]}
+        if info["is_flag"]:
+            kwargs["is_flag"] = True
+        elif info["count"]:
+            kwargs["count"] = True
+        else:
+            kwargs["type"] = _make_type(info["type"])
+            kwargs["nargs"] = info["nargs"]
+            kwargs["multiple"] = info["multiple"]
+        super().__init__(decls, **kwargs)
+
+
+class ManifestArgument(_ManifestParam, click.Argument):
+    """An argument created from its description in a manifest."""
+
+    def __init__(self, info: dict[str, Any]) -> None:
+        """
+        Initialize a new ``ManifestArgument`` instance.
+
+        :param info:
+            The description of the argument.
+        """
+        self.info = info
+        super().__init__(
+            [info["name"]],
+            type=_make_type(info["type"]),
+            nargs=info["nargs"],
+            required=False,
+        )
+
+
+def _make_params(info: dict[str, Any]) -> list[click.Parameter]:
+    """Create the stand-in parameters of a command."""
+    params: list[click.Parameter] = []
+    for param in info["params"]:
+        if param["param_type"] == "argument":
+            params.append(ManifestArgument(param))
+        elif param["param_type"] == "option":
+            params.append(ManifestOption(param))
+    return params
+
+
+class ManifestCommand(click.Command):
+    """
+    A stand-in for a command, created from its description in a manifest.
+
+    Help and completion are answered from the description. Any other
+    invocation loads the real command and creates its context instead.
+
+    :Attributes:
+        info (dict[str, Any]):
+            The description of the command.
+        loader (Callable[[], click.Command] | None):
+            Loads the real command, ``None`` for stand-ins that are only
+            used for help and completion.
+    """
+
+    def __init__(
+        self,
+        info: dict[str, Any],
+        loader: Callable[[], click.Command] | None = None,
+    ) -> None:
+        """
+        Initialize a new ``ManifestCommand`` instance.
+
+        :param info:
+            The description of the command.
+        :param loader:
+            Loads the real command.
+        """
+        self.info = info
+        self.loader = loader
+        self.aliases: list[str] = info.get("aliases", [])
+        super().__init__(
+            name=info["name"],
+            context_settings=dict(info["context_settings"]),
+            params=_make_params(info),
+            help=info["help"],
+            epilog=info["epilog"],
+            short_help=info["short_help"],
+            options_metavar=info["options_metavar"],
+            add_help_option=info["add_help_option"],
+            no_args_is_help=info["no_args_is_help"],
+            hidden=info["hidden"],
+            deprecated=info["deprecated"],
+        )
+
+    def make_context(
+        self,
+        info_name: str | None,
+        args: list[str],
+        parent: click.Context | None = None,
+        **extra: Any,
+    ) -> click.Context:
+        """
+        Create a context, from the real command unless help is shown.
+
+        :param info_name:
+            The name the command is invoked as.
+        :param args:
+            The arguments to parse.
+        :param parent:
+            The parent context.
+        :param \\*\\*extra:
+            Extra keyword arguments for the context.
+
+        :returns:
+            The context of the stand-in while completing, otherwise the
+            context of the real command.
+        :rtype: click.Context
+        """
+        resilient = extra.get("resilient_parsing") or (
+            parent is not None and parent.resilient_parsing
+        )
+        if self.loader is None or resilient:
+            return super().make_context(info_name, args, parent, **extra)
+
+        self.serve_help(info_name, list(args), parent, extra)
+        return self.loader().make_context(info_name, args, parent, **extra)
+
+    def serve_help(
+        self,
+        info_name: str | None,
+        args: list[str],
+        parent: click.Context | None,
+        extra: dict[str, Any],
+    ) -> None:
+        """
+        Show help if the arguments ask for it, which exits.
+
+        :param info_name:
+            The name the command is invoked as.
+        :param args:
+            The arguments to parse.
+        :param parent:
+            The parent context.
+        :param extra:
+            Extra keyword arguments for the context.
+        """
+        try:
+            ctx = click.Command.make_context(self, info_name, args, parent, **extra)
+        except click.exceptions.NoArgsIsHelpError:
+            raise
+        except click.UsageError:
+            return
+        with ctx:
+            self.serve_subcommand_help(ctx)
+
+    def serve_subcommand_help(self, ctx: click.Context) -> None:
+        """
+        Show help of a subcommand if the arguments ask for it.
+
+        :param ctx:
+            The context of the command.
+        """
+
+
+class ManifestGroup(ManifestCommand, click.Group):
+    """A stand-in for a group, created from its description in a manifest."""
+
+    def __init__(
+        self,
+        info: dict[str, Any],
+        loader: Callable[[], click.Command] | None = None,
+    ) -> None:
+        """
+        Initialize a new ``ManifestGroup`` instance.
+
+        :param info:
+            The description of the group.
+        :param loader:
+            Loads the real group.
+        """
+        super().__init__(info, loader)
+        self.chain = info["chain"]
+        self.subcommand_metavar = info["subcommand_metavar"]
+        self.invoke_without_command = info["invoke_without_command"]
+        self._aliases = {
+            alias: name
+            for name, sub in info["commands"].items()
+            for alias in sub["aliases"]
+        }
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """
+        Return a stand-in for a subcommand by name or alias.
+
+        :param ctx:
+            The Click context.
+        :param cmd_name:
+            The name or alias of the subcommand.
+
+        :returns:
+            The stand-in, or ``None`` if no subcommand has the name.
+        :rtype: click.Command | None
+        """
+        name = self._aliases.get(cmd_name, cmd_name)
+        info = self.info["commands"].get(name)
+        if info is None:
+            return None
+        return manifest_command(info)
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """
+        Return the names and aliases of all subcommands.
+
+        :param ctx:
+            The Click context.
+
+        :returns:
+            The sorted names and aliases.
+        :rtype: list[str]
+        """
+        return sorted({*self.info["commands"], *self._aliases})
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """
+        Format the recorded command list for display in help text.
+
+        :param ctx:
+            The Click context.
+        :param formatter:
+            The formatter to write command information to.
+        """
+        rows = []
+        for name, sub in self.info["commands"].items():
+            if sub["hidden"]:
+                continue
+            if sub["aliases"]:
+                name = f"{name} ({', '.join(sub['aliases'])})"
+            rows.append((name, sub["listed_help"] or ""))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def serve_subcommand_help(self, ctx: click.Context) -> None:
+        """
+        Show help of a subcommand if the arguments ask for it.
+
+        :param ctx:
+            The context of the group.
+        """
+        args = [*ctx._protected_args, *ctx.args]
+        if not args or self.chain:
+            return
+        try:
+            name, command, rest = self.resolve_command(ctx, args)
+        except click.UsageError:
+            return
+        if isinstance(command, ManifestCommand):
+            command.serve_help(name, rest, ctx, {})
+
+
+def manifest_command(
+    info: dict[str, Any], loader: Callable[[], click.Command] | None = None
+) -> ManifestCommand:
+    """
+    Create a stand-in for a command or group from its description.
+
+    :param info:
+        The description of the command.
+    :param loader:
+        Loads the real command.
+
+    :returns:
+        The stand-in.
+    :rtype: ManifestCommand
+    """
+    if "commands" in info:
+        return ManifestGroup(info, loader)
+    return ManifestCommand(info, loader)
+
+
+__all__ = [
+    "Manifest",
+    "ManifestArgument",
+    "ManifestCommand",
+    "ManifestGroup",
+    "ManifestOption",
+    "build_manifest",
+    "collect_sources",
+    "describe_command",
+    "manifest_command",
+    "write_manifest",
+]
@@ -0,0 +1,164 @@
+"""Precomputed lookups over the parent nodes of a tree."""
+
+# pylint: disable=cyclic-import
+# pylint: disable=import-outside-toplevel
+
+from typing import TYPE_CHECKING, Literal
+
+from click_extended.utils.run_state import get_run_state
+
+if TYPE_CHECKING:
+    from click_extended.core.nodes.parent_node import ParentNode
+
+ParentKind = Literal["argument", "option", "env"]
+
+
+class ParentIndex:
+    """
+    Immutable lookups over the parent nodes of a tree.
+
+    The index is built once after the tree has been validated. Parents are
+    numbered in registration order, so the parents of a kind and the parents
+    that were provided are stored as bitsets and queries only visit the
+    parents in the result.
+
+    Which parents were provided changes per invocation and is computed from
+    ``ParentNode.was_provided`` the first time it is needed after
+    ``reset_provided`` is called. During an invocation, it is cached in the
+    ``RunState`` of the invocation instead of on the index.
+    """
+
+    __slots__ = ("nodes", "_tagged", "_kinds", "_provided")
+
+    def __init__(self, parents: dict[str, "ParentNode"]) -> None:
+        """
+        Build the index for the given parents.
+
+        :param parents:
+            Dictionary mapping parent names to parent nodes.
+        """
+        from click_extended.core.decorators.argument import Argument
+        from click_extended.core.decorators.env import Env
+        from click_extended.core.decorators.option import Option
+
+        self.nodes: tuple["ParentNode", ...] = tuple(parents.values())
+
+        tagged: dict[str, list["ParentNode"]] = {}
+        kinds: dict[ParentKind, int] = {"argument": 0, "option": 0, "env": 0}
+
+        for position, parent in enumerate(self.nodes):
+            for tag in parent.tags:
+                tagged.setdefault(tag, []).append(parent)
+
+            if isinstance(parent, Argument):
+                kinds["argument"] |= 1 << position
+            elif isinstance(parent, Option):
+                kinds["option"] |= 1 << position
+            elif isinstance(parent, Env):
+                kinds["env"] |= 1 << position
+
+        self._tagged = {tag: tuple(nodes) for tag, nodes in tagged.items()}
+        self._kinds = kinds
+        self._provided: int | None = None
+
+    def reset_provided(self) -> None:
+        """Recompute which parents were provided on the next query."""
+        state = get_run_state()
+        if state is None:
+            self._provided = None
+        else:
+            state.masks.pop(self, None)
+
+    def _provided_mask(self) -> int:
+        """
+        Get the bitset of the parents that were provided.
+
+        :returns:
+            The bitset with a bit set for every provided parent.
+        :rtype: int
+        """
+        state = get_run_state()
+        cached = self._provided if state is None else state.masks.get(self)
+        if cached is not None:
+            return cached
+
+        mask = 0
+        for position, parent in enumerate(self.nodes):
+            if parent.was_provided:
+                mask |= 1 << position
+
+        if state is None:
+            self._provided = mask
+        else:
+            state.masks[self] = mask
+        return mask
+
+    def _select(self, mask: int) -> list["ParentNode"]:
+        """
+        Get the parents in a bitset in registration order.
+
+        :param mask:
+            The bitset of parents to select.
+
+        :returns:
+            List of the selected parent nodes.
+        :rtype: list[ParentNode]
+        """
+        result: list["ParentNode"] = []
+        while mask:
+            low = mask & -mask
+            result.append(self.nodes[low.bit_length() - 1])
+            mask ^= low
+        return result
+
+    def tagged(self) -> dict[str, list["ParentNode"]]:
+        """
+        Get the parents of every tag.
+
+        :returns:
+            Dictionary mapping tag names to lists of parent nodes.
+        :rtype: dict[str, list[ParentNode]]
+        """
+        return {tag: list(nodes) for tag, nodes in self._tagged.items()}
+
+    def tagged_with(self, tag: str) -> list["ParentNode"]:
+        """
+        Get the parents with a tag.
+
+        :param tag:
+            The tag name.
+
+        :returns:
+            List of parent nodes with the tag.
+        :rtype: list[ParentNode]
+        """
+        return list(self._tagged.get(tag, ()))
+
+    def provided(self, kind: ParentKind | None = None) -> list["ParentNode"]:
+        """
+        Get the parents that were provided.
+
+        :param kind:
+            Only include parents of this kind. If ``None``, includes all.
+
+        :returns:
+            List of provided parent nodes.
+        :rtype: list[ParentNode]
+        """
+        mask = self._provided_mask()
+        if kind is not None:
+            mask &= self._kinds[kind]
+        return self._select(mask)
+
+    def missing(self, kind: ParentKind) -> list["ParentNode"]:
+        """
+        Get the parents of a kind that were not provided.
+
+        :param kind:
+            The kind of parents to include.
+
+        :returns:
+            List of missing parent nodes.
+        :rtype: list[ParentNode]
+        """
+        return self._select(self._kinds[kind] & ~self._provided_mask())
@@ -16,6 +16,7 @@ Phases:
 
 import os
 import sys
+import threading
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 import click
@@ -27,6 +28,7 @@ from click_extended.errors import (
     ParentExistsError,
     RootExistsError,
 )
+from click_extended.utils.scope import scope_target
 
 if TYPE_CHECKING:
     from click_extended.core.decorators.tag import Tag
@@ -35,6 +37,7 @@ if TYPE_CHECKING:
     from click_extended.core.nodes.child_validation_node import ChildValidationNode
     from click_extended.core.nodes.parent_node import ParentNode
     from click_extended.core.nodes.validation_node import ValidationNode
+    from click_extended.core.other._execution_plan import ExecutionPlan
 
 
 class Tree:
@@ -67,6 +70,9 @@ class Tree:
             Custom data storage
         is_validated (bool):
             Whether Phase 3 validation has completed.
+        plan (ExecutionPlan | None):
+            The structure every invocation shares, including the lookups
+            over the parent nodes, built after validation.
     """
 
     _pending_nodes: list[
@@ -82,6 +88,8 @@ class Tree:
         ]
     ] = []
 
+    _lock = threading.RLock()
+
     @staticmethod
     def get_pending_nodes() -> list[
         tuple[
@@ -169,7 +177,12 @@ class Tree:
         self.tags: dict[str, "Tag"] = {}
         self.validations: list["ValidationNode"] = []
         self.data: dict[str, Any] = {}
-        self.is_validated: bool = False
+        self.plan: "ExecutionPlan | None" = None
+
+    @property
+    def is_validated(self) -> bool:
+        """Whether Phase 3 validation has completed."""
+        return self.plan is not None
 
     @staticmethod
     def initialize_context(context: click.Context, root_node: "RootNode") -> None:
@@ -183,26 +196,13 @@ class Tree:
         :param root_node:
             The root node of the tree.
         """
-        parents_dict: dict[str, "ParentNode"] = {}
-        if (root := root_node.tree.root) is not None:
-            parents_dict = {
-                name: node  # type: ignore[misc]
-                for name, node in root.children.items()
-                if isinstance(name, str)
-            }
-
-        children_dict: dict[str, "ChildNode"] = {}
-        for parent in parents_dict.values():
-            for child_name, child_node in parent.children.items():
-                if isinstance(child_name, (str, int)):
-                    name = child_node.name
-                    children_dict[name] = child_node  # type: ignore
+        plan = root_node.tree.plan
+        if plan is not None:
+            parents_dict, children_dict = plan.parents, plan.children
+        else:
+            from click_extended.core.other._execution_plan import collect_nodes
 
-        for tag in root_node.tree.tags.values():
-            for child_name, child_node in tag.children.items():
-                if isinstance(child_name, (str, int)):
-                    name = child_node.name
-                    children_dict[name] = child_node  # type: ignore
+            parents_dict, children_dict = collect_nodes(root_node.tree)
 
         debug = os.getenv("CLICK_EXTENDED_DEBUG", "").lower() in (
             "1",
@@ -227,8 +227,12 @@ class Tree:
             "children": children_dict,
             "data": data,
             "debug": debug,
+            "strict_types": root_node.settings.strict_types,
         }
 
+        if plan is not None:
+            context.meta["click_extended"]["nodes"] = plan.nodes
+
     @staticmethod
     def update_scope(
         context: click.Context,
@@ -254,9 +258,42 @@ class Tree:
         if "click_extended" not in context.meta:
             return
 
-        context.meta["click_extended"]["current_scope"] = scope
-        context.meta["click_extended"]["parent_node"] = parent_node
-        context.meta["click_extended"]["child_node"] = child_node
+        target = scope_target(context.meta["click_extended"])
+        target["current_scope"] = scope
+        target["parent_node"] = parent_node
+        target["child_node"] = child_node
+
+    @staticmethod
+    def get_node_index(meta: dict[str, Any]) -> dict[str, Any]:
+        """
+        Get the index of all nodes by name for the current invocation.
+        This is a part of ``phase 4`` and the index is built from the
+        parents, tags, children and globals in the metadata the first time
+        it is requested, then shared by every context of the invocation.
+
+        :param meta:
+            The ``click-extended`` metadata of the Click context.
+
+        :returns:
+            Dictionary mapping node names to nodes.
+        :rtype: dict[str, Any]
+        """
+        nodes: dict[str, Any] | None = meta.get("nodes")
+        if nodes is not None:
+            return nodes
+
+        nodes = {}
+        for key in ("parents", "tags", "children", "globals"):
+            group = meta.get(key)
+            if isinstance(group, dict):
+                nodes.update(group)
+
+        root_node = meta.get("root_node")
+        if root_node is not None:
+            nodes[root_node.name] = root_node
+
+        meta["nodes"] = nodes
+        return nodes
 
     def validate_and_build(self, context: click.Context) -> None:
         """
@@ -273,6 +310,11 @@ class Tree:
         4. Validates types (child/parent compatibility)
         5. Sets up tags and globals
 
+        The tree is built once, by the first invocation, and is not modified
+        by later invocations, so a command can be invoked from several
+        threads at once. The execution plan is built along with it and bound
+        to the context of every invocation.
+
         :param context:
             The Click context (must be initialized).
 
@@ -289,8 +331,43 @@ class Tree:
         :raises TypeMismatchError:
             If child/parent types incompatible.
         """
-        if self.is_validated:
-            return
+        if self.plan is None:
+            with Tree._lock:
+                if self.plan is None:
+                    self._build()
+
+        plan = self.get_plan()
+        if plan is not None:
+            plan.index.reset_provided()
+            if "click_extended" in context.meta:
+                meta = context.meta["click_extended"]
+                meta["parents"] = plan.parents
+                meta["children"] = plan.children
+                meta["nodes"] = plan.nodes
+                meta["parent_index"] = plan.index
+
+    def get_plan(self) -> "ExecutionPlan | None":
+        """
+        Get the execution plan of the tree.
+
+        The plan is rebuilt if a handler method of a child class changed
+        since it was built.
+
+        :returns:
+            The plan, or ``None`` if the tree has not been validated.
+        :rtype: ExecutionPlan | None
+        """
+        plan = self.plan
+        if plan is not None and not plan.is_current():
+            from click_extended.core.other._execution_plan import ExecutionPlan
+
+            plan = self.plan = ExecutionPlan(self, plan.index, plan.validations)
+        return plan
+
+    def _build(self) -> None:
+        """Build the tree from pending nodes, validate it and plan it."""
+        from click_extended.core.other._execution_plan import ExecutionPlan
+        from click_extended.core.other._parent_index import ParentIndex
 
         if not self.root or not self.root.children:
             pending = list(reversed(Tree.get_pending_nodes()))
@@ -310,7 +387,43 @@ class Tree:
                     )
 
         self._validate_names()
-        self.is_validated = True
+
+        parents: dict[str, "ParentNode"] = {}
+        if self.root is not None:
+            parents = {
+                name: node  # type: ignore[misc]
+                for name, node in self.root.children.items()
+                if isinstance(name, str)
+            }
+        index = ParentIndex(parents)
+
+        for tag_name, tag in self.tags.items():
+            tag.parent_nodes = index.tagged_with(tag_name)
+
+        self.plan = ExecutionPlan(self, index, self._plan_validations())
+
+    def _plan_validations(self) -> list["ValidationNode"]:
+        """
+        Order the validations and hand the ones after the first ``@catch``
+        to it, so it can catch their errors.
+
+        :returns:
+            The validations the runtime calls itself, in order.
+        :rtype: list[ValidationNode]
+        """
+        catch_nodes = [v for v in self.validations if v.__class__.__name__ == "Catch"]
+        other_nodes = [v for v in self.validations if v.__class__.__name__ != "Catch"]
+        self.validations = catch_nodes + other_nodes
+
+        for i, validation_node in enumerate(self.validations):
+            if validation_node.__class__.__name__ == "Catch":
+                if hasattr(validation_node, "remaining_validations"):
+                    validation_node.remaining_validations = (  # type: ignore
+                        self.validations[i + 1 :]
+                    )
+                return self.validations[: i + 1]
+
+        return self.validations
 
     def _register_parent_node(self, node: "ParentNode") -> None:
         """Register a parent node during validation phase."""
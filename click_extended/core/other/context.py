@@ -6,7 +6,7 @@
 # pylint: disable=protected-access
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, overload
+from typing import TYPE_CHECKING, Any, cast, overload
 
 if TYPE_CHECKING:
     from click import Context as ClickContext
@@ -19,9 +19,12 @@ if TYPE_CHECKING:
     from click_extended.core.nodes.child_node import ChildNode
     from click_extended.core.nodes.node import Node
     from click_extended.core.nodes.parent_node import ParentNode
+    from click_extended.core.other._parent_index import ParentIndex
+    from click_extended.utils.profile import Profiler
+    from click_extended.utils.run_state import RunState
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Context:
     """
     Context with a unified all contextual information across the context.
@@ -50,6 +53,12 @@ class Context:
       debug (bool):
         Debug mode flag. When ``True``, handler exceptions show full tracebacks.
         Set via ``@debug()`` decorator.
+      index (ParentIndex | None):
+        Precomputed lookups over ``parents`` used by the query methods. When
+        ``None``, the query methods scan ``parents`` instead.
+
+    Contexts are immutable and share their node dictionaries, so a context
+    for another node is derived with ``with_node`` instead of being rebuilt.
     """
 
     root: "RootNode"
@@ -62,6 +71,39 @@ class Context:
     children: dict[str, "ChildNode"]
     data: dict[str, Any]
     debug: bool = False
+    index: "ParentIndex | None" = None
+
+    def with_node(
+        self, current: "Node | None", parent: "ParentNode | Tag | None"
+    ) -> "Context":
+        """
+        Get a view of this context for another node.
+
+        The returned context shares every attribute with this context except
+        ``current`` and ``parent``.
+
+        :param current:
+            The node the view is for.
+        :param parent:
+            The parent of the node the view is for.
+
+        :returns:
+            The context for the node.
+        :rtype: Context
+        """
+        return Context(
+            self.root,
+            current,
+            parent,
+            self.click_context,
+            self.nodes,
+            self.parents,
+            self.tags,
+            self.children,
+            self.data,
+            self.debug,
+            self.index,
+        )
 
     def is_root(self) -> bool:
         """
@@ -280,6 +322,11 @@ class Context:
             of parent nodes with that tag.
         :rtype: dict[str, list[ParentNode]] | list[ParentNode]
         """
+        if self.index is not None:
+            if name is None:
+                return self.index.tagged()
+            return self.index.tagged_with(name)
+
         result: dict[str, list["ParentNode"]] = {}
 
         for parent in self.parents.values():
@@ -313,6 +360,9 @@ class Context:
         """
         from click_extended.core.decorators.argument import Argument
 
+        if self.index is not None:
+            return cast("list[Argument]", self.index.provided("argument"))
+
         return [
             parent
             for parent in self.parents.values()
@@ -329,6 +379,9 @@ class Context:
         """
         from click_extended.core.decorators.option import Option
 
+        if self.index is not None:
+            return cast("list[Option]", self.index.provided("option"))
+
         return [
             parent
             for parent in self.parents.values()
@@ -345,6 +398,9 @@ class Context:
         """
         from click_extended.core.decorators.env import Env
 
+        if self.index is not None:
+            return cast("list[Env]", self.index.provided("env"))
+
         return [
             parent
             for parent in self.parents.values()
@@ -376,6 +432,9 @@ class Context:
             The provided raw values in the context.
         :rtype: dict[str, Any]
         """
+        if self.index is not None:
+            return {parent.name: parent.raw_value for parent in self.index.provided()}
+
         provided: dict[str, Any] = {}
         for name, parent in self.parents.items():
             if parent.was_provided:
@@ -392,6 +451,9 @@ class Context:
         """
         from click_extended.core.decorators.argument import Argument
 
+        if self.index is not None:
+            return cast("list[Argument]", self.index.missing("argument"))
+
         return [
             parent
             for parent in self.parents.values()
@@ -408,6 +470,9 @@ class Context:
         """
         from click_extended.core.decorators.option import Option
 
+        if self.index is not None:
+            return cast("list[Option]", self.index.missing("option"))
+
         return [
             parent
             for parent in self.parents.values()
@@ -424,12 +489,47 @@ class Context:
         """
         from click_extended.core.decorators.env import Env
 
+        if self.index is not None:
+            return cast("list[Env]", self.index.missing("env"))
+
         return [
             parent
             for parent in self.parents.values()
             if isinstance(parent, Env) and not parent.was_provided
         ]
 
+    def get_profile(self) -> "Profiler | None":
+        """
+        Get the timings recorded for the current invocation.
+
+        Profiling is enabled with ``Settings(profile=True)`` on
+        ``@command``/``@group`` or the ``CLICK_EXTENDED_PROFILE`` environment
+        variable.
+
+        :returns:
+            The profiler of the invocation, or ``None`` if profiling is
+            disabled.
+        :rtype: Profiler | None
+        """
+        meta = self.click_context.meta.get("click_extended", {})
+        return cast("Profiler | None", meta.get("profiler"))
+
+    def get_run_state(self) -> "RunState | None":
+        """
+        Get the per-invocation state of the parent nodes.
+
+        The values, raw values and provided flags of the parents of an
+        invocation are stored in its state rather than on the shared nodes,
+        so a command can be invoked from several threads at once.
+
+        :returns:
+            The state of the invocation, or ``None`` if the context was
+            created outside of an invocation.
+        :rtype: RunState | None
+        """
+        meta = self.click_context.meta.get("click_extended", {})
+        return cast("RunState | None", meta.get("run_state"))
+
     def get_current_tags(self) -> list[str]:
         """
         Get a list of the tags of the current node.
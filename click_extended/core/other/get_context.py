@@ -9,7 +9,9 @@ from typing import TYPE_CHECKING, Any, cast
 
 import click
 
+from click_extended.core.other._tree import Tree
 from click_extended.core.other.context import Context
+from click_extended.utils.scope import get_scope_value
 
 if TYPE_CHECKING:
     from click_extended.core.decorators.tag import Tag
@@ -48,7 +50,6 @@ def get_context() -> Context:
     parents: dict[str, Any] = meta.get("parents", {})
     tags: dict[str, Any] = meta.get("tags", {})
     children: dict[str, Any] = meta.get("children", {})
-    globals_nodes: dict[str, Any] = meta.get("globals", {})
 
     if not isinstance(parents, dict):
         parents = {}
@@ -56,26 +57,14 @@ def get_context() -> Context:
         tags = {}
     if not isinstance(children, dict):
         children = {}
-    if not isinstance(globals_nodes, dict):
-        globals_nodes = {}
-
-    all_nodes: dict[str, Any] = {}
-    if isinstance(parents, dict):
-        all_nodes.update(parents)
-    if isinstance(tags, dict):
-        all_nodes.update(tags)
-    if isinstance(children, dict):
-        all_nodes.update(children)
-    if isinstance(globals_nodes, dict):
-        all_nodes.update(globals_nodes)
-    if root_node is not None:
-        all_nodes[root_node.name] = root_node
-
-    current_scope = meta.get("current_scope", "root")
+
+    all_nodes = Tree.get_node_index(meta)
+
+    current_scope = get_scope_value(meta, "current_scope", "root")
     if current_scope not in ("root", "parent", "child"):
         current_scope = "root"
-    parent_node = meta.get("parent_node")
-    child_node = meta.get("child_node")
+    parent_node = get_scope_value(meta, "parent_node")
+    child_node = get_scope_value(meta, "child_node")
 
     current = None
     parent = None
@@ -98,4 +87,5 @@ def get_context() -> Context:
         children=cast("dict[str, ChildNode]", children),
         data=meta.get("data", {}),
         debug=bool(meta.get("debug", False)),
+        index=meta.get("parent_index"),
     )
@@ -0,0 +1,64 @@
+"""Runtime settings of commands and groups."""
+
+from dataclasses import dataclass
+
+from click_extended.utils.offload import EXECUTOR_KINDS, ExecutorKind
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Runtime settings of a command or group, passed to ``@command`` and
+    ``@group`` as ``settings``.
+
+    :param strict_types: Whether values are checked against the type hints
+        of child handlers at runtime. Set to ``False`` once the tree has been
+        verified to skip these checks entirely.
+    :param profile: Whether to record timings of child handlers, parent
+        loads and validations for every invocation. The timings are
+        available from ``Context.get_profile()``.
+    :param concurrent_loads: Whether async ``load`` methods of parents that
+        do not read other nodes through the context run concurrently. Set to
+        ``False`` to load parents one at a time in tree order.
+    :param chain_concurrency: The maximum number of parents whose children
+        are processed at once when any handler is async, or ``None`` for no
+        limit. Set to ``1`` to process parents one at a time.
+    :param executor: Run blocking calls in a pool of worker threads when
+        set to ``"thread"``. Sync child handlers and the sync ``load``
+        methods of self-sourcing parents (such as ``@env``) then run in the
+        pool, so the I/O of independent parents overlaps. Individual
+        children can opt in with ``offload = True`` instead.
+    :param max_workers: The maximum number of worker threads of the
+        executor, or ``None`` for the ``ThreadPoolExecutor`` default.
+    :param batch: Whether to add the ``--batch`` option, which runs the
+        command once for every line of a file.
+
+    :raises ValueError: If ``chain_concurrency`` or ``max_workers`` is less
+        than ``1``, or the executor is not supported.
+    """
+
+    strict_types: bool = True
+    profile: bool = False
+    concurrent_loads: bool = True
+    chain_concurrency: int | None = None
+    executor: ExecutorKind | None = None
+    max_workers: int | None = None
+    batch: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the settings."""
+        if self.chain_concurrency is not None and self.chain_concurrency < 1:
+            raise ValueError(
+                "chain_concurrency must be at least 1, "
+                f"got {self.chain_concurrency}."
+            )
+        if self.executor is not None and self.executor not in EXECUTOR_KINDS:
+            raise ValueError(
+                f"Unsupported executor '{self.executor}', "
+                f"expected one of {EXECUTOR_KINDS}."
+            )
+        if self.max_workers is not None and self.max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {self.max_workers}.")
+
+
+__all__ = ["Settings"]
@@ -1,21 +1,26 @@
 """Initialization file for the `click_extended.decorators` module."""
 
-from click_extended.decorators.check import *
+from typing import TYPE_CHECKING
+
 from click_extended.decorators.check import __all__ as check_all
-from click_extended.decorators.compare import *
 from click_extended.decorators.compare import __all__ as compare_all
-from click_extended.decorators.convert import *
 from click_extended.decorators.convert import __all__ as convert_all
-from click_extended.decorators.load import *
 from click_extended.decorators.load import __all__ as load_all
-from click_extended.decorators.math import *
 from click_extended.decorators.math import __all__ as math_all
-from click_extended.decorators.misc import *
 from click_extended.decorators.misc import __all__ as misc_all
-from click_extended.decorators.random import *
 from click_extended.decorators.random import __all__ as random_all
-from click_extended.decorators.transform import *
 from click_extended.decorators.transform import __all__ as transform_all
+from click_extended.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from click_extended.decorators.check import *
+    from click_extended.decorators.compare import *
+    from click_extended.decorators.convert import *
+    from click_extended.decorators.load import *
+    from click_extended.decorators.math import *
+    from click_extended.decorators.misc import *
+    from click_extended.decorators.random import *
+    from click_extended.decorators.transform import *
 
 __all__ = [
     *check_all,
@@ -27,3 +32,17 @@ __all__ = [
     *random_all,
     *transform_all,
 ]  # type: ignore
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        **dict.fromkeys(check_all, ".check"),
+        **dict.fromkeys(compare_all, ".compare"),
+        **dict.fromkeys(convert_all, ".convert"),
+        **dict.fromkeys(load_all, ".load"),
+        **dict.fromkeys(math_all, ".math"),
+        **dict.fromkeys(misc_all, ".misc"),
+        **dict.fromkeys(random_all, ".random"),
+        **dict.fromkeys(transform_all, ".transform"),
+    },
+)
@@ -1,32 +1,37 @@
 """Initialization file for the `click_extended.decorators.check` module."""
 
-from click_extended.decorators.check.conflicts import conflicts
-from click_extended.decorators.check.contains import contains
-from click_extended.decorators.check.dependencies import dependencies
-from click_extended.decorators.check.divisible_by import divisible_by
-from click_extended.decorators.check.ends_with import ends_with
-from click_extended.decorators.check.exclusive import exclusive
-from click_extended.decorators.check.falsy import falsy
-from click_extended.decorators.check.is_email import is_email
-from click_extended.decorators.check.is_hex_color import is_hex_color
-from click_extended.decorators.check.is_hostname import is_hostname
-from click_extended.decorators.check.is_ipv4 import is_ipv4
-from click_extended.decorators.check.is_ipv6 import is_ipv6
-from click_extended.decorators.check.is_json import is_json
-from click_extended.decorators.check.is_mac_address import is_mac_address
-from click_extended.decorators.check.is_negative import is_negative
-from click_extended.decorators.check.is_non_zero import is_non_zero
-from click_extended.decorators.check.is_numeric import is_numeric
-from click_extended.decorators.check.is_port import is_port
-from click_extended.decorators.check.is_positive import is_positive
-from click_extended.decorators.check.is_url import is_url
-from click_extended.decorators.check.is_uuid import is_uuid
-from click_extended.decorators.check.length import length
-from click_extended.decorators.check.not_empty import not_empty
-from click_extended.decorators.check.regex import regex
-from click_extended.decorators.check.requires import requires
-from click_extended.decorators.check.starts_with import starts_with
-from click_extended.decorators.check.truthy import truthy
+from typing import TYPE_CHECKING
+
+from click_extended.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from click_extended.decorators.check.conflicts import conflicts
+    from click_extended.decorators.check.contains import contains
+    from click_extended.decorators.check.dependencies import dependencies
+    from click_extended.decorators.check.divisible_by import divisible_by
+    from click_extended.decorators.check.ends_with import ends_with
+    from click_extended.decorators.check.exclusive import exclusive
+    from click_extended.decorators.check.falsy import falsy
+    from click_extended.decorators.check.is_email import is_email
+    from click_extended.decorators.check.is_hex_color import is_hex_color
+    from click_extended.decorators.check.is_hostname import is_hostname
+    from click_extended.decorators.check.is_ipv4 import is_ipv4
+    from click_extended.decorators.check.is_ipv6 import is_ipv6
+    from click_extended.decorators.check.is_json import is_json
+    from click_extended.decorators.check.is_mac_address import is_mac_address
+    from click_extended.decorators.check.is_negative import is_negative
+    from click_extended.decorators.check.is_non_zero import is_non_zero
+    from click_extended.decorators.check.is_numeric import is_numeric
+    from click_extended.decorators.check.is_port import is_port
+    from click_extended.decorators.check.is_positive import is_positive
+    from click_extended.decorators.check.is_url import is_url
+    from click_extended.decorators.check.is_uuid import is_uuid
+    from click_extended.decorators.check.length import length
+    from click_extended.decorators.check.not_empty import not_empty
+    from click_extended.decorators.check.regex import regex
+    from click_extended.decorators.check.requires import requires
+    from click_extended.decorators.check.starts_with import starts_with
+    from click_extended.decorators.check.truthy import truthy
 
 __all__ = [
     "conflicts",
@@ -57,3 +62,36 @@ __all__ = [
     "starts_with",
     "truthy",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "conflicts": ".conflicts",
+        "contains": ".contains",
+        "dependencies": ".dependencies",
+        "divisible_by": ".divisible_by",
+        "ends_with": ".ends_with",
+        "exclusive": ".exclusive",
+        "falsy": ".falsy",
+        "is_email": ".is_email",
+        "is_hex_color": ".is_hex_color",
+        "is_hostname": ".is_hostname",
+        "is_ipv4": ".is_ipv4",
+        "is_ipv6": ".is_ipv6",
+        "is_json": ".is_json",
+        "is_mac_address": ".is_mac_address",
+        "is_negative": ".is_negative",
+        "is_non_zero": ".is_non_zero",
+        "is_numeric": ".is_numeric",
+        "is_port": ".is_port",
+        "is_positive": ".is_positive",
+        "is_url": ".is_url",
+        "is_uuid": ".is_uuid",
+        "length": ".length",
+        "not_empty": ".not_empty",
+        "regex": ".regex",
+        "requires": ".requires",
+        "starts_with": ".starts_with",
+        "truthy": ".truthy",
+    },
+)
@@ -1,18 +1,18 @@
 """Check if a value is divisible by a number."""
 
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from typing import Any
 
 from click_extended.core.nodes.child_node import ChildNode
 from click_extended.core.other.context import Context
 from click_extended.types import Decorator
-
-getcontext().prec = 35
+from click_extended.utils.precision import decimal_precision
 
 
 class DivisibleBy(ChildNode):
     """Check if a value is divisible by a number."""
 
+    @decimal_precision(35)
     def handle_numeric(
         self,
         value: int | float,
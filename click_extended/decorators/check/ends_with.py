@@ -6,6 +6,7 @@ from typing import Any
 
 from click_extended.core.nodes.child_node import ChildNode
 from click_extended.core.other.context import Context
+from click_extended.errors import BatchItemError
 from click_extended.types import Decorator
 from click_extended.utils.humanize import humanize_iterable
 
@@ -50,6 +51,30 @@ class EndsWith(ChildNode):
 
         return value
 
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: Context,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Any, ...]:
+        patterns: tuple[str | re.Pattern[str], ...] = kwargs.get("text", ())
+        suffixes = tuple(
+            pattern
+            for pattern in patterns
+            if isinstance(pattern, str)
+            and not any(char in pattern for char in ["*", "?", "[", "]"])
+        )
+
+        for index, value in enumerate(values):
+            if not value.endswith(suffixes):
+                try:
+                    self.handle_str(value, context, *args, **kwargs)
+                except ValueError as e:
+                    raise BatchItemError(index, e) from e
+
+        return values
+
 
 def ends_with(*text: str | re.Pattern[str]) -> Decorator:
     r"""
@@ -1,8 +1,8 @@
 """Check if a value is a valid email address."""
 
-from typing import Any
+# pylint: disable=import-outside-toplevel
 
-from email_validator import EmailNotValidError, validate_email
+from typing import Any
 
 from click_extended.core.nodes.child_node import ChildNode
 from click_extended.core.other.context import Context
@@ -19,6 +19,8 @@ class IsEmail(ChildNode):
         *args: Any,
         **kwargs: Any,
     ) -> Any:
+        from email_validator import EmailNotValidError, validate_email
+
         try:
             validate_email(value, check_deliverability=False)
         except EmailNotValidError as e:
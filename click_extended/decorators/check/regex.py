@@ -5,6 +5,7 @@ from typing import Any, Union
 
 from click_extended.core.nodes.child_node import ChildNode
 from click_extended.core.other.context import Context
+from click_extended.errors import BatchItemError
 from click_extended.types import Decorator
 
 
@@ -38,6 +39,28 @@ class Regex(ChildNode):
             f"Value '{value}' does not match any " + f"of the patterns: {pattern_strs}"
         )
 
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: Context,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Any, ...]:
+        flags: int = kwargs.get("flags", 0)
+        compiled_patterns = [
+            pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, flags)
+            for pattern in kwargs["patterns"]
+        ]
+
+        for index, value in enumerate(values):
+            if not any(pattern.fullmatch(value) for pattern in compiled_patterns):
+                try:
+                    self.handle_str(value, context, *args, **kwargs)
+                except ValueError as e:
+                    raise BatchItemError(index, e) from e
+
+        return values
+
 
 def regex(*patterns: Union[str, re.Pattern[str]], flags: int = 0) -> Decorator:
     r"""
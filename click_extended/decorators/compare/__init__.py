@@ -1,10 +1,15 @@
 """Initialization file for the `click_extended.decorators.compare` module."""
 
-from click_extended.decorators.compare.at_least import at_least
-from click_extended.decorators.compare.at_most import at_most
-from click_extended.decorators.compare.between import between
-from click_extended.decorators.compare.greater_than import greater_than
-from click_extended.decorators.compare.less_than import less_than
+from typing import TYPE_CHECKING
+
+from click_extended.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from click_extended.decorators.compare.at_least import at_least
+    from click_extended.decorators.compare.at_most import at_most
+    from click_extended.decorators.compare.between import between
+    from click_extended.decorators.compare.greater_than import greater_than
+    from click_extended.decorators.compare.less_than import less_than
 
 __all__ = [
     "at_least",
@@ -13,3 +18,14 @@ __all__ = [
     "greater_than",
     "less_than",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "at_least": ".at_least",
+        "at_most": ".at_most",
+        "between": ".between",
+        "greater_than": ".greater_than",
+        "less_than": ".less_than",
+    },
+)
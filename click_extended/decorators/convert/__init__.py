@@ -1,17 +1,24 @@
 """Initialization file for the `click_extended.decorators.convert` module."""
 
-from click_extended.decorators.convert.convert_angle import convert_angle
-from click_extended.decorators.convert.convert_area import convert_area
-from click_extended.decorators.convert.convert_bits import convert_bits
-from click_extended.decorators.convert.convert_distance import convert_distance
-from click_extended.decorators.convert.convert_energy import convert_energy
-from click_extended.decorators.convert.convert_power import convert_power
-from click_extended.decorators.convert.convert_pressure import convert_pressure
-from click_extended.decorators.convert.convert_speed import convert_speed
-from click_extended.decorators.convert.convert_temperature import convert_temperature
-from click_extended.decorators.convert.convert_time import convert_time
-from click_extended.decorators.convert.convert_volume import convert_volume
-from click_extended.decorators.convert.convert_weight import convert_weight
+from typing import TYPE_CHECKING
+
+from click_extended.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from click_extended.decorators.convert.convert_angle import convert_angle
+    from click_extended.decorators.convert.convert_area import convert_area
+    from click_extended.decorators.convert.convert_bits import convert_bits
+    from click_extended.decorators.convert.convert_distance import convert_distance
+    from click_extended.decorators.convert.convert_energy import convert_energy
+    from click_extended.decorators.convert.convert_power import convert_power
+    from click_extended.decorators.convert.convert_pressure import convert_pressure
+    from click_extended.decorators.convert.convert_speed import convert_speed
+    from click_extended.decorators.convert.convert_temperature import (
+        convert_temperature,
+    )
+    from click_extended.decorators.convert.convert_time import convert_time
+    from click_extended.decorators.convert.convert_volume import convert_volume
+    from click_extended.decorators.convert.convert_weight import convert_weight
 
 __all__ = [
     "convert_angle",
@@ -27,3 +34,21 @@ __all__ = [
     "convert_volume",
     "convert_weight",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "convert_angle": ".convert_angle",
+        "convert_area": ".convert_area",
+        "convert_bits": ".convert_bits",
+        "convert_distance": ".convert_distance",
+        "convert_energy": ".convert_energy",
+        "convert_power": ".convert_power",
+        "convert_pressure": ".convert_pressure",
+        "convert_speed": ".convert_speed",
+        "convert_temperature": ".convert_temperature",
+        "convert_time": ".convert_time",
+        "convert_volume": ".convert_volume",
+        "convert_weight": ".convert_weight",
+    },
+)
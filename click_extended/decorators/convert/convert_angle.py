@@ -1,14 +1,13 @@
 """Convert between different angle units."""
 
 import math
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from typing import Any, Literal
 
 from click_extended.core.nodes.child_node import ChildNode
 from click_extended.core.other.context import Context
 from click_extended.types import Decorator
-
-getcontext().prec = 35
+from click_extended.utils.precision import decimal_precision
 
 PI = Decimal(math.pi)
 
@@ -27,6 +26,7 @@ UNITS = {
 class ConvertAngle(ChildNode):
     """Convert between different angle units."""
 
+    @decimal_precision(35)
     def handle_numeric(
         self,
         value: int | float,
@@ -47,6 +47,28 @@ class ConvertAngle(ChildNode):
 
         return float(degrees / UNITS[to_unit])
 
+    @decimal_precision(35)
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: Context,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Any, ...]:
+        from_unit = kwargs["from_unit"]
+        to_unit = kwargs["to_unit"]
+
+        if from_unit not in UNITS:
+            raise ValueError(f"Unknown unit '{from_unit}'")
+        if to_unit not in UNITS:
+            raise ValueError(f"Unknown unit '{to_unit}'")
+
+        from_factor = UNITS[from_unit]
+        to_factor = UNITS[to_unit]
+        return tuple(
+            float(Decimal(str(value)) * from_factor / to_factor) for value in values
+        )
+
 
 def convert_angle(
     from_unit: Literal[
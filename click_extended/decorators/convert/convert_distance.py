@@ -1,13 +1,12 @@
 """Convert between various distance units."""
 
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from typing import Any, Literal
 
 from click_extended.core.nodes.child_node import ChildNode
 from click_extended.core.other.context import Context
 from click_extended.types import Decorator
-
-getcontext().prec = 35
+from click_extended.utils.precision import decimal_precision
 
 UNITS = {
     "Qm": Decimal("1e30"),
@@ -40,6 +39,7 @@ UNITS = {
 class ConvertDistance(ChildNode):
     """Convert between various distance units."""
 
+    @decimal_precision(35)
     def handle_numeric(
         self,
         value: int | float,
@@ -59,6 +59,28 @@ class ConvertDistance(ChildNode):
         meters = val * UNITS[from_unit]
         return float(meters / UNITS[to_unit])
 
+    @decimal_precision(35)
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: Context,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Any, ...]:
+        from_unit = kwargs["from_unit"]
+        to_unit = kwargs["to_unit"]
+
+        if from_unit not in UNITS:
+            raise ValueError(f"Unknown unit '{from_unit}'")
+        if to_unit not in UNITS:
+            raise ValueError(f"Unknown unit '{to_unit}'")
+
+        from_factor = UNITS[from_unit]
+        to_factor = UNITS[to_unit]
+        return tuple(
+            float(Decimal(str(value)) * from_factor / to_factor) for value in values
+        )
+
 
 def convert_distance(
     from_unit: Literal[
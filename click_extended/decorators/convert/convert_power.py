@@ -1,13 +1,12 @@
 """Convert between different power units."""
 
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from typing import Any, Literal
 
 from click_extended.core.nodes.child_node import ChildNode
 from click_extended.core.other.context import Context
 from click_extended.types import Decorator
-
-getcontext().prec = 35
+from click_extended.utils.precision import decimal_precision
 
 UNITS = {
     "W": Decimal("1"),
@@ -27,6 +26,7 @@ UNITS = {
 class ConvertPower(ChildNode):
     """Convert between different power units."""
 
+    @decimal_precision(35)
     def handle_numeric(
         self,
         value: int | float,
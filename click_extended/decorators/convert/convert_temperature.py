@@ -1,13 +1,12 @@
 """Convert between temperature units."""
 
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from typing import Any, Literal
 
 from click_extended.core.nodes.child_node import ChildNode
 from click_extended.core.other.context import Context
 from click_extended.types import Decorator
-
-getcontext().prec = 28
+from click_extended.utils.precision import decimal_precision
 
 
 class ConvertTemperature(ChildNode):
@@ -44,6 +43,7 @@ class ConvertTemperature(ChildNode):
             return (100 - value) * Decimal("3") / Decimal("2")
         raise ValueError(f"Unknown unit '{unit}'")
 
+    @decimal_precision(28)
     def handle_numeric(
         self, value: int | float, context: Context, *args: Any, **kwargs: Any
     ) -> float:
@@ -1,15 +1,13 @@
 """Convert between time units."""
 
 import re
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from typing import Any, Literal
 
 from click_extended.core.nodes.child_node import ChildNode
 from click_extended.core.other.context import Context
 from click_extended.types import Decorator
-
-# Set precision high enough for time conversions
-getcontext().prec = 28
+from click_extended.utils.precision import decimal_precision
 
 UNITS = {
     "ns": Decimal("1e-9"),
@@ -39,6 +37,7 @@ class ConvertTime(ChildNode):
         result = seconds / UNITS[to_unit]
         return float(result)
 
+    @decimal_precision(28)
     def handle_str(
         self, value: str, context: Context, *args: Any, **kwargs: Any
     ) -> float:
@@ -62,6 +61,7 @@ class ConvertTime(ChildNode):
         result = total_seconds / UNITS[to_unit]
         return float(result)
 
+    @decimal_precision(28)
     def handle_numeric(
         self, value: int | float, context: Context, *args: Any, **kwargs: Any
     ) -> Any:
@@ -1,13 +1,12 @@
 """Convert between various weight units."""
 
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from typing import Any, Literal
 
 from click_extended.core.nodes.child_node import ChildNode
 from click_extended.core.other.context import Context
 from click_extended.types import Decorator
-
-getcontext().prec = 28
+from click_extended.utils.precision import decimal_precision
 
 MASS_UNITS = {
     "ug": Decimal("1e-9"),
@@ -36,6 +35,7 @@ FORCE_UNITS = {
 class ConvertWeight(ChildNode):
     """Convert between various weight units."""
 
+    @decimal_precision(28)
     def handle_numeric(
         self,
         value: int | float,
@@ -1,9 +1,14 @@
 """Initialization file for the `click_extended.decorators.load` module."""
 
-from click_extended.decorators.load.load_csv import load_csv
-from click_extended.decorators.load.load_json import load_json
-from click_extended.decorators.load.load_toml import load_toml
-from click_extended.decorators.load.load_yaml import load_yaml
+from typing import TYPE_CHECKING
+
+from click_extended.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from click_extended.decorators.load.load_csv import load_csv
+    from click_extended.decorators.load.load_json import load_json
+    from click_extended.decorators.load.load_toml import load_toml
+    from click_extended.decorators.load.load_yaml import load_yaml
 
 __all__ = [
     "load_csv",
@@ -11,3 +16,13 @@ __all__ = [
     "load_toml",
     "load_yaml",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "load_csv": ".load_csv",
+        "load_json": ".load_json",
+        "load_toml": ".load_toml",
+        "load_yaml": ".load_yaml",
+    },
+)
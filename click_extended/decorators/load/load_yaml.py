@@ -1,10 +1,10 @@
 """Child decorator to load the contents of a YAML file."""
 
+# pylint: disable=import-outside-toplevel
+
 from pathlib import Path
 from typing import Any, Literal
 
-from yaml import FullLoader, SafeLoader, UnsafeLoader, load
-
 from click_extended.core.nodes.child_node import ChildNode
 from click_extended.core.other.context import Context
 from click_extended.types import Decorator
@@ -16,6 +16,8 @@ class LoadYaml(ChildNode):
     def handle_path(
         self, value: Path, context: Context, *args: Any, **kwargs: Any
     ) -> Any:
+        from yaml import FullLoader, SafeLoader, UnsafeLoader, load
+
         if value.is_dir():
             raise IsADirectoryError(
                 f"Path '{value.absolute()}' is a directory, but must be a file."
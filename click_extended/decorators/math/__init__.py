@@ -1,21 +1,26 @@
 """Initialization file for the `click_extended.decorators.math` module."""
 
-from click_extended.decorators.math.absolute import absolute
-from click_extended.decorators.math.add import add
-from click_extended.decorators.math.ceil import ceil
-from click_extended.decorators.math.clamp import clamp
-from click_extended.decorators.math.divide import divide
-from click_extended.decorators.math.floor import floor
-from click_extended.decorators.math.maximum import maximum
-from click_extended.decorators.math.minimum import minimum
-from click_extended.decorators.math.modulo import modulo
-from click_extended.decorators.math.multiply import multiply
-from click_extended.decorators.math.normalize import normalize
-from click_extended.decorators.math.power import power
-from click_extended.decorators.math.rounded import rounded
-from click_extended.decorators.math.sqrt import sqrt
-from click_extended.decorators.math.subtract import subtract
-from click_extended.decorators.math.to_percent import to_percent
+from typing import TYPE_CHECKING
+
+from click_extended.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from click_extended.decorators.math.absolute import absolute
+    from click_extended.decorators.math.add import add
+    from click_extended.decorators.math.ceil import ceil
+    from click_extended.decorators.math.clamp import clamp
+    from click_extended.decorators.math.divide import divide
+    from click_extended.decorators.math.floor import floor
+    from click_extended.decorators.math.maximum import maximum
+    from click_extended.decorators.math.minimum import minimum
+    from click_extended.decorators.math.modulo import modulo
+    from click_extended.decorators.math.multiply import multiply
+    from click_extended.decorators.math.normalize import normalize
+    from click_extended.decorators.math.power import power
+    from click_extended.decorators.math.rounded import rounded
+    from click_extended.decorators.math.sqrt import sqrt
+    from click_extended.decorators.math.subtract import subtract
+    from click_extended.decorators.math.to_percent import to_percent
 
 __all__ = [
     "absolute",
@@ -35,3 +40,25 @@ __all__ = [
     "subtract",
     "to_percent",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "absolute": ".absolute",
+        "add": ".add",
+        "ceil": ".ceil",
+        "clamp": ".clamp",
+        "divide": ".divide",
+        "floor": ".floor",
+        "maximum": ".maximum",
+        "minimum": ".minimum",
+        "modulo": ".modulo",
+        "multiply": ".multiply",
+        "normalize": ".normalize",
+        "power": ".power",
+        "rounded": ".rounded",
+        "sqrt": ".sqrt",
+        "subtract": ".subtract",
+        "to_percent": ".to_percent",
+    },
+)
@@ -19,6 +19,15 @@ class Absolute(ChildNode):
     ) -> Any:
         return abs(value)
 
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: Context,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Any, ...]:
+        return tuple(map(abs, values))
+
 
 def absolute() -> Decorator:
     """
@@ -28,6 +28,19 @@ class Add(ChildNode):
     ) -> Any:
         return value + str(kwargs["n"])
 
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: Context,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Any, ...]:
+        n = kwargs["n"]
+        suffix = str(n)
+        return tuple(
+            value + suffix if isinstance(value, str) else value + n for value in values
+        )
+
 
 def add(n: int | float | str) -> Decorator:
     """
@@ -20,6 +20,15 @@ class Ceil(ChildNode):
     ) -> Any:
         return math.ceil(value)
 
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: Context,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Any, ...]:
+        return tuple(map(math.ceil, values))
+
 
 def ceil() -> Decorator:
     """
@@ -22,6 +22,18 @@ class Divide(ChildNode):
             raise ZeroDivisionError("division by zero")
         return value / n
 
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: Context,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Any, ...]:
+        n = kwargs["n"]
+        if n == 0:
+            raise ZeroDivisionError("division by zero")
+        return tuple(value / n for value in values)
+
 
 def divide(n: int | float) -> Decorator:
     """
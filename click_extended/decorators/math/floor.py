@@ -20,6 +20,15 @@ class Floor(ChildNode):
     ) -> Any:
         return math.floor(value)
 
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: Context,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Any, ...]:
+        return tuple(map(math.floor, values))
+
 
 def floor() -> Decorator:
     """
@@ -19,6 +19,16 @@ class Maximum(ChildNode):
     ) -> Any:
         return min(value, kwargs["max_val"])
 
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: Context,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Any, ...]:
+        max_val = kwargs["max_val"]
+        return tuple(min(value, max_val) for value in values)
+
 
 def maximum(max_val: Union[int, float]) -> Decorator:
     """
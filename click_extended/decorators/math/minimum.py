@@ -19,6 +19,16 @@ class Minimum(ChildNode):
     ) -> Any:
         return max(value, kwargs["min_val"])
 
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: Context,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Any, ...]:
+        min_val = kwargs["min_val"]
+        return tuple(max(value, min_val) for value in values)
+
 
 def minimum(min_val: int | float) -> Decorator:
     """
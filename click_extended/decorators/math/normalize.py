@@ -1,18 +1,18 @@
 """Normalize a value within a range."""
 
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from typing import Any
 
 from click_extended.core.nodes.child_node import ChildNode
 from click_extended.core.other.context import Context
 from click_extended.types import Decorator
-
-getcontext().prec = 35
+from click_extended.utils.precision import decimal_precision
 
 
 class Normalize(ChildNode):
     """Normalize a value within a range."""
 
+    @decimal_precision(35)
     def handle_numeric(
         self,
         value: int | float,
@@ -40,6 +40,31 @@ class Normalize(ChildNode):
 
         return float(result)
 
+    @decimal_precision(35)
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: Context,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Any, ...]:
+        new_min = kwargs.get("new_min")
+        new_max = kwargs.get("new_max")
+        min_v = Decimal(str(kwargs["min_val"]))
+        span = Decimal(str(kwargs["max_val"])) - min_v
+
+        if new_min is None or new_max is None:
+            return tuple(
+                float((Decimal(str(value)) - min_v) / span) for value in values
+            )
+
+        n_min = Decimal(str(new_min))
+        n_span = Decimal(str(new_max)) - n_min
+        return tuple(
+            float(n_min + (Decimal(str(value)) - min_v) * n_span / span)
+            for value in values
+        )
+
 
 def normalize(
     min_val: float,
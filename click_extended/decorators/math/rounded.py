@@ -19,6 +19,16 @@ class Rounded(ChildNode):
     ) -> Any:
         return round(value, kwargs["digits"])
 
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: Context,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Any, ...]:
+        digits = kwargs["digits"]
+        return tuple(round(value, digits) for value in values)
+
 
 def rounded(digits: int = 0) -> Decorator:
     """
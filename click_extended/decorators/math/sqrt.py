@@ -23,6 +23,17 @@ class Sqrt(ChildNode):
             return cmath.sqrt(value)
         return math.sqrt(value)
 
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: Context,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Any, ...]:
+        return tuple(
+            cmath.sqrt(value) if value < 0 else math.sqrt(value) for value in values
+        )
+
 
 def sqrt() -> Decorator:
     """
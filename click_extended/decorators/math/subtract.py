@@ -19,6 +19,16 @@ class Subtract(ChildNode):
     ) -> Any:
         return value - kwargs["n"]
 
+    def handle_batch(
+        self,
+        values: tuple[Any, ...],
+        context: Context,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Any, ...]:
+        n = kwargs["n"]
+        return tuple(value - n for value in values)
+
 
 def subtract(n: int | float) -> Decorator:
     """
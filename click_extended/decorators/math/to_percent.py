@@ -1,18 +1,18 @@
 """Convert a value to a percentage decimal."""
 
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from typing import Any
 
 from click_extended.core.nodes.child_node import ChildNode
 from click_extended.core.other.context import Context
 from click_extended.types import Decorator
-
-getcontext().prec = 35
+from click_extended.utils.precision import decimal_precision
 
 
 class ToPercent(ChildNode):
     """Convert a value to a percentage decimal."""
 
+    @decimal_precision(35)
     def handle_str(
         self,
         value: str,
@@ -31,6 +31,7 @@ class ToPercent(ChildNode):
 
         return float(val / 100)
 
+    @decimal_precision(35)
     def handle_numeric(
         self,
         value: int | float,
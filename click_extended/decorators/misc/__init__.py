@@ -1,15 +1,18 @@
 """Initialization file for the `click_extended.decorators.misc` module."""
 
-# pylint: disable=wrong-import-position
+from typing import TYPE_CHECKING
 
-from click_extended.decorators.misc.catch import catch
-from click_extended.decorators.misc.choice import choice
-from click_extended.decorators.misc.confirm_if import confirm_if
-from click_extended.decorators.misc.default import default
-from click_extended.decorators.misc.deprecated import deprecated
-from click_extended.decorators.misc.experimental import experimental
-from click_extended.decorators.misc.now import now
-from click_extended.decorators.misc.observe import observe
+from click_extended.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from click_extended.decorators.misc.catch import catch
+    from click_extended.decorators.misc.choice import choice
+    from click_extended.decorators.misc.confirm_if import confirm_if
+    from click_extended.decorators.misc.default import default
+    from click_extended.decorators.misc.deprecated import deprecated
+    from click_extended.decorators.misc.experimental import experimental
+    from click_extended.decorators.misc.now import now
+    from click_extended.decorators.misc.observe import observe
 
 __all__ = [
     "catch",
@@ -21,3 +24,17 @@ __all__ = [
     "experimental",
     "now",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "catch": ".catch",
+        "choice": ".choice",
+        "confirm_if": ".confirm_if",
+        "default": ".default",
+        "deprecated": ".deprecated",
+        "experimental": ".experimental",
+        "now": ".now",
+        "observe": ".observe",
+    },
+)
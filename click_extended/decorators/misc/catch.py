@@ -9,12 +9,13 @@ Validation node to catch and handle exceptions from command/group functions.
 import asyncio
 import inspect
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable
 from weakref import WeakKeyDictionary
 
 from click_extended.core.nodes.validation_node import ValidationNode
 from click_extended.core.other._tree import Tree
 from click_extended.core.other.context import Context
+from click_extended.hooks.hook_registry import get_registry
 from click_extended.types import Decorator
 
 _catch_handlers: WeakKeyDictionary[
@@ -83,13 +84,67 @@ class Catch(ValidationNode):
         self.wrapped_func: Callable[..., Any] | None = None
         self.remaining_validations: list[ValidationNode] = []
 
-    def on_finalize(self, context: Context, *args: Any, **kwargs: Any) -> None:
+    def on_finalize(
+        self, context: Context, *args: Any, **kwargs: Any
+    ) -> Awaitable[None] | None:
         """
         Execute remaining validations wrapped in exception handling.
 
         This catches exceptions from all validators that run after @catch,
         allowing it to catch validation errors like those from @exclusive.
 
+        If the handler or any remaining validation is async, or an event
+        loop is running, a coroutine is returned instead so it is awaited on
+        the event loop of the invocation.
+
+        Args:
+            context: The execution context
+            *args: Contains exception types tuple at index 0
+            **kwargs: Contains handler, reraise parameters
+        """
+        handler: Callable[..., Any] | None = kwargs.get("handler")
+
+        if (
+            asyncio.iscoroutinefunction(handler)
+            or any(
+                asyncio.iscoroutinefunction(v.on_finalize)
+                for v in self.remaining_validations
+            )
+            or _is_loop_running()
+        ):
+            return self._finalize_async(context, *args, **kwargs)
+
+        exception_types: tuple[type[BaseException], ...] = args[0]
+        reraise: bool = kwargs.get("reraise", False)
+
+        for validation_node in self.remaining_validations:
+            try:
+                finalized = validation_node.on_finalize(
+                    context,
+                    *validation_node.process_args,
+                    **validation_node.process_kwargs,
+                )
+                if inspect.isawaitable(finalized):
+                    get_registry().run_coroutine(finalized)
+            except BaseException as exc:
+                if isinstance(exc, exception_types):
+                    if handler is not None:
+                        _call_handler_sync(handler, exc)
+
+                    if not reraise:
+                        return None
+
+                raise
+
+        return None
+
+    async def _finalize_async(
+        self, context: Context, *args: Any, **kwargs: Any
+    ) -> None:
+        """
+        Execute remaining validations wrapped in exception handling, awaiting
+        async validations and handlers.
+
         Args:
             context: The execution context
             *args: Contains exception types tuple at index 0
@@ -101,25 +156,18 @@ class Catch(ValidationNode):
 
         for validation_node in self.remaining_validations:
             try:
-                if asyncio.iscoroutinefunction(validation_node.on_finalize):
-                    asyncio.run(
-                        validation_node.on_finalize(
-                            context,
-                            *validation_node.process_args,
-                            **validation_node.process_kwargs,
-                        )
-                    )
-                else:
-                    validation_node.on_finalize(
-                        context,
-                        *validation_node.process_args,
-                        **validation_node.process_kwargs,
-                    )
+                finalized = validation_node.on_finalize(
+                    context,
+                    *validation_node.process_args,
+                    **validation_node.process_kwargs,
+                )
+                if inspect.isawaitable(finalized):
+                    await finalized
             except BaseException as exc:
                 if isinstance(exc, exception_types):
                     if handler is not None:
                         if asyncio.iscoroutinefunction(handler):
-                            asyncio.run(_call_handler_async(handler, exc))
+                            await _call_handler_async(handler, exc)
                         else:
                             _call_handler_sync(handler, exc)
 
@@ -274,7 +322,9 @@ def catch(
                     if isinstance(exc, exc_types):
                         if hdlr is not None:
                             if asyncio.iscoroutinefunction(hdlr):
-                                asyncio.run(_call_handler_async(hdlr, exc))
+                                get_registry().run_coroutine(
+                                    _call_handler_async(hdlr, exc)
+                                )
                             else:
                                 _call_handler_sync(hdlr, exc)
 
@@ -309,6 +359,15 @@ async def _call_handler_async(handler: Callable[..., Any], exc: BaseException) -
         return await handler(exc, None)
 
 
+def _is_loop_running() -> bool:
+    """Check if an event loop is running in the current thread."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 def _call_handler_sync(handler: Callable[..., Any], exc: BaseException) -> Any:
     """Call sync handler with appropriate number of arguments."""
     sig = inspect.signature(handler)
@@ -6,11 +6,18 @@ from typing import Any, Callable, Coroutine, cast
 
 from click_extended.core.nodes.child_node import ChildNode
 from click_extended.core.other.context import Context
+from click_extended.hooks.hook_registry import get_registry
 from click_extended.types import Decorator
 
 
 class Observe(ChildNode):
-    """Child decorator to observe values without modifying them."""
+    """
+    Child decorator to observe values without modifying them.
+
+    Async handlers are run on the event loop of the invocation. Use
+    ``AsyncObserve`` (as ``observe()`` does) to await them from async
+    processing instead.
+    """
 
     def handle_all(
         self, value: Any, context: Context, *args: Any, **kwargs: Any
@@ -30,7 +37,7 @@ class Observe(ChildNode):
                 async_handler_one = cast(
                     Callable[[Any], Coroutine[Any, Any, Any]], handler
                 )
-                asyncio.run(async_handler_one(value))
+                get_registry().run_coroutine(async_handler_one(value))
             else:
                 sync_handler_one = cast(Callable[[Any], Any], handler)
                 sync_handler_one(value)
@@ -40,7 +47,7 @@ class Observe(ChildNode):
                     Callable[[Any, Context], Coroutine[Any, Any, Any]],
                     handler,
                 )
-                asyncio.run(async_handler_two(value, context))
+                get_registry().run_coroutine(async_handler_two(value, context))
             else:
                 sync_handler_two = cast(Callable[[Any, Context], Any], handler)
                 sync_handler_two(value, context)
@@ -52,6 +59,33 @@ class Observe(ChildNode):
         return value
 
 
+class AsyncObserve(ChildNode):  # pylint: disable=abstract-method
+    """Child decorator to observe values with an async handler."""
+
+    async def handle_all(  # pylint: disable=invalid-overridden-method
+        self, value: Any, context: Context, *args: Any, **kwargs: Any
+    ) -> Any:
+        handler: (
+            Callable[[Any], Coroutine[Any, Any, Any]]
+            | Callable[[Any, Context], Coroutine[Any, Any, Any]]
+        ) = kwargs["handler"]
+
+        param_count = len(inspect.signature(handler).parameters)
+
+        if param_count == 1:
+            await cast(Callable[[Any], Coroutine[Any, Any, Any]], handler)(value)
+        elif param_count == 2:
+            await cast(Callable[[Any, Context], Coroutine[Any, Any, Any]], handler)(
+                value, context
+            )
+        else:
+            raise ValueError(
+                "observe() handler must accept (value) or (value, context)."
+            )
+
+        return value
+
+
 def observe(
     handler: (
         Callable[[Any], Any]
@@ -89,7 +123,9 @@ def observe(
             pass
         ```
     """
+    if asyncio.iscoroutinefunction(handler):
+        return AsyncObserve.as_decorator(handler=handler)
     return Observe.as_decorator(handler=handler)
 
 
-__all__ = ["observe", "Observe"]
+__all__ = ["observe", "AsyncObserve", "Observe"]
@@ -1,43 +1,48 @@
 """Initialization file for the `click_extended.decorators.transform` module."""
 
-from click_extended.decorators.transform.add_prefix import add_prefix
-from click_extended.decorators.transform.add_suffix import add_suffix
-from click_extended.decorators.transform.apply import apply
-from click_extended.decorators.transform.basename import basename
-from click_extended.decorators.transform.dirname import dirname
-from click_extended.decorators.transform.expand_vars import expand_vars
-from click_extended.decorators.transform.remove_prefix import remove_prefix
-from click_extended.decorators.transform.remove_suffix import remove_suffix
-from click_extended.decorators.transform.replace import replace
-from click_extended.decorators.transform.slugify import slugify
-from click_extended.decorators.transform.split import split
-from click_extended.decorators.transform.strip import lstrip, rstrip, strip
-from click_extended.decorators.transform.to_case import (
-    to_camel_case,
-    to_dot_case,
-    to_flat_case,
-    to_kebab_case,
-    to_lower_case,
-    to_meme_case,
-    to_pascal_case,
-    to_path_case,
-    to_screaming_snake_case,
-    to_snake_case,
-    to_title_case,
-    to_train_case,
-    to_upper_case,
-)
-from click_extended.decorators.transform.to_date import to_date
-from click_extended.decorators.transform.to_datetime import to_datetime
-from click_extended.decorators.transform.to_decimal import to_decimal
-from click_extended.decorators.transform.to_directory import to_directory
-from click_extended.decorators.transform.to_file import to_file
-from click_extended.decorators.transform.to_path import to_path
-from click_extended.decorators.transform.to_string import to_string
-from click_extended.decorators.transform.to_symlink import to_symlink
-from click_extended.decorators.transform.to_time import to_time
-from click_extended.decorators.transform.to_timestamp import to_timestamp
-from click_extended.decorators.transform.truncate import truncate
+from typing import TYPE_CHECKING
+
+from click_extended.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from click_extended.decorators.transform.add_prefix import add_prefix
+    from click_extended.decorators.transform.add_suffix import add_suffix
+    from click_extended.decorators.transform.apply import apply
+    from click_extended.decorators.transform.basename import basename
+    from click_extended.decorators.transform.dirname import dirname
+    from click_extended.decorators.transform.expand_vars import expand_vars
+    from click_extended.decorators.transform.remove_prefix import remove_prefix
+    from click_extended.decorators.transform.remove_suffix import remove_suffix
+    from click_extended.decorators.transform.replace import replace
+    from click_extended.decorators.transform.slugify import slugify
+    from click_extended.decorators.transform.split import split
+    from click_extended.decorators.transform.strip import lstrip, rstrip, strip
+    from click_extended.decorators.transform.to_case import (
+        to_camel_case,
+        to_dot_case,
+        to_flat_case,
+        to_kebab_case,
+        to_lower_case,
+        to_meme_case,
+        to_pascal_case,
+        to_path_case,
+        to_screaming_snake_case,
+        to_snake_case,
+        to_title_case,
+        to_train_case,
+        to_upper_case,
+    )
+    from click_extended.decorators.transform.to_date import to_date
+    from click_extended.decorators.transform.to_datetime import to_datetime
+    from click_extended.decorators.transform.to_decimal import to_decimal
+    from click_extended.decorators.transform.to_directory import to_directory
+    from click_extended.decorators.transform.to_file import to_file
+    from click_extended.decorators.transform.to_path import to_path
+    from click_extended.decorators.transform.to_string import to_string
+    from click_extended.decorators.transform.to_symlink import to_symlink
+    from click_extended.decorators.transform.to_time import to_time
+    from click_extended.decorators.transform.to_timestamp import to_timestamp
+    from click_extended.decorators.transform.truncate import truncate
 
 __all__ = [
     "add_prefix",
@@ -79,3 +84,47 @@ __all__ = [
     "to_timestamp",
     "truncate",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "add_prefix": ".add_prefix",
+        "add_suffix": ".add_suffix",
+        "apply": ".apply",
+        "basename": ".basename",
+        "dirname": ".dirname",
+        "expand_vars": ".expand_vars",
+        "remove_prefix": ".remove_prefix",
+        "remove_suffix": ".remove_suffix",
+        "replace": ".replace",
+        "slugify": ".slugify",
+        "split": ".split",
+        "lstrip": ".strip",
+        "rstrip": ".strip",
+        "strip": ".strip",
+        "to_camel_case": ".to_case",
+        "to_dot_case": ".to_case",
+        "to_flat_case": ".to_case",
+        "to_kebab_case": ".to_case",
+        "to_lower_case": ".to_case",
+        "to_meme_case": ".to_case",
+        "to_pascal_case": ".to_case",
+        "to_path_case": ".to_case",
+        "to_screaming_snake_case": ".to_case",
+        "to_snake_case": ".to_case",
+        "to_title_case": ".to_case",
+        "to_train_case": ".to_case",
+        "to_upper_case": ".to_case",
+        "to_date": ".to_date",
+        "to_datetime": ".to_datetime",
+        "to_decimal": ".to_decimal",
+        "to_directory": ".to_directory",
+        "to_file": ".to_file",
+        "to_path": ".to_path",
+        "to_string": ".to_string",
+        "to_symlink": ".to_symlink",
+        "to_time": ".to_time",
+        "to_timestamp": ".to_timestamp",
+        "truncate": ".truncate",
+    },
+)
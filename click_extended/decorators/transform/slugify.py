@@ -1,8 +1,8 @@
 """Convert the string to a slug."""
 
-from typing import Any
+# pylint: disable=import-outside-toplevel
 
-from slugify import slugify as _slugify
+from typing import Any
 
 from click_extended.core.nodes.child_node import ChildNode
 from click_extended.core.other.context import Context
@@ -19,6 +19,8 @@ class Slugify(ChildNode):
         *args: Any,
         **kwargs: Any,
     ) -> str:
+        from slugify import slugify as _slugify
+
         return _slugify(value, **kwargs)
 
 
@@ -7,6 +7,7 @@ import click
 from click.utils import echo
 
 from click_extended.utils.humanize import humanize_iterable
+from click_extended.utils.scope import get_scope_value
 
 
 class ClickExtendedError(Exception):
@@ -43,6 +44,28 @@ class ClickExtendedError(Exception):
             echo(f"\nTip: {self.tip}", file=file)
 
 
+class BatchItemError(ClickExtendedError):
+    """
+    Exception raised by ``handle_batch`` for the value at an index.
+
+    The wrapped error is reported as if it was raised for the value at
+    ``index`` of the values passed to ``handle_batch``.
+    """
+
+    def __init__(self, index: int, error: ValueError | TypeError) -> None:
+        """
+        Initialize a new ``BatchItemError`` instance.
+
+        :param index:
+            The position of the failing value in the values of the batch.
+        :param error:
+            The error raised for the value.
+        """
+        super().__init__(str(error))
+        self.index = index
+        self.error = error
+
+
 class ContextAwareError(ClickExtendedError):
     """
     Base exception for errors that occur within Click context.
@@ -88,10 +111,12 @@ class ContextAwareError(ClickExtendedError):
 
         meta = self.context.meta.get("click_extended", {})
 
-        if meta.get("child_node"):
-            return str(meta["child_node"].name)
-        if meta.get("parent_node"):
-            return str(meta["parent_node"].name)
+        child_node = get_scope_value(meta, "child_node")
+        if child_node:
+            return str(child_node.name)
+        parent_node = get_scope_value(meta, "parent_node")
+        if parent_node:
+            return str(parent_node.name)
         if meta.get("root_node"):
             return str(meta["root_node"].name)
 
@@ -155,7 +180,7 @@ class MissingValueError(ContextAwareError):
             ctx = click.get_current_context()
             meta = ctx.meta.get("click_extended", {})
 
-            parent = meta.get("parent_node")
+            parent = get_scope_value(meta, "parent_node")
 
             if parent is not None:
                 return self._tip_for_parent(parent)
@@ -10,7 +10,8 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-from collections.abc import Coroutine
+import threading
+from collections.abc import Awaitable
 from typing import TYPE_CHECKING, Any
 
 import click
@@ -32,7 +33,16 @@ class HookRegistry:
     def __init__(self) -> None:
         """Initialize a new hook registry."""
         self._hooks: list[HookNode] = []
-        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._local = threading.local()
+
+    @property
+    def _async_loop(self) -> asyncio.AbstractEventLoop | None:
+        """The event loop of the invocation running in the current thread."""
+        return getattr(self._local, "loop", None)
+
+    @_async_loop.setter
+    def _async_loop(self, loop: asyncio.AbstractEventLoop | None) -> None:
+        self._local.loop = loop
 
     def register(
         self,
@@ -241,15 +251,21 @@ class HookRegistry:
         except (ValueError, TypeError):
             return False
 
-    def run_coroutine(self, coro: Coroutine[Any, Any, Any]) -> Any:
+    def run_coroutine(self, coro: Awaitable[Any]) -> Any:
         """
-        Run a coroutine on the shared hook event loop.
+        Run a coroutine on the shared event loop of the invocation.
+
+        The loop is created on first use and closed when the ``exit`` phase
+        runs, so hooks, parent loads, child handlers, validations and the
+        command function of an invocation all share it. Every thread has its
+        own loop, so invocations in different threads do not share one.
 
-        :param coro: Coroutine to execute on the shared loop.
+        :param coro: Coroutine or other awaitable to execute on the shared
+            loop.
         :returns Any: The coroutine result.
         """
         loop = self._get_async_loop()
-        task = loop.create_task(coro)
+        task = asyncio.ensure_future(coro, loop=loop)
         try:
             return loop.run_until_complete(task)
         except BaseException:
@@ -292,8 +308,10 @@ class HookRegistry:
             from click_extended.errors import ProcessError
 
             raise ProcessError(
-                "Cannot use async hook handlers in an existing event loop.",
-                tip=("Use synchronous hooks or run the CLI outside async " "contexts."),
+                "Cannot use async handlers in an existing event loop "
+                "(e.g., Jupyter notebooks).",
+                tip="Use synchronous handlers instead, or run your CLI "
+                "outside of async contexts.",
             )
 
         if self._async_loop is None or self._async_loop.is_closed():
@@ -321,7 +339,10 @@ class HookRegistry:
                 loop.run_until_complete(
                     asyncio.gather(*pending, return_exceptions=True)
                 )
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
         finally:
+            asyncio.set_event_loop(None)
             loop.close()
 
 
@@ -1,8 +1,13 @@
 """Initialization file for the 'click_extended.utils' module."""
 
-from click_extended.utils.casing import Casing
-from click_extended.utils.checks import is_argument, is_option, is_tag
-from click_extended.utils.humanize import humanize_iterable
+from typing import TYPE_CHECKING
+
+from click_extended.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from click_extended.utils.casing import Casing
+    from click_extended.utils.checks import is_argument, is_option, is_tag
+    from click_extended.utils.humanize import humanize_iterable
 
 __all__ = [
     "Casing",
@@ -11,3 +16,14 @@ __all__ = [
     "is_tag",
     "humanize_iterable",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Casing": ".casing",
+        "is_argument": ".checks",
+        "is_option": ".checks",
+        "is_tag": ".checks",
+        "humanize_iterable": ".humanize",
+    },
+)
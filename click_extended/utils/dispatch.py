@@ -14,17 +14,37 @@ automatic detection and routing.
 # pylint: disable=too-many-nested-blocks
 # pylint: disable=import-outside-toplevel
 # pylint: disable=too-many-lines
+# pylint: disable=too-few-public-methods
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-positional-arguments
 
 import asyncio
 from datetime import date, datetime, time
 from decimal import Decimal
 from pathlib import Path
 from types import UnionType
-from typing import TYPE_CHECKING, Any, Union, cast, get_args, get_origin, get_type_hints
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    NoReturn,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 from uuid import UUID
-
-from click_extended.core.nodes.child_node import ChildNode
-from click_extended.errors import InvalidHandlerError, ProcessError, UnhandledTypeError
+from weakref import WeakKeyDictionary
+
+from click_extended.core.nodes.child_node import ChildNode, ChildNodeMeta
+from click_extended.errors import (
+    BatchItemError,
+    InvalidHandlerError,
+    ProcessError,
+    UnhandledTypeError,
+)
+from click_extended.utils.offload import run_in_executor
+from click_extended.utils.scope import get_scope_value, scope_target
 
 if TYPE_CHECKING:
     from click_extended.core.other.context import Context
@@ -52,6 +72,7 @@ ALL_HANDLER_NAMES = [
     "handle_all",
     "handle_none",
     *TYPE_SPECIFIC_HANDLERS,
+    "handle_batch",
     "handle_tag",
 ]
 
@@ -118,125 +139,698 @@ def _extract_inner_types(type_hint: Any) -> set[type]:
     return set()
 
 
-def _validate_handler_type(
-    handler_name: str, value: Any, type_hint: Any
-) -> tuple[bool, str]:
+_Validator = Callable[[Any], "str | None"]
+
+_EXPECTED_PRIMITIVES: dict[str, type | tuple[type, ...]] = {
+    "handle_str": str,
+    "handle_int": int,
+    "handle_float": float,
+    "handle_bool": bool,
+    "handle_numeric": (int, float),
+}
+
+_STR_TO_INT_TIP = (
+    "\nTip: Add type=int to your option/argument to convert strings to integers."
+)
+
+
+def _is_covered(type_hint: Any, expected: type | tuple[type, ...]) -> bool:
     """
-    Validate that value matches handler's type hint.
+    Check if an ``isinstance`` check against a hint implies one against
+    ``expected``, so the second check can be skipped.
 
-    :param handler_name: Name of the handler being called.
-    :param value: The runtime value to validate.
-    :param type_hint: The type hint from the handler's signature.
+    :param type_hint: The plain type hint of the handler.
+    :param expected: The type(s) the handler name expects.
 
-    :returns: ``(is_valid, error_message)`` where ``error_message`` is empty
-        if valid.
-    :rtype: tuple[bool, str]
+    :returns: ``True`` if the hint is a subclass of ``expected``.
+    :rtype: bool
     """
-    origin = get_origin(type_hint)
+    try:
+        return issubclass(type_hint, expected)
+    except TypeError:
+        return False
 
-    if type_hint is Any:
-        return True, ""
 
-    if isinstance(type_hint, type) and origin is None:
-        if not isinstance(value, type_hint):
-            expected_name = type_hint.__name__
-            actual_type = type(value).__name__
+def _compile_hint_check(type_hint: type) -> _Validator:
+    """
+    Compile the check of a value against a plain type hint.
+
+    :param type_hint: The plain type hint of the handler.
+
+    :returns: The validator.
+    :rtype: _Validator
+    """
+    expected_name = type_hint.__name__
+    str_tip = _STR_TO_INT_TIP if type_hint in (int, float) else ""
+    int_tip = (
+        "\nTip: Change int to str for the type argument." if type_hint == str else ""
+    )
+
+    def check(value: Any) -> str | None:
+        if isinstance(value, type_hint):
+            return None
+
+        actual_type = type(value).__name__
+        if actual_type == "str":
+            suggestion = str_tip
+        elif actual_type == "int":
+            suggestion = int_tip
+        else:
             suggestion = ""
 
-            if actual_type == "str" and type_hint in (int, float):
-                suggestion = (
-                    "\nTip: Add type=int to your option/argument "
-                    "to convert strings to integers."
-                )
-            elif actual_type == "int" and type_hint == str:
-                suggestion = "\nTip: Change int to str for the type argument."
+        return f"Expected {expected_name}, got {actual_type}.{suggestion}"
 
-            return (
-                False,
-                f"Expected {expected_name}, got {actual_type}.{suggestion}",
-            )
+    return check
 
-    if handler_name in (
-        "handle_str",
-        "handle_int",
-        "handle_float",
-        "handle_bool",
-        "handle_numeric",
-    ):
-        expected_type_map: dict[str, type | tuple[type, ...]] = {
-            "handle_str": str,
-            "handle_int": int,
-            "handle_float": float,
-            "handle_bool": bool,
-            "handle_numeric": (int, float),
-        }
-        expected = expected_type_map[handler_name]
-
-        if not isinstance(value, expected):
-            if handler_name == "handle_numeric":
-                return (
-                    False,
-                    f"Expected int or float, got {type(value).__name__}",
-                )
-            expected_name = (
-                expected.__name__ if isinstance(expected, type) else "number"
-            )
-            actual_type = type(value).__name__
+
+def _compile_primitive_check(handler_name: str) -> _Validator:
+    """
+    Compile the check of a value against the type a primitive handler expects.
+
+    :param handler_name: The name of a primitive handler.
+
+    :returns: The validator.
+    :rtype: _Validator
+    """
+    expected = _EXPECTED_PRIMITIVES[handler_name]
+
+    if handler_name == "handle_numeric":
+
+        def check_numeric(value: Any) -> str | None:
+            if isinstance(value, expected):
+                return None
+            return f"Expected int or float, got {type(value).__name__}"
+
+        return check_numeric
+
+    expected_name = expected.__name__ if isinstance(expected, type) else "number"
+    str_tip = _STR_TO_INT_TIP if expected in (int, (int, float)) else ""
+    int_tip = (
+        "\nTip: Change type from int to str in option/argument."
+        if expected == str
+        else ""
+    )
+
+    def check(value: Any) -> str | None:
+        if isinstance(value, expected):
+            return None
+
+        actual_type = type(value).__name__
+        if actual_type == "str":
+            suggestion = str_tip
+        elif actual_type == "int":
+            suggestion = int_tip
+        else:
             suggestion = ""
 
-            if actual_type == "str" and expected in (int, (int, float)):
-                suggestion = (
-                    "\nTip: Add type=int to your option/argument "
-                    "to convert strings to integers."
-                )
-            elif actual_type == "int" and expected == str:
-                suggestion = "\nTip: Change type from int to str in option/argument."
+        return f"Expected {expected_name}, got {actual_type}.{suggestion}"
+
+    return check
+
+
+def _compile_container_check(expected: type) -> _Validator:
+    """
+    Compile the check of a value against a container type.
+
+    :param expected: The container type.
+
+    :returns: The validator.
+    :rtype: _Validator
+    """
+    expected_name = expected.__name__
+
+    def check(value: Any) -> str | None:
+        if isinstance(value, expected):
+            return None
+        return f"Expected {expected_name}, got {type(value).__name__}"
+
+    return check
+
+
+def _compile_items_check(expected_types: set[type]) -> _Validator:
+    """
+    Compile the structural check of the items of a list.
+
+    :param expected_types: The types the items may have.
+
+    :returns: The validator.
+    :rtype: _Validator
+    """
+    item_types = tuple(expected_types)
+    type_names = " | ".join(sorted(t.__name__ for t in expected_types))
+
+    def check(value: Any) -> str | None:
+        mismatches = [item for item in value if not isinstance(item, item_types)]
+        if not mismatches:
+            return None
+
+        examples = [f"{repr(item)} ({type(item).__name__})" for item in mismatches[:3]]
+
+        return (
+            f"Expected list[{type_names}], but found "
+            f"{len(mismatches)} item(s) with wrong type."
+            f"\nExamples: {', '.join(examples)}"
+        )
+
+    return check
+
+
+def _compile_validator(handler_name: str, type_hint: Any) -> _Validator | None:
+    """
+    Compile a handler's ``value`` type hint into a validator.
+
+    The returned validator performs the same checks, in the same order, as
+    inspecting the hint for every value would, but all inspection of the hint
+    happens once here.
+
+    :param handler_name: Name of the handler the hint belongs to.
+    :param type_hint: The type hint from the handler's signature.
+
+    :returns: A validator returning an error message for invalid values and
+        ``None`` for valid ones, or ``None`` if every value is valid.
+    :rtype: _Validator | None
+    """
+    if type_hint is Any:
+        return None
+
+    checks: list[_Validator] = []
+    is_plain_type = isinstance(type_hint, type) and get_origin(type_hint) is None
+
+    if is_plain_type:
+        checks.append(_compile_hint_check(type_hint))
+
+    if handler_name in _EXPECTED_PRIMITIVES:
+        expected = _EXPECTED_PRIMITIVES[handler_name]
+        if not (is_plain_type and _is_covered(type_hint, expected)):
+            checks.append(_compile_primitive_check(handler_name))
+
+    elif handler_name in ("handle_tuple", "handle_list", "handle_dict"):
+        container: type = {
+            "handle_tuple": tuple,
+            "handle_list": list,
+            "handle_dict": dict,
+        }[handler_name]
+
+        if not (is_plain_type and _is_covered(type_hint, container)):
+            checks.append(_compile_container_check(container))
+
+        if handler_name == "handle_list":
+            expected_types = _extract_inner_types(type_hint)
+            if expected_types:
+                checks.append(_compile_items_check(expected_types))
+
+    if not checks:
+        return None
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def validate(value: Any) -> str | None:
+        for check in checks:
+            error_msg = check(value)
+            if error_msg is not None:
+                return error_msg
+        return None
+
+    return validate
+
+
+class _TypeHandlers:
+    """The handlers registered for a value type, in order of preference."""
+
+    __slots__ = ("handler_names", "use_handle_all")
+
+    def __init__(self, handler_names: tuple[str, ...], use_handle_all: bool) -> None:
+        """
+        Initialize a new ``_TypeHandlers`` instance.
+
+        :param handler_names: The handler names to try, in order.
+        :param use_handle_all: Whether ``handle_all`` is used when none of
+            the handlers are implemented.
+        """
+        self.handler_names = handler_names
+        self.use_handle_all = use_handle_all
+
+
+class _HandlerRegistry:
+    """
+    The handlers registered for value types.
+
+    Handler names introduced by registrations are kept here rather than in
+    ``TYPE_SPECIFIC_HANDLERS`` and ``ALL_HANDLER_NAMES``, which only list the
+    built-in handlers.
+    """
+
+    __slots__ = ("types", "resolved", "specific_names", "all_names")
+
+    def __init__(self) -> None:
+        """Initialize a new ``_HandlerRegistry`` instance."""
+        self.types: dict[type, _TypeHandlers] = {}
+        self.resolved: "WeakKeyDictionary[type, _TypeHandlers | None]" = (
+            WeakKeyDictionary()
+        )
+        self.specific_names = tuple(TYPE_SPECIFIC_HANDLERS)
+        self.all_names = tuple(ALL_HANDLER_NAMES)
+
+    def register(
+        self, value_type: type, handler_names: tuple[str, ...], use_handle_all: bool
+    ) -> None:
+        """
+        Route values of a type to handlers.
+
+        :param value_type: The type of values to route.
+        :param handler_names: The handler names to try, in order.
+        :param use_handle_all: Whether ``handle_all`` is used when none of
+            the handlers are implemented.
+        """
+        for name in handler_names:
+            if name not in self.all_names:
+                self.specific_names += (name,)
+                self.all_names = (*self.all_names[:-1], name, self.all_names[-1])
+
+        self.types[value_type] = _TypeHandlers(handler_names, use_handle_all)
+        self.resolved.clear()
+        ChildNodeMeta.handler_generation += 1
+
+    def find(self, value_type: type) -> _TypeHandlers | None:
+        """
+        Find the registered handlers for a value type.
+
+        The most specific registered class in the type's method resolution
+        order wins. Types only related to a registered class through
+        ``__subclasshook__`` or ``register()`` are matched afterwards, in
+        registration order. Results are cached per type.
+
+        :param value_type: The type of the value to dispatch.
+
+        :returns: The registered handlers, or ``None`` if the type is not
+            registered.
+        :rtype: _TypeHandlers | None
+        """
+        try:
+            return self.resolved[value_type]
+        except KeyError:
+            pass
+
+        slot: _TypeHandlers | None = None
+        for cls in value_type.__mro__:
+            slot = self.types.get(cls)
+            if slot is not None:
+                break
+        else:
+            for registered_type, registered_slot in self.types.items():
+                if issubclass(value_type, registered_type):
+                    slot = registered_slot
+                    break
 
-            return (
-                False,
-                f"Expected {expected_name}, got {actual_type}.{suggestion}",
+        self.resolved[value_type] = slot
+        return slot
+
+
+_REGISTRY = _HandlerRegistry()
+
+
+def register_handler(
+    value_type: type,
+    handler_name: str,
+    *,
+    fallbacks: tuple[str, ...] = (),
+) -> None:
+    """
+    Register the handler that child nodes use for values of a type.
+
+    Values are routed by the most specific registered class in the method
+    resolution order of their type, so registering ``enum.Enum`` routes all
+    enum members to ``handle_enum``. Registering a type that is already
+    registered replaces its handlers.
+
+    :param value_type: The type of values to route.
+    :param handler_name: The name of the handler method, which must start
+        with ``"handle_"``.
+    :param fallbacks: Handler names tried in order when the child does not
+        implement ``handler_name``. ``handle_all`` is used when none of
+        them are implemented.
+
+    :raises ValueError: If a handler name does not start with ``"handle_"``.
+    :raises TypeError: If ``value_type`` is not a class.
+    """
+    if not isinstance(value_type, type):
+        raise TypeError(f"Expected a class, got {type(value_type).__name__}.")
+
+    handler_names = (handler_name, *fallbacks)
+    for name in handler_names:
+        if not name.startswith("handle_"):
+            raise ValueError(f"Handler name '{name}' must start with 'handle_'.")
+
+    _REGISTRY.register(value_type, handler_names, True)
+
+
+register_handler(bytes, "handle_bytes")
+register_handler(Decimal, "handle_decimal")
+register_handler(datetime, "handle_datetime")
+register_handler(date, "handle_date")
+register_handler(time, "handle_time")
+register_handler(UUID, "handle_uuid")
+register_handler(Path, "handle_path")
+register_handler(dict, "handle_dict")
+register_handler(str, "handle_str")
+register_handler(bool, "handle_bool")
+register_handler(int, "handle_int", fallbacks=("handle_numeric",))
+register_handler(float, "handle_float", fallbacks=("handle_numeric",))
+register_handler(list, "handle_list")
+
+# Tuples are not routed to handle_all, the dispatchers decide that themselves
+# depending on whether the tuple is a container of values.
+_REGISTRY.register(tuple, ("handle_tuple",), False)
+
+
+class _HandlerSpec:
+    """
+    A handler method resolved once on a ``ChildNode`` subclass.
+
+    Type hints and ``None`` acceptance are resolved lazily on first use and
+    then cached, so annotations that cannot be resolved raise at the same
+    point as they would when inspected per call.
+    """
+
+    __slots__ = (
+        "name",
+        "function",
+        "is_async",
+        "_hints",
+        "_accepts_none",
+        "_validator",
+        "_validator_compiled",
+    )
+
+    def __init__(self, cls: type["ChildNode"], name: str) -> None:
+        """
+        Initialize a new ``_HandlerSpec`` instance.
+
+        :param cls: The child node class to resolve the handler on.
+        :param name: The name of the handler method.
+        """
+        self.name = name
+        self.function: Any = getattr(cls, name)
+        self.is_async = asyncio.iscoroutinefunction(self.function)
+        self._hints: dict[str, Any] | None = None
+        self._accepts_none: bool | None = None
+        self._validator: _Validator | None = None
+        self._validator_compiled = False
+
+    @property
+    def hints(self) -> dict[str, Any]:
+        """Get the cached type hints of the handler."""
+        if self._hints is None:
+            self._hints = get_type_hints(self.function)
+        return self._hints
+
+    @property
+    def accepts_none(self) -> bool:
+        """Check whether the handler's ``value`` hint accepts ``None``."""
+        if self._accepts_none is None:
+            try:
+                hints = self.hints
+            except (AttributeError, ImportError):
+                self._accepts_none = True
+                return True
+
+            if "value" not in hints or hints["value"] is Any:
+                self._accepts_none = True
+            else:
+                value_hint = hints["value"]
+                origin = get_origin(value_hint)
+                self._accepts_none = (origin is UnionType or origin is Union) and type(
+                    None
+                ) in get_args(value_hint)
+
+        return self._accepts_none
+
+    @property
+    def validator(self) -> _Validator | None:
+        """Get the compiled validator of the handler's ``value`` hint."""
+        if not self._validator_compiled:
+            hints = self.hints
+            if "value" in hints:
+                self._validator = _compile_validator(self.name, hints["value"])
+            self._validator_compiled = True
+        return self._validator
+
+
+class _DispatchTable:
+    """
+    Handler lookups compiled once per ``ChildNode`` subclass.
+
+    The table maps each concrete value type seen by the class to the name of
+    the handler that processes it, and caches the resolved handler methods.
+    It is stored on the class itself and rebuilt whenever a ``handle_*``
+    attribute is assigned or deleted on any child class.
+    """
+
+    __slots__ = (
+        "cls",
+        "generation",
+        "implemented",
+        "by_type",
+        "specs",
+        "_has_async",
+        "_has_element_handlers",
+    )
+
+    def __init__(self, cls: type["ChildNode"], generation: int) -> None:
+        """
+        Initialize a new ``_DispatchTable`` instance.
+
+        :param cls: The child node class the table belongs to.
+        :param generation: The handler generation the table was built for.
+        """
+        self.cls = cls
+        self.generation = generation
+        self.implemented: dict[str, bool] = {}
+        self.by_type: dict[type, str | None] = {}
+        self.specs: dict[str, _HandlerSpec] = {}
+        self._has_async: bool | None = None
+        self._has_element_handlers: bool | None = None
+
+    def is_implemented(self, handler_name: str) -> bool:
+        """
+        Check if a handler is implemented by the class (not just inherited).
+
+        :param handler_name: Name of the handler method to check.
+
+        :returns: ``True`` if the handler is implemented, ``False`` otherwise.
+        :rtype: bool
+        """
+        implemented = self.implemented.get(handler_name)
+        if implemented is None:
+            implemented = False
+            for cls in self.cls.__mro__:
+                if handler_name in cls.__dict__:
+                    implemented = cls is not ChildNode
+                    break
+            self.implemented[handler_name] = implemented
+        return implemented
+
+    def spec(self, handler_name: str) -> _HandlerSpec:
+        """
+        Get the resolved handler for a handler name.
+
+        :param handler_name: Name of the handler method.
+
+        :returns: The resolved handler.
+        :rtype: _HandlerSpec
+        """
+        spec = self.specs.get(handler_name)
+        if spec is None:
+            spec = _HandlerSpec(self.cls, handler_name)
+            self.specs[handler_name] = spec
+        return spec
+
+    def handler_for(self, value_type: type) -> str | None:
+        """
+        Get the handler name for a concrete value type outside of tags.
+
+        :param value_type: The type of the value to dispatch.
+
+        :returns: Handler method name, or ``None`` if no handler found.
+        :rtype: str | None
+        """
+        try:
+            return self.by_type[value_type]
+        except KeyError:
+            handler_name = self._resolve(value_type)
+            self.by_type[value_type] = handler_name
+            return handler_name
+
+    def has_async(self) -> bool:
+        """
+        Check if any implemented handler is async.
+
+        :returns: ``True`` if any handler is async, ``False`` otherwise.
+        :rtype: bool
+        """
+        if self._has_async is None:
+            self._has_async = any(
+                self.spec(handler_name).is_async
+                for handler_name in _REGISTRY.all_names
+                if self.is_implemented(handler_name)
             )
+        return self._has_async
+
+    def has_element_handlers(self) -> bool:
+        """
+        Check if the class implements handlers for individual values.
+
+        :returns: ``True`` if ``handle_all`` or any type-specific handler is
+            implemented, ``False`` otherwise.
+        :rtype: bool
+        """
+        if self._has_element_handlers is None:
+            self._has_element_handlers = self.is_implemented("handle_all") or any(
+                self.is_implemented(handler_name)
+                for handler_name in _REGISTRY.specific_names
+            )
+        return self._has_element_handlers
 
-    elif handler_name == "handle_tuple":
-        if not isinstance(value, tuple):
-            return False, f"Expected tuple, got {type(value).__name__}"
-
-    elif handler_name == "handle_list":
-        if not isinstance(value, list):
-            return False, f"Expected list, got {type(value).__name__}"
-
-        expected_types = _extract_inner_types(type_hint)
-        if expected_types and value:
-            list_mismatches: list[tuple[int, str, Any]] = []
-            value = cast(Any, value)
-            for i, item in enumerate(value):
-                if not any(isinstance(item, t) for t in expected_types):
-                    list_mismatches.append((i, type(item).__name__, item))
-
-            if list_mismatches:
-                type_names = " | ".join(sorted(t.__name__ for t in expected_types))
-
-                examples: list[str] = []
-                for (
-                    _,
-                    item_type,
-                    item_val,
-                ) in list_mismatches[:3]:
-                    examples.append(f"{repr(item_val)} ({item_type})")
-
-                error_msg = "".join(
-                    f"Expected list[{type_names}], but found "
-                    f"{len(list_mismatches)} item(s) with wrong type."
-                    f"\nExamples: {', '.join(examples)}"
-                )
+    def _resolve(self, value_type: type) -> str | None:
+        """
+        Resolve the handler for a value type based on priority.
+
+        :param value_type: The type of the value to dispatch.
+
+        :returns: Handler method name, or ``None`` if no handler found.
+        :rtype: str | None
+        """
+        slot = _REGISTRY.find(value_type)
+
+        if slot is not None:
+            for handler_name in slot.handler_names:
+                if self.is_implemented(handler_name):
+                    return handler_name
+            if not slot.use_handle_all:
+                return None
+
+        if self.is_implemented("handle_all"):
+            return "handle_all"
+
+        return None
+
+
+def _get_dispatch_table(child: "ChildNode") -> _DispatchTable:
+    """
+    Get the compiled dispatch table for the class of a child node.
+
+    :param child: The child node instance.
+
+    :returns: The dispatch table of the child's class.
+    :rtype: _DispatchTable
+    """
+    cls = type(child)
+    table: _DispatchTable | None = cls.__dict__.get("_dispatch_table")
+    generation = ChildNodeMeta.handler_generation
+
+    if table is None or table.generation != generation:
+        table = _DispatchTable(cls, generation)
+        type.__setattr__(cls, "_dispatch_table", table)
+
+    return table
 
-                return False, error_msg
 
-    elif handler_name == "handle_dict":
-        if not isinstance(value, dict):
-            return False, f"Expected dict, got {type(value).__name__}"
+def _raise_invalid_tag_result() -> None:
+    """
+    Raise the error for a ``handle_tag`` that returned a value.
+
+    :raises InvalidHandlerError: Always.
+    """
+    message = (
+        "Method handle_tag() is validation-only and "
+        "does not support transformations."
+    )
+
+    tip = (
+        "Remove the return statement to make it "
+        "validation-only or move the "
+        "transformation logic to the parent node."
+    )
+
+    raise InvalidHandlerError(message=message, tip=tip)
+
+
+def _check_handler_type(spec: _HandlerSpec, value: Any) -> None:
+    """
+    Check a value against the ``value`` hint of the handler it is sent to.
+
+    :param spec: The resolved handler.
+    :param value: The value to check.
+
+    :raises ProcessError: If the value does not match the hint.
+    """
+    validator = spec.validator
+
+    if validator is not None:
+        error_msg = validator(value)
+        if error_msg is not None:
+            raise ProcessError(f"Type mismatch in {spec.name}: " f"{error_msg}")
+
+
+def _set_handler_method(context: "Context", handler_name: str) -> None:
+    """
+    Record the handler in use for error reporting.
+
+    :param context: The processing context.
+    :param handler_name: The name of the handler about to be called.
+    """
+    if "click_extended" in context.click_context.meta:
+        meta = context.click_context.meta["click_extended"]
+        scope_target(meta)["handler_method"] = handler_name
 
-    return True, ""
+
+def _offloads(child: "ChildNode", meta: dict[str, Any]) -> bool:
+    """
+    Check if the sync handlers of a child run in a worker thread.
+
+    :param child: The child node to check.
+    :param meta: The ``click-extended`` metadata of the run.
+
+    :returns: ``True`` if the child sets ``offload`` or the command has an
+        executor, ``False`` otherwise.
+    :rtype: bool
+    """
+    return child.offload or meta.get("executor") is not None
+
+
+async def _call_handler_async(
+    spec: _HandlerSpec,
+    child: "ChildNode",
+    meta: dict[str, Any],
+    *args: Any,
+) -> Any:
+    r"""
+    Call a handler from async code.
+
+    Async handlers are awaited, and sync handlers run in a worker thread
+    if the child is offloaded and in the current thread otherwise.
+
+    :param spec: The handler to call.
+    :param child: The child node the handler belongs to.
+    :param meta: The ``click-extended`` metadata of the run.
+    :param \*args: The value (if any) and context to pass to the handler.
+
+    :returns: The return value of the handler.
+    :rtype: Any
+    """
+    if spec.is_async:
+        return await getattr(child, spec.name)(
+            *args, *child.process_args, **child.process_kwargs
+        )
+    if _offloads(child, meta):
+        return await run_in_executor(
+            getattr(child, spec.name),
+            (*args, *child.process_args),
+            child.process_kwargs,
+            meta.get("executor"),
+        )
+    return getattr(child, spec.name)(*args, *child.process_args, **child.process_kwargs)
 
 
 def dispatch_to_child(
@@ -259,9 +853,11 @@ def dispatch_to_child(
     :raises InvalidHandlerError: If ``handle_tag`` returns a modified
         dictionary.
     """
+    table = _get_dispatch_table(child)
+    meta = context.click_context.meta.get("click_extended", {})
+
     if isinstance(value, tuple):
-        meta = context.click_context.meta.get("click_extended", {})
-        is_container = meta.get("is_container_tuple", False)
+        is_container = get_scope_value(meta, "is_container_tuple", False)
 
         if is_container:
             return _process_container_tuple(
@@ -272,7 +868,7 @@ def dispatch_to_child(
 
     if value is None:
         # Handle None
-        if _is_handler_implemented(child, "handle_none"):
+        if table.is_implemented("handle_none"):
             try:
                 result = child.handle_none(
                     context, *child.process_args, **child.process_kwargs
@@ -281,12 +877,12 @@ def dispatch_to_child(
             except NotImplementedError:
                 pass
 
-        for handler_name in TYPE_SPECIFIC_HANDLERS:
-            if _is_handler_implemented(child, handler_name):
-                if _should_call_handler(child, handler_name, value):
+        for specific_name in _REGISTRY.specific_names:
+            if table.is_implemented(specific_name):
+                spec = table.spec(specific_name)
+                if spec.accepts_none:
                     try:
-                        handler = getattr(child, handler_name)
-                        result = handler(
+                        result = getattr(child, spec.name)(
                             value,
                             context,
                             *child.process_args,
@@ -301,8 +897,9 @@ def dispatch_to_child(
 
         # Handle all
         try:
-            if _should_call_handler(child, "handle_all", value):
-                result = child.handle_all(
+            spec = table.spec("handle_all")
+            if spec.accepts_none:
+                result = getattr(child, spec.name)(
                     value, context, *child.process_args, **child.process_kwargs
                 )
                 return value if result is None else result
@@ -311,66 +908,35 @@ def dispatch_to_child(
 
         return None
 
-    handler_name = _determine_handler(
-        child,
-        value,
-        context,
-    )  # type: ignore[assignment]
+    handler_name = _determine_handler(child, value, context, table)
 
     # Handle specific
     if handler_name:
         try:
-            if _should_call_handler(child, handler_name, value):
-                if "click_extended" in context.click_context.meta:
-                    context.click_context.meta["click_extended"][
-                        "handler_method"
-                    ] = handler_name  # type: ignore[assignment]
-
-                handler = getattr(child, handler_name)
-                hints = get_type_hints(handler)
-
-                if "value" in hints:
-                    is_valid, error_msg = _validate_handler_type(
-                        handler_name, value, hints["value"]
-                    )
-                    if not is_valid:
-                        raise ProcessError(
-                            f"Type mismatch in {handler_name}: " f"{error_msg}"
-                        )
+            _set_handler_method(context, handler_name)
 
-                result = handler(
-                    value, context, *child.process_args, **child.process_kwargs
-                )
+            spec = table.spec(handler_name)
+            if meta.get("strict_types", True):
+                _check_handler_type(spec, value)
 
-                if handler_name == "handle_tag" and result is not None:
-                    message = (
-                        "Method handle_tag() is validation-only and "
-                        "does not support transformations."
-                    )
-
-                    tip = (
-                        "Remove the return statement to make it "
-                        "validation-only or move the "
-                        "transformation logic to the parent node."
-                    )
+            result = getattr(child, spec.name)(
+                value, context, *child.process_args, **child.process_kwargs
+            )
 
-                    raise InvalidHandlerError(message=message, tip=tip)
+            if handler_name == "handle_tag" and result is not None:
+                _raise_invalid_tag_result()
 
-                return value if result is None else result  # type: ignore
+            return value if result is None else result  # type: ignore
         except NotImplementedError:
             pass
 
     try:
-        if _should_call_handler(child, "handle_all", value):
-            if "click_extended" in context.click_context.meta:
-                context.click_context.meta["click_extended"][
-                    "handler_method"
-                ] = "handle_all"
+        _set_handler_method(context, "handle_all")
 
-            result = child.handle_all(
-                value, context, *child.process_args, **child.process_kwargs
-            )
-            return value if result is None else result  # type: ignore
+        result = child.handle_all(
+            value, context, *child.process_args, **child.process_kwargs
+        )
+        return value if result is None else result  # type: ignore
     except NotImplementedError:
         pass
 
@@ -382,7 +948,10 @@ def dispatch_to_child(
 
 
 def _determine_handler(
-    child: "ChildNode", value: Any, context: "Context"
+    child: "ChildNode",
+    value: Any,
+    context: "Context",
+    table: _DispatchTable | None = None,
 ) -> str | None:
     """
     Determine which handler should process this value based on priority.
@@ -390,67 +959,18 @@ def _determine_handler(
     :param child: The child node to check for implemented handlers.
     :param value: The value to check.
     :param context: The processing context.
+    :param table: The dispatch table of the child, looked up if omitted.
 
     :returns: Handler method name, or ``None`` if no handler found.
     :rtype: str | None
     """
-    if context.is_tag() and _is_handler_implemented(child, "handle_tag"):
-        return "handle_tag"
+    if table is None:
+        table = _get_dispatch_table(child)
 
-    if isinstance(value, bytes):
-        if _is_handler_implemented(child, "handle_bytes"):
-            return "handle_bytes"
-    elif isinstance(value, Decimal):
-        if _is_handler_implemented(child, "handle_decimal"):
-            return "handle_decimal"
-    elif isinstance(value, datetime):
-        if _is_handler_implemented(child, "handle_datetime"):
-            return "handle_datetime"
-    elif isinstance(value, date):
-        if _is_handler_implemented(child, "handle_date"):
-            return "handle_date"
-    elif isinstance(value, time):
-        if _is_handler_implemented(child, "handle_time"):
-            return "handle_time"
-    elif isinstance(value, UUID):
-        if _is_handler_implemented(child, "handle_uuid"):
-            return "handle_uuid"
-    elif isinstance(value, Path):
-        if _is_handler_implemented(child, "handle_path"):
-            return "handle_path"
-    elif isinstance(value, dict):
-        if _is_handler_implemented(child, "handle_dict"):
-            return "handle_dict"
-    elif isinstance(value, str):
-        if _is_handler_implemented(child, "handle_str"):
-            return "handle_str"
-    elif isinstance(
-        value, bool
-    ):  # Must check bool before int since bool is subclass of int
-        if _is_handler_implemented(child, "handle_bool"):
-            return "handle_bool"
-    elif isinstance(value, int):
-        if _is_handler_implemented(child, "handle_int"):
-            return "handle_int"
-        if _is_handler_implemented(child, "handle_numeric"):
-            return "handle_numeric"
-    elif isinstance(value, float):
-        if _is_handler_implemented(child, "handle_float"):
-            return "handle_float"
-        if _is_handler_implemented(child, "handle_numeric"):
-            return "handle_numeric"
-    elif isinstance(value, list):
-        if _is_handler_implemented(child, "handle_list"):
-            return "handle_list"
-    elif isinstance(value, tuple):
-        if _is_handler_implemented(child, "handle_tuple"):
-            return "handle_tuple"
-        return None
-
-    if _is_handler_implemented(child, "handle_all"):
-        return "handle_all"
+    if context.is_tag() and table.is_implemented("handle_tag"):
+        return "handle_tag"
 
-    return None
+    return table.handler_for(type(value))
 
 
 def _should_call_handler(child: "ChildNode", handler_name: str, value: Any) -> bool:
@@ -470,33 +990,10 @@ def _should_call_handler(child: "ChildNode", handler_name: str, value: Any) -> b
     if value is not None:
         return True
 
-    try:
-        method = getattr(child, handler_name, None)
-        if method is None:
-            return False
-
-        hints = get_type_hints(method)
-        if "value" not in hints:
-            return True
-
-        value_hint = hints["value"]
-
-        if value_hint is Any:
-            return True
-
-        origin = get_origin(value_hint)
-
-        if origin is UnionType:
-            args = get_args(value_hint)
-            return type(None) in args
-
-        if origin is Union:
-            args = get_args(value_hint)
-            return type(None) in args
-
+    if getattr(child, handler_name, None) is None:
         return False
-    except (AttributeError, ImportError):
-        return True
+
+    return _get_dispatch_table(child).spec(handler_name).accepts_none
 
 
 def _is_handler_implemented(child: "ChildNode", handler_name: str) -> bool:
@@ -510,11 +1007,7 @@ def _is_handler_implemented(child: "ChildNode", handler_name: str) -> bool:
         otherwise.
     :rtype: bool
     """
-    for cls in type(child).__mro__:
-        if handler_name in cls.__dict__:
-            return cls is not ChildNode
-
-    return False
+    return _get_dispatch_table(child).is_implemented(handler_name)
 
 
 def _get_implemented_handlers(child: "ChildNode") -> list[str]:
@@ -527,16 +1020,101 @@ def _get_implemented_handlers(child: "ChildNode") -> list[str]:
         that are implemented.
     :rtype: list[str]
     """
-    handlers: list[str] = []
+    table = _get_dispatch_table(child)
+    return [
+        handler_name.replace("handle_", "")
+        for handler_name in _REGISTRY.all_names
+        if table.is_implemented(handler_name)
+    ]
+
+
+def _resolve_element_handler(
+    child: "ChildNode",
+    table: _DispatchTable,
+    item: Any,
+    is_tag: bool,
+) -> _HandlerSpec | None:
+    """
+    Resolve the handler for a single element of a container tuple.
+
+    :param child: The child node to dispatch handlers from.
+    :param table: The dispatch table of the child.
+    :param item: The element to process.
+    :param is_tag: Whether the parent of the child is a tag.
+
+    :returns: The handler to call, or ``None`` if the element should be
+        passed through unchanged.
+    :rtype: _HandlerSpec | None
+
+    :raises UnhandledTypeError: If no handler exists for the element's type.
+    """
+    if is_tag and table.is_implemented("handle_tag"):
+        handler_name: str | None = "handle_tag"
+    else:
+        handler_name = table.handler_for(type(item))
+
+    if not handler_name:
+        if not table.is_implemented("handle_all"):
+            raise UnhandledTypeError(
+                child_name=child.name,
+                value_type=type(item).__name__,  # type: ignore
+                implemented_handlers=_get_implemented_handlers(child),
+            )
+        handler_name = "handle_all"
+
+    spec = table.spec(handler_name)
+    if item is None and not spec.accepts_none:
+        return None
+    return spec
+
+
+def _should_batch(table: _DispatchTable, value: tuple[Any, ...], is_tag: bool) -> bool:
+    """
+    Check if one level of a container tuple is passed to ``handle_batch``.
+
+    Empty levels and levels containing tuples are always processed element
+    by element, so that nested levels are batched separately. If the child
+    also implements element handlers, the level is only batched when all of
+    its values are routed to one of them; otherwise the element handlers
+    process the level and report unhandled values as usual.
+
+    :param table: The dispatch table of the child.
+    :param value: The level of the container tuple.
+    :param is_tag: Whether the parent of the child is a tag.
+
+    :returns: ``True`` if ``handle_batch`` should process the level.
+    :rtype: bool
+    """
+    if not value or is_tag or not table.is_implemented("handle_batch"):
+        return False
+
+    check_handlers = table.has_element_handlers()
+    for value_type in set(map(type, value)):
+        if issubclass(value_type, tuple):
+            return False
+        if check_handlers and (
+            value_type is type(None) or table.handler_for(value_type) is None
+        ):
+            return False
+
+    return True
 
-    for handler_name in ALL_HANDLER_NAMES:
-        for cls in type(child).__mro__:
-            if handler_name in cls.__dict__:
-                if cls is not ChildNode:
-                    handlers.append(handler_name.replace("handle_", ""))
-                break
 
-    return handlers
+def _raise_with_path(error: ValueError | TypeError, path: list[int]) -> NoReturn:
+    """
+    Re-raise an error from a container tuple with the index of the value.
+
+    :param error: The error raised while processing the value.
+    :param path: The path of the value in the container tuple.
+
+    :raises ValueError: If ``error`` is a ``ValueError``.
+    :raises TypeError: If ``error`` is a ``TypeError``.
+    """
+    path_str = "".join(f"[{idx}]" for idx in path)
+    error_msg = str(error)
+    if path_str and " at index " not in error_msg:
+        raise type(error)(f"{error_msg} at index {path_str}") from error
+    raise error
 
 
 def _process_container_tuple(
@@ -551,6 +1129,8 @@ def _process_container_tuple(
     This function recursively processes tuples from options/arguments with
     ``multiple=True`` or ``nargs>1``, applying appropriate handlers to each
     leaf element based on its type and preserving the tuple structure.
+    Levels without nested tuples are passed to ``handle_batch`` in a single
+    call when the child implements it.
 
     :param child: The child node to dispatch handlers from.
     :param value: The container tuple to process.
@@ -567,6 +1147,45 @@ def _process_container_tuple(
     if path is None:
         path = []
 
+    table = _get_dispatch_table(child)
+    is_tag = context.is_tag()
+
+    if _should_batch(table, value, is_tag):
+        try:
+            result = child.handle_batch(
+                value, context, *child.process_args, **child.process_kwargs
+            )
+        except BatchItemError as e:
+            _raise_with_path(e.error, path + [e.index])
+        except (ValueError, TypeError) as e:
+            _raise_with_path(e, path)
+
+        return value if result is None else tuple(result)
+
+    return _process_container_items(child, table, value, context, path, is_tag)
+
+
+def _process_container_items(
+    child: "ChildNode",
+    table: _DispatchTable,
+    value: tuple[Any, ...],
+    context: "Context",
+    path: list[int],
+    is_tag: bool,
+) -> tuple[Any, ...]:
+    """
+    Process one level of a container tuple element by element.
+
+    :param child: The child node to dispatch handlers from.
+    :param table: The dispatch table of the child.
+    :param value: The level of the container tuple.
+    :param context: Processing context.
+    :param path: Path of the level for error reporting.
+    :param is_tag: Whether the parent of the child is a tag.
+
+    :returns: New tuple with same structure but processed elements.
+    :rtype: tuple[Any, ...]
+    """
     results: list[Any] = []
 
     for i, item in enumerate(value):
@@ -581,42 +1200,21 @@ def _process_container_tuple(
                     current_path,
                 )
             else:
-                if handler_name := _determine_handler(child, item, context):
-                    if _should_call_handler(child, handler_name, item):
-                        handler = getattr(child, handler_name)
-                        result = handler(
-                            item,
-                            context,
-                            *child.process_args,
-                            **child.process_kwargs,
-                        )
-                    else:
-                        result = item
-                elif _is_handler_implemented(child, "handle_all"):
-                    if _should_call_handler(child, "handle_all", item):
-                        result = child.handle_all(
-                            item,
-                            context,
-                            *child.process_args,
-                            **child.process_kwargs,
-                        )
-                    else:
-                        result = item
+                spec = _resolve_element_handler(child, table, item, is_tag)
+                if spec is None:
+                    result = item
                 else:
-                    raise UnhandledTypeError(
-                        child_name=child.name,
-                        value_type=type(item).__name__,  # type: ignore
-                        implemented_handlers=_get_implemented_handlers(child),
+                    result = getattr(child, spec.name)(
+                        item,
+                        context,
+                        *child.process_args,
+                        **child.process_kwargs,
                     )
 
             results.append(result)
 
         except (ValueError, TypeError) as e:
-            path_str = "".join(f"[{idx}]" for idx in current_path)
-            error_msg = str(e)
-            if path_str and " at index " not in error_msg:
-                raise type(e)(f"{error_msg} at index {path_str}") from e
-            raise
+            _raise_with_path(e, current_path)
 
     return tuple(results)
 
@@ -626,6 +1224,7 @@ async def _process_container_tuple_async(
     value: tuple[Any, ...],
     context: "Context",
     path: list[int] | None = None,
+    semaphore: asyncio.Semaphore | None = None,
 ) -> tuple[Any, ...]:
     """
     Async version of _process_container_tuple for async handler support.
@@ -635,11 +1234,18 @@ async def _process_container_tuple_async(
     This function recursively processes tuples from options/arguments with
     ``multiple=True`` or ``nargs>1``, applying appropriate handlers to each
     leaf element based on its type and preserving the tuple structure.
+    Levels without nested tuples are passed to ``handle_batch`` in a single
+    call when the child implements it.
+
+    If the child sets ``max_concurrency``, async or offloaded element handlers
+    run concurrently with at most that many calls in flight across all levels.
 
     :param child: The child node to dispatch handlers from.
     :param value: The container tuple to process.
     :param context: Processing context.
     :param path: Current path for error reporting. Defaults to empty list.
+    :param semaphore: Semaphore limiting concurrent handler calls, created
+        from ``max_concurrency`` at the top level.
 
     :returns: New tuple with same structure but processed elements.
     :rtype: tuple[Any, ...]
@@ -648,78 +1254,134 @@ async def _process_container_tuple_async(
     :raises TypeError: If type mismatch occurs, with path information added.
     :raises UnhandledTypeError: If no handler exists for an element's type.
     """
+    table = _get_dispatch_table(child)
+    is_tag = context.is_tag()
+    meta = context.click_context.meta.get("click_extended", {})
+
     if path is None:
         path = []
+        if child.max_concurrency is not None and (
+            table.has_async() or _offloads(child, meta)
+        ):
+            semaphore = asyncio.Semaphore(child.max_concurrency)
 
-    results: list[Any] = []
+    if _should_batch(table, value, is_tag):
+        spec = table.spec("handle_batch")
+        try:
+            result = await _call_handler_async(spec, child, meta, value, context)
+        except BatchItemError as e:
+            _raise_with_path(e.error, path + [e.index])
+        except (ValueError, TypeError) as e:
+            _raise_with_path(e, path)
 
-    for i, item in enumerate(value):
-        current_path = path + [i]
+        return value if result is None else tuple(result)
 
-        try:
-            if isinstance(item, tuple):
-                result = await _process_container_tuple_async(
-                    child,
-                    item,  # type: ignore
-                    context,
-                    current_path,
+    return await _process_container_items_async(
+        child, table, value, context, path, is_tag, semaphore
+    )
+
+
+async def _process_container_items_async(
+    child: "ChildNode",
+    table: _DispatchTable,
+    value: tuple[Any, ...],
+    context: "Context",
+    path: list[int],
+    is_tag: bool,
+    semaphore: asyncio.Semaphore | None,
+) -> tuple[Any, ...]:
+    """
+    Async version of _process_container_items for async handler support.
+
+    Without a semaphore the elements are processed one after another.
+    With one, they are processed concurrently and the results keep their
+    original order. If several elements fail, the error of the first one
+    in order is raised.
+
+    :param child: The child node to dispatch handlers from.
+    :param table: The dispatch table of the child.
+    :param value: The level of the container tuple.
+    :param context: Processing context.
+    :param path: Path of the level for error reporting.
+    :param is_tag: Whether the parent of the child is a tag.
+    :param semaphore: Semaphore limiting concurrent handler calls.
+
+    :returns: New tuple with same structure but processed elements.
+    :rtype: tuple[Any, ...]
+    """
+    if semaphore is None:
+        results: list[Any] = []
+        for i, item in enumerate(value):
+            results.append(
+                await _process_container_item_async(
+                    child, table, item, context, path + [i], is_tag, None
                 )
-            else:
-                if handler_name := _determine_handler(child, item, context):
-                    if _should_call_handler(child, handler_name, item):
-                        handler = getattr(child, handler_name)
-                        if asyncio.iscoroutinefunction(handler):
-                            result = await handler(
-                                item,
-                                context,
-                                *child.process_args,
-                                **child.process_kwargs,
-                            )
-                        else:
-                            result = handler(
-                                item,
-                                context,
-                                *child.process_args,
-                                **child.process_kwargs,
-                            )
-                    else:
-                        result = item
-                elif _is_handler_implemented(child, "handle_all"):
-                    if _should_call_handler(child, "handle_all", item):
-                        handler = child.handle_all
-                        if asyncio.iscoroutinefunction(handler):
-                            result = await handler(
-                                item,
-                                context,
-                                *child.process_args,
-                                **child.process_kwargs,
-                            )
-                        else:
-                            result = handler(
-                                item,
-                                context,
-                                *child.process_args,
-                                **child.process_kwargs,
-                            )
-                    else:
-                        result = item
-                else:
-                    raise UnhandledTypeError(
-                        child_name=child.name,
-                        value_type=type(item).__name__,  # type: ignore
-                        implemented_handlers=_get_implemented_handlers(child),
-                    )
+            )
+        return tuple(results)
 
-            results.append(result)
+    outcomes = await asyncio.gather(
+        *(
+            _process_container_item_async(
+                child, table, item, context, path + [i], is_tag, semaphore
+            )
+            for i, item in enumerate(value)
+        ),
+        return_exceptions=True,
+    )
 
-        except (ValueError, TypeError) as e:
-            path_str = "".join(f"[{idx}]" for idx in current_path)
-            error_msg = str(e)
-            if path_str and " at index " not in error_msg:
-                raise type(e)(f"{error_msg} at index {path_str}") from e
-            raise
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
 
-    return tuple(results)
+    return tuple(outcomes)
+
+
+async def _process_container_item_async(
+    child: "ChildNode",
+    table: _DispatchTable,
+    item: Any,
+    context: "Context",
+    path: list[int],
+    is_tag: bool,
+    semaphore: asyncio.Semaphore | None,
+) -> Any:
+    """
+    Process a single element of a container tuple.
+
+    :param child: The child node to dispatch handlers from.
+    :param table: The dispatch table of the child.
+    :param item: The element to process.
+    :param context: Processing context.
+    :param path: Path of the element for error reporting.
+    :param is_tag: Whether the parent of the child is a tag.
+    :param semaphore: Semaphore limiting concurrent handler calls.
+
+    :returns: The processed element.
+    :rtype: Any
+    """
+    try:
+        if isinstance(item, tuple):
+            return await _process_container_tuple_async(
+                child,
+                item,  # type: ignore
+                context,
+                path,
+                semaphore,
+            )
+
+        spec = _resolve_element_handler(child, table, item, is_tag)
+        if spec is None:
+            return item
+
+        meta = context.click_context.meta.get("click_extended", {})
+        if semaphore is None or not (spec.is_async or _offloads(child, meta)):
+            return await _call_handler_async(spec, child, meta, item, context)
+
+        async with semaphore:
+            return await _call_handler_async(spec, child, meta, item, context)
+
+    except (ValueError, TypeError) as e:
+        _raise_with_path(e, path)
 
 
 def has_async_handlers(child: "ChildNode") -> bool:
@@ -731,13 +1393,7 @@ def has_async_handlers(child: "ChildNode") -> bool:
     :returns: ``True`` if any handler is async, ``False`` otherwise.
     :rtype: bool
     """
-    for handler_name in ALL_HANDLER_NAMES:
-        if _is_handler_implemented(child, handler_name):
-            handler = getattr(child, handler_name)
-            if asyncio.iscoroutinefunction(handler):
-                return True
-
-    return False
+    return _get_dispatch_table(child).has_async()
 
 
 async def dispatch_to_child_async(
@@ -762,10 +1418,11 @@ async def dispatch_to_child_async(
     :raises InvalidHandlerError: If ``handle_tag`` returns a modified
         dictionary.
     """
+    table = _get_dispatch_table(child)
+    meta = context.click_context.meta.get("click_extended", {})
+
     if isinstance(value, tuple):
-        is_container = context.click_context.meta.get("click_extended", {}).get(
-            "is_container_tuple", False
-        )
+        is_container = get_scope_value(meta, "is_container_tuple", False)
         if is_container:
             return await _process_container_tuple_async(
                 child,
@@ -775,40 +1432,22 @@ async def dispatch_to_child_async(
 
     if value is None:
         # Handle None
-        if _is_handler_implemented(child, "handle_none"):
+        if table.is_implemented("handle_none"):
             try:
-                none_handler = child.handle_none
-                if asyncio.iscoroutinefunction(none_handler):
-                    result = await none_handler(
-                        context, *child.process_args, **child.process_kwargs
-                    )
-                else:
-                    result = none_handler(
-                        context, *child.process_args, **child.process_kwargs
-                    )
+                spec = table.spec("handle_none")
+                result = await _call_handler_async(spec, child, meta, context)
                 return value if result is None else result  # type: ignore
             except NotImplementedError:
                 pass
 
-        for handler_name in TYPE_SPECIFIC_HANDLERS:
-            if _is_handler_implemented(child, handler_name):
-                if _should_call_handler(child, handler_name, value):
+        for specific_name in _REGISTRY.specific_names:
+            if table.is_implemented(specific_name):
+                spec = table.spec(specific_name)
+                if spec.accepts_none:
                     try:
-                        handler = getattr(child, handler_name)
-                        if asyncio.iscoroutinefunction(handler):
-                            result = await handler(
-                                value,
-                                context,
-                                *child.process_args,
-                                **child.process_kwargs,
-                            )
-                        else:
-                            result = handler(
-                                value,
-                                context,
-                                *child.process_args,
-                                **child.process_kwargs,
-                            )
+                        result = await _call_handler_async(
+                            spec, child, meta, value, context
+                        )
 
                         if result is None:
                             return value
@@ -818,105 +1457,41 @@ async def dispatch_to_child_async(
 
         # Handle all
         try:
-            if _should_call_handler(child, "handle_all", value):
-                all_handler = child.handle_all
-                if asyncio.iscoroutinefunction(all_handler):
-                    result = await all_handler(
-                        value,
-                        context,
-                        *child.process_args,
-                        **child.process_kwargs,
-                    )
-                else:
-                    result = all_handler(
-                        value,
-                        context,
-                        *child.process_args,
-                        **child.process_kwargs,
-                    )
+            spec = table.spec("handle_all")
+            if spec.accepts_none:
+                result = await _call_handler_async(spec, child, meta, value, context)
                 return value if result is None else result
         except NotImplementedError:
             pass
 
         return None
 
-    handler_name = _determine_handler(
-        child,
-        value,
-        context,
-    )  # type: ignore[assignment]
+    handler_name = _determine_handler(child, value, context, table)
 
     # Handle specific
     if handler_name:
         try:
-            if _should_call_handler(child, handler_name, value):
-                if "click_extended" in context.click_context.meta:
-                    context.click_context.meta["click_extended"][
-                        "handler_method"
-                    ] = handler_name  # type: ignore[assignment]
-
-                handler = getattr(child, handler_name)
-                hints = get_type_hints(handler)
-
-                if "value" in hints:
-                    is_valid, error_msg = _validate_handler_type(
-                        handler_name, value, hints["value"]
-                    )
-                    if not is_valid:
-                        raise ProcessError(
-                            f"Type mismatch in {handler_name}: " f"{error_msg}"
-                        )
+            _set_handler_method(context, handler_name)
 
-                if asyncio.iscoroutinefunction(handler):
-                    result = await handler(
-                        value,
-                        context,
-                        *child.process_args,
-                        **child.process_kwargs,
-                    )
-                else:
-                    result = handler(
-                        value,
-                        context,
-                        *child.process_args,
-                        **child.process_kwargs,
-                    )
+            spec = table.spec(handler_name)
+            if meta.get("strict_types", True):
+                _check_handler_type(spec, value)
 
-                if handler_name == "handle_tag" and result is not None:
-                    message = (
-                        "Method handle_tag() is validation-only and "
-                        "does not support transformations."
-                    )
+            result = await _call_handler_async(spec, child, meta, value, context)
 
-                    tip = (
-                        "Remove the return statement to make it "
-                        "validation-only or move the "
-                        "transformation logic to the parent node."
-                    )
-
-                    raise InvalidHandlerError(message=message, tip=tip)
+            if handler_name == "handle_tag" and result is not None:
+                _raise_invalid_tag_result()
 
-                return value if result is None else result  # type: ignore
+            return value if result is None else result  # type: ignore
         except NotImplementedError:
             pass
 
     try:
-        if _should_call_handler(child, "handle_all", value):
-            if "click_extended" in context.click_context.meta:
-                context.click_context.meta["click_extended"][
-                    "handler_method"
-                ] = "handle_all"
-
-            handler = child.handle_all
-            if asyncio.iscoroutinefunction(handler):
-                result = await handler(
-                    value, context, *child.process_args, **child.process_kwargs
-                )
-            else:
-                result = handler(
-                    value, context, *child.process_args, **child.process_kwargs
-                )
-            return value if result is None else result  # type: ignore
+        _set_handler_method(context, "handle_all")
+
+        spec = table.spec("handle_all")
+        result = await _call_handler_async(spec, child, meta, value, context)
+        return value if result is None else result  # type: ignore
     except NotImplementedError:
         pass
 
@@ -931,4 +1506,5 @@ __all__ = [
     "dispatch_to_child",
     "dispatch_to_child_async",
     "has_async_handlers",
+    "register_handler",
 ]
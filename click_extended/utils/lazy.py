@@ -0,0 +1,75 @@
+"""Utilities for resolving the exports of a package when first accessed."""
+
+# pylint: disable=no-member
+# pylint: disable=too-few-public-methods
+
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Callable, Mapping
+
+
+class _LazyModule(ModuleType):
+    """
+    Module keeping its lazy exports when a submodule of the same name loads.
+
+    Importing a submodule sets it as an attribute of its package, which
+    would hide an export of the same name, such as the ``is_email`` function
+    of the ``is_email`` submodule. The export is set instead.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        exports: Mapping[str, str] = self.__dict__.get("__lazy_exports__", {})
+        if (
+            isinstance(value, ModuleType)
+            and exports.get(name) == f".{name}"
+            and value.__name__ == f"{self.__name__}.{name}"
+            and hasattr(value, name)
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+def lazy_exports(
+    module_name: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Create the module ``__getattr__`` and ``__dir__`` of lazy exports.
+
+    The module an export is defined in is imported the first time the export
+    is accessed, and the export is then stored on the module so later
+    accesses do not go through ``__getattr__`` again.
+
+    :param module_name: The name of the module the exports belong to,
+        usually ``__name__``.
+    :param exports: The modules the exports are imported from, relative to
+        the module, keyed by the name of the export.
+
+    :returns: The ``__getattr__`` and ``__dir__`` functions of the module.
+    :rtype: tuple[Callable[[str], Any], Callable[[], list[str]]]
+
+    Example:
+        ```python
+        __getattr__, __dir__ = lazy_exports(
+            __name__, {"is_email": ".is_email"}
+        )
+        ```
+    """
+    module = sys.modules[module_name]
+    module.__dict__["__lazy_exports__"] = dict(exports)
+    module.__class__ = _LazyModule
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module '{module_name}' has no attribute '{name}'")
+        value = getattr(import_module(exports[name], module_name), name)
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*module.__dict__, *exports})
+
+    return __getattr__, __dir__
+
+
+__all__ = ["lazy_exports"]
@@ -0,0 +1,101 @@
+"""Utilities for running blocking sync handlers and loads in threads."""
+
+import asyncio
+import contextvars
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Literal
+
+import click
+from click.globals import pop_context, push_context
+
+ExecutorKind = Literal["thread"]
+
+EXECUTOR_KINDS: tuple[ExecutorKind, ...] = ("thread",)
+
+
+def create_executor(kind: ExecutorKind, max_workers: int | None = None) -> Executor:
+    """
+    Create the executor offloaded calls of a command run in.
+
+    :param kind: The kind of executor. Only ``"thread"`` is supported.
+    :param max_workers: The maximum number of worker threads. If ``None``,
+        uses the default of ``ThreadPoolExecutor``.
+
+    :returns: The executor.
+    :rtype: Executor
+
+    :raises ValueError: If the kind is not supported.
+    """
+    if kind not in EXECUTOR_KINDS:
+        raise ValueError(
+            f"Unsupported executor '{kind}', expected one of {EXECUTOR_KINDS}."
+        )
+    return ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="click-extended"
+    )
+
+
+def _call_in_click_context(
+    click_context: click.Context | None,
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    """
+    Call a function with the Click context pushed in the current thread.
+
+    :param click_context: The Click context of the caller, if any.
+    :param func: The function to call.
+    :param args: The positional arguments to call the function with.
+    :param kwargs: The keyword arguments to call the function with.
+
+    :returns: The return value of the function.
+    :rtype: Any
+    """
+    if click_context is None:
+        return func(*args, **kwargs)
+
+    push_context(click_context)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        pop_context()
+
+
+async def run_in_executor(
+    func: Callable[..., Any],
+    args: tuple[Any, ...] = (),
+    kwargs: dict[str, Any] | None = None,
+    executor: Executor | None = None,
+) -> Any:
+    """
+    Run a blocking function in a worker thread and await its result.
+
+    The function runs in a copy of the current ``contextvars`` context with
+    the current Click context pushed, so ``click.get_current_context()``,
+    ``get_context()`` and context-aware errors work as they do in the
+    calling thread.
+
+    :param func: The function to call.
+    :param args: The positional arguments to call the function with.
+    :param kwargs: The keyword arguments to call the function with.
+    :param executor: The executor to run in. If ``None``, uses the default
+        executor of the running event loop.
+
+    :returns: The return value of the function.
+    :rtype: Any
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        executor,
+        context.run,
+        _call_in_click_context,
+        click.get_current_context(silent=True),
+        func,
+        args,
+        kwargs or {},
+    )
+
+
+__all__ = ["EXECUTOR_KINDS", "ExecutorKind", "create_executor", "run_in_executor"]
@@ -0,0 +1,43 @@
+"""Utilities for running handlers with a decimal precision."""
+
+from decimal import localcontext
+from functools import wraps
+from typing import Any, Callable, TypeVar, cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def decimal_precision(prec: int) -> Callable[[F], F]:
+    """
+    Run a function with the given precision for decimal arithmetic.
+
+    The precision only applies to the calls of the function, so neither the
+    decimal context of the caller nor that of other handlers is changed.
+
+    :param prec: The number of significant digits.
+
+    :returns: A decorator applying the precision to a function.
+    :rtype: Callable[[F], F]
+
+    Example:
+        ```python
+        class Halve(ChildNode):
+            @decimal_precision(35)
+            def handle_numeric(self, value, context, *args, **kwargs):
+                return float(Decimal(str(value)) / 2)
+        ```
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with localcontext() as ctx:
+                ctx.prec = prec
+                return func(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+__all__ = ["decimal_precision"]
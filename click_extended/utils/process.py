@@ -3,8 +3,15 @@
 # pylint: disable=too-many-locals
 # pylint: disable=broad-exception-caught
 # pylint: disable=too-many-branches
+# pylint: disable=import-outside-toplevel
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-positional-arguments
 
+import asyncio
+import inspect
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, Any, Mapping, cast
+from weakref import WeakKeyDictionary
 
 import click
 
@@ -12,263 +19,514 @@ from click_extended.core.other._tree import Tree
 from click_extended.core.other.context import Context
 from click_extended.errors import ContextAwareError
 from click_extended.utils.dispatch import (
+    _get_dispatch_table,
     dispatch_to_child,
     dispatch_to_child_async,
-    has_async_handlers,
 )
+from click_extended.utils.scope import enter_task_scope, scope_target
+from click_extended.utils.trace import span
 
 if TYPE_CHECKING:
     from click_extended.core.decorators.tag import Tag
     from click_extended.core.nodes._root_node import RootNode
     from click_extended.core.nodes.child_node import ChildNode
     from click_extended.core.nodes.parent_node import ParentNode
+    from click_extended.utils.profile import Profiler
+    from click_extended.utils.trace import Tracer
 
 
-def process_children(
-    value: Any,
-    children: Mapping[Any, Any],
-    parent: "ParentNode | Tag",
-    tags: dict[str, "Tag"] | None = None,
-    click_context: click.Context | None = None,
-) -> Any:
+class ChildPipeline:
     """
-    Process a value through a chain of child nodes.
-    This is a ``phase 4`` function and does the following:
-
-    1. Updates scope tracking for each child
-    2. Dispatches value to appropriate handler
-    3. Wraps handler execution to catch exceptions
-    4. Converts user exceptions to ProcessError with context
-
-    :param value: The initial value to process.
-    :param children: Mapping of child nodes to process the value through.
-    :param parent: The parent node that owns these children.
-    :param tags: Dictionary mapping tag names to Tag instances.
-    :param click_context: The Click context for scope tracking and error
-        reporting.
+    A compiled chain of child nodes for a single parent.
 
-    :returns: The processed value after passing through all children.
-
-    :raises UnhandledTypeError: If a child node doesn't implement a handler
-        for the value type.
-    :raises ProcessError: If validation or transformation fails in a child
-        node.
+    Everything that only depends on the tree structure is resolved once when
+    the pipeline is compiled: the ordered children, their dispatch tables,
+    whether any handler is async and whether the parent produces container
+    tuples. Running the pipeline binds a single base ``Context`` per run and
+    only swaps the current child and the scope entries between handlers.
     """
-    child_nodes = [cast("ChildNode", child) for child in children.values()]
-
-    if tags is None:
-        tags = {}
-
-    is_container_tuple = False
-    if isinstance(value, tuple) and parent.__class__.__name__ in (
-        "Option",
-        "Argument",
-    ):
-        parent_cast: click.Option | click.Argument
-        if parent.__class__.__name__ == "Option":
-            parent_cast = cast(click.Option, parent)
-            is_container_tuple = parent_cast.multiple or parent_cast.nargs != 1
-        else:
-            parent_cast = cast(click.Argument, parent)
-            is_container_tuple = parent_cast.nargs != 1
-
-    for child in child_nodes:
-        if click_context is not None:
-            Tree.update_scope(
-                click_context,
-                "child",
-                parent_node=(
-                    cast("ParentNode", parent)
-                    if parent.__class__.__name__ != "Tag"
-                    else None
-                ),
-                child_node=child,
-            )
 
-            if "click_extended" in click_context.meta:
-                click_context.meta["click_extended"]["handler_value"] = value
-                click_context.meta["click_extended"][
-                    "is_container_tuple"
-                ] = is_container_tuple
+    __slots__ = (
+        "parent",
+        "children",
+        "is_async",
+        "generation",
+        "_scope_parent",
+        "_container",
+        "_keys",
+    )
+
+    def __init__(self, children: Mapping[Any, Any], parent: "ParentNode | Tag"):
+        """
+        Compile the children of a parent into a pipeline.
+
+        :param children: Mapping of child nodes to process the value through.
+        :param parent: The parent node that owns these children.
+        """
+        from click_extended.core.nodes.child_node import ChildNodeMeta
+
+        self.parent = parent
+        self.children: tuple["ChildNode", ...] = tuple(
+            cast("ChildNode", child) for child in children.values()
+        )
+        self.generation = ChildNodeMeta.handler_generation
+        self._keys = tuple(f"{parent.name}.{child.name}" for child in self.children)
+        self.is_async = any(
+            child.offload or _get_dispatch_table(child).has_async()
+            for child in self.children
+        )
+
+        class_name = parent.__class__.__name__
+        self._scope_parent = cast("ParentNode", parent) if class_name != "Tag" else None
+
+        self._container = False
+        if class_name == "Option":
+            option = cast(click.Option, parent)
+            self._container = option.multiple or option.nargs != 1
+        elif class_name == "Argument":
+            argument = cast(click.Argument, parent)
+            self._container = argument.nargs != 1
+
+    def is_current(self, children: Mapping[Any, Any]) -> bool:
+        """
+        Check if the pipeline still matches the given children.
+
+        :param children: Mapping of child nodes of the parent.
+
+        :returns: ``True`` if the children and handlers are unchanged since
+            the pipeline was compiled, ``False`` otherwise.
+        :rtype: bool
+        """
+        from click_extended.core.nodes.child_node import ChildNodeMeta
+
+        if self.generation != ChildNodeMeta.handler_generation:
+            return False
+        if len(children) != len(self.children):
+            return False
+        return all(
+            a is b for a, b in zip(children.values(), self.children, strict=True)
+        )
 
+    def _bind(
+        self, value: Any, click_context: click.Context | None
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None, Context]:
+        """
+        Prepare the scope and base context for a single run.
+
+        :param value: The initial value to process.
+        :param click_context: The Click context for scope tracking and error
+            reporting.
+
+        :returns: The ``click-extended`` metadata and the dictionary the
+            scope is written to (both ``None`` when there is no scope to
+            track), and the base context for this run.
+        :rtype: tuple[dict[str, Any] | None, dict[str, Any] | None, Context]
+        """
         root_node: "RootNode | None" = None
         all_nodes: dict[str, Any] = {}
         all_parents: dict[str, Any] = {}
         all_tags: dict[str, Any] = {}
         all_children: dict[str, Any] = {}
-        all_globals: dict[str, Any] = {}
-        meta: dict[str, Any] = {}
+        meta: dict[str, Any] | None = None
+        scope: dict[str, Any] | None = None
 
         if click_context is not None and "click_extended" in click_context.meta:
             meta = click_context.meta["click_extended"]
             root_node = meta.get("root_node")
+            all_nodes = Tree.get_node_index(meta)
+            all_parents = meta.get("parents", all_parents)
+            all_tags = meta.get("tags", all_tags)
+            all_children = meta.get("children", all_children)
 
-            if "parents" in meta:
-                all_parents = meta["parents"]
-                all_nodes.update(all_parents)
-
-            if "tags" in meta:
-                all_tags = meta["tags"]
-                all_nodes.update(all_tags)
-
-            if "children" in meta:
-                all_children = meta["children"]
-                all_nodes.update(all_children)
-
-            if "globals" in meta:
-                all_globals = meta["globals"]
-                all_nodes.update(all_globals)
-
-            if root_node:
-                all_nodes[root_node.name] = root_node
+            scope = scope_target(meta)
+            scope["current_scope"] = "child"
+            scope["parent_node"] = self._scope_parent
+            scope["is_container_tuple"] = self._container and isinstance(value, tuple)
 
         context = Context(
             root=cast("RootNode", root_node),
-            parent=parent,
-            current=child,
+            parent=self.parent,
+            current=None,
             click_context=cast(click.Context, click_context),
             nodes=all_nodes,
             parents=all_parents,
             tags=all_tags,
             children=all_children,
-            data=meta.get("data", {}),
-            debug=meta.get("debug", False),
+            data=(meta or {}).get("data", {}),
+            debug=(meta or {}).get("debug", False),
+            index=(meta or {}).get("parent_index"),
         )
+        return meta, scope, context
+
+    def run(self, value: Any, click_context: click.Context | None = None) -> Any:
+        """
+        Process a value through the compiled chain.
+
+        :param value: The initial value to process.
+        :param click_context: The Click context for scope tracking and error
+            reporting.
+
+        :returns: The processed value after passing through all children.
+        """
+        if not self.children:
+            return value
+
+        meta, scope, base = self._bind(value, click_context)
+        profiler, tracer = self._instruments(meta)
+
+        if profiler is None and tracer is None:
+            for child in self.children:
+                if scope is not None:
+                    scope["child_node"] = child
+                    scope["handler_value"] = value
+
+                value = dispatch_to_child(
+                    child, value, base.with_node(child, self.parent)
+                )
+            return value
+
+        with span(tracer, self.parent.name, "parent"):
+            for position, child in enumerate(self.children):
+                if scope is not None:
+                    scope["child_node"] = child
+                    scope["handler_value"] = value
+
+                start = perf_counter_ns()
+                handled = value
+                try:
+                    value = dispatch_to_child(
+                        child, value, base.with_node(child, self.parent)
+                    )
+                finally:
+                    self._record(profiler, tracer, position, start, handled, scope)
+
+        return value
+
+    async def run_async(
+        self, value: Any, click_context: click.Context | None = None
+    ) -> Any:
+        """
+        Process a value through the compiled chain with async support.
+
+        :param value: The initial value to process.
+        :param click_context: The Click context for scope tracking and error
+            reporting.
+
+        :returns: The processed value after passing through all children.
+        """
+        if not self.children:
+            return value
+
+        meta, scope, base = self._bind(value, click_context)
+        profiler, tracer = self._instruments(meta)
+
+        if profiler is None and tracer is None:
+            for child in self.children:
+                if scope is not None:
+                    scope["child_node"] = child
+                    scope["handler_value"] = value
+
+                value = await dispatch_to_child_async(
+                    child, value, base.with_node(child, self.parent)
+                )
+            return value
+
+        with span(tracer, self.parent.name, "parent"):
+            for position, child in enumerate(self.children):
+                if scope is not None:
+                    scope["child_node"] = child
+                    scope["handler_value"] = value
+
+                start = perf_counter_ns()
+                handled = value
+                try:
+                    value = await dispatch_to_child_async(
+                        child, value, base.with_node(child, self.parent)
+                    )
+                finally:
+                    self._record(profiler, tracer, position, start, handled, scope)
+
+        return value
+
+    @staticmethod
+    def _instruments(
+        meta: dict[str, Any] | None,
+    ) -> tuple["Profiler | None", "Tracer | None"]:
+        """
+        Get the profiler and tracer of the invocation.
+
+        :param meta: The ``click-extended`` metadata of the run.
+
+        :returns: The profiler and tracer, each ``None`` when disabled.
+        :rtype: tuple[Profiler | None, Tracer | None]
+        """
+        if meta is None:
+            return None, None
+        return meta.get("profiler"), meta.get("tracer")
+
+    def _record(
+        self,
+        profiler: "Profiler | None",
+        tracer: "Tracer | None",
+        position: int,
+        start: int,
+        value: Any,
+        scope: dict[str, Any] | None,
+    ) -> None:
+        """
+        Record the time a child spent processing a value.
+
+        :param profiler: The profiler of the invocation, if enabled.
+        :param tracer: The tracer of the invocation, if enabled.
+        :param position: The position of the child in the chain.
+        :param start: The ``perf_counter_ns`` reading before the call.
+        :param value: The value passed to the child.
+        :param scope: The scope of the run.
+        """
+        end = perf_counter_ns()
+
+        if profiler is not None:
+            is_container = scope is not None and scope["is_container_tuple"]
+            profiler.record(
+                "children",
+                self._keys[position],
+                end - start,
+                value if is_container else None,
+            )
 
-        if isinstance(child, type(ContextAwareError)):
-            raise child
+        if tracer is not None:
+            child = self.children[position]
+            tracer.add(child.name, "child", start, end, {"parent": self.parent.name})
 
-        value = dispatch_to_child(child, value, context)
 
-    return value  # type: ignore
+_PIPELINES: "WeakKeyDictionary[ParentNode | Tag, ChildPipeline]" = WeakKeyDictionary()
 
 
-async def process_children_async(
+def compile_children(
+    children: Mapping[Any, Any], parent: "ParentNode | Tag"
+) -> ChildPipeline:
+    """
+    Get the compiled pipeline for the children of a parent.
+
+    Pipelines are cached per parent and recompiled when the children or any
+    handler method changes.
+
+    :param children: Mapping of child nodes to process the value through.
+    :param parent: The parent node that owns these children.
+
+    :returns: The compiled pipeline.
+    :rtype: ChildPipeline
+
+    :raises ContextAwareError: If a child in the chain is an error instance.
+    """
+    pipeline = _PIPELINES.get(parent)
+
+    if pipeline is None or not pipeline.is_current(children):
+        for child in children.values():
+            if isinstance(child, ContextAwareError):
+                raise child
+
+        pipeline = ChildPipeline(children, parent)
+        _PIPELINES[parent] = pipeline
+
+    return pipeline
+
+
+def process_children(
     value: Any,
     children: Mapping[Any, Any],
     parent: "ParentNode | Tag",
-    tags: dict[str, "Tag"] | None = None,
     click_context: click.Context | None = None,
 ) -> Any:
     """
-    Async version of process_children for async handler support.
+    Process a value through a chain of child nodes.
+    This is a ``phase 4`` function that compiles the chain with
+    ``compile_children`` and runs it.
 
-    Process a value through a chain of child nodes (async).
-    This is a ``phase 4`` function and does the following:
+    Errors raised by handlers propagate unchanged. The scope recorded for
+    each child is used to report them with the failing node.
 
-    1. Updates scope tracking for each child
-    2. Dispatches value to appropriate handler (with async support)
-    3. Wraps handler execution to catch exceptions
-    4. Converts user exceptions to ProcessError with context
+    :param value: The initial value to process.
+    :param children: Mapping of child nodes to process the value through.
+    :param parent: The parent node that owns these children.
+    :param click_context: The Click context for scope tracking and error
+        reporting.
+
+    :returns: The processed value after passing through all children.
+
+    :raises UnhandledTypeError: If a child node doesn't implement a handler
+        for the value type.
+    """
+    return compile_children(children, parent).run(value, click_context)
+
+
+async def process_children_async(
+    value: Any,
+    children: Mapping[Any, Any],
+    parent: "ParentNode | Tag",
+    click_context: click.Context | None = None,
+) -> Any:
+    """
+    Async version of process_children for async handler support.
 
     :param value: The initial value to process.
     :param children: Mapping of child nodes to process the value through.
     :param parent: The parent node that owns these children.
-    :param tags: Dictionary mapping tag names to Tag instances.
     :param click_context: The Click context for scope tracking and error
         reporting.
     :returns: The processed value after passing through all children.
     :raises UnhandledTypeError: If a child node doesn't implement a handler
         for the value type.
-    :raises ProcessError: If validation or transformation fails in a child node.
     """
-    child_nodes = [cast("ChildNode", child) for child in children.values()]
-
-    if tags is None:
-        tags = {}
-
-    is_container_tuple = False
-    if isinstance(value, tuple) and parent.__class__.__name__ in (
-        "Option",
-        "Argument",
-    ):
-        parent_cast: click.Option | click.Argument
-        if parent.__class__.__name__ == "Option":
-            parent_cast = cast(click.Option, parent)
-            is_container_tuple = parent_cast.multiple or parent_cast.nargs != 1
-        else:
-            parent_cast = cast(click.Argument, parent)
-            is_container_tuple = parent_cast.nargs != 1
-
-    for child in child_nodes:
-        if click_context is not None:
-            Tree.update_scope(
-                click_context,
-                "child",
-                parent_node=(
-                    cast("ParentNode", parent)
-                    if parent.__class__.__name__ != "Tag"
-                    else None
-                ),
-                child_node=child,
+    return await compile_children(children, parent).run_async(value, click_context)
+
+
+async def run_chains(
+    chains: list[tuple["ParentNode", Any]],
+    click_context: click.Context,
+    limit: int | None = None,
+) -> "dict[ParentNode, Any]":
+    """
+    Process the children of several parents concurrently.
+
+    Every chain runs as its own task with its own scope, so the nodes and
+    values recorded for error reporting are not overwritten by other chains.
+    If several chains fail, the error of the first chain in the list is
+    raised and its scope is copied to the metadata of the invocation.
+
+    :param chains: List of ``(parent, raw_value)`` pairs, in tree order.
+    :param click_context: The Click context for scope tracking and error
+        reporting.
+    :param limit: The maximum number of chains processed at once. If
+        ``None``, all chains run at once. If ``1``, chains run one after
+        another in the current task.
+
+    :returns: Dictionary mapping every parent to its processed value.
+    :rtype: dict[ParentNode, Any]
+    """
+    results: "dict[ParentNode, Any]" = {}
+
+    if len(chains) <= 1 or limit == 1:
+        for parent, value in chains:
+            Tree.update_scope(click_context, "parent", parent_node=parent)
+            results[parent] = await compile_children(parent.children, parent).run_async(
+                value, click_context
             )
+        return results
+
+    semaphore = asyncio.Semaphore(limit) if limit is not None else None
+
+    async def run(parent: "ParentNode", value: Any) -> tuple[bool, Any, dict[str, Any]]:
+        scope = enter_task_scope()
+        try:
+            if semaphore is None:
+                return True, await run_chain(parent, value), scope
+            async with semaphore:
+                return True, await run_chain(parent, value), scope
+        except Exception as e:
+            return False, e, scope
+
+    async def run_chain(parent: "ParentNode", value: Any) -> Any:
+        Tree.update_scope(click_context, "parent", parent_node=parent)
+        return await compile_children(parent.children, parent).run_async(
+            value, click_context
+        )
+
+    outcomes = await asyncio.gather(*(run(parent, value) for parent, value in chains))
 
+    for (parent, _), (ok, result, scope) in zip(chains, outcomes):
+        if not ok:
             if "click_extended" in click_context.meta:
-                click_context.meta["click_extended"]["handler_value"] = value
-                click_context.meta["click_extended"][
-                    "is_container_tuple"
-                ] = is_container_tuple
+                click_context.meta["click_extended"].update(scope)
+            raise result
+        results[parent] = result
 
-        root_node: "RootNode | None" = None
-        all_nodes: dict[str, Any] = {}
-        all_parents: dict[str, Any] = {}
-        all_tags: dict[str, Any] = {}
-        all_children: dict[str, Any] = {}
-        all_globals: dict[str, Any] = {}
-        meta: dict[str, Any] = {}
+    return results
 
-        if click_context is not None and "click_extended" in click_context.meta:
-            meta = click_context.meta["click_extended"]
-            root_node = meta.get("root_node")
 
-            if "parents" in meta:
-                all_parents = meta["parents"]
-                all_nodes.update(all_parents)
+def is_offloaded_load(parent: "ParentNode", offload: bool) -> bool:
+    """
+    Check if the ``load`` method of a parent runs in a worker thread.
 
-            if "tags" in meta:
-                all_tags = meta["tags"]
-                all_nodes.update(all_tags)
+    Only sync loads of parents that source their own value, such as
+    ``@env`` or custom parent nodes, are offloaded. Options and arguments
+    only convert the value parsed by Click.
 
-            if "children" in meta:
-                all_children = meta["children"]
-                all_nodes.update(all_children)
+    :param parent: The parent node to check.
+    :param offload: Whether the command offloads blocking calls.
 
-            if "globals" in meta:
-                all_globals = meta["globals"]
-                all_nodes.update(all_globals)
+    :returns: ``True`` if the load runs in a worker thread, ``False``
+        otherwise.
+    :rtype: bool
+    """
+    from click_extended.core.nodes.argument_node import ArgumentNode
+    from click_extended.core.nodes.option_node import OptionNode
 
-            if root_node:
-                all_nodes[root_node.name] = root_node
+    return (
+        offload
+        and not isinstance(parent, (OptionNode, ArgumentNode))
+        and not inspect.iscoroutinefunction(parent.load)
+    )
 
-        context = Context(
-            root=cast("RootNode", root_node),
-            parent=parent,
-            current=child,
-            click_context=cast(click.Context, click_context),
-            nodes=all_nodes,
-            parents=all_parents,
-            tags=all_tags,
-            children=all_children,
-            data=meta.get("data", {}),
-            debug=meta.get("debug", False),
-        )
 
-        if isinstance(child, type(ContextAwareError)):
-            raise child
+def is_independent_load(parent: "ParentNode", offload: bool = False) -> bool:
+    """
+    Check if the ``load`` method of a parent can run concurrently.
 
-        value = await dispatch_to_child_async(child, value, context)
+    A load is independent if the parent declares ``independent = True``
+    and its load is a coroutine function, or is offloaded to a worker
+    thread. Loads of parents that do not declare it may read other nodes
+    through the context and always run on their own.
 
-    return value  # type: ignore
+    :param parent: The parent node to check.
+    :param offload: Whether the command offloads blocking calls.
+
+    :returns: ``True`` if the load can run concurrently with other
+        independent loads, ``False`` otherwise.
+    :rtype: bool
+    """
+    return parent.independent and (
+        inspect.iscoroutinefunction(parent.load) or is_offloaded_load(parent, offload)
+    )
 
 
-def check_has_async_handlers(children: Mapping[Any, Any]) -> bool:
+def plan_loads(
+    parents: Mapping[Any, Any], concurrent: bool = True, offload: bool = False
+) -> list[list[tuple[str, "ParentNode"]]]:
     """
-    Check if any child in the collection has async handlers.
+    Group parents into batches whose loads can run concurrently.
 
-    :param children: Mapping of child nodes to check.
+    Consecutive parents with independent loads share a batch. Any other
+    parent is placed in a batch of its own, so it runs after every parent
+    before it has loaded. Batches and the parents in them are in tree order.
 
-    :returns: ``True`` if any child has async handlers, ``False`` otherwise.
-    :rtype: bool
+    :param parents: Mapping of parent names to parent nodes, in tree order.
+    :param concurrent: Whether independent loads may share a batch. If
+        ``False``, every parent is placed in a batch of its own.
+    :param offload: Whether the command offloads blocking calls, making
+        sync loads of self-sourcing parents independent as well.
+
+    :returns: List of batches of ``(name, parent)`` pairs.
+    :rtype: list[list[tuple[str, ParentNode]]]
     """
-    child_nodes = [cast("ChildNode", child) for child in children.values()]
-    return any(has_async_handlers(child) for child in child_nodes)
+    batches: list[list[tuple[str, "ParentNode"]]] = []
+    pending: list[tuple[str, "ParentNode"]] = []
+
+    for name, parent in parents.items():
+        if not isinstance(name, str):
+            continue
+
+        parent = cast("ParentNode", parent)
+        if concurrent and is_independent_load(parent, offload):
+            pending.append((name, parent))
+            continue
+
+        if pending:
+            batches.append(pending)
+            pending = []
+        batches.append([(name, parent)])
+
+    if pending:
+        batches.append(pending)
+
+    return batches
@@ -0,0 +1,231 @@
+"""Opt-in instrumentation for the processing phases of a command."""
+
+# pylint: disable=too-few-public-methods
+
+import json
+import os
+from contextlib import AbstractContextManager, nullcontext
+from time import perf_counter_ns
+from types import TracebackType
+from typing import Any, Literal
+
+ProfileKind = Literal["children", "loads", "validations"]
+
+PROFILE_ENV_VAR = "CLICK_EXTENDED_PROFILE"
+
+_TRUTHY = ("1", "true", "yes")
+_FALSY = ("", "0", "false", "no")
+_DISABLED: AbstractContextManager[None] = nullcontext()
+
+
+class _Stat:
+    """Timings and sizes recorded for a single node."""
+
+    __slots__ = ("samples", "items", "bytes")
+
+    def __init__(self) -> None:
+        self.samples: list[int] = []
+        self.items = 0
+        self.bytes = 0
+
+
+class _Measure:
+    """Context manager that records the time spent in its block."""
+
+    __slots__ = ("profiler", "kind", "name", "start")
+
+    def __init__(self, profiler: "Profiler", kind: ProfileKind, name: str):
+        self.profiler = profiler
+        self.kind = kind
+        self.name = name
+        self.start = 0
+
+    def __enter__(self) -> None:
+        self.start = perf_counter_ns()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.profiler.record(self.kind, self.name, perf_counter_ns() - self.start)
+
+
+def _percentile(samples: list[int], percent: int) -> int:
+    """
+    Get a percentile of the samples using the nearest-rank method.
+
+    :param samples: The sorted samples.
+    :param percent: The percentile between 1 and 100.
+
+    :returns: The sample at the percentile.
+    :rtype: int
+    """
+    rank = -(-percent * len(samples) // 100)
+    return samples[max(rank, 1) - 1]
+
+
+def _byte_size(value: Any) -> int:
+    """
+    Get the size in bytes of a string or bytes-like value.
+
+    :param value: The value to measure.
+
+    :returns: The UTF-8 length of strings, the length of bytes-like values
+        and ``0`` for anything else.
+    :rtype: int
+    """
+    if isinstance(value, str):
+        return len(value.encode("utf-8", "surrogatepass"))
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    return 0
+
+
+class Profiler:
+    """
+    Timings recorded during a single invocation of a command.
+
+    Child handlers, parent loads and ``ValidationNode.on_finalize`` calls are
+    timed with ``time.perf_counter_ns``. Nodes are keyed by name, with child
+    nodes prefixed by the name of their parent, so nodes sharing a key are
+    aggregated.
+    """
+
+    __slots__ = ("_stats",)
+
+    def __init__(self) -> None:
+        """Initialize an empty profiler."""
+        self._stats: dict[ProfileKind, dict[str, _Stat]] = {
+            "children": {},
+            "loads": {},
+            "validations": {},
+        }
+
+    def record(
+        self,
+        kind: ProfileKind,
+        name: str,
+        elapsed_ns: int,
+        value: Any = None,
+    ) -> None:
+        """
+        Record a single timed call.
+
+        :param kind: The kind of call.
+        :param name: The key of the node that was called.
+        :param elapsed_ns: The time spent in the call in nanoseconds.
+        :param value: The container tuple the call processed, if any. Its
+            length is counted as items and the size of its string and
+            bytes values as bytes.
+        """
+        stat = self._stats[kind].get(name)
+        if stat is None:
+            stat = self._stats[kind][name] = _Stat()
+
+        stat.samples.append(elapsed_ns)
+        if isinstance(value, tuple):
+            stat.items += len(value)
+            stat.bytes += sum(_byte_size(item) for item in value)
+
+    def measure(self, kind: ProfileKind, name: str) -> AbstractContextManager[None]:
+        """
+        Time the block of a ``with`` statement.
+
+        :param kind: The kind of call.
+        :param name: The key of the node that is called.
+
+        :returns: A context manager recording the time spent in its block.
+        :rtype: AbstractContextManager[None]
+        """
+        return _Measure(self, kind, name)
+
+    def summary(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        Summarize the recorded calls.
+
+        :returns: Dictionary mapping the kind of call to the statistics of
+            every node, with ``count``, ``total_ms``, ``p50_ms``, ``p99_ms``,
+            ``items`` and ``bytes``.
+        :rtype: dict[str, dict[str, dict[str, Any]]]
+        """
+        result: dict[str, dict[str, dict[str, Any]]] = {}
+
+        for kind, stats in self._stats.items():
+            result[kind] = {}
+            for name, stat in stats.items():
+                samples = sorted(stat.samples)
+                result[kind][name] = {
+                    "count": len(samples),
+                    "total_ms": sum(samples) / 1e6,
+                    "p50_ms": _percentile(samples, 50) / 1e6,
+                    "p99_ms": _percentile(samples, 99) / 1e6,
+                    "items": stat.items,
+                    "bytes": stat.bytes,
+                }
+
+        return result
+
+    def to_json(self, indent: int | None = 2) -> str:
+        """
+        Serialize the summary as JSON.
+
+        :param indent: The indentation passed to ``json.dumps``.
+
+        :returns: The summary as a JSON string.
+        :rtype: str
+        """
+        return json.dumps(self.summary(), indent=indent)
+
+    def dump(self, path: str) -> None:
+        """
+        Write the summary as JSON to a file.
+
+        :param path: The path of the file to write.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.to_json())
+            file.write("\n")
+
+
+def measure(
+    profiler: Profiler | None, kind: ProfileKind, name: str
+) -> AbstractContextManager[None]:
+    """
+    Time the block of a ``with`` statement if profiling is enabled.
+
+    :param profiler: The profiler of the invocation, or ``None``.
+    :param kind: The kind of call.
+    :param name: The key of the node that is called.
+
+    :returns: A context manager recording the time spent in its block, or
+        a no-op context manager if ``profiler`` is ``None``.
+    :rtype: AbstractContextManager[None]
+    """
+    if profiler is None:
+        return _DISABLED
+    return profiler.measure(kind, name)
+
+
+def get_profile_setting() -> tuple[bool, str | None]:
+    """
+    Read the profiling setting from the environment.
+
+    ``CLICK_EXTENDED_PROFILE`` enables profiling when set to ``1``, ``true``
+    or ``yes``. Any other non-empty value other than ``0``, ``false`` or
+    ``no`` enables profiling and is used as the path of the JSON file the
+    summary is written to when the command exits.
+
+    :returns: Whether profiling is enabled and the path to write to, if any.
+    :rtype: tuple[bool, str | None]
+    """
+    value = os.getenv(PROFILE_ENV_VAR, "")
+    if value.lower() in _FALSY:
+        return False, None
+    if value.lower() in _TRUTHY:
+        return True, None
+    return True, value
+
+
+__all__ = ["PROFILE_ENV_VAR", "Profiler", "get_profile_setting", "measure"]
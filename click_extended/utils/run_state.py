@@ -0,0 +1,70 @@
+"""Per-invocation state of a command."""
+
+# pylint: disable=too-few-public-methods
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    from click_extended.core.nodes.parent_node import ParentNode
+    from click_extended.core.other._parent_index import ParentIndex
+
+
+class RunState:
+    """
+    Values of the parent nodes during a single invocation of a command.
+
+    Nodes are shared by every invocation of a command, so the values that
+    change per invocation are stored here instead of on the nodes. The state
+    of the running invocation is found through a ``ContextVar``, so
+    invocations in different threads, and the tasks and worker threads of an
+    invocation, each see their own state.
+    """
+
+    __slots__ = ("provided", "raw_values", "values", "masks")
+
+    def __init__(self) -> None:
+        """Initialize an empty state."""
+        self.provided: dict["ParentNode", bool] = {}
+        self.raw_values: dict["ParentNode", Any] = {}
+        self.values: dict["ParentNode", Any] = {}
+        self.masks: dict["ParentIndex", int] = {}
+
+
+_RUN_STATE: ContextVar[RunState | None] = ContextVar(
+    "click_extended_run_state", default=None
+)
+
+
+def get_run_state() -> RunState | None:
+    """
+    Get the state of the running invocation.
+
+    :returns:
+        The state, or ``None`` outside of an invocation.
+    :rtype: RunState | None
+    """
+    return _RUN_STATE.get()
+
+
+@contextmanager
+def use_run_state(state: RunState) -> Iterator[RunState]:
+    """
+    Make a state the state of the running invocation in a ``with`` block.
+
+    :param state:
+        The state of the invocation.
+
+    :returns:
+        A context manager yielding the state.
+    :rtype: Iterator[RunState]
+    """
+    token = _RUN_STATE.set(state)
+    try:
+        yield state
+    finally:
+        _RUN_STATE.reset(token)
+
+
+__all__ = ["RunState", "get_run_state", "use_run_state"]
@@ -0,0 +1,75 @@
+"""Task-local tracking of the nodes being processed."""
+
+from contextvars import ContextVar
+from typing import Any
+
+SCOPE_KEYS = (
+    "current_scope",
+    "parent_node",
+    "child_node",
+    "handler_method",
+    "handler_value",
+    "is_container_tuple",
+)
+
+_TASK_SCOPE: ContextVar[dict[str, Any] | None] = ContextVar(
+    "click_extended_scope", default=None
+)
+
+
+def enter_task_scope() -> dict[str, Any]:
+    """
+    Track the scope of the current task separately from other tasks.
+
+    Must be called from inside the task, such as at the start of a coroutine
+    passed to ``asyncio.gather``, since every task runs in a copy of the
+    context it was created in. Until the task finishes, scope writes go to
+    the returned dictionary instead of ``click_context.meta``, and reads fall
+    back to the metadata for keys the task has not written.
+
+    :returns:
+        The dictionary holding the scope of the task.
+    :rtype: dict[str, Any]
+    """
+    scope: dict[str, Any] = {}
+    _TASK_SCOPE.set(scope)
+    return scope
+
+
+def scope_target(meta: dict[str, Any]) -> dict[str, Any]:
+    """
+    Get the dictionary the scope of the current task is written to.
+
+    :param meta:
+        The ``click-extended`` metadata of the invocation.
+
+    :returns:
+        The task scope if one was entered, otherwise ``meta``.
+    :rtype: dict[str, Any]
+    """
+    scope = _TASK_SCOPE.get()
+    return meta if scope is None else scope
+
+
+def get_scope_value(meta: dict[str, Any], key: str, default: Any = None) -> Any:
+    """
+    Read a scope value of the current task.
+
+    :param meta:
+        The ``click-extended`` metadata of the invocation.
+    :param key:
+        The scope key to read, one of ``SCOPE_KEYS``.
+    :param default:
+        The value returned if the key is not set.
+
+    :returns:
+        The value from the task scope, falling back to ``meta``.
+    :rtype: Any
+    """
+    scope = _TASK_SCOPE.get()
+    if scope is not None and key in scope:
+        return scope[key]
+    return meta.get(key, default)
+
+
+__all__ = ["SCOPE_KEYS", "enter_task_scope", "get_scope_value", "scope_target"]
@@ -0,0 +1,164 @@
+"""Chrome trace-event output for the lifecycle phases of a command."""
+
+import json
+import os
+import threading
+from contextlib import AbstractContextManager, nullcontext
+from time import perf_counter_ns
+from types import TracebackType
+from typing import Any
+
+TRACE_ENV_VAR = "CLICK_EXTENDED_TRACE"
+
+_DISABLED: AbstractContextManager[None] = nullcontext()
+
+
+class _Span:
+    """Context manager that records its block as a complete trace event."""
+
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        category: str,
+        args: dict[str, Any] | None,
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def __enter__(self) -> None:
+        self.start = perf_counter_ns()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        args = self.args
+        if exc_type is not None:
+            args = {**(args or {}), "error": exc_type.__name__}
+        self.tracer.add(self.name, self.category, self.start, perf_counter_ns(), args)
+
+
+class Tracer:
+    """
+    Trace events recorded during a single invocation of a command.
+
+    Events are complete (``"ph": "X"``) events in the Chrome trace-event
+    format with timestamps in microseconds relative to the creation of the
+    tracer, so the output can be opened in Perfetto or ``chrome://tracing``.
+    """
+
+    __slots__ = ("events", "_origin", "_pid")
+
+    def __init__(self) -> None:
+        """Initialize an empty tracer."""
+        self.events: list[dict[str, Any]] = []
+        self._origin = perf_counter_ns()
+        self._pid = os.getpid()
+
+    def add(
+        self,
+        name: str,
+        category: str,
+        start_ns: int,
+        end_ns: int,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Add a complete event.
+
+        :param name: The name of the event.
+        :param category: The category of the event, such as ``phase``,
+            ``parent`` or ``child``.
+        :param start_ns: The ``perf_counter_ns`` reading at the start.
+        :param end_ns: The ``perf_counter_ns`` reading at the end.
+        :param args: Additional data shown with the event.
+        """
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start_ns - self._origin) / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def span(
+        self, name: str, category: str, args: dict[str, Any] | None = None
+    ) -> AbstractContextManager[None]:
+        """
+        Record the block of a ``with`` statement as an event.
+
+        :param name: The name of the event.
+        :param category: The category of the event.
+        :param args: Additional data shown with the event.
+
+        :returns: A context manager recording its block.
+        :rtype: AbstractContextManager[None]
+        """
+        return _Span(self, name, category, args)
+
+    def to_json(self) -> str:
+        """
+        Serialize the events in the Chrome trace-event format.
+
+        :returns: The trace as a JSON string.
+        :rtype: str
+        """
+        return json.dumps({"traceEvents": self.events, "displayTimeUnit": "ms"})
+
+    def dump(self, path: str) -> None:
+        """
+        Write the trace to a file.
+
+        :param path: The path of the file to write.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.to_json())
+
+
+def span(
+    tracer: Tracer | None,
+    name: str,
+    category: str,
+    args: dict[str, Any] | None = None,
+) -> AbstractContextManager[None]:
+    """
+    Record the block of a ``with`` statement if tracing is enabled.
+
+    :param tracer: The tracer of the invocation, or ``None``.
+    :param name: The name of the event.
+    :param category: The category of the event.
+    :param args: Additional data shown with the event.
+
+    :returns: A context manager recording its block, or a no-op context
+        manager if ``tracer`` is ``None``.
+    :rtype: AbstractContextManager[None]
+    """
+    if tracer is None:
+        return _DISABLED
+    return tracer.span(name, category, args)
+
+
+def get_trace_path() -> str | None:
+    """
+    Read the path to write traces to from ``CLICK_EXTENDED_TRACE``.
+
+    :returns: The path, or ``None`` if tracing is disabled.
+    :rtype: str | None
+    """
+    return os.getenv(TRACE_ENV_VAR) or None
+
+
+__all__ = ["TRACE_ENV_VAR", "Tracer", "get_trace_path", "span"]
@@ -0,0 +1,159 @@
+"""Tests for the handle_batch implementations of the built-in decorators."""
+
+import re
+from typing import Any
+from unittest.mock import Mock
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from click_extended.core.decorators.command import command
+from click_extended.core.decorators.option import option
+from click_extended.core.nodes.child_node import ChildNode
+from click_extended.core.other.context import Context
+from click_extended.decorators.check.ends_with import EndsWith
+from click_extended.decorators.check.regex import Regex, regex
+from click_extended.decorators.check.starts_with import StartsWith
+from click_extended.decorators.convert.convert_angle import ConvertAngle
+from click_extended.decorators.convert.convert_area import ConvertArea
+from click_extended.decorators.convert.convert_bits import ConvertBits
+from click_extended.decorators.convert.convert_distance import (
+    ConvertDistance,
+    convert_distance,
+)
+from click_extended.decorators.convert.convert_energy import ConvertEnergy
+from click_extended.decorators.convert.convert_pressure import ConvertPressure
+from click_extended.decorators.convert.convert_speed import ConvertSpeed
+from click_extended.decorators.convert.convert_volume import ConvertVolume
+from click_extended.decorators.math.absolute import Absolute
+from click_extended.decorators.math.add import Add
+from click_extended.decorators.math.ceil import Ceil
+from click_extended.decorators.math.divide import Divide
+from click_extended.decorators.math.floor import Floor
+from click_extended.decorators.math.maximum import Maximum
+from click_extended.decorators.math.minimum import Minimum
+from click_extended.decorators.math.modulo import Modulo
+from click_extended.decorators.math.normalize import Normalize
+from click_extended.decorators.math.power import Power
+from click_extended.decorators.math.rounded import Rounded
+from click_extended.decorators.math.sqrt import Sqrt
+from click_extended.decorators.math.subtract import Subtract
+from click_extended.errors import BatchItemError
+from click_extended.utils.dispatch import _get_dispatch_table  # type: ignore
+
+NUMBERS = (1, 2.5, 7, 10.0)
+UNITS = {"from_unit": "m", "to_unit": "km"}
+
+CASES: list[
+    tuple[type[ChildNode], tuple[Any, ...], dict[str, Any], tuple[Any, ...]]
+] = [
+    (EndsWith, (), {"text": ("x", "*z", re.compile("q$"))}, ("ax", "bz", "cq")),
+    (StartsWith, (), {"text": ("x", "z*", re.compile("^q"))}, ("xa", "zb", "qc")),
+    (Regex, (), {"patterns": (r"\d+", re.compile("[a-z]+")), "flags": 0}, ("1", "a")),
+    (Absolute, (), {}, (-1, 2.5, -7)),
+    (Add, (), {"n": 2}, (1, 2.5, "a")),
+    (Ceil, (), {}, NUMBERS),
+    (Divide, (), {"n": 4}, NUMBERS),
+    (Floor, (), {}, NUMBERS),
+    (Maximum, (), {"max_val": 5}, NUMBERS),
+    (Minimum, (), {"min_val": 5}, NUMBERS),
+    (Modulo, (), {"n": 3}, NUMBERS),
+    (Normalize, (), {"min_val": 0, "max_val": 10}, NUMBERS),
+    (
+        Normalize,
+        (),
+        {"min_val": 0, "max_val": 10, "new_min": -1, "new_max": 1},
+        NUMBERS,
+    ),
+    (Power, (), {"n": 2}, NUMBERS),
+    (Rounded, (), {"digits": 1}, (1.25, 2.55, 3)),
+    (Sqrt, (), {}, (4, -4, 2.25)),
+    (Subtract, (), {"n": 1}, NUMBERS),
+    (ConvertAngle, (), {"from_unit": "deg", "to_unit": "rad"}, NUMBERS),
+    (ConvertArea, (), {"from_unit": "m2", "to_unit": "cm2"}, NUMBERS),
+    (ConvertBits, (), {"from_unit": "kB", "to_unit": "B"}, NUMBERS),
+    (ConvertDistance, (), UNITS, NUMBERS),
+    (ConvertEnergy, (), {"from_unit": "kJ", "to_unit": "J"}, NUMBERS),
+    (ConvertPressure, (), {"from_unit": "kPa", "to_unit": "Pa"}, NUMBERS),
+    (ConvertSpeed, (), {"from_unit": "kmh", "to_unit": "mps"}, NUMBERS),
+    (ConvertVolume, (), {"from_unit": "m3", "to_unit": "cm3"}, NUMBERS),
+]
+
+
+@pytest.mark.parametrize(
+    ("cls", "args", "kwargs", "values"),
+    CASES,
+    ids=[case[0].__name__ for case in CASES],
+)
+def test_batch_matches_element_handlers(
+    cls: type[ChildNode],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    values: tuple[Any, ...],
+) -> None:
+    """Test that handle_batch returns what the element handlers return."""
+    node = cls(name="test", process_args=args, process_kwargs=kwargs)
+    ctx = Mock(spec=Context)
+    table = _get_dispatch_table(node)
+
+    expected = tuple(
+        getattr(node, str(table.handler_for(type(value))))(value, ctx, *args, **kwargs)
+        for value in values
+    )
+
+    assert node.handle_batch(values, ctx, *args, **kwargs) == expected
+
+
+@pytest.mark.parametrize(
+    ("cls", "kwargs", "values"),
+    [
+        (Regex, {"patterns": (r"\d+",), "flags": 0}, ("1", "a", "b")),
+        (StartsWith, {"text": ("x",)}, ("xa", "ya", "yb")),
+        (EndsWith, {"text": ("x",)}, ("ax", "ay", "by")),
+    ],
+    ids=["Regex", "StartsWith", "EndsWith"],
+)
+def test_batch_error_has_index(
+    cls: type[ChildNode], kwargs: dict[str, Any], values: tuple[Any, ...]
+) -> None:
+    """Test that batches set the index of the first failing value."""
+    node = cls(name="test", process_kwargs=kwargs)
+
+    with pytest.raises(BatchItemError) as exc_info:
+        node.handle_batch(values, Mock(spec=Context), **kwargs)
+
+    assert exc_info.value.index == 1
+    assert isinstance(exc_info.value.error, ValueError)
+
+
+def test_batch_reports_failing_index(cli_runner: CliRunner) -> None:
+    """Test that errors from a batch report the failing index."""
+
+    @command()
+    @option("values", multiple=True)
+    @regex(r"\d+")
+    def cmd(values: tuple[str, ...]) -> None:
+        click.echo(values)
+
+    result = cli_runner.invoke(cmd, ["--values", "1", "--values", "2"])
+    assert result.exit_code == 0
+    assert "('1', '2')" in result.output
+
+    result = cli_runner.invoke(cmd, ["--values", "1", "--values", "x"])
+    assert result.exit_code == 1
+    assert "at index [1]" in result.output
+
+
+def test_batch_with_nargs_and_multiple(cli_runner: CliRunner) -> None:
+    """Test that nested container tuples are batched per inner tuple."""
+
+    @command()
+    @option("values", type=float, nargs=2, multiple=True)
+    @convert_distance(from_unit="km", to_unit="m")
+    def cmd(values: tuple[tuple[float, float], ...]) -> None:
+        click.echo(values)
+
+    result = cli_runner.invoke(cmd, ["--values", "1", "2", "--values", "3", "4"])
+    assert result.exit_code == 0
+    assert "((1000.0, 2000.0), (3000.0, 4000.0))" in result.output
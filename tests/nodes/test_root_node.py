@@ -15,10 +15,16 @@ from click_extended.core.decorators.group import Group, group
 from click_extended.core.decorators.option import option
 from click_extended.core.decorators.tag import tag
 from click_extended.core.nodes.child_node import ChildNode
+from click_extended.core.nodes.parent_node import ParentNode
+from click_extended.core.nodes.validation_node import ValidationNode
 from click_extended.core.other._click_command import ClickCommand
 from click_extended.core.other._click_group import ClickGroup
 from click_extended.core.other.context import Context
+from click_extended.core.other.settings import Settings
+from click_extended.decorators.misc.catch import catch
+from click_extended.decorators.misc.observe import observe
 from click_extended.errors import ContextAwareError, NameExistsError
+from click_extended.hooks.on_init import on_init
 
 
 class TestRootNodeInit:
@@ -61,6 +67,15 @@ class TestRootNodeInit:
         assert cmd.extra_kwargs["help"] == "Test command"
         assert "context_settings" in cmd.extra_kwargs
 
+    def test_command_settings_default(self) -> None:
+        """Test that settings default to Settings() and are not stored."""
+        cmd = Command(name="test")
+        relaxed = Command(name="test", settings=Settings(strict_types=False))
+
+        assert cmd.settings == Settings()
+        assert relaxed.settings.strict_types is False
+        assert "settings" not in relaxed.extra_kwargs
+
     def test_group_initialization_basic(self) -> None:
         """Test basic Group initialization."""
         grp = Group(name="test_group")
@@ -655,6 +670,32 @@ class TestRootNodeChildrenProcessing:
         assert result.exit_code == 1
         assert "Value must be positive" in result.output
 
+    def test_strict_types_disabled_skips_type_check(self, cli_runner: Any) -> None:
+        """Test that strict_types=False skips handler type checks."""
+
+        class Mismatched(ChildNode):
+            def handle_str(
+                self, value: int, context: Context, *args: Any, **kwargs: Any
+            ) -> str:
+                return f"<{value}>"
+
+        def make_cmd(strict_types: bool) -> click.Command:
+            @command(settings=Settings(strict_types=strict_types))
+            @option("name")
+            @Mismatched.as_decorator()
+            def show(name: str) -> None:
+                click.echo(name)
+
+            return show
+
+        strict_result = cli_runner.invoke(make_cmd(True), ["--name", "x"])
+        assert strict_result.exit_code == 1
+        assert "Type mismatch" in strict_result.output
+
+        relaxed_result = cli_runner.invoke(make_cmd(False), ["--name", "x"])
+        assert relaxed_result.exit_code == 0
+        assert "<x>" in relaxed_result.output
+
     def test_children_receive_transformed_values(self, cli_runner: Any) -> None:
         """Test that children receive output from previous children."""
 
@@ -2135,3 +2176,371 @@ class TestClickDecoratorMethods:
 
         decorator = Group._get_click_decorator()  # type: ignore
         assert callable(decorator)
+
+
+class SlowParent(ParentNode):
+    """Parent node whose async load tracks how many loads run at once."""
+
+    independent = True
+    active = 0
+    peak = 0
+
+    async def load(self, context: Context, *args: Any, **kwargs: Any) -> Any:
+        SlowParent.active += 1
+        SlowParent.peak = max(SlowParent.peak, SlowParent.active)
+        await asyncio.sleep(kwargs.get("delay", 0.01))
+        SlowParent.active -= 1
+        if kwargs.get("fail"):
+            raise ValueError(f"failed to load {self.name}")
+        return self.name
+
+
+class CopyParent(ParentNode):
+    """Parent node whose async load reads another parent."""
+
+    async def load(self, context: Context, *args: Any, **kwargs: Any) -> Any:
+        source = context.get_parent(kwargs["source"])
+        return f"copy of {source.raw_value}" if source is not None else None
+
+
+class TestConcurrentLoads:
+    """Test async parent loads run concurrently."""
+
+    def setup_method(self) -> None:
+        """Reset the load counters."""
+        SlowParent.active = 0
+        SlowParent.peak = 0
+
+    def test_independent_loads_overlap(self, cli_runner: CliRunner) -> None:
+        """Test independent loads run at the same time in tree order."""
+
+        @command()
+        @SlowParent.as_decorator(name="first", delay=0.03)
+        @SlowParent.as_decorator(name="second", delay=0.01)
+        @SlowParent.as_decorator(name="third", delay=0.02)
+        def cmd(**kwargs: Any) -> None:
+            click.echo(" ".join(kwargs))
+            click.echo(" ".join(kwargs.values()))
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code == 0, result.output
+        assert result.output.splitlines() == [
+            "first second third",
+            "first second third",
+        ]
+        assert SlowParent.peak == 3
+
+    def test_escape_hatch(self, cli_runner: CliRunner) -> None:
+        """Test concurrent_loads=False loads one parent at a time."""
+
+        @command(settings=Settings(concurrent_loads=False))
+        @SlowParent.as_decorator(name="first")
+        @SlowParent.as_decorator(name="second")
+        def cmd(first: str, second: str) -> None:
+            click.echo(f"{first} {second}")
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code == 0, result.output
+        assert result.output.strip() == "first second"
+        assert SlowParent.peak == 1
+
+    def test_undeclared_loads_wait(self, cli_runner: CliRunner) -> None:
+        """Test loads of parents not declared independent run one at a time."""
+
+        class UndeclaredParent(SlowParent):
+            """Parent node that does not declare its load independent."""
+
+            independent = False
+
+        @command()
+        @UndeclaredParent.as_decorator(name="first")
+        @UndeclaredParent.as_decorator(name="second")
+        def cmd(first: str, second: str) -> None:
+            click.echo(f"{first} {second}")
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code == 0, result.output
+        assert result.output.strip() == "first second"
+        assert SlowParent.peak == 1
+
+    def test_dependent_load_waits(self, cli_runner: CliRunner) -> None:
+        """Test a load reading another parent runs after earlier loads."""
+
+        @command()
+        @SlowParent.as_decorator(name="source")
+        @CopyParent.as_decorator(name="copy", source="source")
+        def cmd(source: str, copy: str) -> None:
+            click.echo(copy)
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code == 0, result.output
+        assert result.output.strip() == "copy of source"
+
+    def test_error_precedence(self, cli_runner: CliRunner) -> None:
+        """Test the first failing parent in tree order is reported."""
+
+        @command()
+        @SlowParent.as_decorator(name="first", delay=0.03, fail=True)
+        @SlowParent.as_decorator(name="second", delay=0.0, fail=True)
+        def cmd(first: str, second: str) -> None:
+            click.echo("unreachable")
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code != 0
+        assert "failed to load first" in result.output + str(result.exception)
+        assert "failed to load second" not in result.output
+
+    def test_error_names_parent(self, cli_runner: CliRunner) -> None:
+        """Test errors of concurrent loads are reported with the parent."""
+
+        @command()
+        @SlowParent.as_decorator(name="first", fail=True)
+        @SlowParent.as_decorator(name="second")
+        def cmd(first: str, second: str) -> None:
+            click.echo("unreachable")
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code != 0
+        assert SlowParent.peak == 2
+        assert "ValueError (first): failed to load first" in result.output
+
+    def test_async_load_without_async_children(self, cli_runner: CliRunner) -> None:
+        """Test async loads are awaited when no child is async."""
+
+        @command()
+        @SlowParent.as_decorator(name="value")
+        @option("name", default="x")
+        def cmd(value: str, name: str) -> None:
+            click.echo(f"{value} {name}")
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code == 0, result.output
+        assert result.output.strip() == "value x"
+
+
+class TestEventLoop:
+    """Test every phase of an invocation shares one event loop."""
+
+    def test_single_loop(self, cli_runner: CliRunner) -> None:
+        """Test hooks, loads, children, validations and the command."""
+        loops: dict[str, asyncio.AbstractEventLoop] = {}
+
+        class LoopParent(ParentNode):
+            async def load(self, context: Context, *args: Any, **kwargs: Any) -> Any:
+                loops["load"] = asyncio.get_running_loop()
+                return "x"
+
+        class LoopChild(ChildNode):
+            async def handle_all(self, value: Any, context: Context) -> Any:
+                loops["child"] = asyncio.get_running_loop()
+                return value
+
+        class LoopValidation(ValidationNode):
+            async def on_finalize(
+                self, context: Context, *args: Any, **kwargs: Any
+            ) -> None:
+                loops["validation"] = asyncio.get_running_loop()
+
+        async def init_hook() -> None:
+            loops["hook"] = asyncio.get_running_loop()
+
+        async def seen(value: Any) -> None:
+            loops["observe"] = asyncio.get_running_loop()
+
+        @command()
+        @on_init(init_hook)
+        @LoopParent.as_decorator(name="value")
+        @LoopChild.as_decorator()
+        @observe(seen)
+        @LoopValidation.as_decorator()
+        async def cmd(value: str) -> None:
+            loops["command"] = asyncio.get_running_loop()
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code == 0, result.output
+        assert set(loops) == {
+            "hook",
+            "load",
+            "child",
+            "observe",
+            "validation",
+            "command",
+        }
+        assert len({id(loop) for loop in loops.values()}) == 1
+        assert loops["command"].is_closed()
+
+    def test_loop_per_invocation(self, cli_runner: CliRunner) -> None:
+        """Test every invocation gets a new loop."""
+        loops: list[asyncio.AbstractEventLoop] = []
+
+        @command()
+        async def cmd() -> None:
+            loops.append(asyncio.get_running_loop())
+
+        assert cli_runner.invoke(cmd, []).exit_code == 0
+        assert cli_runner.invoke(cmd, []).exit_code == 0
+        assert loops[0] is not loops[1]
+        assert all(loop.is_closed() for loop in loops)
+
+    def test_async_validation_without_async_children(
+        self, cli_runner: CliRunner
+    ) -> None:
+        """Test async validations are awaited in sync processing."""
+        seen: list[str] = []
+
+        class AsyncValidation(ValidationNode):
+            async def on_finalize(
+                self, context: Context, *args: Any, **kwargs: Any
+            ) -> None:
+                seen.append("validated")
+
+        @command()
+        @option("name", default="x")
+        @AsyncValidation.as_decorator()
+        def cmd(name: str) -> None:
+            click.echo(name)
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code == 0, result.output
+        assert seen == ["validated"]
+
+    def test_catch_in_async_processing(self, cli_runner: CliRunner) -> None:
+        """Test @catch catches validation errors with async children."""
+        caught: list[str] = []
+
+        class Failing(ValidationNode):
+            def on_finalize(self, context: Context, *args: Any, **kwargs: Any) -> None:
+                raise ValueError("invalid")
+
+        class AsyncChild(ChildNode):
+            async def handle_all(self, value: Any, context: Context) -> Any:
+                return value
+
+        async def handler(exc: BaseException) -> None:
+            caught.append(str(exc))
+
+        @command()
+        @option("name", default="x")
+        @AsyncChild.as_decorator()
+        @catch(ValueError, handler=handler)
+        @Failing.as_decorator()
+        def cmd(name: str) -> None:
+            click.echo(name)
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code == 0, result.output
+        assert caught == ["invalid"]
+
+
+class TestInvokeFast:
+    """Test invoking commands from Python without parsing arguments."""
+
+    def test_values_are_not_converted(self) -> None:
+        """Test typed values and defaults reach the function."""
+
+        @command()
+        @argument("src")
+        @option("count", type=int, default=3)
+        @option("tags", multiple=True)
+        def cmd(src: Any, count: int, tags: tuple[str, ...]) -> Any:
+            return src, count, tags
+
+        path = object()
+        assert cmd.invoke_fast(src=path) == (path, 3, ())
+        assert cmd.invoke_fast(src="a", count=5, tags=("x",)) == ("a", 5, ("x",))
+
+    def test_container_values_become_tuples(self) -> None:
+        """Test values of multiple and nargs parameters are passed as tuples."""
+        seen: list[Any] = []
+
+        class Upper(ChildNode):
+            def handle_str(self, value: str, context: Context) -> str:
+                seen.append(value)
+                return value.upper()
+
+        @command()
+        @option("tags", multiple=True)
+        @Upper.as_decorator()
+        @option("point", type=int, nargs=2)
+        @option("pairs", type=int, nargs=2, multiple=True)
+        def cmd(tags: Any, point: Any, pairs: Any) -> Any:
+            return tags, point, pairs
+
+        assert cmd.invoke_fast(
+            tags=["a", "b"], point=[1, 2], pairs=[[1, 2], [3, 4]]
+        ) == (("A", "B"), (1, 2), ((1, 2), (3, 4)))
+        assert seen == ["a", "b"]
+        assert cmd.invoke_fast() == ((), None, ())
+
+    def test_children_and_provided_flags(self) -> None:
+        """Test values run through the children like on the command line."""
+        provided: dict[str, bool] = {}
+
+        class Upper(ChildNode):
+            def handle_str(self, value: str, context: Context) -> str:
+                provided[context.parent.name] = (  # type: ignore[union-attr]
+                    context.parent.was_provided  # type: ignore[union-attr]
+                )
+                return value.upper()
+
+        @command()
+        @option("first", default="a")
+        @Upper.as_decorator()
+        @option("second", default="b")
+        @Upper.as_decorator()
+        def cmd(first: str, second: str) -> str:
+            return first + second
+
+        assert cmd.invoke_fast(first="x") == "XB"
+        assert provided == {"first": True, "second": False}
+
+    def test_missing_and_unknown_values(self) -> None:
+        """Test required parameters and unknown names are rejected."""
+
+        @command()
+        @argument("src")
+        def cmd(src: str) -> None:
+            pass
+
+        with pytest.raises(click.MissingParameter):
+            cmd.invoke_fast()
+        with pytest.raises(TypeError, match="unexpected keyword argument 'dst'"):
+            cmd.invoke_fast(src="a", dst="b")
+
+    def test_errors_exit_like_the_cli(self) -> None:
+        """Test errors in handlers exit with the CLI exit code."""
+
+        class Failing(ChildNode):
+            def handle_str(self, value: str, context: Context) -> str:
+                raise ValueError("invalid")
+
+        @command()
+        @option("name", default="a")
+        @Failing.as_decorator()
+        def cmd(name: str) -> None:
+            pass
+
+        with pytest.raises(SystemExit) as exc_info:
+            cmd.invoke_fast()
+        assert exc_info.value.code == 1
+
+    def test_ainvoke(self) -> None:
+        """Test async invocation runs async handlers off the caller's loop."""
+
+        class AsyncUpper(ChildNode):
+            async def handle_str(self, value: str, context: Context) -> str:
+                await asyncio.sleep(0)
+                return value.upper()
+
+        @command()
+        @option("name", default="a")
+        @AsyncUpper.as_decorator()
+        async def cmd(name: str) -> str:
+            return name
+
+        async def main() -> list[Any]:
+            return list(
+                await asyncio.gather(cmd.ainvoke(name="x"), cmd.ainvoke(name="y"))
+            )
+
+        assert asyncio.run(main()) == ["X", "Y"]
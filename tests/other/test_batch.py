@@ -0,0 +1,286 @@
+"""Tests for batch mode."""
+
+import json
+from typing import Any
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from click_extended.core.decorators.argument import argument
+from click_extended.core.decorators.command import command
+from click_extended.core.decorators.group import group
+from click_extended.core.decorators.option import option
+from click_extended.core.nodes.child_node import ChildNode
+from click_extended.core.other._batch import locate_command, parse_line
+from click_extended.core.other.context import Context
+from click_extended.core.other.settings import Settings
+
+BATCH = Settings(batch=True)
+
+
+@command(settings=BATCH)
+@argument("word")
+def shout(word: str) -> str:
+    """Command run by the worker processes."""
+    if word == "fail":
+        raise ValueError("failed")
+    return word.upper()
+
+
+def records(output: str) -> list[dict[str, Any]]:
+    """Parse the JSON lines written by a batch."""
+    return [json.loads(line) for line in output.splitlines()]
+
+
+class TestParseLine:
+    """Test parsing lines of batch input."""
+
+    def test_arguments(self) -> None:
+        """Test plain lines are split like a shell would."""
+        assert parse_line("a --name 'b c'\n") == ["a", "--name", "b c"]
+
+    def test_json(self) -> None:
+        """Test JSON objects hold values and arrays hold arguments."""
+        assert parse_line('{"count": 2}') == {"count": 2}
+        assert parse_line('["a", "--name", "b"]') == ["a", "--name", "b"]
+
+    @pytest.mark.parametrize("line", ["{invalid", "[1, 2]", '["a", null]'])
+    def test_invalid_json(self, line: str) -> None:
+        """Test invalid JSON and arrays of non-strings are rejected."""
+        with pytest.raises(click.UsageError):
+            parse_line(line)
+
+
+class TestBatchCommand:
+    """Test batch mode of commands."""
+
+    def test_runs_every_line(self, cli_runner: CliRunner) -> None:
+        """Test every line runs and its output and return value are recorded."""
+
+        @command(settings=BATCH)
+        @argument("word")
+        @option("count", type=int, default=1)
+        def cmd(word: str, count: int) -> int:
+            click.echo(word * count)
+            return count
+
+        result = cli_runner.invoke(
+            cmd, ["--batch", "-"], input='a --count 2\n\n{"word": "b", "count": 3}\n'
+        )
+
+        assert result.exit_code == 0, result.output
+        assert records(result.output) == [
+            {"line": 1, "exit_code": 0, "result": 2, "stdout": "aa\n", "stderr": ""},
+            {"line": 3, "exit_code": 0, "result": 3, "stdout": "bbb\n", "stderr": ""},
+        ]
+
+    def test_failures_do_not_stop_the_batch(self, cli_runner: CliRunner) -> None:
+        """Test failing lines are recorded and the batch exits with 1."""
+
+        class Positive(ChildNode):
+            def handle_int(self, value: int, context: Context) -> int:
+                if value <= 0:
+                    raise ValueError("must be positive")
+                return value
+
+        @command(settings=BATCH)
+        @option("count", type=int, default=1)
+        @Positive.as_decorator()
+        def cmd(count: int) -> int:
+            return count
+
+        result = cli_runner.invoke(
+            cmd,
+            ["--batch", "-"],
+            input='--count 0\n--count x\n{"total": 1}\n{broken\n--count 4\n',
+        )
+
+        assert result.exit_code == 1
+        lines = records(result.output)
+        assert [line["exit_code"] for line in lines] == [1, 2, 1, 2, 0]
+        assert "must be positive" in lines[0]["stderr"]
+        assert "not a valid integer" in lines[1]["stderr"]
+        assert "unexpected keyword argument 'total'" in lines[2]["error"]
+        assert "Invalid JSON" in lines[3]["error"]
+        assert lines[4]["result"] == 4
+
+    def test_reads_file(self, cli_runner: CliRunner, tmp_path: Any) -> None:
+        """Test batch input is read from a file."""
+
+        @command(settings=BATCH)
+        @argument("word")
+        def cmd(word: str) -> str:
+            return word.upper()
+
+        path = tmp_path / "batch.txt"
+        path.write_text("a\nb\n", encoding="utf-8")
+
+        result = cli_runner.invoke(cmd, ["--batch", str(path)])
+
+        assert result.exit_code == 0, result.output
+        assert [line["result"] for line in records(result.output)] == ["A", "B"]
+
+    def test_disabled_by_default(self, cli_runner: CliRunner) -> None:
+        """Test commands only get the batch option when enabled."""
+
+        @command()
+        @option("name", default="a")
+        def cmd(name: str) -> None:
+            click.echo(name)
+
+        result = cli_runner.invoke(cmd, ["--batch", "-"], input="\n")
+
+        assert result.exit_code == 2
+        assert "No such option '--batch'" in result.output
+
+    def test_existing_batch_parameter(self, cli_runner: CliRunner) -> None:
+        """Test commands with their own batch parameter keep it."""
+
+        @command()
+        @option("batch", type=int, default=1)
+        def cmd(batch: int) -> None:
+            click.echo(f"batch={batch}")
+
+        result = cli_runner.invoke(cmd, ["--batch", "5"])
+
+        assert result.exit_code == 0, result.output
+        assert result.output == "batch=5\n"
+
+    @pytest.mark.parametrize("name", ["batch", "batch_workers"])
+    def test_conflicting_parameter(self, name: str) -> None:
+        """Test enabling batch mode fails when a parameter uses its names."""
+
+        def cmd(**kwargs: Any) -> None:
+            pass
+
+        decorated = option(name, default=1)(cmd)
+
+        with pytest.raises(ValueError, match="conflicts with the batch options"):
+            command(settings=BATCH)(decorated)
+
+    def test_invoke_fast_skips_batch_option(self) -> None:
+        """Test the batch option is not passed to the function."""
+
+        @command(settings=BATCH)
+        @option("name", default="a")
+        def cmd(name: str) -> str:
+            return name
+
+        assert cmd.invoke_fast() == "a"
+        with pytest.raises(TypeError):
+            cmd.invoke_fast(batch="-")
+
+
+class TestBatchGroup:
+    """Test batch mode of groups."""
+
+    def test_lines_select_subcommands(self, cli_runner: CliRunner) -> None:
+        """Test every line runs the subcommand it names."""
+
+        @group(settings=BATCH)
+        def cli() -> None:
+            pass
+
+        @cli.command()
+        @argument("word")
+        def upper(word: str) -> str:
+            return word.upper()
+
+        @cli.command()
+        @argument("word")
+        def lower(word: str) -> str:
+            return word.lower()
+
+        result = cli_runner.invoke(
+            cli, ["--batch", "-"], input='upper a\n["lower", "B"]\nmissing\n{"a": 1}\n'
+        )
+
+        assert result.exit_code == 1
+        lines = records(result.output)
+        assert [line["result"] for line in lines[:2]] == ["A", "b"]
+        assert "No such command 'missing'" in lines[2]["stderr"]
+        assert "only supported by commands" in lines[3]["error"]
+
+    def test_subcommands_have_batch_mode(self, cli_runner: CliRunner) -> None:
+        """Test subcommands provide batch mode as well."""
+
+        @group(settings=BATCH)
+        def cli() -> None:
+            pass
+
+        @cli.command(settings=BATCH)
+        @argument("word")
+        def upper(word: str) -> str:
+            return word.upper()
+
+        result = cli_runner.invoke(cli, ["upper", "--batch", "-"], input="a\nb\n")
+
+        assert result.exit_code == 0, result.output
+        assert [line["result"] for line in records(result.output)] == ["A", "B"]
+
+
+class TestBatchWorkers:
+    """Test batch mode with worker processes."""
+
+    def test_ordered(self, cli_runner: CliRunner) -> None:
+        """Test records are written in input order with a summary."""
+        words = [f"w{i}" for i in range(20)]
+
+        result = cli_runner.invoke(
+            shout,
+            ["--batch-workers", "2", "--batch", "-", "--batch-chunk-size", "3"],
+            input="\n".join(words) + "\n",
+        )
+
+        assert result.exit_code == 0, result.output
+        lines = records(result.stdout)
+        assert [line["result"] for line in lines] == [w.upper() for w in words]
+        assert all(line["worker"] for line in lines)
+
+        summary = json.loads(result.stderr)
+        assert summary["lines"] == 20
+        assert summary["failed"] == 0
+        assert sum(summary["workers"].values()) == 20
+
+    def test_unordered(self, cli_runner: CliRunner) -> None:
+        """Test every record is written when results are unordered."""
+        result = cli_runner.invoke(
+            shout,
+            ["--batch", "-", "--batch-workers", "3", "--batch-unordered"],
+            input="a\nfail\n\nb\n",
+        )
+
+        assert result.exit_code == 1
+        lines = sorted(records(result.stdout), key=lambda line: line["line"])
+        assert [line["line"] for line in lines] == [1, 2, 4]
+        assert [line["exit_code"] for line in lines] == [0, 1, 0]
+        assert json.loads(result.stderr)["failed"] == 1
+
+    def test_options_follow_batch_mode(self, cli_runner: CliRunner) -> None:
+        """Test the worker options are hidden and only added with batch mode."""
+
+        @command()
+        @argument("word")
+        def plain(word: str) -> None:
+            pass
+
+        result = cli_runner.invoke(plain, ["a", "--batch-workers", "2"])
+        assert result.exit_code == 2
+        assert "No such option '--batch-workers'" in result.output
+
+        result = cli_runner.invoke(shout, ["--help"])
+        assert result.exit_code == 0, result.output
+        assert "--batch FILE" in result.output
+        assert "--batch-" not in result.output
+
+    def test_requires_module_level_command(self) -> None:
+        """Test commands that can not be imported by workers are rejected."""
+
+        @command()
+        def local() -> None:
+            pass
+
+        assert locate_command(shout) == (__name__, "shout")
+        with pytest.raises(click.UsageError, match="top level of a module"):
+            locate_command(local)
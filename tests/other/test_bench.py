@@ -0,0 +1,163 @@
+"""Tests for the startup benchmark."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from click_extended.bench import (
+    check_budgets,
+    decorate_time,
+    decorator_subpackages,
+    import_time,
+    main,
+    noop_time,
+    parse_importtime,
+)
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       234 |        234 |   _io
+import time:        50 |        350 | encodings
+import time:       100 |        100 |     click.types
+import time:       300 |        600 |   click.core
+import time:       400 |       1000 | click
+some other output
+"""
+
+
+class TestParseImporttime:
+    """Test parsing the output of ``python -X importtime``."""
+
+    def test_parses_lines(self) -> None:
+        """Test the level, name and cumulative time of imports are parsed."""
+        assert parse_importtime(IMPORTTIME) == [
+            (1, "_io", 234),
+            (0, "encodings", 350),
+            (2, "click.types", 100),
+            (1, "click.core", 600),
+            (0, "click", 1000),
+        ]
+
+    def test_import_time(self) -> None:
+        """Test the import time of a module is measured."""
+        assert import_time("json") > 0
+        assert import_time("sys") == 0
+
+
+class TestMeasurements:
+    """Test the measurements of decorating and running commands."""
+
+    def test_decorator_subpackages(self) -> None:
+        """Test the decorator subpackages are discovered."""
+        subpackages = decorator_subpackages()
+
+        assert "click_extended.decorators.check" in subpackages
+        assert "click_extended.decorators.transform" in subpackages
+
+    def test_decorate_time(self) -> None:
+        """Test decorating synthetic commands is measured."""
+        assert decorate_time(3) > 0
+
+    def test_noop_time(self) -> None:
+        """Test running a command that does nothing is measured."""
+        assert noop_time() > 0
+
+
+class TestCheckBudgets:
+    """Test checking measurements against budgets."""
+
+    results = {
+        "import:click_extended": {"min_ms": 4.0, "median_ms": 5.0, "max_ms": 9.0},
+        "decorate": {"min_ms": 40.0, "median_ms": 50.0, "max_ms": 60.0},
+    }
+
+    def test_within_budgets(self) -> None:
+        """Test measurements within their budgets pass."""
+        assert not check_budgets(self.results, {"click_extended": 5, "decorate": 51})
+
+    def test_over_budget(self) -> None:
+        """Test the median of a measurement is compared to its budget."""
+        assert check_budgets(self.results, {"import:click_extended": 4.5}) == [
+            "import:click_extended: 5.0 ms is over 4.5 ms"
+        ]
+
+    def test_missing_measurement(self) -> None:
+        """Test budgets of measurements that were not taken fail."""
+        assert check_budgets(self.results, {"missing": 1}) == [
+            "missing: no such measurement"
+        ]
+
+
+class TestMain:
+    """Test running the benchmark from the command line."""
+
+    def test_writes_results(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test the results and budgets are written as JSON."""
+        budgets = tmp_path / "budgets.json"
+        budgets.write_text(json.dumps({"decorate": 0, "noop:invoke": 60000}))
+        output = tmp_path / "bench.json"
+
+        code = main(
+            [
+                "startup",
+                "--repeat=1",
+                "--commands=2",
+                f"--budgets={budgets}",
+                "--budget=decorate=60000",
+                f"--output={output}",
+            ]
+        )
+
+        report = json.loads(output.read_text())
+        assert code == 0
+        assert report["budgets"] == {"decorate": 60000, "noop:invoke": 60000}
+        assert not report["failures"]
+        assert {
+            "import:click_extended",
+            "import:click_extended.decorators.misc",
+            "decorate",
+            "noop:invoke",
+            "noop:process",
+            "interpreter",
+        } <= set(report["results"])
+        assert "decorate" in capsys.readouterr().err
+
+    def test_fails_over_budget(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test the benchmark fails when a measurement is over its budget."""
+        code = main(
+            [
+                "startup",
+                "--repeat=1",
+                "--commands=1",
+                "--budget=interpreter=0",
+                f"--output={tmp_path / 'bench.json'}",
+            ]
+        )
+
+        assert code == 1
+        assert "Over budget: interpreter" in capsys.readouterr().err
+
+    def test_invalid_budget(self) -> None:
+        """Test budgets that are not NAME=MS are rejected."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["startup", "--budget=decorate"])
+
+        assert exc_info.value.code == 2
+
+    def test_runs_as_module(self) -> None:
+        """Test the benchmark runs with ``python -m``."""
+        result = subprocess.run(
+            [sys.executable, "-m", "click_extended.bench", "--help"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert "startup" in result.stdout
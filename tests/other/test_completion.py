@@ -0,0 +1,416 @@
+"""Tests for shell completion from a completion index."""
+
+import json
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import click
+import pytest
+from click.shell_completion import ShellComplete, get_completion_class
+from click.testing import CliRunner
+
+from click_extended.completion import (
+    complete,
+    completions,
+    format_completion,
+    index_path,
+)
+from click_extended.core.decorators.argument import argument
+from click_extended.core.decorators.command import command
+from click_extended.core.decorators.group import group
+from click_extended.core.decorators.option import option
+from click_extended.core.other._click_group import ClickGroup
+from click_extended.core.other._completion import completion_index
+from click_extended.core.other._manifest import describe_command
+from click_extended.decorators.misc.choice import choice
+from click_extended.hooks.hook_registry import HookRegistry, get_registry
+from click_extended.hooks.on_boot import on_boot
+
+COMPLETE_VAR = "_CLI_COMPLETE"
+
+
+def shell_env(line: str, shell: str = "bash") -> dict[str, str]:
+    """Return the environment the completion script of a shell sets."""
+    words = line.split()
+    cword = len(words) if line.endswith(" ") else len(words) - 1
+    if shell == "fish":
+        incomplete = "" if line.endswith(" ") else words[-1]
+        return {
+            COMPLETE_VAR: "fish_complete",
+            "COMP_WORDS": line,
+            "COMP_CWORD": incomplete,
+        }
+    return {
+        COMPLETE_VAR: f"{shell}_complete",
+        "COMP_WORDS": line,
+        "COMP_CWORD": str(cword),
+    }
+
+
+@pytest.fixture(name="cache_dir", autouse=True)
+def fixture_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Write completion indexes to a temporary directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("CLICK_EXTENDED_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture(name="hook_registry")
+def fixture_hook_registry() -> Iterator[HookRegistry]:
+    """Reset the hook registry between tests."""
+    registry = get_registry()
+    registry._hooks.clear()  # type: ignore
+    yield registry
+    registry._hooks.clear()  # type: ignore
+
+
+@pytest.fixture(name="cli")
+def fixture_cli() -> ClickGroup:
+    """Create a group with commands, aliases, choices and a plain group."""
+
+    @group()
+    def cli() -> None:
+        """Root group."""
+
+    @cli.command(aliases=["d", "dep"])
+    @argument("target")
+    @option("--env", "-e", help="The environment.")
+    @choice("dev", "prod")
+    @option("--tag", multiple=True)
+    @option("--verbose", "-v", is_flag=True)
+    def deploy(target: str, env: str, tag: tuple[str, ...], verbose: bool) -> None:
+        """Deploy a target: to an environment."""
+
+    @click.group()
+    def db() -> None:
+        """Database."""
+
+    @db.command()
+    @click.argument("file", type=click.File())
+    @click.option("--path", type=click.Path(file_okay=False))
+    @click.option("--mode", type=click.Choice(["Fast", "slow"], case_sensitive=False))
+    @click.option("--pair", nargs=2)
+    def load(file: str, path: str, mode: str, pair: tuple[str, str]) -> None:
+        """Load a file."""
+
+    @db.command(hidden=True)
+    def secret() -> None:
+        """Hidden."""
+
+    @db.command()
+    @click.option("--name", shell_complete=lambda ctx, param, incomplete: ["x"])
+    def custom(name: str) -> None:
+        """Custom completion."""
+
+    @db.group()
+    def migrate() -> None:
+        """Migrations."""
+
+    @migrate.command(name="run")
+    @click.argument("direction", type=click.Choice(["up", "down"]))
+    @click.argument("paths", nargs=-1, type=click.Path(dir_okay=False))
+    @click.option("--dry-run/--no-dry-run", help="Only print the plan.")
+    @click.option("-q", "--quiet", count=True)
+    @click.option("--token", hidden=True)
+    def run_migrations(
+        direction: str, paths: tuple[str, ...], dry_run: bool, quiet: int, token: str
+    ) -> None:
+        """Run migrations."""
+
+    cli.add_command(db)
+    return cli
+
+
+def click_completions(
+    cli: click.Command, args: list[str], incomplete: str
+) -> list[tuple[str, str, str | None]]:
+    """Return the completions of Click itself."""
+    comp = ShellComplete(cli, {}, "cli", COMPLETE_VAR)
+    return [
+        (item.type, item.value, item.help or None)
+        for item in comp.get_completions(args, incomplete)
+    ]
+
+
+def index_completions(
+    cli: click.Command, args: list[str], incomplete: str
+) -> list[tuple[str, str, str | None]] | None:
+    """Return the completions from the index of a command."""
+    index = completion_index(describe_command(cli, "cli"))
+    found = completions(index, args, incomplete)
+    return None if found is None else [(t, v, h or None) for t, v, h in found]
+
+
+class TestCompletions:
+    """Test completions from the index match those of Click."""
+
+    @pytest.mark.parametrize(
+        ("args", "incomplete"),
+        [
+            ([], ""),
+            ([], "d"),
+            ([], "--"),
+            (["deploy"], "-"),
+            (["d"], "--v"),
+            (["deploy", "x"], ""),
+            (["deploy", "-v"], "-"),
+            (["deploy", "--tag", "a"], "--t"),
+            (["deploy", "--"], "-"),
+            (["db"], ""),
+            (["db"], "s"),
+            (["db", "load"], ""),
+            (["db", "load", "--path"], ""),
+            (["db", "load", "--mode"], "f"),
+            (["db", "load"], "--mode=S"),
+            (["db", "load", "--pair"], ""),
+            (["db", "load", "--pair", "a"], ""),
+            (["db", "load", "f"], "--"),
+            (["missing"], ""),
+        ],
+    )
+    def test_matches_click(
+        self, cli: ClickGroup, args: list[str], incomplete: str
+    ) -> None:
+        """Test the index completes like Click."""
+        assert index_completions(cli, args, incomplete) == click_completions(
+            cli, args, incomplete
+        )
+
+    def test_choice_values(self, cli: ClickGroup) -> None:
+        """Test the values of choice() children are completed."""
+        assert index_completions(cli, ["deploy", "--env"], "") == [
+            ("plain", "dev", None),
+            ("plain", "prod", None),
+        ]
+        assert index_completions(cli, ["dep"], "-e=p") == [("plain", "prod", None)]
+
+    def test_case_insensitive_choice(self) -> None:
+        """Test choice() children without case sensitivity match any case."""
+
+        @command()
+        @option("--env")
+        @choice("Dev", "Prod", case_sensitive=False)
+        def cmd(env: str) -> None:
+            """Command with a case-insensitive choice."""
+
+        description = describe_command(cmd, "cmd")
+        assert description["params"][0]["type"] == {
+            "kind": "choice",
+            "choices": ["Dev", "Prod"],
+            "case_sensitive": False,
+        }
+        assert index_completions(cmd, ["--env"], "p") == [("plain", "Prod", None)]
+
+    def test_custom_completion(self, cli: ClickGroup) -> None:
+        """Test custom completion functions are left to Click."""
+        assert index_completions(cli, ["db", "custom", "--name"], "") is None
+
+    @pytest.mark.parametrize("shell", ["bash", "zsh", "fish"])
+    def test_format_matches_click(self, cli: ClickGroup, shell: str) -> None:
+        """Test completions are formatted like Click formats them."""
+        comp_cls = get_completion_class(shell)
+        assert comp_cls is not None
+        comp = comp_cls(cli, {}, "cli", COMPLETE_VAR)
+
+        for item in comp.get_completions([], ""):
+            assert format_completion(
+                shell, (item.type, item.value, item.help)
+            ) == comp.format_completion(item)
+
+
+# The values of choice() children are only known to the index and are tested
+# separately, Click itself completes nothing for them.
+PARITY_CASES = [
+    "cli ",
+    "cli d",
+    "cli --",
+    "cli deploy -",
+    "cli deploy x ",
+    "cli deploy --tag a --t",
+    "cli deploy -- -",
+    "cli db ",
+    "cli db load ",
+    "cli db load --path ",
+    "cli db load --mode f",
+    "cli db load --pair a ",
+    "cli db load f --",
+    "cli db migrate ",
+    "cli db migrate run ",
+    "cli db migrate run u",
+    "cli db migrate run up ",
+    "cli db migrate run up a.sql ",
+    "cli db migrate run --",
+    "cli db migrate run --no",
+    "cli db migrate run -q -q -",
+    "cli db migrate run up -- -",
+    "cli missing ",
+]
+
+
+class TestParity:
+    """Test the shell gets the same answer from the index as from Click."""
+
+    @pytest.mark.parametrize("shell", ["bash", "zsh", "fish"])
+    @pytest.mark.parametrize("line", PARITY_CASES)
+    def test_matches_click(
+        self,
+        cli: ClickGroup,
+        cli_runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+        line: str,
+        shell: str,
+    ) -> None:
+        """Test the output of the completion script matches Click's."""
+        env = shell_env(line, shell)
+        from_index = cli_runner.invoke(cli, prog_name="cli", env=env)
+
+        monkeypatch.setattr(
+            "click_extended.core.other._completion.complete_from_index",
+            lambda *args: None,
+        )
+        from_click = cli_runner.invoke(cli, prog_name="cli", env=env)
+
+        assert from_index.exit_code == from_click.exit_code == 0
+        assert from_index.output == from_click.output
+
+    @pytest.mark.parametrize("line", PARITY_CASES)
+    def test_answered_by_index(self, cli: ClickGroup, line: str) -> None:
+        """Test the parity cases are answered without falling back to Click."""
+        args = line.split()[1:]
+        incomplete = "" if line.endswith(" ") else args.pop()
+
+        assert index_completions(cli, args, incomplete) is not None
+
+
+class TestCompleteFromIndex:
+    """Test commands answer the shell from their completion index."""
+
+    @pytest.mark.parametrize("shell", ["bash", "zsh", "fish"])
+    def test_answers_shell(
+        self, cli: ClickGroup, cli_runner: CliRunner, shell: str
+    ) -> None:
+        """Test the group answers the completion script of a shell."""
+        result = cli_runner.invoke(
+            cli, prog_name="cli", env=shell_env("cli deploy --env ", shell)
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "dev" in result.output
+        assert "prod" in result.output
+
+    def test_skips_lifecycle(
+        self, cli: ClickGroup, cli_runner: CliRunner, hook_registry: HookRegistry
+    ) -> None:
+        """Test completion runs no hooks and builds no trees."""
+        events: list[object] = []
+
+        @on_boot()
+        def handler(event: object) -> None:
+            events.append(event)
+
+        result = cli_runner.invoke(cli, prog_name="cli", env=shell_env("cli d "))
+
+        assert result.exit_code == 0, result.output
+        assert not events
+        assert not cli.root.tree.is_validated
+        assert len(hook_registry._hooks) == 1  # type: ignore
+
+    def test_writes_index(
+        self, cli: ClickGroup, cli_runner: CliRunner, cache_dir: Path
+    ) -> None:
+        """Test the index is written for the standard library completer."""
+        cli_runner.invoke(cli, prog_name="cli", env=shell_env("cli "))
+
+        path = index_path(COMPLETE_VAR)
+        assert path.parent == cache_dir
+        data = json.loads(path.read_text())
+        assert set(data["command"]["commands"]) == {"db", "deploy"}
+
+    def test_falls_back_to_click(self, cli: ClickGroup, cli_runner: CliRunner) -> None:
+        """Test completions the index can not answer are left to Click."""
+        result = cli_runner.invoke(
+            cli, prog_name="cli", env=shell_env("cli db custom --name ")
+        )
+
+        assert result.exit_code == 0, result.output
+        assert result.output == "plain,x\n"
+
+    def test_source(self, cli: ClickGroup, cli_runner: CliRunner) -> None:
+        """Test the completion script is still written by Click."""
+        result = cli_runner.invoke(
+            cli, prog_name="cli", env={COMPLETE_VAR: "bash_source"}
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "_cli_completion" in result.output
+
+
+class TestComplete:
+    """Test answering the shell before the commands are imported."""
+
+    def test_not_completing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test nothing happens when the shell does not ask."""
+        monkeypatch.delenv(COMPLETE_VAR, raising=False)
+
+        complete("cli")
+
+    def test_missing_index(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the program answers when there is no index yet."""
+        for key, value in shell_env("cli ").items():
+            monkeypatch.setenv(key, value)
+
+        complete("cli")
+
+    def test_answers_from_index(
+        self,
+        cli: ClickGroup,
+        cli_runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+        capsysbinary: pytest.CaptureFixture[bytes],
+    ) -> None:
+        """Test the shell is answered from the index the program wrote."""
+        env = shell_env("cli deploy --env ")
+        expected = cli_runner.invoke(cli, prog_name="cli", env=env).output
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+        with pytest.raises(SystemExit) as exc_info:
+            complete("cli")
+
+        assert exc_info.value.code == 0
+        assert capsysbinary.readouterr().out.decode() == expected
+
+    def test_stale_index(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test an index whose sources changed is not used."""
+        source = tmp_path / "source.py"
+        source.write_text("")
+        path = index_path(COMPLETE_VAR)
+        path.parent.mkdir(parents=True)
+        data = {
+            "version": 1,
+            "sources": {str(source): {"mtime_ns": 0, "size": 0, "sha256": "x"}},
+            "command": {"params": [], "help_option": None},
+        }
+        path.write_text(json.dumps(data))
+        for key, value in shell_env("cli -").items():
+            monkeypatch.setenv(key, value)
+
+        complete("cli")
+
+    def test_standard_library_only(self) -> None:
+        """Test the completer does not import Click or the commands."""
+        script = (
+            "import sys, click_extended.completion\n"
+            "print([m for m in ('click', 'click_extended.core') "
+            "if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "[]"
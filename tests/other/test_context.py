@@ -1,5 +1,6 @@
 """Tests for the Context class and its methods."""
 
+from dataclasses import FrozenInstanceError
 from typing import Any
 from unittest.mock import MagicMock, Mock
 
@@ -959,6 +960,33 @@ class TestContextCurrentParentTyped:
             context.get_current_parent_as_tag()
 
 
+class TestContextWithNode:
+    """Test deriving contexts for other nodes."""
+
+    def test_with_node_swaps_current_and_parent(
+        self, basic_context: Context, mock_tag: Mock
+    ) -> None:
+        """Test with_node() only changes current and parent."""
+        child = StubChildNode(name="child")
+        view = basic_context.with_node(child, mock_tag)
+
+        assert view.current is child
+        assert view.parent is mock_tag
+        assert view.root is basic_context.root
+        assert view.click_context is basic_context.click_context
+        assert view.nodes is basic_context.nodes
+        assert view.parents is basic_context.parents
+        assert view.data is basic_context.data
+        assert basic_context.current is None
+
+    def test_slots(self, basic_context: Context) -> None:
+        """Test Context uses slots and stays immutable."""
+        assert not hasattr(basic_context, "__dict__")
+
+        with pytest.raises(FrozenInstanceError):
+            basic_context.debug = True  # type: ignore[misc]
+
+
 class TestContextEdgeCases:
     """Test edge cases and error conditions."""
 
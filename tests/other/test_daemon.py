@@ -0,0 +1,181 @@
+"""Tests for the daemon and its client."""
+
+import multiprocessing
+import os
+import socket
+import stat
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+import click
+import pytest
+
+from click_extended.client import run
+from click_extended.core.decorators.argument import argument
+from click_extended.core.decorators.group import group
+from click_extended.core.decorators.option import option
+from click_extended.core.other._daemon import warm
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32" or not hasattr(socket, "AF_UNIX"),
+    reason="The daemon requires Unix domain sockets and fork.",
+)
+
+CALLS: list[str] = []
+
+
+@group()
+def cli() -> None:
+    """Group served by the daemon."""
+
+
+@cli.command()
+@argument("word")
+@option("code", type=int, default=0)
+def say(word: str, code: int) -> None:
+    """Echo the word, the state and the environment of the invocation."""
+    CALLS.append(word)
+    click.echo(f"{word} calls={len(CALLS)} env={os.environ.get('DAEMON_TEST')}")
+    click.echo(f"cwd={os.getcwd()}", err=True)
+    sys.exit(code)
+
+
+@pytest.fixture(name="daemon")
+def fixture_daemon(tmp_path: Path) -> Iterator[str]:
+    """Start a daemon serving the group and stop it after the test."""
+    path = str(tmp_path / "cli.sock")
+    process = multiprocessing.get_context("fork").Process(
+        target=cli.serve, args=(path,)
+    )
+    process.start()
+
+    deadline = time.monotonic() + 10
+    while not os.path.exists(path):
+        assert time.monotonic() < deadline, "The daemon did not start."
+        time.sleep(0.01)
+
+    yield path
+
+    process.terminate()
+    process.join(10)
+    assert not os.path.exists(path)
+
+
+def invoke(path: str, argv: list[str]) -> Any:
+    """Invoke the group through the client and return the exit code."""
+    with pytest.raises(SystemExit) as exc_info:
+        run(path, f"{__name__}:cli", argv, prog_name="cli")
+    return exc_info.value.code
+
+
+class TestDaemon:
+    """Test invocations through the daemon."""
+
+    def test_forwards_output_env_and_cwd(
+        self,
+        daemon: str,
+        capfd: pytest.CaptureFixture[str],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test the invocation sees the client's environment and directory."""
+        monkeypatch.setenv("DAEMON_TEST", "yes")
+        monkeypatch.chdir(tmp_path)
+
+        assert invoke(daemon, ["say", "hello"]) == 0
+
+        out, err = capfd.readouterr()
+        assert out == "hello calls=1 env=yes\n"
+        assert err == f"cwd={tmp_path}\n"
+
+    def test_invocations_are_isolated(
+        self, daemon: str, capfd: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test module state of one invocation is not seen by the next."""
+        assert invoke(daemon, ["say", "a"]) == 0
+        assert invoke(daemon, ["say", "b"]) == 0
+
+        out, _ = capfd.readouterr()
+        assert out.splitlines() == ["a calls=1 env=None", "b calls=1 env=None"]
+        assert not CALLS
+
+    def test_forwards_exit_codes(
+        self, daemon: str, capfd: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test exit codes and usage errors reach the client."""
+        assert invoke(daemon, ["say", "a", "--code", "3"]) == 3
+        assert invoke(daemon, ["missing"]) == 2
+
+        _, err = capfd.readouterr()
+        assert "No such command 'missing'" in err
+
+    def test_socket_is_private(self, daemon: str) -> None:
+        """Test only the owner can connect to the socket."""
+        assert stat.S_IMODE(os.stat(daemon).st_mode) == 0o600
+
+    def test_second_daemon_is_rejected(self, daemon: str) -> None:
+        """Test a socket in use is not taken over."""
+        with pytest.raises(click.UsageError, match="already listening"):
+            cli.serve(daemon)
+
+
+class TestClient:
+    """Test the client without a daemon."""
+
+    def test_falls_back_to_local_execution(
+        self, tmp_path: Path, capfd: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test the command runs in the process when no daemon listens."""
+        assert invoke(str(tmp_path / "missing.sock"), ["say", "local"]) == 0
+
+        out, _ = capfd.readouterr()
+        assert out.startswith("local calls=")
+        CALLS.clear()
+
+
+class TestPlatform:
+    """Test daemon mode on platforms without fork or Unix domain sockets."""
+
+    def test_serve_requires_fork(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test serving fails clearly without fork."""
+        monkeypatch.delattr(os, "fork")
+
+        with pytest.raises(NotImplementedError, match="POSIX"):
+            cli.serve(str(tmp_path / "cli.sock"))
+
+        assert not os.path.exists(tmp_path / "cli.sock")
+
+    def test_client_requires_unix_sockets(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the client fails clearly without Unix domain sockets."""
+        monkeypatch.delattr(socket, "AF_UNIX")
+
+        with pytest.raises(NotImplementedError, match="POSIX"):
+            run(str(tmp_path / "cli.sock"), f"{__name__}:cli", ["say", "a"])
+
+
+class TestWarm:
+    """Test warming the trees of a group."""
+
+    def test_builds_every_tree(self) -> None:
+        """Test the trees of the group and its commands are validated."""
+
+        @group()
+        def local() -> None:
+            pass
+
+        @local.command(aliases="s")
+        @argument("word")
+        def sub(word: str) -> None:
+            pass
+
+        warm(local)
+
+        assert local.root.tree.is_validated
+        assert sub.root.tree.is_validated
+        assert sub.root.tree.plan is not None
@@ -8,6 +8,7 @@ import click
 from click.testing import CliRunner
 
 from click_extended.errors import (
+    BatchItemError,
     ClickExtendedError,
     ContextAwareError,
     InternalError,
@@ -71,6 +72,20 @@ class TestClickExtendedError:
             assert call_kwargs["file"] == sys.stderr
 
 
+class TestBatchItemError:
+    """Test BatchItemError class."""
+
+    def test_wraps_error(self) -> None:
+        """Test the index and error of the value are kept."""
+        cause = ValueError("Negative")
+        error = BatchItemError(2, cause)
+
+        assert isinstance(error, ClickExtendedError)
+        assert error.index == 2
+        assert error.error is cause
+        assert str(error) == "Negative"
+
+
 class TestContextAwareError:
     """Test ContextAwareError class."""
 
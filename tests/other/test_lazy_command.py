@@ -0,0 +1,150 @@
+"""Tests for lazily imported commands of groups."""
+
+import sys
+import textwrap
+from collections.abc import Iterator
+from pathlib import Path
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from click_extended.core.decorators.group import group
+from click_extended.core.other._click_group import ClickGroup
+from click_extended.core.other._daemon import warm
+from click_extended.core.other._lazy_command import LazyCommand
+
+MODULE = "lazy_commands_module"
+
+SOURCE = '''
+from click_extended import argument, command, group
+
+
+@command(aliases="h")
+@argument("name")
+def hello(name):
+    """Help from the module."""
+    print(f"Hello {name}!")
+
+
+@group()
+def tools():
+    """Tools from the module."""
+
+
+@tools.command()
+def version():
+    print("1.0")
+
+
+not_a_command = 1
+'''
+
+
+@pytest.fixture(name="module")
+def fixture_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """Write a module of commands that is not imported yet."""
+    (tmp_path / f"{MODULE}.py").write_text(textwrap.dedent(SOURCE))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield MODULE
+    sys.modules.pop(MODULE, None)
+
+
+@pytest.fixture(name="cli")
+def fixture_cli(module: str) -> ClickGroup:
+    """Create a group with lazy commands from the module."""
+
+    @group()
+    def cli() -> None:
+        """Root group."""
+
+    cli.lazy_command(
+        "hello", f"{module}:hello", help="Say hello.", aliases=["hi", "hey"]
+    ).lazy_group("tools", f"{module}:tools", help="Tools.")
+    return cli
+
+
+class TestLazyCommand:
+    """Test registering and loading lazy commands."""
+
+    def test_help_does_not_import(self, cli: ClickGroup, cli_runner: CliRunner) -> None:
+        """Test the command list is formatted from the registration."""
+        result = cli_runner.invoke(cli, ["--help"])
+
+        assert result.exit_code == 0, result.output
+        assert "hello (hi, hey)  Say hello." in result.output
+        assert "tools            Tools." in result.output
+        assert MODULE not in sys.modules
+
+    def test_invoke_imports(self, cli: ClickGroup, cli_runner: CliRunner) -> None:
+        """Test invoking a lazy command imports and runs it."""
+        result = cli_runner.invoke(cli, ["hello", "World"])
+
+        assert result.exit_code == 0, result.output
+        assert result.output == "Hello World!\n"
+        assert MODULE in sys.modules
+
+    @pytest.mark.parametrize("alias", ["hi", "hey"])
+    def test_aliases(self, cli: ClickGroup, cli_runner: CliRunner, alias: str) -> None:
+        """Test lazy commands are invoked by their aliases."""
+        result = cli_runner.invoke(cli, [alias, "World"])
+
+        assert result.exit_code == 0, result.output
+        assert result.output == "Hello World!\n"
+
+    def test_lazy_group(self, cli: ClickGroup, cli_runner: CliRunner) -> None:
+        """Test the subcommands of a lazy group are invoked."""
+        result = cli_runner.invoke(cli, ["tools", "version"])
+
+        assert result.exit_code == 0, result.output
+        assert result.output == "1.0\n"
+
+    def test_list_commands(self, cli: ClickGroup) -> None:
+        """Test names and aliases are listed without importing."""
+        assert cli.list_commands(click.Context(cli)) == [
+            "hello",
+            "hey",
+            "hi",
+            "tools",
+        ]
+        assert MODULE not in sys.modules
+
+    def test_loaded_once(self, cli: ClickGroup, cli_runner: CliRunner) -> None:
+        """Test the command is imported once and shared by its aliases."""
+        cli_runner.invoke(cli, ["hello", "a"])
+        cli_runner.invoke(cli, ["hi", "b"])
+
+        assert cli.lazy_commands["hello"].command is not None
+        assert cli.lazy_commands["hello"] is cli.lazy_commands["hi"]
+
+    def test_warm_imports_lazy_commands(self, cli: ClickGroup) -> None:
+        """Test warming a group for the daemon imports its lazy commands."""
+        warm(cli)
+
+        hello = cli.lazy_commands["hello"].command
+        assert hello is not None
+        assert hello.root.tree.is_validated  # type: ignore[attr-defined]
+
+
+class TestLazyCommandErrors:
+    """Test invalid lazy commands."""
+
+    def test_invalid_import_path(self) -> None:
+        """Test import paths without an attribute are rejected."""
+        with pytest.raises(ValueError, match="expected 'module:attribute'"):
+            LazyCommand("hello", "module.hello")
+
+    def test_missing_attribute(self, module: str) -> None:
+        """Test a missing attribute raises an ImportError."""
+        with pytest.raises(ImportError, match="has no attribute 'missing'"):
+            LazyCommand("missing", f"{module}:missing").load()
+
+    def test_not_a_command(self, module: str) -> None:
+        """Test objects that are not commands are rejected."""
+        with pytest.raises(TypeError, match="must be a command"):
+            LazyCommand("value", f"{module}:not_a_command").load()
+
+    def test_not_a_group(self, module: str) -> None:
+        """Test lazy groups must import a group."""
+        with pytest.raises(TypeError, match="must be a group"):
+            LazyCommand("hello", f"{module}:hello", is_group=True).load()
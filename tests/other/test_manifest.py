@@ -0,0 +1,244 @@
+"""Tests for answering help and completion from a manifest."""
+
+import json
+import os
+import sys
+import textwrap
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import click
+import pytest
+from click.shell_completion import ShellComplete
+from click.testing import CliRunner
+
+from click_extended.completion import default_cache_dir, is_fresh
+from click_extended.core.decorators.group import group
+from click_extended.core.other._click_group import ClickGroup
+from click_extended.core.other._manifest import Manifest, ManifestCommand
+
+MODULE = "manifest_commands_module"
+
+SOURCE = '''
+from click_extended import argument, command, group, option
+from click_extended.decorators import choice
+
+
+@command(aliases="d")
+@argument("target")
+@option("--env", help="The environment.", tags="remote")
+@choice("dev", "prod")
+@option("--force", "-f", is_flag=True, help="Skip checks.")
+def deploy(target, env, force):
+    """Deploy a target."""
+    print(f"Deploying {target} to {env}")
+
+
+@group()
+def tools():
+    """Tools from the module."""
+
+
+@tools.command(aliases="v")
+@option("--short", is_flag=True, help="Only the number.")
+def version(short):
+    """Show the version."""
+    print("1.0")
+'''
+
+
+def complete(cli: ClickGroup, args: list[str], incomplete: str) -> list[str]:
+    """Return the completions of the arguments."""
+    completion = ShellComplete(cli, {}, "cli", "_CLI_COMPLETE")
+    return [item.value for item in completion.get_completions(args, incomplete)]
+
+
+@pytest.fixture(name="module")
+def fixture_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Write a module of commands that is not imported yet."""
+    path = tmp_path / "src" / f"{MODULE}.py"
+    path.parent.mkdir()
+    path.write_text(textwrap.dedent(SOURCE))
+    monkeypatch.syspath_prepend(str(path.parent))
+    yield path
+    sys.modules.pop(MODULE, None)
+
+
+@pytest.fixture(name="make_cli")
+def fixture_make_cli(
+    module: Path, tmp_path: Path
+) -> Iterator[Callable[[], ClickGroup]]:
+    """Create groups with lazy commands answered from a manifest."""
+
+    def make_cli() -> ClickGroup:
+        @group()
+        def cli() -> None:
+            """Root group."""
+
+        cli.lazy_command("deploy", f"{MODULE}:deploy", aliases="d")
+        cli.lazy_group("tools", f"{MODULE}:tools", help="Tools.")
+        return cli.use_manifest(tmp_path / "cache")
+
+    yield make_cli
+
+
+@pytest.fixture(name="cli")
+def fixture_cli(make_cli: Callable[[], ClickGroup]) -> ClickGroup:
+    """Create a group whose manifest was written by an earlier process."""
+    manifest = make_cli().manifest
+    assert manifest is not None
+    manifest.get()
+    sys.modules.pop(MODULE, None)
+    return make_cli()
+
+
+class TestManifest:
+    """Test help and completion are answered without importing."""
+
+    def test_group_help(self, cli: ClickGroup, cli_runner: CliRunner) -> None:
+        """Test the command list uses help from the manifest."""
+        result = cli_runner.invoke(cli, ["--help"])
+
+        assert result.exit_code == 0, result.output
+        assert "deploy (d)  Deploy a target." in result.output
+        assert "tools       Tools." in result.output
+        assert MODULE not in sys.modules
+
+    def test_command_help(self, cli: ClickGroup, cli_runner: CliRunner) -> None:
+        """Test the help of a lazy command is shown from the manifest."""
+        result = cli_runner.invoke(cli, ["d", "--help"])
+
+        assert result.exit_code == 0, result.output
+        assert "Usage: cli d [OPTIONS] TARGET" in result.output
+        assert "Deploy a target." in result.output
+        assert "--env TEXT" in result.output
+        assert "-f, --force" in result.output
+        assert MODULE not in sys.modules
+
+    def test_help_matches(
+        self,
+        make_cli: Callable[[], ClickGroup],
+        cli: ClickGroup,
+        cli_runner: CliRunner,
+    ) -> None:
+        """Test help from the manifest matches the help of the commands."""
+        args_list = [["deploy", "--help"], ["tools", "--help"], ["tools", "v", "-h"]]
+        cached = [cli_runner.invoke(cli, args).output for args in args_list]
+        assert MODULE not in sys.modules
+
+        loaded = make_cli()
+        loaded.manifest = None
+        assert cached == [cli_runner.invoke(loaded, args).output for args in args_list]
+
+    def test_subcommand_help(self, cli: ClickGroup, cli_runner: CliRunner) -> None:
+        """Test the help of a subcommand of a lazy group is shown."""
+        result = cli_runner.invoke(cli, ["tools", "v", "--help"])
+
+        assert result.exit_code == 0, result.output
+        assert "Only the number." in result.output
+        assert MODULE not in sys.modules
+
+    def test_completion(self, cli: ClickGroup) -> None:
+        """Test completion uses the flags and choices from the manifest."""
+        assert complete(cli, ["deploy"], "--f") == ["--force"]
+        assert complete(cli, ["deploy", "--env"], "") == ["dev", "prod"]
+        assert complete(cli, ["tools"], "") == ["v", "version"]
+        assert MODULE not in sys.modules
+
+    def test_invoke_loads(self, cli: ClickGroup, cli_runner: CliRunner) -> None:
+        """Test invoking a lazy command runs the real command."""
+        result = cli_runner.invoke(cli, ["d", "web", "--env", "prod"])
+
+        assert result.exit_code == 0, result.output
+        assert result.output == "Deploying web to prod\n"
+        assert MODULE in sys.modules
+
+    def test_invoke_validates(self, cli: ClickGroup, cli_runner: CliRunner) -> None:
+        """Test invalid values are reported by the real command."""
+        result = cli_runner.invoke(cli, ["deploy", "web", "--env", "qa"])
+
+        assert result.exit_code != 0
+        assert "qa" in result.output
+
+    def test_stand_in(self, cli: ClickGroup) -> None:
+        """Test unloaded lazy commands are stand-ins from the manifest."""
+        ctx = click.Context(cli)
+        assert isinstance(cli.get_command(ctx, "deploy"), ManifestCommand)
+
+    def test_tags(self, cli: ClickGroup) -> None:
+        """Test the tags of parents are recorded."""
+        assert cli.manifest is not None
+        info = cli.manifest.lookup("deploy")
+
+        assert info is not None
+        assert info["tags"] == {"remote": ["env"]}
+
+
+class TestManifestFreshness:
+    """Test stale manifests are rebuilt."""
+
+    def test_written(self, cli: ClickGroup) -> None:
+        """Test the manifest records the sources of the commands."""
+        assert cli.manifest is not None
+        data = json.loads(cli.manifest.path.read_text())
+
+        assert any(path.endswith(f"{MODULE}.py") for path in data["sources"])
+        assert is_fresh(data["sources"])
+
+    def test_touched_source_is_fresh(self, cli: ClickGroup, module: Path) -> None:
+        """Test a source with a new time but the same content is fresh."""
+        os.utime(module, ns=(0, 0))
+
+        assert cli.manifest is not None
+        assert cli.manifest.load() is not None
+
+    def test_changed_source_rebuilds(
+        self, cli: ClickGroup, module: Path, cli_runner: CliRunner
+    ) -> None:
+        """Test a changed source rebuilds the manifest."""
+        module.write_text(module.read_text().replace("Deploy a target", "Ship it"))
+        assert cli.manifest is not None
+        assert cli.manifest.load() is None
+
+        result = cli_runner.invoke(cli, ["--help"])
+
+        assert "deploy (d)  Ship it." in result.output
+        assert cli.manifest.load() is not None
+
+    def test_unwritable_cache(
+        self, module: Path, tmp_path: Path, cli_runner: CliRunner
+    ) -> None:
+        """Test the manifest is built in memory if it can not be written."""
+        (tmp_path / "file").write_text("")
+
+        @group()
+        def cli() -> None:
+            """Root group."""
+
+        cli.lazy_command("deploy", f"{MODULE}:deploy").use_manifest(
+            tmp_path / "file" / "cache"
+        )
+        result = cli_runner.invoke(cli, ["--help"])
+
+        assert result.exit_code == 0, result.output
+        assert "Deploy a target." in result.output
+        assert module.exists()
+
+    def test_default_cache_dir(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the default cache directory follows the environment."""
+        monkeypatch.setenv("CLICK_EXTENDED_CACHE_DIR", "/tmp/a")
+        assert default_cache_dir() == Path("/tmp/a")
+
+        monkeypatch.delenv("CLICK_EXTENDED_CACHE_DIR")
+        monkeypatch.setenv("XDG_CACHE_HOME", "/tmp/b")
+        assert default_cache_dir() == Path("/tmp/b/click-extended")
+
+    def test_manifest_path_is_stable(self, tmp_path: Path) -> None:
+        """Test the manifest of a group is stored under the same name."""
+
+        @group()
+        def cli() -> None:
+            """Root group."""
+
+        assert Manifest(cli, tmp_path).path == Manifest(cli, tmp_path).path
+        assert Manifest(cli, tmp_path).path.parent == tmp_path
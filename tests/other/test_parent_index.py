@@ -0,0 +1,125 @@
+"""Tests for the ParentIndex class."""
+
+from typing import Any
+
+import click
+from click.testing import CliRunner
+
+from click_extended.core.decorators.argument import Argument, argument
+from click_extended.core.decorators.command import command
+from click_extended.core.decorators.env import Env
+from click_extended.core.decorators.option import Option, option
+from click_extended.core.nodes.child_node import ChildNode
+from click_extended.core.nodes.parent_node import ParentNode
+from click_extended.core.other._parent_index import ParentIndex
+from click_extended.core.other.context import Context
+
+
+def make_parents() -> dict[str, ParentNode]:
+    """Create parents of every kind with overlapping tags."""
+    return {
+        "src": Argument(name="src", tags="io"),
+        "verbose": Option(name="verbose", tags=["flags", "io"]),
+        "quiet": Option(name="quiet", tags="flags"),
+        "home": Env(name="home", env_name="HOME"),
+    }
+
+
+class TestParentIndex:
+    """Test ParentIndex lookups."""
+
+    def test_tagged(self) -> None:
+        """Test tags map to their parents in registration order."""
+        parents = make_parents()
+        index = ParentIndex(parents)
+
+        assert index.tagged() == {
+            "io": [parents["src"], parents["verbose"]],
+            "flags": [parents["verbose"], parents["quiet"]],
+        }
+        assert index.tagged_with("flags") == [parents["verbose"], parents["quiet"]]
+        assert index.tagged_with("unknown") == []
+
+    def test_tagged_returns_copies(self) -> None:
+        """Test callers cannot modify the index through the results."""
+        index = ParentIndex(make_parents())
+
+        index.tagged_with("io").clear()
+        index.tagged()["io"].clear()
+
+        assert len(index.tagged_with("io")) == 2
+
+    def test_provided_and_missing(self) -> None:
+        """Test parents are split by kind and whether they were provided."""
+        parents = make_parents()
+        parents["verbose"].was_provided = True
+        parents["home"].was_provided = True
+        index = ParentIndex(parents)
+
+        assert index.provided() == [parents["verbose"], parents["home"]]
+        assert index.provided("option") == [parents["verbose"]]
+        assert index.provided("argument") == []
+        assert index.missing("option") == [parents["quiet"]]
+        assert index.missing("argument") == [parents["src"]]
+        assert index.missing("env") == []
+
+    def test_reset_provided(self) -> None:
+        """Test provided parents are recomputed after a reset."""
+        parents = make_parents()
+        index = ParentIndex(parents)
+        assert index.provided() == []
+
+        parents["quiet"].was_provided = True
+        assert index.provided() == []
+
+        index.reset_provided()
+        assert index.provided() == [parents["quiet"]]
+
+    def test_context_uses_index(self) -> None:
+        """Test Context query methods read from the index."""
+        parents = make_parents()
+        parents["src"].was_provided = True
+        parents["src"].raw_value = "a.txt"
+        context = Context(
+            root=None,  # type: ignore[arg-type]
+            current=None,
+            parent=None,
+            click_context=click.Context(click.Command("cmd")),
+            nodes={},
+            parents=parents,
+            tags={},
+            children={},
+            data={},
+            index=ParentIndex(parents),
+        )
+
+        assert context.get_tagged("io") == [parents["src"], parents["verbose"]]
+        assert context.get_provided_arguments() == [parents["src"]]
+        assert context.get_missing_options() == [
+            parents["verbose"],
+            parents["quiet"],
+        ]
+        assert context.get_missing_envs() == [parents["home"]]
+        assert context.get_provided_values() == {"src": "a.txt"}
+
+
+def test_provided_per_invocation(cli_runner: CliRunner) -> None:
+    """Test provided parents are tracked per invocation."""
+    seen: list[list[str]] = []
+
+    class Record(ChildNode):
+        def handle_all(self, value: Any, context: Context) -> Any:
+            seen.append([p.name for p in context.get_provided_options()])
+            return value
+
+    @command()
+    @argument("src")
+    @Record.as_decorator()
+    @option("name", default="x")
+    @option("count", type=int, default=1)
+    def cmd(src: str, name: str, count: int) -> None:
+        click.echo("ok")
+
+    assert cli_runner.invoke(cmd, ["a", "--name", "y"]).exit_code == 0
+    assert cli_runner.invoke(cmd, ["a", "--count", "3"]).exit_code == 0
+    assert seen == [["name"], ["count"]]
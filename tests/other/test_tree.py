@@ -7,6 +7,7 @@ import pytest
 
 from click_extended.core.decorators.argument import argument
 from click_extended.core.decorators.command import Command, command
+from click_extended.core.decorators.env import env
 from click_extended.core.decorators.group import group
 from click_extended.core.decorators.option import option
 from click_extended.core.decorators.tag import Tag, tag
@@ -375,6 +376,44 @@ class TestTreeContextInitialization:
 
         assert ctx.meta["click_extended"]["data"] == {}
 
+    def test_get_node_index(self) -> None:
+        """Test get_node_index() merges all nodes and caches the index."""
+
+        root = Command(name="test_cmd")
+        parent = ConcreteParentNode(name="parent")
+        child = ConcreteChildNode(name="child")
+        tag = Tag(name="tag")
+        meta: dict[str, Any] = {
+            "root_node": root,
+            "parents": {"parent": parent},
+            "tags": {"tag": tag},
+            "children": {"child": child},
+        }
+
+        nodes = Tree.get_node_index(meta)
+
+        assert nodes == {
+            "parent": parent,
+            "tag": tag,
+            "child": child,
+            "test_cmd": root,
+        }
+        assert Tree.get_node_index(meta) is nodes
+
+    def test_get_node_index_per_invocation(self) -> None:
+        """Test initialize_context() starts a new index per invocation."""
+
+        root = Command(name="test_cmd")
+        ctx = click.Context(click.Command("test"))
+
+        Tree.initialize_context(ctx, root)
+        first = Tree.get_node_index(ctx.meta["click_extended"])
+        Tree.initialize_context(ctx, root)
+        second = Tree.get_node_index(ctx.meta["click_extended"])
+
+        assert first == second == {"test_cmd": root}
+        assert first is not second
+
 
 class TestTreeScopeManagement:
     """Test Phase 4: Scope tracking."""
@@ -1308,3 +1347,105 @@ class TestTreeIntegration:
         assert "Name: TEST" in result.output
 
         assert process.root.tree.is_validated is True  # type: ignore
+
+
+class TestTreeExecutionPlan:
+    """Test the execution plan built with the tree."""
+
+    def test_plan_is_built_once(self, cli_runner: Any) -> None:
+        """Test every invocation shares the plan and its node dictionaries."""
+
+        seen: list[dict[str, Any]] = []
+
+        @command()
+        @option("value", default="a")
+        def cmd(value: str) -> None:
+            seen.append(click.get_current_context().meta["click_extended"])
+
+        assert cmd.root.tree.plan is None  # type: ignore
+
+        assert cli_runner.invoke(cmd, ["--value", "b"]).exit_code == 0
+        plan = cmd.root.tree.plan  # type: ignore
+        assert plan is not None
+
+        assert cli_runner.invoke(cmd, []).exit_code == 0
+        assert cmd.root.tree.plan is plan  # type: ignore
+
+        for meta in seen:
+            assert meta["parents"] is plan.parents
+            assert meta["children"] is plan.children
+            assert meta["nodes"] is plan.nodes
+
+    def test_plan_contents(self, cli_runner: Any) -> None:
+        """Test the plan records the parents by kind and the node index."""
+
+        @command()
+        @argument("src")
+        @ConcreteChildNode.as_decorator()
+        @env("HOME", name="home")
+        @option("upper", is_flag=True)
+        @tag("group")
+        def cmd(src: str, home: str, upper: bool) -> None:
+            pass
+
+        assert cli_runner.invoke(cmd, ["x"]).exit_code == 0
+        plan = cmd.root.tree.plan  # type: ignore
+        assert plan is not None
+
+        assert [(name, from_argv) for name, _, from_argv in plan.loads] == [
+            ("src", True),
+            ("home", False),
+            ("upper", True),
+        ]
+        assert [node.name for node in plan.envs] == ["home"]
+        assert set(plan.nodes) == {"src", "home", "upper", "group", "cmd"} | set(
+            plan.children
+        )
+        assert plan.is_async is False
+
+    def test_plan_detects_async_handlers(self, cli_runner: Any) -> None:
+        """Test the plan runs invocations with async handlers on the loop."""
+
+        class AsyncUpper(ChildNode):
+            async def handle_str(self, value: str, context: Context) -> str:
+                return value.upper()
+
+        @command()
+        @option("name", default="x")
+        @AsyncUpper.as_decorator()
+        def cmd(name: str) -> None:
+            click.echo(name)
+
+        result = cli_runner.invoke(cmd, ["--name", "abc"])
+        assert result.exit_code == 0
+        assert "ABC" in result.output
+        assert cmd.root.tree.plan.is_async is True  # type: ignore
+
+    def test_plan_is_rebuilt_when_handlers_change(self, cli_runner: Any) -> None:
+        """Test assigning a handler method invalidates the plan."""
+
+        class Upper(ChildNode):
+            def handle_str(self, value: str, context: Context) -> str:
+                return value.upper()
+
+        @command()
+        @option("name", default="x")
+        @Upper.as_decorator()
+        def cmd(name: str) -> None:
+            click.echo(name)
+
+        assert cli_runner.invoke(cmd, ["--name", "abc"]).exit_code == 0
+        plan = cmd.root.tree.plan  # type: ignore
+        assert plan is not None
+        assert plan.is_async is False
+
+        async def handle_str(self: Any, value: str, context: Context) -> str:
+            return value.lower()
+
+        Upper.handle_str = handle_str  # type: ignore
+
+        result = cli_runner.invoke(cmd, ["--name", "ABC"])
+        assert result.exit_code == 0
+        assert "abc" in result.output
+        assert cmd.root.tree.plan is not plan  # type: ignore
+        assert cmd.root.tree.plan.is_async is True  # type: ignore
@@ -1,27 +1,38 @@
 """Tests for dispatch utilities."""
 
 import asyncio
+import os
+from collections.abc import Iterator
 from datetime import date, datetime, time
 from decimal import Decimal
+from enum import Enum, IntEnum
 from pathlib import Path
-from typing import Any
-from unittest.mock import Mock
+from typing import Any, get_type_hints
+from unittest.mock import Mock, patch
 from uuid import UUID
 
 import pytest
 
 from click_extended.core.nodes.child_node import ChildNode
-from click_extended.errors import InvalidHandlerError, ProcessError, UnhandledTypeError
+from click_extended.errors import (
+    BatchItemError,
+    InvalidHandlerError,
+    ProcessError,
+    UnhandledTypeError,
+)
+from click_extended.utils import dispatch
+from click_extended.utils.dispatch import _compile_validator  # type: ignore
 from click_extended.utils.dispatch import _determine_handler  # type: ignore
 from click_extended.utils.dispatch import _extract_inner_types  # type: ignore
+from click_extended.utils.dispatch import _get_dispatch_table  # type: ignore
 from click_extended.utils.dispatch import _get_implemented_handlers  # type: ignore
 from click_extended.utils.dispatch import _is_handler_implemented  # type: ignore
 from click_extended.utils.dispatch import _should_call_handler  # type: ignore
-from click_extended.utils.dispatch import _validate_handler_type  # type: ignore
 from click_extended.utils.dispatch import (
     dispatch_to_child,
     dispatch_to_child_async,
     has_async_handlers,
+    register_handler,
 )
 
 
@@ -77,65 +88,87 @@ class TestExtractInnerTypes:
         assert _extract_inner_types(outer) == {int}
 
 
+def validate(handler_name: str, value: Any, type_hint: Any) -> str | None:
+    """Validate a value with the compiled validator of a handler hint."""
+    validator = _compile_validator(handler_name, type_hint)
+    return None if validator is None else validator(value)
+
+
 class TestValidateHandlerType:
-    """Test _validate_handler_type function."""
+    """Test the messages of compiled handler validators."""
 
     def test_any_type_always_valid(self) -> None:
         """Test that Any type always validates."""
-        from typing import Any
-
-        is_valid, msg = _validate_handler_type("handle_all", 123, Any)
-        assert is_valid
-        assert msg == ""
+        msg = validate("handle_all", 123, Any)
+        assert msg is None
 
     def test_handle_int_with_correct_type(self) -> None:
         """Test handle_int with correct int type."""
-        is_valid, msg = _validate_handler_type("handle_int", 42, int)
-        assert is_valid
-        assert msg == ""
+        msg = validate("handle_int", 42, int)
+        assert msg is None
 
     def test_handle_int_with_wrong_type(self) -> None:
         """Test handle_int with wrong type."""
-        is_valid, msg = _validate_handler_type("handle_int", "hello", int)
-        assert not is_valid
+        msg = validate("handle_int", "hello", int)
+        assert msg is not None
         assert "Expected int, got str" in msg
 
     def test_handle_int_string_to_int_suggestion(self) -> None:
         """Test suggestion when string is provided but int expected."""
-        is_valid, msg = _validate_handler_type("handle_int", "123", int)
-        assert not is_valid
+        msg = validate("handle_int", "123", int)
+        assert msg is not None
         assert "type=int" in msg
 
     def test_handle_string_int_to_string_suggestion(self) -> None:
         """Test suggestion when int is provided but str expected."""
-        is_valid, msg = _validate_handler_type("handle_str", 123, str)
-        assert not is_valid
+        msg = validate("handle_str", 123, str)
+        assert msg is not None
         assert "str" in msg
 
     def test_handle_tuple_accepts_any_tuple(self) -> None:
         """Test handle_tuple accepts any tuple."""
-        is_valid, msg = _validate_handler_type("handle_tuple", (1, "a", [2]), tuple)
-        assert is_valid
-        assert msg == ""
+        msg = validate("handle_tuple", (1, "a", [2]), tuple)
+        assert msg is None
 
     def test_handle_list_not_list(self) -> None:
         """Test handle_list with non-list value."""
-        is_valid, msg = _validate_handler_type("handle_list", (1, 2), list[int])
-        assert not is_valid
+        msg = validate("handle_list", (1, 2), list[int])
+        assert msg is not None
         assert "Expected list, got tuple" in msg
 
     def test_handle_list_wrong_inner_type(self) -> None:
         """Test handle_list with wrong inner types."""
-        is_valid, msg = _validate_handler_type("handle_list", ["a", "b"], list[int])
-        assert not is_valid
+        msg = validate("handle_list", ["a", "b"], list[int])
+        assert msg is not None
         assert "Expected list[int]" in msg
 
     def test_handle_dict_not_dict(self) -> None:
         """Test handle_dict with non-dict value."""
-        is_valid, msg = _validate_handler_type("handle_dict", [1, 2], dict)
-        assert not is_valid
+        msg = validate("handle_dict", [1, 2], dict)
+        assert msg is not None
         assert "Expected dict, got list" in msg
 
+    def test_handle_numeric_with_string(self) -> None:
+        """Test handle_numeric with a string."""
+        msg = validate("handle_numeric", "1", int | float)
+        assert msg is not None
+        assert "Expected int or float, got str" in msg
+
+
+class TestCompileValidator:
+    """Test _compile_validator function."""
+
+    def test_any_compiles_to_none(self) -> None:
+        """Test that an Any hint needs no validator."""
+        assert _compile_validator("handle_all", Any) is None
+
+    def test_matching_hint_skips_redundant_checks(self) -> None:
+        """Test that a single check is compiled for a plain matching hint."""
+        validator = _compile_validator("handle_int", int)
+        assert validator is not None
+        assert validator(42) is None
+        assert validator([1]) == "Expected int, got list."
+
 
 class MockChildNode(ChildNode):
     """Mock child node for testing."""
@@ -776,3 +809,582 @@ class TestDispatchToChildAsync:
             await dispatch_to_child_async(child, 123, context)
 
         assert "Type mismatch" in str(exc_info.value)
+
+
+class TestDispatchTable:
+    """Test the compiled per-class dispatch table."""
+
+    def _make_context(self) -> Mock:
+        context = Mock()
+        context.is_tag.return_value = False
+        context.click_context = Mock()
+        context.click_context.meta = {"click_extended": {}}
+        return context
+
+    def test_table_is_reused_across_calls(self) -> None:
+        """Test that the table is built once per class."""
+
+        class CustomChild(MockChildNode):
+            def handle_int(self, value: int, context: Any) -> int:
+                return value * 2
+
+        context = self._make_context()
+        dispatch_to_child(CustomChild(), 1, context)
+        table = _get_dispatch_table(CustomChild())
+        dispatch_to_child(CustomChild(), 2, context)
+
+        assert _get_dispatch_table(CustomChild()) is table
+        assert table.by_type[int] == "handle_int"
+
+    def test_type_hints_resolved_once(self) -> None:
+        """Test that handler type hints are not resolved per value."""
+
+        class CustomChild(MockChildNode):
+            def handle_int(self, value: int, context: Any) -> int:
+                return value * 2
+
+        child = CustomChild()
+        context = self._make_context()
+
+        with patch(
+            "click_extended.utils.dispatch.get_type_hints",
+            wraps=get_type_hints,
+        ) as mock_hints:
+            for i in range(100):
+                assert dispatch_to_child(child, i, context) == i * 2
+
+        assert mock_hints.call_count == 1
+
+    def test_subclasses_have_own_tables(self) -> None:
+        """Test that subclasses do not share the table of their base."""
+
+        class BaseChild(MockChildNode):
+            def handle_all(self, value: Any, context: Any) -> str:
+                return "base"
+
+        class SubChild(BaseChild):
+            def handle_str(self, value: str, context: Any) -> str:
+                return "sub"
+
+        context = self._make_context()
+
+        assert dispatch_to_child(BaseChild(), "x", context) == "base"
+        assert dispatch_to_child(SubChild(), "x", context) == "sub"
+        assert _get_dispatch_table(BaseChild()) is not _get_dispatch_table(SubChild())
+
+    def test_monkeypatched_handler_invalidates_table(self) -> None:
+        """Test that assigning a handler after first use is picked up."""
+
+        class CustomChild(MockChildNode):
+            def handle_all(self, value: Any, context: Any) -> str:
+                return "all"
+
+        child = CustomChild()
+        context = self._make_context()
+        assert dispatch_to_child(child, "x", context) == "all"
+
+        def handle_str(self: Any, value: str, context: Any) -> str:
+            return "str"
+
+        setattr(CustomChild, "handle_str", handle_str)
+        assert dispatch_to_child(child, "x", context) == "str"
+
+        delattr(CustomChild, "handle_str")
+        assert dispatch_to_child(child, "x", context) == "all"
+
+    def test_patched_base_handler_invalidates_subclass_table(self) -> None:
+        """Test that patching a base class invalidates subclass tables."""
+
+        class BaseChild(MockChildNode):
+            def handle_int(self, value: int, context: Any) -> int:
+                return value + 1
+
+        class SubChild(BaseChild):
+            pass
+
+        child = SubChild()
+        context = self._make_context()
+        assert dispatch_to_child(child, 1, context) == 2
+
+        def handle_int(self: Any, value: int, context: Any) -> int:
+            return value + 10
+
+        with patch.object(BaseChild, "handle_int", handle_int):
+            assert dispatch_to_child(child, 1, context) == 11
+
+        assert dispatch_to_child(child, 1, context) == 2
+
+    @pytest.mark.asyncio
+    async def test_instance_handler_is_called(self) -> None:
+        """Test that a handler assigned on an instance replaces the method."""
+
+        class CustomChild(MockChildNode):
+            def handle_int(self, value: int, context: Any) -> int:
+                return value + 1
+
+        child = CustomChild()
+        other = CustomChild()
+        setattr(child, "handle_int", lambda value, context: value + 10)
+        context = self._make_context()
+
+        assert dispatch_to_child(child, 1, context) == 11
+        assert dispatch_to_child(other, 1, context) == 2
+        assert await dispatch_to_child_async(child, 1, context) == 11
+
+        context.click_context.meta["click_extended"]["is_container_tuple"] = True
+        assert dispatch_to_child(child, (1, 2), context) == (11, 12)
+
+    def test_container_tuple_uses_table(self) -> None:
+        """Test that container tuple elements use the cached handlers."""
+
+        class CustomChild(MockChildNode):
+            def handle_int(self, value: int, context: Any) -> int:
+                return value * 2
+
+        child = CustomChild()
+        context = self._make_context()
+        context.click_context.meta["click_extended"]["is_container_tuple"] = True
+
+        with patch(
+            "click_extended.utils.dispatch.get_type_hints",
+            wraps=get_type_hints,
+        ) as mock_hints:
+            result = dispatch_to_child(child, (1, (2, 3)), context)
+
+        assert result == (2, (4, 6))
+        assert mock_hints.call_count == 0
+
+    def test_validator_compiled_once(self) -> None:
+        """Test that the value hint is compiled once per handler."""
+
+        class CustomChild(MockChildNode):
+            def handle_int(self, value: int, context: Any) -> int:
+                return value
+
+        child = CustomChild()
+        context = self._make_context()
+
+        with patch(
+            "click_extended.utils.dispatch._compile_validator",
+            wraps=_compile_validator,
+        ) as mock_compile:
+            for i in range(10):
+                dispatch_to_child(child, i, context)
+
+        assert mock_compile.call_count == 1
+
+
+class TestStrictTypes:
+    """Test the strict_types flag in the dispatch functions."""
+
+    def _make_context(self, strict_types: bool) -> Mock:
+        context = Mock()
+        context.is_tag.return_value = False
+        context.click_context = Mock()
+        context.click_context.meta = {"click_extended": {"strict_types": strict_types}}
+        return context
+
+    def test_strict_types_raises_on_mismatch(self) -> None:
+        """Test that mismatched values raise when strict."""
+
+        class CustomChild(MockChildNode):
+            def handle_str(self, value: int, context: Any) -> Any:
+                return value
+
+        with pytest.raises(ProcessError, match="Type mismatch in handle_str"):
+            dispatch_to_child(CustomChild(), "x", self._make_context(True))
+
+    def test_non_strict_skips_check(self) -> None:
+        """Test that mismatched values pass through when not strict."""
+
+        class CustomChild(MockChildNode):
+            def handle_str(self, value: int, context: Any) -> Any:
+                return value
+
+        context = self._make_context(False)
+        assert dispatch_to_child(CustomChild(), "x", context) == "x"
+
+    @pytest.mark.asyncio
+    async def test_non_strict_skips_check_async(self) -> None:
+        """Test that the async dispatcher honors the flag."""
+
+        class CustomChild(MockChildNode):
+            async def handle_str(self, value: int, context: Any) -> Any:
+                return value
+
+        context = self._make_context(False)
+        result = await dispatch_to_child_async(CustomChild(), "x", context)
+        assert result == "x"
+
+
+@pytest.fixture
+def restore_registry() -> Iterator[None]:
+    """Restore the handler registry after a test registers handlers."""
+    registry = dispatch._REGISTRY
+    types = dict(registry.types)
+    specific_names = registry.specific_names
+    all_names = registry.all_names
+    yield
+    registry.types.clear()
+    registry.types.update(types)
+    registry.specific_names = specific_names
+    registry.all_names = all_names
+    registry.resolved.clear()
+
+
+class Color(Enum):
+    """Enum used to test registered handlers."""
+
+    RED = "red"
+
+
+class Level(IntEnum):
+    """Int enum used to test registered handlers."""
+
+    LOW = 1
+
+
+@pytest.mark.usefixtures("restore_registry")
+class TestRegisterHandler:
+    """Test registering handlers for new value types."""
+
+    def _make_context(self) -> Mock:
+        context = Mock()
+        context.is_tag.return_value = False
+        context.click_context = Mock()
+        context.click_context.meta = {"click_extended": {}}
+        return context
+
+    def test_registered_handler_is_used(self) -> None:
+        """Test that a registered handler receives values of the type."""
+
+        class EnumChild(MockChildNode):
+            def handle_enum(self, value: Enum, context: Any) -> str:
+                return value.name
+
+            def handle_all(self, value: Any, context: Any) -> str:
+                return "all"
+
+        child = EnumChild()
+        context = self._make_context()
+        assert dispatch_to_child(child, Color.RED, context) == "all"
+
+        register_handler(Enum, "handle_enum")
+
+        assert dispatch_to_child(child, Color.RED, context) == "RED"
+        assert "enum" in _get_implemented_handlers(child)
+
+    def test_builtin_lists_are_unchanged(self) -> None:
+        """Test registered names are kept in the registry."""
+        specific_names = list(dispatch.TYPE_SPECIFIC_HANDLERS)
+        all_names = list(dispatch.ALL_HANDLER_NAMES)
+
+        register_handler(Enum, "handle_enum")
+
+        assert dispatch.TYPE_SPECIFIC_HANDLERS == specific_names
+        assert dispatch.ALL_HANDLER_NAMES == all_names
+        assert "handle_enum" in dispatch._REGISTRY.specific_names
+        assert dispatch._REGISTRY.all_names[-1] == "handle_tag"
+
+    def test_tuples_skip_handle_all(self) -> None:
+        """Test tuples are not routed to handle_all by the registry."""
+        slot = dispatch._REGISTRY.find(tuple)
+
+        assert slot is not None
+        assert slot.handler_names == ("handle_tuple",)
+        assert not slot.use_handle_all
+
+    def test_most_specific_type_wins(self) -> None:
+        """Test that the type's method resolution order decides."""
+
+        class EnumChild(MockChildNode):
+            def handle_enum(self, value: Enum, context: Any) -> str:
+                return "enum"
+
+            def handle_int(self, value: int, context: Any) -> str:
+                return "int"
+
+        register_handler(Enum, "handle_enum")
+        context = self._make_context()
+
+        assert dispatch_to_child(EnumChild(), Level.LOW, context) == "int"
+
+        register_handler(IntEnum, "handle_enum")
+
+        assert dispatch_to_child(EnumChild(), Level.LOW, context) == "enum"
+
+    def test_fallbacks(self) -> None:
+        """Test that fallback handlers are tried in order."""
+
+        class FallbackChild(MockChildNode):
+            def handle_str(self, value: Any, context: Any) -> str:
+                return "str"
+
+            def handle_all(self, value: Any, context: Any) -> str:
+                return "all"
+
+        register_handler(Enum, "handle_enum", fallbacks=("handle_str",))
+        context = self._make_context()
+        assert dispatch_to_child(FallbackChild(), Color.RED, context) == "str"
+
+        register_handler(Enum, "handle_enum", fallbacks=("handle_bool",))
+        assert dispatch_to_child(FallbackChild(), Color.RED, context) == "all"
+
+    def test_virtual_subclasses_are_matched(self) -> None:
+        """Test that abstract base classes match virtual subclasses."""
+
+        class PathLikeValue:
+            def __fspath__(self) -> str:
+                return "value"
+
+        class PathLikeChild(MockChildNode):
+            def handle_pathlike(self, value: Any, context: Any) -> Any:
+                return os.fspath(value)
+
+        register_handler(os.PathLike, "handle_pathlike")
+        context = self._make_context()
+
+        assert dispatch_to_child(PathLikeChild(), PathLikeValue(), context) == "value"
+
+    def test_invalid_registrations(self) -> None:
+        """Test that invalid registrations are rejected."""
+        with pytest.raises(ValueError, match="must start with 'handle_'"):
+            register_handler(Enum, "enum")
+
+        with pytest.raises(TypeError, match="Expected a class"):
+            register_handler(list[int], "handle_list")  # type: ignore[arg-type]
+
+
+class TestHandleBatch:
+    """Test dispatching container tuples to handle_batch."""
+
+    def _make_context(self) -> Mock:
+        context = Mock()
+        context.is_tag.return_value = False
+        context.click_context = Mock()
+        context.click_context.meta = {"click_extended": {"is_container_tuple": True}}
+        return context
+
+    def test_batch_preferred_for_container(self) -> None:
+        """Test that handle_batch receives the whole container once."""
+        calls: list[tuple[Any, ...]] = []
+
+        class BatchChild(MockChildNode):
+            def handle_int(self, value: int, context: Any) -> int:
+                raise AssertionError("element handler should not be called")
+
+            def handle_batch(
+                self, values: tuple[Any, ...], context: Any
+            ) -> tuple[Any, ...]:
+                calls.append(values)
+                return tuple(value * 2 for value in values)
+
+        result = dispatch_to_child(BatchChild(), (1, 2, 3), self._make_context())
+
+        assert result == (2, 4, 6)
+        assert calls == [(1, 2, 3)]
+
+    def test_batch_returning_none_keeps_values(self) -> None:
+        """Test that returning None passes the values through."""
+
+        class BatchChild(MockChildNode):
+            def handle_batch(self, values: tuple[Any, ...], context: Any) -> None:
+                return None
+
+        assert dispatch_to_child(BatchChild(), (1, 2), self._make_context()) == (1, 2)
+
+    def test_nested_tuples_batched_per_level(self) -> None:
+        """Test that each inner tuple is passed separately."""
+        calls: list[tuple[Any, ...]] = []
+
+        class BatchChild(MockChildNode):
+            def handle_batch(
+                self, values: tuple[Any, ...], context: Any
+            ) -> tuple[Any, ...]:
+                calls.append(values)
+                return tuple(-value for value in values)
+
+        result = dispatch_to_child(BatchChild(), ((1, 2), (3, 4)), self._make_context())
+
+        assert result == ((-1, -2), (-3, -4))
+        assert calls == [(1, 2), (3, 4)]
+
+    def test_unhandled_types_use_element_handlers(self) -> None:
+        """Test that values the element handlers reject are not batched."""
+
+        class BatchChild(MockChildNode):
+            def handle_int(self, value: int, context: Any) -> int:
+                return value
+
+            def handle_batch(
+                self, values: tuple[Any, ...], context: Any
+            ) -> tuple[Any, ...]:
+                raise AssertionError("handle_batch should not be called")
+
+        context = self._make_context()
+        with pytest.raises(UnhandledTypeError):
+            dispatch_to_child(BatchChild(), (1, "a"), context)
+
+        with pytest.raises(UnhandledTypeError, match="NoneType"):
+            dispatch_to_child(BatchChild(), (1, None), context)
+
+    def test_batch_error_reports_index(self) -> None:
+        """Test that batch errors report the index set by the batch."""
+
+        class BatchChild(MockChildNode):
+            def __init__(self) -> None:
+                super().__init__()
+                self.calls = 0
+
+            def handle_int(self, value: int, context: Any) -> int:
+                self.calls += 1
+                return value
+
+            def handle_batch(
+                self, values: tuple[Any, ...], context: Any
+            ) -> tuple[Any, ...]:
+                for index, value in enumerate(values):
+                    if value < 0:
+                        raise BatchItemError(index, ValueError("Negative"))
+                return values
+
+        context = self._make_context()
+        child = BatchChild()
+
+        with pytest.raises(ValueError, match=r"Negative at index \[1\]"):
+            dispatch_to_child(child, (1, -1), context)
+
+        with pytest.raises(ValueError, match=r"Negative at index \[1\]\[0\]"):
+            dispatch_to_child(child, ((1,), (-1, 2)), context)
+
+        assert child.calls == 0
+
+    def test_batch_error_without_index(self) -> None:
+        """Test that batch errors without an index are not located."""
+
+        class BatchChild(MockChildNode):
+            def handle_int(self, value: int, context: Any) -> int:
+                raise AssertionError("Element handlers must not run")
+
+            def handle_batch(
+                self, values: tuple[Any, ...], context: Any
+            ) -> tuple[Any, ...]:
+                raise ValueError("Negative")
+
+        context = self._make_context()
+
+        with pytest.raises(ValueError, match="^Negative$"):
+            dispatch_to_child(BatchChild(), (1, -1), context)
+
+        with pytest.raises(ValueError, match=r"^Negative at index \[0\]$"):
+            dispatch_to_child(BatchChild(), ((1,), (-1, 2)), context)
+
+    def test_batch_only_child(self) -> None:
+        """Test that a child without element handlers gets every value."""
+
+        class BatchChild(MockChildNode):
+            def handle_batch(
+                self, values: tuple[Any, ...], context: Any
+            ) -> tuple[Any, ...]:
+                if None in values:
+                    raise ValueError("Missing value")
+                return tuple(str(value) for value in values)
+
+        context = self._make_context()
+        assert dispatch_to_child(BatchChild(), (1, "a"), context) == ("1", "a")
+
+        with pytest.raises(ValueError, match="^Missing value$"):
+            dispatch_to_child(BatchChild(), (1, None), context)
+
+    @pytest.mark.asyncio
+    async def test_async_batch(self) -> None:
+        """Test that async batch handlers are awaited."""
+
+        class BatchChild(MockChildNode):
+            async def handle_batch(
+                self, values: tuple[Any, ...], context: Any
+            ) -> tuple[Any, ...]:
+                await asyncio.sleep(0)
+                if 0 in values:
+                    raise BatchItemError(values.index(0), ValueError("Zero"))
+                return tuple(value + 1 for value in values)
+
+        child = BatchChild()
+        assert has_async_handlers(child)
+
+        result = await dispatch_to_child_async(child, (1, 2), self._make_context())
+        assert result == (2, 3)
+
+        with pytest.raises(ValueError, match=r"Zero at index \[2\]"):
+            await dispatch_to_child_async(child, (1, 2, 0), self._make_context())
+
+
+class TestMaxConcurrency:
+    """Test concurrent processing of container tuples."""
+
+    def _make_context(self) -> Mock:
+        context = Mock()
+        context.is_tag.return_value = False
+        context.click_context = Mock()
+        context.click_context.meta = {"click_extended": {"is_container_tuple": True}}
+        return context
+
+    def _make_child(self, limit: int | None) -> tuple[MockChildNode, list[int]]:
+        peak = [0, 0]
+
+        class SlowChild(MockChildNode):
+            max_concurrency = limit
+
+            async def handle_int(self, value: int, context: Any) -> int:
+                peak[0] += 1
+                peak[1] = max(peak[1], peak[0])
+                await asyncio.sleep(0.01 if value % 2 else 0.001)
+                peak[0] -= 1
+                if value < 0:
+                    raise ValueError(f"Negative {value}")
+                return value * 10
+
+        return SlowChild(), peak
+
+    @pytest.mark.asyncio
+    async def test_sequential_without_limit(self) -> None:
+        """Test that elements are processed one at a time by default."""
+        child, peak = self._make_child(None)
+
+        result = await dispatch_to_child_async(
+            child, (1, 2, 3, 4), self._make_context()
+        )
+
+        assert result == (10, 20, 30, 40)
+        assert peak[1] == 1
+
+    @pytest.mark.asyncio
+    async def test_limit_is_respected_and_order_kept(self) -> None:
+        """Test that at most max_concurrency handlers run at once."""
+        child, peak = self._make_child(3)
+
+        result = await dispatch_to_child_async(
+            child, ((1, 2), (3, 4), (5, 6, 7)), self._make_context()
+        )
+
+        assert result == ((10, 20), (30, 40), (50, 60, 70))
+        assert peak[1] == 3
+
+    @pytest.mark.asyncio
+    async def test_first_error_in_order_is_raised(self) -> None:
+        """Test that errors keep the index of the first failing element."""
+        child, _ = self._make_child(4)
+
+        with pytest.raises(ValueError, match=r"Negative -3 at index \[1\]\[0\]"):
+            await dispatch_to_child_async(
+                child, ((1, 2), (-3, -1)), self._make_context()
+            )
+
+    def test_invalid_limit(self) -> None:
+        """Test that a limit below one is rejected."""
+
+        class InvalidChild(ChildNode):
+            max_concurrency = 0
+
+        with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+            InvalidChild(name="invalid")
@@ -0,0 +1,135 @@
+"""Tests for resolving the exports of packages when first accessed."""
+
+import json
+import subprocess
+import sys
+from decimal import getcontext
+from types import ModuleType
+from unittest.mock import Mock
+
+import pytest
+
+import click_extended
+import click_extended.decorators
+import click_extended.utils
+from click_extended.decorators import convert, transform
+from click_extended.decorators.convert.convert_weight import ConvertWeight
+from click_extended.decorators.transform.slugify import Slugify
+
+
+def loaded_modules(code: str, *modules: str) -> list[str]:
+    """Run code in a new interpreter and return the modules it loaded."""
+    script = (
+        f"import sys\n{code}\n"
+        f"print(__import__('json').dumps([m for m in {list(modules)!r} "
+        "if m in sys.modules]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded: list[str] = json.loads(result.stdout)
+    return loaded
+
+
+class TestImportTime:
+    """Test importing packages does not load unused modules."""
+
+    def test_top_level(self) -> None:
+        """Test importing the package does not load the core modules."""
+        loaded = loaded_modules(
+            "import click_extended",
+            "click_extended.core",
+            "click_extended.decorators",
+            "dotenv",
+        )
+
+        assert not loaded
+
+    def test_decorators(self) -> None:
+        """Test importing the decorators does not load any decorator."""
+        loaded = loaded_modules(
+            "import click_extended.decorators",
+            "click_extended.decorators.check.is_email",
+            "click_extended.decorators.load.load_csv",
+            "click_extended.decorators.transform.slugify",
+            "email_validator",
+            "slugify",
+            "yaml",
+            "zoneinfo",
+        )
+
+        assert not loaded
+
+    def test_commands_skip_optional_features(self) -> None:
+        """Test commands load batch, completion and manifest support on use."""
+        code = (
+            "from click_extended import command, group\n"
+            "command()(lambda: None).main([], standalone_mode=False)\n"
+            "group()(lambda: None)"
+        )
+
+        assert not loaded_modules(
+            code,
+            "click_extended.core.other._batch",
+            "click_extended.core.other._completion",
+            "click_extended.core.other._manifest",
+        )
+
+    def test_dependencies_load_on_first_use(self) -> None:
+        """Test third-party libraries load when a handler first needs them."""
+        code = (
+            "from click_extended.decorators import is_email, slugify, load_yaml\n"
+            "is_email(); slugify(); load_yaml()"
+        )
+        modules = ("email_validator", "slugify", "yaml", "dotenv")
+
+        assert not loaded_modules(code, *modules)
+        assert loaded_modules(
+            code + "\nfrom click_extended.decorators.check.is_email import IsEmail\n"
+            "IsEmail(name='x').handle_str('a@example.com', None)",
+            *modules,
+        ) == ["email_validator"]
+
+    def test_decimal_precision_is_unchanged(self) -> None:
+        """Test importing conversions does not change the decimal precision."""
+        prec = getcontext().prec
+        node = ConvertWeight(name="weight")
+
+        result = node.handle_numeric(
+            1, Mock(), from_unit="kg", to_unit="g", gravity=9.80665
+        )
+
+        assert result == 1000
+        assert getcontext().prec == prec
+
+
+class TestLazyExports:
+    """Test the exports of lazy packages."""
+
+    def test_exports_resolve(self) -> None:
+        """Test every name in __all__ resolves and is listed by dir()."""
+        modules = (
+            click_extended,
+            click_extended.decorators,
+            click_extended.utils,
+            convert,
+        )
+        for module in modules:
+            for name in module.__all__:
+                assert callable(getattr(module, name))
+                assert name in dir(module)
+
+    def test_submodule_does_not_shadow_export(self) -> None:
+        """Test importing a submodule keeps the export of the same name."""
+        assert Slugify.__module__ == "click_extended.decorators.transform.slugify"
+        assert transform.slugify is click_extended.decorators.slugify
+        assert callable(transform.slugify)
+        assert not isinstance(transform.slugify, ModuleType)
+
+    def test_unknown_name(self) -> None:
+        """Test unknown names raise an AttributeError."""
+        with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+            getattr(click_extended.decorators, "missing")
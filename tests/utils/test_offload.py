@@ -0,0 +1,189 @@
+"""Tests for running blocking calls in worker threads."""
+
+import asyncio
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from click_extended.core.decorators.command import command
+from click_extended.core.decorators.option import option
+from click_extended.core.nodes.child_node import ChildNode
+from click_extended.core.nodes.parent_node import ParentNode
+from click_extended.core.other.context import Context
+from click_extended.core.other.settings import Settings
+from click_extended.errors import ProcessError
+from click_extended.utils.offload import create_executor, run_in_executor
+
+VARIABLE: ContextVar[str] = ContextVar("variable", default="unset")
+
+
+class Tracker:
+    """Thread-safe counter of calls running at once."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.threads: set[str] = set()
+
+    def reset(self) -> None:
+        """Forget all recorded calls."""
+        self.active = 0
+        self.peak = 0
+        self.threads.clear()
+
+    def run(self, delay: float) -> None:
+        """Record a blocking call."""
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.threads.add(threading.current_thread().name)
+        time.sleep(delay)
+        with self.lock:
+            self.active -= 1
+
+
+TRACKER = Tracker()
+
+
+class BlockingChild(ChildNode):
+    """Child node with a blocking sync handler."""
+
+    def handle_all(self, value: Any, context: Context, **kwargs: Any) -> Any:
+        TRACKER.run(kwargs.get("delay", 0.05))
+        if kwargs.get("fail"):
+            raise ProcessError("failed")
+        return f"{value}!"
+
+
+class OffloadedChild(BlockingChild):
+    """Child node that always runs in a worker thread."""
+
+    offload = True
+
+
+class BlockingParent(ParentNode):
+    """Parent node with a blocking sync load."""
+
+    independent = True
+
+    def load(self, context: Context, *args: Any, **kwargs: Any) -> Any:
+        TRACKER.run(0.05)
+        return self.name
+
+
+class TestRunInExecutor:
+    """Test run_in_executor function."""
+
+    def test_runs_in_thread(self) -> None:
+        """Test the call runs in another thread with the same context."""
+        click_context = click.Context(click.Command("cmd"))
+
+        def call(prefix: str, suffix: str = "") -> tuple[str, str, Any]:
+            return (
+                prefix + VARIABLE.get() + suffix,
+                threading.current_thread().name,
+                click.get_current_context(silent=True),
+            )
+
+        async def main() -> tuple[str, str, Any]:
+            VARIABLE.set("value")
+            with click_context:
+                result: tuple[str, str, Any] = await run_in_executor(
+                    call, ("<",), {"suffix": ">"}
+                )
+            return result
+
+        text, thread, current = asyncio.run(main())
+        assert text == "<value>"
+        assert thread != threading.current_thread().name
+        assert current is click_context
+
+    def test_create_executor(self) -> None:
+        """Test only thread executors are supported."""
+        executor = create_executor("thread", max_workers=2)
+        try:
+            assert executor.submit(lambda: 1).result() == 1
+        finally:
+            executor.shutdown()
+
+        with pytest.raises(ValueError, match="Unsupported executor"):
+            create_executor("process")  # type: ignore[arg-type]
+
+
+class TestOffloadedCommand:
+    """Test commands that offload blocking calls."""
+
+    def setup_method(self) -> None:
+        """Reset the tracker."""
+        TRACKER.reset()
+
+    def test_executor_overlaps_handlers(self, cli_runner: CliRunner) -> None:
+        """Test sync handlers of different parents run at the same time."""
+
+        @command(settings=Settings(executor="thread", max_workers=4))
+        @option("first", default="a")
+        @BlockingChild.as_decorator()
+        @option("second", default="b")
+        @BlockingChild.as_decorator()
+        def cmd(first: str, second: str) -> None:
+            click.echo(f"{first} {second}")
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code == 0, result.output
+        assert result.output.strip() == "a! b!"
+        assert TRACKER.peak == 2
+        assert all(name.startswith("click-extended") for name in TRACKER.threads)
+
+    def test_executor_overlaps_loads(self, cli_runner: CliRunner) -> None:
+        """Test sync loads of self-sourcing parents run at the same time."""
+
+        @command(settings=Settings(executor="thread"))
+        @BlockingParent.as_decorator(name="first")
+        @BlockingParent.as_decorator(name="second")
+        def cmd(first: str, second: str) -> None:
+            click.echo(f"{first} {second}")
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code == 0, result.output
+        assert result.output.strip() == "first second"
+        assert TRACKER.peak == 2
+
+    def test_offload_attribute(self, cli_runner: CliRunner) -> None:
+        """Test children with offload = True run in worker threads."""
+
+        @command()
+        @option("first", default="a")
+        @OffloadedChild.as_decorator(delay=0.0)
+        def cmd(first: str) -> None:
+            click.echo(first)
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code == 0, result.output
+        assert result.output.strip() == "a!"
+        assert threading.current_thread().name not in TRACKER.threads
+
+    def test_error_in_thread(self, cli_runner: CliRunner) -> None:
+        """Test errors raised in worker threads are reported as usual."""
+
+        @command(settings=Settings(executor="thread"))
+        @option("first", default="a")
+        @BlockingChild.as_decorator(delay=0.0, fail=True)
+        def cmd(first: str) -> None:
+            click.echo("unreachable")
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code != 0
+        assert "ProcessError (first): failed" in result.output
+
+    def test_invalid_settings(self) -> None:
+        """Test unsupported executors and worker counts are rejected."""
+        with pytest.raises(ValueError, match="Unsupported executor"):
+            Settings(executor="process")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="max_workers"):
+            Settings(executor="thread", max_workers=0)
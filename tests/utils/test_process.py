@@ -0,0 +1,399 @@
+"""Tests for child processing utilities."""
+
+import asyncio
+from typing import Any
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from click_extended.core.decorators.argument import Argument
+from click_extended.core.decorators.command import command
+from click_extended.core.decorators.option import option
+from click_extended.core.decorators.tag import Tag, tag
+from click_extended.core.nodes.child_node import ChildNode
+from click_extended.core.nodes.parent_node import ParentNode
+from click_extended.core.other.context import Context
+from click_extended.core.other.settings import Settings
+from click_extended.decorators.math.multiply import multiply
+from click_extended.errors import ProcessError
+from click_extended.utils.process import (
+    ChildPipeline,
+    compile_children,
+    is_independent_load,
+    plan_loads,
+    process_children,
+    process_children_async,
+    run_chains,
+)
+
+
+class UpperChild(ChildNode):
+    """Child node that uppercases strings."""
+
+    def handle_str(self, value: str, context: Context) -> str:
+        return value.upper()
+
+
+class DoubleChild(ChildNode):
+    """Child node that doubles integers."""
+
+    def handle_int(self, value: int, context: Context) -> int:
+        return value * 2
+
+
+class RecordingChild(ChildNode):
+    """Child node that records the context it was called with."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name=name)
+        self.calls: list[tuple[Any, Context]] = []
+
+    def handle_all(self, value: Any, context: Context) -> Any:
+        self.calls.append((value, context))
+        return value
+
+
+class AsyncChild(ChildNode):
+    """Child node with an async handler."""
+
+    async def handle_int(self, value: int, context: Context) -> int:
+        await asyncio.sleep(0)
+        return value + 1
+
+
+def make_click_context() -> click.Context:
+    """Create a Click context with empty click-extended metadata."""
+    click_context = click.Context(click.Command("cmd"))
+    click_context.meta["click_extended"] = {"root_node": None}
+    return click_context
+
+
+class TestCompileChildren:
+    """Test compile_children function."""
+
+    def test_returns_pipeline(self) -> None:
+        """Test that the children are compiled in order."""
+        parent = Tag("parent")
+        first, second = UpperChild(name="first"), UpperChild(name="second")
+        pipeline = compile_children({0: first, 1: second}, parent)
+
+        assert isinstance(pipeline, ChildPipeline)
+        assert pipeline.children == (first, second)
+        assert pipeline.parent is parent
+        assert pipeline.is_async is False
+
+    def test_cached_per_parent(self) -> None:
+        """Test that the pipeline is reused while the children are unchanged."""
+        parent = Tag("parent")
+        children = {0: UpperChild(name="child")}
+
+        assert compile_children(children, parent) is compile_children(children, parent)
+
+    def test_recompiled_when_children_change(self) -> None:
+        """Test that adding a child recompiles the pipeline."""
+        parent = Tag("parent")
+        children: dict[int, ChildNode] = {0: UpperChild(name="child")}
+        pipeline = compile_children(children, parent)
+
+        children[1] = UpperChild(name="other")
+        recompiled = compile_children(children, parent)
+
+        assert recompiled is not pipeline
+        assert len(recompiled.children) == 2
+
+    def test_recompiled_when_handlers_change(self) -> None:
+        """Test that changing a handler recompiles the pipeline."""
+
+        class Child(ChildNode):
+            def handle_int(self, value: int, context: Context) -> int:
+                return value
+
+        parent = Tag("parent")
+        children = {0: Child(name="child")}
+        assert compile_children(children, parent).is_async is False
+
+        async def handle_int(self: Any, value: int, context: Context) -> int:
+            return value
+
+        Child.handle_int = handle_int  # type: ignore
+        assert compile_children(children, parent).is_async is True
+
+    def test_is_async(self) -> None:
+        """Test that async handlers are detected at compile time."""
+        pipeline = compile_children(
+            {0: UpperChild(name="sync"), 1: AsyncChild(name="async")},
+            Tag("parent"),
+        )
+        assert pipeline.is_async is True
+
+
+class TestChildPipeline:
+    """Test running a ChildPipeline."""
+
+    def test_run_chains_values(self) -> None:
+        """Test that each child receives the output of the previous one."""
+        pipeline = compile_children(
+            {0: DoubleChild(name="a"), 1: DoubleChild(name="b")},
+            Tag("parent"),
+        )
+        assert pipeline.run(3, make_click_context()) == 12
+
+    def test_run_without_children(self) -> None:
+        """Test that an empty pipeline passes the value through."""
+        assert compile_children({}, Tag("parent")).run("value") == "value"
+
+    def test_run_async(self) -> None:
+        """Test running a pipeline with async handlers."""
+        pipeline = compile_children(
+            {0: AsyncChild(name="a"), 1: DoubleChild(name="b")},
+            Tag("parent"),
+        )
+        assert asyncio.run(pipeline.run_async(1, make_click_context())) == 4
+
+    def test_context_per_child(self) -> None:
+        """Test that each child sees itself as the current node."""
+        parent = Tag("parent")
+        first, second = RecordingChild("first"), RecordingChild("second")
+        compile_children({0: first, 1: second}, parent).run(
+            "value", make_click_context()
+        )
+
+        first_context = first.calls[0][1]
+        second_context = second.calls[0][1]
+        assert first_context.current is first
+        assert second_context.current is second
+        assert first_context.parent is parent
+        assert first_context.nodes is second_context.nodes
+
+    def test_scope_tracking(self) -> None:
+        """Test that the click-extended metadata follows the chain."""
+        seen: list[tuple[Any, Any, Any]] = []
+
+        class ScopeChild(ChildNode):
+            def handle_all(self, value: Any, context: Context) -> Any:
+                meta = context.click_context.meta["click_extended"]
+                seen.append(
+                    (meta["current_scope"], meta["child_node"], meta["handler_value"])
+                )
+                return value + 1
+
+        first, second = ScopeChild(name="first"), ScopeChild(name="second")
+        click_context = make_click_context()
+
+        result = compile_children({0: first, 1: second}, Tag("parent")).run(
+            1, click_context
+        )
+
+        assert result == 3
+        assert seen == [("child", first, 1), ("child", second, 2)]
+
+    def test_process_children_wrappers(self) -> None:
+        """Test that process_children delegates to the compiled pipeline."""
+        parent = Tag("parent")
+        children = {0: DoubleChild(name="a")}
+
+        click_context = make_click_context()
+
+        assert process_children(5, children, parent, click_context) == 10
+        assert (
+            asyncio.run(process_children_async(5, children, parent, click_context))
+            == 10
+        )
+
+
+def test_long_chain(cli_runner: CliRunner) -> None:
+    """Test a command with a long chain of children on one option."""
+
+    @command()
+    @option("value", type=int, default=1)
+    @multiply(2)
+    @multiply(2)
+    @multiply(2)
+    @multiply(2)
+    def cmd(value: int) -> None:
+        click.echo(value)
+
+    result = cli_runner.invoke(cmd, ["--value", "3"])
+    assert result.exit_code == 0
+    assert result.output.strip() == "48"
+
+    result = cli_runner.invoke(cmd, ["--value", "2"])
+    assert result.exit_code == 0
+    assert result.output.strip() == "32"
+
+
+class AsyncParent(ParentNode):
+    """Parent node with an independent async load."""
+
+    independent = True
+
+    async def load(self, context: Context, *args: Any, **kwargs: Any) -> Any:
+        await asyncio.sleep(0)
+        return self.name
+
+
+class DependentParent(ParentNode):
+    """Parent node with an async load that reads another parent."""
+
+    async def load(self, context: Context, *args: Any, **kwargs: Any) -> Any:
+        other = context.get_parent("a")
+        return other.raw_value if other else None
+
+
+class SyncParent(ParentNode):
+    """Parent node with an independent sync load."""
+
+    independent = True
+
+    def load(self, context: Context, *args: Any, **kwargs: Any) -> Any:
+        return self.name
+
+
+class TestPlanLoads:
+    """Test grouping parent loads into concurrent batches."""
+
+    def test_is_independent_load(self) -> None:
+        """Test which loads may run concurrently."""
+        assert is_independent_load(AsyncParent(name="a"))
+        assert not is_independent_load(DependentParent(name="b"))
+        assert not is_independent_load(SyncParent(name="c"))
+        assert is_independent_load(SyncParent(name="c"), offload=True)
+        assert not is_independent_load(Argument(name="d"), offload=True)
+
+    def test_batches(self) -> None:
+        """Test dependent and sync loads split batches in tree order."""
+        a, b = AsyncParent(name="a"), AsyncParent(name="b")
+        dep = DependentParent(name="dep")
+        c, arg = AsyncParent(name="c"), Argument(name="arg")
+        parents: dict[str, ParentNode] = {
+            "a": a,
+            "b": b,
+            "dep": dep,
+            "c": c,
+            "arg": arg,
+        }
+
+        assert plan_loads(parents) == [
+            [("a", a), ("b", b)],
+            [("dep", dep)],
+            [("c", c)],
+            [("arg", arg)],
+        ]
+
+    def test_not_concurrent(self) -> None:
+        """Test every parent gets its own batch when disabled."""
+        a, b = AsyncParent(name="a"), AsyncParent(name="b")
+
+        assert plan_loads({"a": a, "b": b}, concurrent=False) == [
+            [("a", a)],
+            [("b", b)],
+        ]
+
+
+class SleepyChild(ChildNode):
+    """Child node that tracks how many async handlers run at once."""
+
+    active = 0
+    peak = 0
+
+    async def handle_all(self, value: Any, context: Context, **kwargs: Any) -> Any:
+        SleepyChild.active += 1
+        SleepyChild.peak = max(SleepyChild.peak, SleepyChild.active)
+        await asyncio.sleep(kwargs.get("delay", 0.01))
+        SleepyChild.active -= 1
+        if kwargs.get("fail"):
+            raise ProcessError("failed")
+        return f"{value}!"
+
+
+class TestRunChains:
+    """Test processing the children of several parents concurrently."""
+
+    def setup_method(self) -> None:
+        """Reset the handler counters."""
+        SleepyChild.active = 0
+        SleepyChild.peak = 0
+
+    def test_chains_overlap(self, cli_runner: CliRunner) -> None:
+        """Test the chains of different parents run at the same time."""
+
+        @command()
+        @option("first", default="a")
+        @SleepyChild.as_decorator()
+        @option("second", default="b")
+        @SleepyChild.as_decorator()
+        @option("third", default="c")
+        def cmd(first: str, second: str, third: str) -> None:
+            click.echo(f"{first} {second} {third}")
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code == 0, result.output
+        assert result.output.strip() == "a! b! c"
+        assert SleepyChild.peak == 2
+
+    def test_limit(self, cli_runner: CliRunner) -> None:
+        """Test chain_concurrency limits the chains processed at once."""
+
+        @command(settings=Settings(chain_concurrency=1))
+        @option("first", default="a")
+        @SleepyChild.as_decorator()
+        @option("second", default="b")
+        @SleepyChild.as_decorator()
+        def cmd(first: str, second: str) -> None:
+            click.echo(f"{first} {second}")
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code == 0, result.output
+        assert result.output.strip() == "a! b!"
+        assert SleepyChild.peak == 1
+
+    def test_error_scope(self, cli_runner: CliRunner) -> None:
+        """Test errors name the failing node despite other chains."""
+
+        @command()
+        @option("first", default="a")
+        @SleepyChild.as_decorator(name="slow_fail", delay=0.03, fail=True)
+        @option("second", default="b")
+        @SleepyChild.as_decorator(name="fast", delay=0.0)
+        def cmd(first: str, second: str) -> None:
+            click.echo("unreachable")
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code != 0
+        assert "ProcessError (first): failed" in result.output
+
+    def test_tags_run_after_join(self, cli_runner: CliRunner) -> None:
+        """Test tag children see the processed values of every chain."""
+        seen: dict[str, Any] = {}
+
+        class Capture(ChildNode):
+            def handle_tag(self, value: Any, context: Context) -> None:
+                seen.update(value)
+
+        @command()
+        @option("first", default="a", tags="all")
+        @SleepyChild.as_decorator(delay=0.02)
+        @option("second", default="b", tags="all")
+        @SleepyChild.as_decorator(delay=0.0)
+        @tag("all")
+        @Capture.as_decorator()
+        def cmd(first: str, second: str) -> None:
+            pass
+
+        result = cli_runner.invoke(cmd, [])
+        assert result.exit_code == 0, result.output
+        assert seen == {"first": "a!", "second": "b!"}
+
+    def test_invalid_limit(self) -> None:
+        """Test chain_concurrency must be positive."""
+        with pytest.raises(ValueError, match="chain_concurrency"):
+            Settings(chain_concurrency=0)
+
+    def test_run_chains_sequential(self) -> None:
+        """Test a single chain runs in the current task."""
+        parent = Argument(name="value")
+        parent.children[0] = UpperChild(name="upper")
+        click_context = make_click_context()
+
+        assert asyncio.run(run_chains([(parent, "a")], click_context)) == {parent: "A"}
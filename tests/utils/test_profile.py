@@ -0,0 +1,195 @@
+"""Tests for profiling utilities."""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from click_extended.core.decorators.command import command
+from click_extended.core.decorators.option import option
+from click_extended.core.nodes.child_node import ChildNode
+from click_extended.core.other.context import Context
+from click_extended.core.other.settings import Settings
+from click_extended.decorators.math.multiply import multiply
+from click_extended.utils.profile import (
+    PROFILE_ENV_VAR,
+    Profiler,
+    get_profile_setting,
+    measure,
+)
+
+
+class TestProfiler:
+    """Test the Profiler class."""
+
+    def test_summary(self) -> None:
+        """Test counts, totals and percentiles of recorded calls."""
+        profiler = Profiler()
+        for elapsed in range(1, 101):
+            profiler.record("children", "value.child", elapsed * 1_000_000)
+
+        stats = profiler.summary()["children"]["value.child"]
+
+        assert stats["count"] == 100
+        assert stats["total_ms"] == 5050
+        assert stats["p50_ms"] == 50
+        assert stats["p99_ms"] == 99
+        assert stats["items"] == 0
+        assert stats["bytes"] == 0
+
+    def test_single_sample(self) -> None:
+        """Test percentiles of a single call."""
+        profiler = Profiler()
+        profiler.record("loads", "value", 2_000_000)
+
+        stats = profiler.summary()["loads"]["value"]
+        assert stats["p50_ms"] == stats["p99_ms"] == 2
+
+    def test_container_sizes(self) -> None:
+        """Test items and bytes are counted for container tuples."""
+        profiler = Profiler()
+        profiler.record("children", "files.child", 1, ("ab", b"cde", 1, "é"))
+        profiler.record("children", "files.child", 1, ("x",))
+        profiler.record("children", "files.child", 1, "not a container")
+
+        stats = profiler.summary()["children"]["files.child"]
+        assert stats["count"] == 3
+        assert stats["items"] == 5
+        assert stats["bytes"] == 8
+
+    def test_measure(self) -> None:
+        """Test timing a block with a context manager."""
+        profiler = Profiler()
+
+        with measure(profiler, "validations", "check"):
+            pass
+        with pytest.raises(ValueError):
+            with measure(profiler, "validations", "check"):
+                raise ValueError
+
+        assert profiler.summary()["validations"]["check"]["count"] == 2
+
+    def test_measure_disabled(self) -> None:
+        """Test measure without a profiler is a no-op."""
+        with measure(None, "loads", "value"):
+            pass
+
+    def test_dump(self, tmp_path: Path) -> None:
+        """Test writing the summary as JSON."""
+        profiler = Profiler()
+        profiler.record("loads", "value", 1_000)
+        path = tmp_path / "profile.json"
+
+        profiler.dump(str(path))
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data == profiler.summary()
+        assert set(data) == {"children", "loads", "validations"}
+
+
+class TestGetProfileSetting:
+    """Test get_profile_setting function."""
+
+    @pytest.mark.parametrize("value", ["", "0", "false", "No"])
+    def test_disabled(self, monkeypatch: pytest.MonkeyPatch, value: str) -> None:
+        """Test values that disable profiling."""
+        monkeypatch.setenv(PROFILE_ENV_VAR, value)
+        assert get_profile_setting() == (False, None)
+
+    @pytest.mark.parametrize("value", ["1", "true", "YES"])
+    def test_enabled(self, monkeypatch: pytest.MonkeyPatch, value: str) -> None:
+        """Test values that enable profiling."""
+        monkeypatch.setenv(PROFILE_ENV_VAR, value)
+        assert get_profile_setting() == (True, None)
+
+    def test_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test any other value is used as the output path."""
+        monkeypatch.setenv(PROFILE_ENV_VAR, "out/profile.json")
+        assert get_profile_setting() == (True, "out/profile.json")
+
+    def test_unset(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test profiling is disabled by default."""
+        monkeypatch.delenv(PROFILE_ENV_VAR, raising=False)
+        assert get_profile_setting() == (False, None)
+
+
+class Snapshot(ChildNode):
+    """Child node that stores the profile summary in the data store."""
+
+    def handle_all(self, value: Any, context: Context) -> Any:
+        profiler = context.get_profile()
+        context.data["profile"] = profiler.summary() if profiler else "disabled"
+        return value
+
+
+class AsyncUpper(ChildNode):
+    """Child node with an async handler."""
+
+    async def handle_str(self, value: str, context: Context) -> str:
+        await asyncio.sleep(0)
+        return value.upper()
+
+
+class TestProfiledCommand:
+    """Test profiling commands."""
+
+    def test_profile_option(self, cli_runner: CliRunner) -> None:
+        """Test profile=True records children and loads."""
+        summaries: list[dict[str, Any]] = []
+
+        @command(settings=Settings(profile=True))
+        @option("values", type=int, multiple=True)
+        @multiply(2)
+        @option("other", default="x")
+        @Snapshot.as_decorator()
+        def cmd(values: tuple[int, ...], other: str) -> None:
+            summaries.append(click.get_current_context().meta["click_extended"])
+
+        result = cli_runner.invoke(cmd, ["--values", "1", "--values", "2"])
+        assert result.exit_code == 0
+
+        profile = summaries[0]["data"]["profile"]
+        assert profile["children"]["values.multiply"]["count"] == 1
+        assert profile["children"]["values.multiply"]["items"] == 2
+        assert profile["loads"]["values"]["count"] == 1
+        assert profile["loads"]["other"]["count"] == 1
+
+    def test_disabled_by_default(
+        self, cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test no profiler is created unless enabled."""
+        monkeypatch.delenv(PROFILE_ENV_VAR, raising=False)
+        seen: list[Any] = []
+
+        @command()
+        @option("value", default="x")
+        @Snapshot.as_decorator()
+        def cmd(value: str) -> None:
+            seen.append(click.get_current_context().meta["click_extended"]["data"])
+
+        assert cli_runner.invoke(cmd, []).exit_code == 0
+        assert seen[0]["profile"] == "disabled"
+
+    def test_env_var_dumps_json(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        """Test the environment variable writes the summary at exit."""
+        path = tmp_path / "profile.json"
+
+        @command()
+        @option("name", default="x")
+        @AsyncUpper.as_decorator()
+        def cmd(name: str) -> None:
+            click.echo(name)
+
+        result = cli_runner.invoke(
+            cmd, ["--name", "abc"], env={PROFILE_ENV_VAR: str(path)}
+        )
+        assert result.exit_code == 0
+        assert result.output.strip() == "ABC"
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["children"]["name.async_upper"]["count"] == 1
+        assert data["loads"]["name"]["count"] == 1
@@ -0,0 +1,131 @@
+"""Tests for per-invocation run state."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import click
+
+from click_extended.core.decorators.command import command
+from click_extended.core.decorators.option import option
+from click_extended.core.decorators.tag import tag
+from click_extended.core.nodes.child_node import ChildNode
+from click_extended.core.nodes.validation_node import ValidationNode
+from click_extended.core.other.context import Context
+from click_extended.decorators.check.exclusive import exclusive
+from click_extended.utils.run_state import RunState, get_run_state, use_run_state
+
+
+class TestRunState:
+    """Test the RunState class and its context variable."""
+
+    def test_no_state_outside_invocation(self) -> None:
+        """Test there is no state outside of an invocation."""
+        assert get_run_state() is None
+
+    def test_use_run_state(self) -> None:
+        """Test the state is only active inside the block."""
+        state = RunState()
+
+        with use_run_state(state) as active:
+            assert active is state
+            assert get_run_state() is state
+
+        assert get_run_state() is None
+
+    def test_nested(self) -> None:
+        """Test the outer state is restored after a nested block."""
+        outer, inner = RunState(), RunState()
+
+        with use_run_state(outer):
+            with use_run_state(inner):
+                assert get_run_state() is inner
+            assert get_run_state() is outer
+
+    def test_threads_do_not_share_state(self) -> None:
+        """Test a state entered in one thread is not seen by others."""
+        seen: list[RunState | None] = []
+
+        with use_run_state(RunState()):
+            thread = threading.Thread(target=lambda: seen.append(get_run_state()))
+            thread.start()
+            thread.join()
+
+        assert seen == [None]
+
+    def test_state_holds_parent_values(self, cli_runner: Any) -> None:
+        """Test the values of an invocation are stored in its state."""
+        states: list[RunState | None] = []
+
+        @command()
+        @option("name", default="x")
+        def cmd(name: str) -> None:
+            context = click.get_current_context()
+            custom = context.meta["click_extended"]["parents"]["name"]
+            states.append(get_run_state())
+            assert custom.get_value() == name
+
+        result = cli_runner.invoke(cmd, ["--name", "abc"])
+        assert result.exit_code == 0, result.output
+
+        state = states[0]
+        assert state is not None
+        assert list(state.values.values()) == ["abc"]
+        assert list(state.provided.values()) == [True]
+
+
+class Upper(ChildNode):
+    """Child node with an async handler."""
+
+    async def handle_str(self, value: str, context: Context) -> str:
+        await asyncio.sleep(0)
+        return value.upper()
+
+
+class Snapshot(ValidationNode):
+    """Validation node that stores what the context sees."""
+
+    def on_finalize(self, context: Context, *args: Any, **kwargs: Any) -> None:
+        context.data["provided"] = sorted(context.get_provided_values())
+        context.data["group"] = context.tags["group"].get_value()
+
+
+class TestConcurrentInvocations:
+    """Test invoking one command from many threads at once."""
+
+    def test_stress(self) -> None:
+        """Test every invocation only sees its own values."""
+
+        @command()
+        @option("name", default="default", tags="group")
+        @Upper.as_decorator()
+        @option("count", type=int, default=0, tags="group")
+        @option("flag", is_flag=True, default=False)
+        @tag("group")
+        @exclusive("name", "flag")
+        @Snapshot.as_decorator()
+        def cmd(name: str, count: int, flag: bool) -> dict[str, Any]:
+            data = click.get_current_context().meta["click_extended"]["data"]
+            return {"name": name, "count": count, "flag": flag, **data}
+
+        def invoke(i: int) -> tuple[int, dict[str, Any]]:
+            args = ["--count", str(i)]
+            if i % 2:
+                args += ["--name", f"n{i}"]
+            return i, cmd.main(args, standalone_mode=False)
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(invoke, range(400)))
+
+        for i, result in results:
+            name = f"N{i}" if i % 2 else "DEFAULT"
+            assert result["name"] == name
+            assert result["count"] == i
+            assert result["flag"] is False
+            assert result["group"] == {"name": name, "count": i}
+
+            provided = ["count", "name"] if i % 2 else ["count"]
+            if i == 0:
+                provided.remove("count")
+            assert result["provided"] == provided
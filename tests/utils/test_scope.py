@@ -0,0 +1,39 @@
+"""Tests for task-local scope tracking."""
+
+import asyncio
+from typing import Any
+
+from click_extended.utils.scope import enter_task_scope, get_scope_value, scope_target
+
+
+class TestScope:
+    """Test reading and writing the scope of a task."""
+
+    def test_without_task_scope(self) -> None:
+        """Test the metadata is used outside of task scopes."""
+        meta: dict[str, Any] = {"child_node": None}
+
+        scope_target(meta)["child_node"] = "child"
+
+        assert meta["child_node"] == "child"
+        assert get_scope_value(meta, "child_node") == "child"
+        assert get_scope_value(meta, "parent_node", "none") == "none"
+
+    def test_tasks_are_isolated(self) -> None:
+        """Test concurrent tasks do not overwrite each other's scope."""
+        meta: dict[str, Any] = {"parent_node": "root", "current_scope": "root"}
+
+        async def run(name: str, delay: float) -> tuple[Any, Any]:
+            enter_task_scope()
+            scope_target(meta)["parent_node"] = name
+            await asyncio.sleep(delay)
+            return (
+                get_scope_value(meta, "parent_node"),
+                get_scope_value(meta, "current_scope"),
+            )
+
+        async def main() -> list[tuple[Any, Any]]:
+            return list(await asyncio.gather(run("a", 0.01), run("b", 0.0)))
+
+        assert asyncio.run(main()) == [("a", "root"), ("b", "root")]
+        assert meta["parent_node"] == "root"
@@ -0,0 +1,157 @@
+"""Tests for tracing utilities."""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from click_extended.core.decorators.command import command
+from click_extended.core.decorators.option import option
+from click_extended.core.nodes.child_node import ChildNode
+from click_extended.core.other.context import Context
+from click_extended.decorators.math.multiply import multiply
+from click_extended.utils.trace import TRACE_ENV_VAR, Tracer, get_trace_path, span
+
+
+class TestTracer:
+    """Test the Tracer class."""
+
+    def test_add(self) -> None:
+        """Test events are complete events in microseconds."""
+        tracer = Tracer()
+        origin = tracer._origin  # pylint: disable=protected-access
+
+        tracer.add("value", "parent", origin + 2_000, origin + 5_000, {"a": 1})
+        tracer.add("boot", "phase", origin, origin + 1_000)
+
+        first, second = tracer.events
+        assert first["name"] == "value"
+        assert first["cat"] == "parent"
+        assert first["ph"] == "X"
+        assert first["ts"] == 2
+        assert first["dur"] == 3
+        assert first["args"] == {"a": 1}
+        assert "args" not in second
+        assert isinstance(first["pid"], int)
+        assert isinstance(first["tid"], int)
+
+    def test_span(self) -> None:
+        """Test recording blocks, including failing ones."""
+        tracer = Tracer()
+
+        with tracer.span("ok", "phase"):
+            pass
+        with pytest.raises(ValueError):
+            with span(tracer, "failed", "phase", {"parent": "x"}):
+                raise ValueError
+
+        ok, failed = tracer.events
+        assert ok["name"] == "ok"
+        assert failed["args"] == {"parent": "x", "error": "ValueError"}
+
+    def test_span_disabled(self) -> None:
+        """Test span without a tracer is a no-op."""
+        with span(None, "boot", "phase"):
+            pass
+
+    def test_dump(self, tmp_path: Path) -> None:
+        """Test writing the trace as JSON."""
+        tracer = Tracer()
+        with tracer.span("boot", "phase"):
+            pass
+        path = tmp_path / "trace.json"
+
+        tracer.dump(str(path))
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["displayTimeUnit"] == "ms"
+        assert data["traceEvents"] == tracer.events
+
+
+class TestGetTracePath:
+    """Test get_trace_path function."""
+
+    def test_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the environment variable is used as the path."""
+        monkeypatch.setenv(TRACE_ENV_VAR, "trace.json")
+        assert get_trace_path() == "trace.json"
+
+    @pytest.mark.parametrize("value", [None, ""])
+    def test_disabled(self, monkeypatch: pytest.MonkeyPatch, value: str | None) -> None:
+        """Test tracing is disabled when unset or empty."""
+        if value is None:
+            monkeypatch.delenv(TRACE_ENV_VAR, raising=False)
+        else:
+            monkeypatch.setenv(TRACE_ENV_VAR, value)
+        assert get_trace_path() is None
+
+
+class AsyncUpper(ChildNode):
+    """Child node with an async handler."""
+
+    async def handle_str(self, value: str, context: Context) -> str:
+        await asyncio.sleep(0.001)
+        return value.upper()
+
+
+class TestTracedCommand:
+    """Test tracing commands."""
+
+    def test_env_var_writes_trace(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        """Test phases, parents and children are written at exit."""
+        path = tmp_path / "trace.json"
+
+        @command()
+        @option("name", default="x")
+        @AsyncUpper.as_decorator()
+        @option("count", type=int, default=1)
+        @multiply(2)
+        def cmd(name: str, count: int) -> None:
+            click.echo(f"{name} {count}")
+
+        result = cli_runner.invoke(
+            cmd, ["--name", "abc"], env={TRACE_ENV_VAR: str(path)}
+        )
+        assert result.exit_code == 0
+        assert result.output.strip() == "ABC 2"
+
+        events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+        names = {(event["cat"], event["name"]) for event in events}
+
+        for phase in (
+            "boot",
+            "initialize_context",
+            "validate_and_build",
+            "loads",
+            "children",
+            "function",
+            "exit",
+        ):
+            assert ("phase", phase) in names
+        assert ("parent", "name") in names
+        assert ("parent", "count") in names
+        assert ("child", "multiply") in names
+
+        child = next(e for e in events if e["name"] == "async_upper")
+        assert child["cat"] == "child"
+        assert child["args"] == {"parent": "name"}
+        assert child["dur"] >= 1000
+
+    def test_disabled_by_default(
+        self, cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test no tracer is created unless enabled."""
+        monkeypatch.delenv(TRACE_ENV_VAR, raising=False)
+        seen: list[dict[str, Any]] = []
+
+        @command()
+        @option("name", default="x")
+        def cmd(name: str) -> None:
+            seen.append(click.get_current_context().meta["click_extended"])
+
+        assert cli_runner.invoke(cmd, []).exit_code == 0
+        assert "tracer" not in seen[0]